@@ -94,11 +94,17 @@ def import_game_stats(
         "-d",
         help="Preview what would be imported without making any changes to the database",
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        "-s",
+        help="Parse rows as they are read and write stats with bulk inserts (faster for large imports)",
+    ),
 ):
     """
     Import game statistics from a CSV file.
     """
-    return ImportCommands.import_game_stats(file, dry_run)
+    return ImportCommands.import_game_stats(file, dry_run, stream)
 
 
 @cli.command("report")
@@ -225,15 +231,78 @@ def update_season_stats(
         None,
         "--season",
         "-s",
-        help="Season to update (e.g., '2024-2025'). If not specified, updates current season.",
+        help="Season code to update (e.g., '2024-25'). If not specified, rebuilds every season.",
     ),
+    batch_size: int = typer.Option(500, "--batch-size", help="Number of rows written per batch"),
 ):
     """
     Update season statistics for all players and teams.
 
-    This command recalculates all season statistics based on game data.
+    This command rebuilds all season statistics from game data using grouped
+    aggregate queries and batched writes in a single transaction.
     """
-    StatsCommands.update_season_stats(season)
+    StatsCommands.update_season_stats(season, batch_size)
+
+
+@cli.command("verify-season-stats")
+def verify_season_stats(
+    season: str = typer.Option(
+        None,
+        "--season",
+        "-s",
+        help="Season code to verify (e.g., '2024-25'). If not specified, verifies all seasons.",
+    ),
+    show_limit: int = typer.Option(20, "--show", help="Maximum mismatched rows to print per table"),
+):
+    """
+    Verify incrementally maintained season statistics.
+
+    Diffs the player and team season tables against a full rebuild from game data
+    and exits with a non-zero status when they differ.
+    """
+    if not StatsCommands.verify_season_stats(season, show_limit):
+        raise typer.Exit(code=1)
+
+
+@cli.command("rebuild-box-scores")
+def rebuild_box_scores(
+    game_ids: list[int] = typer.Option(None, "--game", "-g", help="Game ID to rebuild (repeatable, default: all)"),
+):
+    """
+    Rebuild the stored box scores.
+
+    Box scores are refreshed automatically when a game is finalized, saved from the
+    scorebook or corrected. Use this to backfill existing games or repair the table.
+    """
+    StatsCommands.rebuild_box_scores(game_ids)
+
+
+@cli.command("verify-game-events")
+def verify_game_events(
+    game_ids: list[int] = typer.Option(None, "--game", "-g", help="Game ID to check (repeatable, default: all)"),
+    show_limit: int = typer.Option(20, "--show", help="Maximum mismatches to print"),
+):
+    """
+    Check live-entered games against their event logs.
+
+    Replays each game's recorded events and compares the result with the stored
+    player and quarter lines, exiting with a non-zero status when they differ.
+    """
+    if not StatsCommands.verify_game_events(game_ids, show_limit):
+        raise typer.Exit(code=1)
+
+
+@cli.command("rebuild-game-stats")
+def rebuild_game_stats(
+    game_ids: list[int] = typer.Option(..., "--game", "-g", help="Game ID to rebuild (repeatable)"),
+):
+    """
+    Rebuild live-entered games' stats from their event logs.
+
+    Overwrites the stored player and quarter lines with a replay of the recorded
+    events; season totals and box scores are updated to match.
+    """
+    StatsCommands.rebuild_game_stats(game_ids)
 
 
 @cli.command("list-games")
@@ -671,6 +740,9 @@ def calculate_all_awards(
     recalculate: bool = typer.Option(
         False, "--recalculate", help="Reset existing awards and recalculate from scratch."
     ),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Worker processes for evaluating seasons and award families in parallel."
+    ),
 ):
     """
     Calculate all awards - both weekly and season awards.
@@ -679,10 +751,12 @@ def calculate_all_awards(
         basketball-stats calculate-all-awards                    # Calculate all awards
         basketball-stats calculate-all-awards --season 2024     # Calculate all awards for 2024
         basketball-stats calculate-all-awards --recalculate     # Reset and recalculate all
+        basketball-stats calculate-all-awards --workers 4       # Spread seasons across 4 processes
     """
     from app.config_data.awards import SEASON_AWARDS, WEEKLY_AWARDS
     from app.dependencies import get_db
     from app.services.awards_service import calculate_all_season_awards, calculate_all_weekly_awards, get_current_season
+    from app.services.parallel_awards_service import calculate_awards_parallel
 
     db_session = next(get_db())
 
@@ -699,15 +773,26 @@ def calculate_all_awards(
         typer.echo("🎯 Calculating all awards...")
         typer.echo(f"📅 Current season: {current_season}")
 
-        # Calculate season awards
         season_target = season or current_season
-        typer.echo(f"\n🏆 Calculating season awards for {season_target}...")
-        season_results = calculate_all_season_awards(db_session, season=season_target, recalculate=recalculate)
-
-        # Calculate weekly awards
         weekly_target = season  # None means all seasons for weekly
-        typer.echo(f"\n📅 Calculating weekly awards for {weekly_target or 'all seasons'}...")
-        weekly_results = calculate_all_weekly_awards(db_session, season=weekly_target, recalculate=recalculate)
+
+        if workers > 1:
+            typer.echo(
+                f"\n⚙️  Calculating season awards for {season_target} and weekly awards for "
+                f"{weekly_target or 'all seasons'} with {workers} workers..."
+            )
+            results = calculate_awards_parallel(
+                db_session, {"season": season_target, "weekly": weekly_target}, recalculate, workers
+            )
+            season_results, weekly_results = results["season"], results["weekly"]
+        else:
+            # Calculate season awards
+            typer.echo(f"\n🏆 Calculating season awards for {season_target}...")
+            season_results = calculate_all_season_awards(db_session, season=season_target, recalculate=recalculate)
+
+            # Calculate weekly awards
+            typer.echo(f"\n📅 Calculating weekly awards for {weekly_target or 'all seasons'}...")
+            weekly_results = calculate_all_weekly_awards(db_session, season=weekly_target, recalculate=recalculate)
 
         # Display results
         typer.echo("\n✅ All awards calculated successfully!")
@@ -70,6 +70,26 @@ class Settings(BaseSettings):
     # In development, use directory outside of app code (e.g., /data/uploads or ./uploads)
     UPLOAD_DIR: str = os.environ.get("UPLOAD_DIR", _get_default_upload_dir())
 
+    # Connection pool for the engines managed by app/data_access/database_manager.py
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a connection before giving up
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING: bool = True
+
+    # Pragmas applied to every SQLite connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+
+    # Response cache bounds (app/web_ui/cache.py); least recently used entries are evicted past either limit
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # "memory" keeps the cache per worker process; "sqlite" shares it between the uvicorn workers on a host
+    CACHE_BACKEND: str = "memory"
+    # SQLite cache file; defaults to /dev/shm (tmpfs) when available, otherwise the temp directory
+    CACHE_SQLITE_PATH: str | None = None
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
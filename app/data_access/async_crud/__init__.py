@@ -0,0 +1,42 @@
+"""
+Async CRUD read operations for use with AsyncSession.
+
+These mirror the read functions of app.data_access.crud. Async sessions cannot lazy load,
+so each function eagerly loads the relationships its callers read.
+"""
+
+from app.data_access.async_crud.crud_game import get_all_games, get_game_by_id, get_games_by_team
+from app.data_access.async_crud.crud_player import get_all_players, get_player_by_id, get_players_by_team
+from app.data_access.async_crud.crud_player_game_stats import (
+    get_all_player_game_stats_for_player,
+    get_player_game_stats,
+    get_player_game_stats_by_game,
+)
+from app.data_access.async_crud.crud_player_quarter_stats import (
+    get_player_quarter_stats,
+    get_quarter_stats_by_game,
+)
+from app.data_access.async_crud.crud_team import get_all_teams, get_team_by_id, get_teams_by_ids
+
+# Define public API
+__all__ = [
+    # Team CRUD
+    "get_team_by_id",
+    "get_teams_by_ids",
+    "get_all_teams",
+    # Player CRUD
+    "get_player_by_id",
+    "get_players_by_team",
+    "get_all_players",
+    # Game CRUD
+    "get_game_by_id",
+    "get_games_by_team",
+    "get_all_games",
+    # PlayerGameStats CRUD
+    "get_player_game_stats_by_game",
+    "get_player_game_stats",
+    "get_all_player_game_stats_for_player",
+    # PlayerQuarterStats CRUD
+    "get_player_quarter_stats",
+    "get_quarter_stats_by_game",
+]
@@ -0,0 +1,58 @@
+"""
+Async read operations for Game model.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.data_access.models import Game
+
+# Both teams are read wherever a game is displayed
+_GAME_TEAMS = (selectinload(Game.playing_team), selectinload(Game.opponent_team))
+
+
+async def get_game_by_id(db: AsyncSession, game_id: int) -> Game | None:
+    """
+    Get a game by its ID, with both teams loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+        game_id: ID of the game to find
+
+    Returns:
+        Game instance if found, None otherwise
+    """
+    result = await db.execute(select(Game).options(*_GAME_TEAMS).where(Game.id == game_id))
+    return result.scalars().first()
+
+
+async def get_games_by_team(db: AsyncSession, team_id: int) -> list[Game]:
+    """
+    Get all games played by a specific team (either as home or away), with both teams loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+        team_id: ID of the team to get games for
+
+    Returns:
+        List of Game instances involving the team
+    """
+    result = await db.execute(
+        select(Game).options(*_GAME_TEAMS).where((Game.playing_team_id == team_id) | (Game.opponent_team_id == team_id))
+    )
+    return list(result.scalars().all())
+
+
+async def get_all_games(db: AsyncSession) -> list[Game]:
+    """
+    Get all games from the database, with both teams loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+
+    Returns:
+        List of all Game instances
+    """
+    result = await db.execute(select(Game).options(*_GAME_TEAMS))
+    return list(result.scalars().all())
@@ -0,0 +1,53 @@
+"""
+Async read operations for Player model.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.data_access.models import Player
+
+
+async def get_player_by_id(db: AsyncSession, player_id: int) -> Player | None:
+    """
+    Get a player by their ID, with their team loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+        player_id: ID of the player to find
+
+    Returns:
+        Player instance if found, None otherwise
+    """
+    result = await db.execute(select(Player).options(selectinload(Player.team)).where(Player.id == player_id))
+    return result.scalars().first()
+
+
+async def get_players_by_team(db: AsyncSession, team_id: int) -> list[Player]:
+    """
+    Get all players for a specific team.
+
+    Args:
+        db: SQLAlchemy async database session
+        team_id: ID of the team to get players for
+
+    Returns:
+        List of Player instances for the team
+    """
+    result = await db.execute(select(Player).where(Player.team_id == team_id))
+    return list(result.scalars().all())
+
+
+async def get_all_players(db: AsyncSession) -> list[Player]:
+    """
+    Get all players in the database, with their teams loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+
+    Returns:
+        List of all Player instances
+    """
+    result = await db.execute(select(Player).options(selectinload(Player.team)))
+    return list(result.scalars().all())
@@ -0,0 +1,63 @@
+"""
+Async read operations for PlayerGameStats model.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.data_access.models import PlayerGameStats
+
+
+async def get_player_game_stats_by_game(db: AsyncSession, game_id: int) -> list[PlayerGameStats]:
+    """
+    Get all player game stats for a specific game, with each player loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+        game_id: ID of the game to get stats for
+
+    Returns:
+        List of PlayerGameStats instances for the specified game
+    """
+    result = await db.execute(
+        select(PlayerGameStats).options(selectinload(PlayerGameStats.player)).where(PlayerGameStats.game_id == game_id)
+    )
+    return list(result.scalars().all())
+
+
+async def get_player_game_stats(db: AsyncSession, game_id: int, player_id: int) -> PlayerGameStats | None:
+    """
+    Get a player's game stats for a specific game.
+
+    Args:
+        db: SQLAlchemy async database session
+        game_id: ID of the game
+        player_id: ID of the player
+
+    Returns:
+        PlayerGameStats instance if found, None otherwise
+    """
+    result = await db.execute(
+        select(PlayerGameStats).where(PlayerGameStats.game_id == game_id, PlayerGameStats.player_id == player_id)
+    )
+    return result.scalars().first()
+
+
+async def get_all_player_game_stats_for_player(db: AsyncSession, player_id: int) -> list[PlayerGameStats]:
+    """
+    Get all player game stats for a specific player across all games, with each game loaded.
+
+    Args:
+        db: SQLAlchemy async database session
+        player_id: ID of the player
+
+    Returns:
+        List of PlayerGameStats instances for the specified player
+    """
+    result = await db.execute(
+        select(PlayerGameStats)
+        .options(selectinload(PlayerGameStats.game))
+        .where(PlayerGameStats.player_id == player_id)
+    )
+    return list(result.scalars().all())
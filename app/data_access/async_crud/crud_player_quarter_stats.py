@@ -0,0 +1,47 @@
+"""
+Async read operations for PlayerQuarterStats model.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.models import PlayerGameStats, PlayerQuarterStats
+
+
+async def get_player_quarter_stats(db: AsyncSession, player_game_stat_id: int) -> list[PlayerQuarterStats]:
+    """
+    Get all quarter stats for a specific player game stats record.
+
+    Args:
+        db: SQLAlchemy async database session
+        player_game_stat_id: ID of the PlayerGameStats to get quarter stats for
+
+    Returns:
+        List of PlayerQuarterStats instances for all quarters
+    """
+    result = await db.execute(
+        select(PlayerQuarterStats)
+        .where(PlayerQuarterStats.player_game_stat_id == player_game_stat_id)
+        .order_by(PlayerQuarterStats.quarter_number)
+    )
+    return list(result.scalars().all())
+
+
+async def get_quarter_stats_by_game(db: AsyncSession, game_id: int) -> list[PlayerQuarterStats]:
+    """
+    Get the quarter stats of every player in a game in one query.
+
+    Args:
+        db: SQLAlchemy async database session
+        game_id: ID of the game
+
+    Returns:
+        List of PlayerQuarterStats instances ordered by stat line and quarter
+    """
+    result = await db.execute(
+        select(PlayerQuarterStats)
+        .join(PlayerGameStats, PlayerQuarterStats.player_game_stat_id == PlayerGameStats.id)
+        .where(PlayerGameStats.game_id == game_id)
+        .order_by(PlayerQuarterStats.player_game_stat_id, PlayerQuarterStats.quarter_number)
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,56 @@
+"""
+Async read operations for Team model.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.models import Team
+
+
+async def get_team_by_id(db: AsyncSession, team_id: int) -> Team | None:
+    """
+    Get a team by its ID.
+
+    Args:
+        db: SQLAlchemy async database session
+        team_id: ID of the team to find
+
+    Returns:
+        Team instance if found, None otherwise
+    """
+    return await db.get(Team, team_id)
+
+
+async def get_teams_by_ids(db: AsyncSession, team_ids: Iterable[int]) -> dict[int, Team]:
+    """
+    Get several teams in one query.
+
+    Args:
+        db: SQLAlchemy async database session
+        team_ids: IDs of the teams to find
+
+    Returns:
+        Dictionary mapping team ID to Team instance for the teams that exist
+    """
+    team_ids = set(team_ids)
+    if not team_ids:
+        return {}
+    result = await db.execute(select(Team).where(Team.id.in_(team_ids)))
+    return {team.id: team for team in result.scalars()}
+
+
+async def get_all_teams(db: AsyncSession) -> list[Team]:
+    """
+    Get all teams in the database.
+
+    Args:
+        db: SQLAlchemy async database session
+
+    Returns:
+        List of all Team instances
+    """
+    result = await db.execute(select(Team))
+    return list(result.scalars().all())
@@ -2,6 +2,7 @@
 
 from datetime import date
 
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.data_access.models import PlayerAward
@@ -80,6 +81,114 @@ def create_player_award_safe(
             raise
 
 
+def create_player_awards_batch(session: Session, awards: list[dict]) -> list[PlayerAward]:
+    """Create many award records at once, reusing any that already exist.
+
+    Each award dict carries player_id, season, award_type, week_date and optionally
+    points_scored, game_id and stat_value. Existing awards are looked up with one
+    query and get their stat_value refreshed; new ones are added and flushed together.
+    """
+    if not awards:
+        return []
+
+    existing = {
+        (award.player_id, award.award_type, award.week_date, award.season, award.game_id): award
+        for award in session.query(PlayerAward)
+        .filter(
+            PlayerAward.award_type.in_({award["award_type"] for award in awards}),
+            PlayerAward.season.in_({award["season"] for award in awards}),
+        )
+        .all()
+    }
+
+    records = []
+    for data in awards:
+        key = (data["player_id"], data["award_type"], data["week_date"], data["season"], data.get("game_id"))
+        award = existing.get(key)
+        if award is None:
+            award = PlayerAward(
+                player_id=data["player_id"],
+                season=data["season"],
+                award_type=data["award_type"],
+                week_date=data["week_date"],
+                points_scored=data.get("points_scored"),
+                game_id=data.get("game_id"),
+            )
+            session.add(award)
+            existing[key] = award
+        if data.get("stat_value") is not None:
+            award.stat_value = data["stat_value"]
+        records.append(award)
+
+    session.flush()
+    return records
+
+
+def replace_award_slices(
+    session: Session, awards: list[dict], slices: list[tuple[str, str | None]] | None = None
+) -> dict[tuple[str, str], int]:
+    """Replace whole (award_type, season) slices of awards with a new set of records.
+
+    Existing awards in every slice are removed with a single DELETE and the new records
+    are bulk inserted, so a full recalculation costs two statements regardless of how many
+    weeks or winners it covers. A slice whose season is None covers every season of that
+    award type. Slices default to the (award_type, season) pairs present in ``awards``;
+    pass them explicitly to also clear slices that no longer have any winners.
+
+    Returns:
+        Dict mapping (award_type, season) -> number of awards written
+    """
+    if slices is None:
+        slices = list(dict.fromkeys((award["award_type"], award["season"]) for award in awards))
+
+    if slices:
+        conditions = [
+            and_(PlayerAward.award_type == award_type, PlayerAward.season == season)
+            if season is not None
+            else PlayerAward.award_type == award_type
+            for award_type, season in slices
+        ]
+        session.query(PlayerAward).filter(or_(*conditions)).delete()
+
+    # Collapse duplicates on the unique key so the bulk insert cannot conflict
+    rows = {}
+    for award in awards:
+        key = (award["player_id"], award["award_type"], award["week_date"], award["season"], award.get("game_id"))
+        rows[key] = {
+            "player_id": award["player_id"],
+            "season": award["season"],
+            "award_type": award["award_type"],
+            "week_date": award["week_date"],
+            "points_scored": award.get("points_scored"),
+            "game_id": award.get("game_id"),
+            "stat_value": award.get("stat_value"),
+        }
+
+    if rows:
+        session.bulk_insert_mappings(PlayerAward, list(rows.values()))
+    session.flush()
+
+    counts: dict[tuple[str, str], int] = {}
+    for row in rows.values():
+        key = (row["award_type"], row["season"])
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def count_awards_by_week(session: Session, award_types: list[str], seasons: list[str]) -> dict[tuple, int]:
+    """Count awards per (award_type, season, week_date) for the given types and seasons."""
+    if not award_types or not seasons:
+        return {}
+
+    rows = (
+        session.query(PlayerAward.award_type, PlayerAward.season, PlayerAward.week_date, func.count(PlayerAward.id))
+        .filter(PlayerAward.award_type.in_(award_types), PlayerAward.season.in_(seasons))
+        .group_by(PlayerAward.award_type, PlayerAward.season, PlayerAward.week_date)
+        .all()
+    )
+    return {(award_type, season, week_date): count for award_type, season, week_date, count in rows}
+
+
 def get_player_awards_by_season(session: Session, player_id: int, season: str) -> list[PlayerAward]:
     """Get all awards for a player in a specific season."""
     return (
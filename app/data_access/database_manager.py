@@ -3,18 +3,272 @@
 
 Provides SQLAlchemy database utilities for engine creation, session management,
 and table operations to ensure consistent database access throughout the application.
+Engines are built once per database URL and shared through the engine registry, with
+pool sizing and SQLite pragmas taken from settings. Async engines (aiosqlite/asyncpg) for
+the FastAPI routers are registered alongside the sync ones.
 """
 
-from contextlib import contextmanager
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.config import settings
 from app.data_access.models import Base
 
 
+class PoolMetrics:
+    """Checkout counters for one engine's connection pool, for capacity planning."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_connect(self):
+        """Count a new DBAPI connection opened by the pool."""
+        with self._lock:
+            self.connects += 1
+
+    def record_checkout(self, wait_seconds: float, timed_out: bool = False):
+        """Record how long a caller waited for a connection."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, including the mean checkout wait."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_seconds / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout counts and how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        """Keep the metrics when the engine is disposed and the pool rebuilt."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        """Check out a connection, timing the wait."""
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Asyncio-compatible InstrumentedQueuePool for async engines."""
+
+
+# Async drivers used for each backend when building an async engine
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def is_memory_sqlite(db_url: str | URL) -> bool:
+    """
+    Whether a database URL names an in-memory SQLite database.
+
+    In-memory databases live in a single connection: their engines keep SQLAlchemy's
+    own pool, and other processes cannot open them.
+
+    Args:
+        db_url: Database URL, as a string or a parsed URL
+
+    Returns:
+        True for in-memory SQLite databases, False for any other database
+    """
+    url = make_url(db_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+    """Configure journaling, durability and memory-mapped I/O on a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    finally:
+        cursor.close()
+
+
+def _engine_options(url: URL, poolclass: type[QueuePool]) -> dict[str, Any]:
+    """Pool and connection options from settings for an engine on url."""
+    is_sqlite = url.get_backend_name() == "sqlite"
+    options: dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if not is_memory_sqlite(url):
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+        if is_sqlite:
+            options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def _instrument(engine: Engine):
+    """Attach the SQLite pragmas and connection counting to a (sync or async-backing) engine."""
+    if engine.url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        metrics = engine.pool.metrics
+        event.listen(engine, "connect", lambda dbapi_connection, connection_record: metrics.record_connect())
+
+
+def build_engine(db_url: str) -> Engine:
+    """
+    Create an engine configured from settings.
+
+    Pooled engines use InstrumentedQueuePool sized by DB_POOL_SIZE and DB_MAX_OVERFLOW.
+    SQLite connections get the SQLITE_* pragmas.
+
+    Args:
+        db_url: The database URL to connect to.
+
+    Returns:
+        SQLAlchemy Engine instance.
+    """
+    url = make_url(db_url)
+    engine = create_engine(url, **_engine_options(url, InstrumentedQueuePool))
+    _instrument(engine)
+    return engine
+
+
+def async_database_url(db_url: str) -> URL:
+    """
+    Convert a database URL to its asyncio driver (sqlite -> aiosqlite, postgresql -> asyncpg).
+
+    Args:
+        db_url: The database URL, with or without an explicit sync driver.
+
+    Returns:
+        The URL using the async driver for its backend.
+    """
+    url = make_url(db_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+
+
+def build_async_engine(db_url: str) -> AsyncEngine:
+    """
+    Create an async engine configured from settings, sharing the sync engine's pool options and pragmas.
+
+    Args:
+        db_url: The database URL to connect to; its sync driver is swapped for the async one.
+
+    Returns:
+        SQLAlchemy AsyncEngine instance.
+    """
+    url = async_database_url(db_url)
+    engine = create_async_engine(url, **_engine_options(url, InstrumentedAsyncQueuePool))
+    _instrument(engine.sync_engine)
+    return engine
+
+
+class EngineRegistry:
+    """Process-wide registry holding one configured engine per database URL."""
+
+    def __init__(self):
+        self._engines: dict[str, Engine] = {}
+        self._async_engines: dict[str, AsyncEngine] = {}
+        self._lock = threading.Lock()
+
+    def get_engine(self, db_url: str) -> Engine:
+        """Return the engine for db_url, building it on first use."""
+        with self._lock:
+            engine = self._engines.get(db_url)
+            if engine is None:
+                engine = build_engine(db_url)
+                self._engines[db_url] = engine
+            return engine
+
+    def get_async_engine(self, db_url: str) -> AsyncEngine:
+        """Return the async engine for db_url, building it on first use."""
+        with self._lock:
+            engine = self._async_engines.get(db_url)
+            if engine is None:
+                engine = build_async_engine(db_url)
+                self._async_engines[db_url] = engine
+            return engine
+
+    def dispose_all(self):
+        """Dispose and forget every registered engine.
+
+        Async engines only have their pools dropped; call ``await engine.dispose()`` from the
+        event loop to close their connections gracefully.
+        """
+        with self._lock:
+            engines, self._engines = list(self._engines.values()), {}
+            async_engines, self._async_engines = list(self._async_engines.values()), {}
+        for engine in engines:
+            engine.dispose()
+        for async_engine in async_engines:
+            async_engine.sync_engine.dispose(close=False)
+
+    def pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Return pool gauges and checkout metrics for every registered engine, keyed by masked URL."""
+        with self._lock:
+            engines = list(self._engines.values())
+            engines += [async_engine.sync_engine for async_engine in self._async_engines.values()]
+
+        stats = {}
+        for engine in engines:
+            pool = engine.pool
+            entry: dict[str, Any] = {"pool_class": type(pool).__name__, "status": pool.status()}
+            if isinstance(pool, InstrumentedQueuePool):
+                entry.update(
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    overflow=pool.overflow(),
+                    max_overflow=settings.DB_MAX_OVERFLOW,
+                    **pool.metrics.as_dict(),
+                )
+            stats[engine.url.render_as_string(hide_password=True)] = entry
+        return stats
+
+
+engine_registry = EngineRegistry()
+
+
 class DatabaseManager:
     """
     Manages database connections and sessions for the application.
@@ -27,10 +281,11 @@ class DatabaseManager:
         """Initialize the database manager with no engine or session factory."""
         self._engine = None
         self._session_local = None
+        self._async_session_local = None
 
     def get_engine(self, db_url: str | None = None) -> Engine:
         """
-        Creates and returns a SQLAlchemy engine instance.
+        Returns the shared SQLAlchemy engine for a database URL, creating it on first use.
 
         Args:
             db_url: The database URL to connect to. If None, uses DATABASE_URL from settings.
@@ -41,7 +296,7 @@ class DatabaseManager:
         if db_url is None:
             # Use the DATABASE_URL from our Settings instance
             db_url = settings.DATABASE_URL
-        return create_engine(db_url)
+        return engine_registry.get_engine(db_url)
 
     def get_session_local(self, engine=None):
         """
@@ -92,6 +347,50 @@ class DatabaseManager:
             if db is not None:
                 db.close()
 
+    def get_async_engine(self, db_url: str | None = None) -> AsyncEngine:
+        """
+        Returns the shared async engine for a database URL, creating it on first use.
+
+        Args:
+            db_url: The database URL to connect to. If None, uses DATABASE_URL from settings.
+
+        Returns:
+            SQLAlchemy AsyncEngine instance using the backend's async driver.
+        """
+        if db_url is None:
+            db_url = settings.DATABASE_URL
+        return engine_registry.get_async_engine(db_url)
+
+    def get_async_session_local(self, engine: AsyncEngine | None = None) -> async_sessionmaker[AsyncSession]:
+        """
+        Returns an async_sessionmaker, initializing it if it hasn't been already.
+
+        Args:
+            engine: Async engine to bind the sessions to. If None, uses the default async engine.
+
+        Returns:
+            SQLAlchemy async_sessionmaker factory.
+        """
+        if self._async_session_local is None:
+            bind = self.get_async_engine() if engine is None else engine
+            # Objects stay readable after commit; async sessions cannot lazily refresh them
+            self._async_session_local = async_sessionmaker(bind=bind, autoflush=False, expire_on_commit=False)
+        return self._async_session_local
+
+    @asynccontextmanager
+    async def get_async_db_session(self):
+        """
+        Provides an async session for use from the event loop.
+
+        Lazy loading is not available on async sessions: load relationships eagerly, or run
+        existing sync code with ``await session.run_sync(fn, ...)``.
+
+        Yields:
+            SQLAlchemy AsyncSession: A session for database operations.
+        """
+        async with self.get_async_session_local()() as db:
+            yield db
+
 
 # Create a singleton instance for the application to use
 db_manager = DatabaseManager()
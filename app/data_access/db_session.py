@@ -5,7 +5,7 @@ This module provides simplified access to database sessions without
 directly coupling to the DatabaseManager implementation details.
 """
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 from app.data_access.database_manager import db_manager
 
@@ -23,3 +23,17 @@ def get_db_session():
     """
     with db_manager.get_db_session() as session:
         yield session
+
+
+@asynccontextmanager
+async def get_async_db_session():
+    """
+    Provides an async session for router code running on the event loop.
+
+    This is a convenience wrapper around the DatabaseManager.get_async_db_session method.
+
+    Yields:
+        SQLAlchemy AsyncSession: A session for database operations.
+    """
+    async with db_manager.get_async_db_session() as session:
+        yield session
@@ -313,6 +313,8 @@ class GameState(Base):
     is_final: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     home_timeouts_remaining: Mapped[int] = mapped_column(Integer, default=5)
     away_timeouts_remaining: Mapped[int] = mapped_column(Integer, default=5)
+    # Bumped by every write to the game's stats that bypasses the event log
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
@@ -343,11 +345,15 @@ class GameEvent(Base):
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_by: Mapped[int | None] = mapped_column(Integer, nullable=True)  # User ID
+    # ID assigned by the scorekeeping client, so replayed batches are not applied twice
+    client_event_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     game: Mapped[Game] = relationship("Game", back_populates="game_events")
     player: Mapped[Player | None] = relationship("Player", back_populates="game_events")
     team: Mapped[Team | None] = relationship("Team")
 
+    __table_args__ = (UniqueConstraint("game_id", "client_event_id", name="uq_game_event_client_id"),)
+
     def __repr__(self):
         return (
             f"<GameEvent(id={self.id}, game_id={self.game_id}, "
@@ -389,7 +395,7 @@ class PlayerSeasonStats(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     player_id: Mapped[int] = mapped_column(Integer, ForeignKey("players.id"), nullable=False)
-    season: Mapped[str] = mapped_column(String(20), nullable=False)  # e.g., "2024-2025"
+    season: Mapped[str] = mapped_column(String(20), nullable=False)  # Season.code, e.g., "2024-25"
     games_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_fouls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_ftm: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -420,7 +426,7 @@ class TeamSeasonStats(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     team_id: Mapped[int] = mapped_column(Integer, ForeignKey("teams.id"), nullable=False)
-    season: Mapped[str] = mapped_column(String(20), nullable=False)  # e.g., "2024-2025"
+    season: Mapped[str] = mapped_column(String(20), nullable=False)  # Season.code, e.g., "2024-25"
     games_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -447,6 +453,25 @@ class TeamSeasonStats(Base):
         )
 
 
+class GameBoxScore(Base):
+    """Materialized box score for a completed game.
+
+    Written whenever a game's stats change (finalize, scorebook save, data
+    correction) so read endpoints can serve the box score without recomputing it.
+    """
+
+    __tablename__ = "game_box_scores"
+
+    game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id", ondelete="CASCADE"), primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self):
+        return f"<GameBoxScore(game_id={self.game_id}, built_at={self.built_at})>"
+
+
 class Season(Base):
     """Represents a season or league period."""
 
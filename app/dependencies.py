@@ -1,10 +1,11 @@
 """Common dependency injection for the application."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.data_access.db_session import get_db_session
+from app.data_access.db_session import get_async_db_session, get_db_session
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -15,3 +16,13 @@ def get_db() -> Generator[Session, None, None]:
     """
     with get_db_session() as session:
         yield session
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session dependency.
+
+    Yields:
+        Async database session
+    """
+    async with get_async_db_session() as session:
+        yield session
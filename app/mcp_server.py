@@ -9,11 +9,12 @@ from typing import Any
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.data_access.database_manager import db_manager
 
 # Create FastAPI app
 app = FastAPI(title="Basketball Stats MCP", description="MCP Server for Basketball Stats Data")
@@ -21,8 +22,8 @@ app = FastAPI(title="Basketball Stats MCP", description="MCP Server for Basketba
 # Get database URL from settings
 db_url = settings.DATABASE_URL
 
-# Create engine and session factory
-engine = create_engine(db_url)
+# Reuse the application's shared engine and session factory
+engine = db_manager.get_engine(db_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -16,6 +16,7 @@ Each report type offers different insights for coaches, players, and team manage
 from sqlalchemy.orm import Session
 
 from app.data_access.crud import crud_game, crud_player, crud_player_game_stats, crud_player_quarter_stats, crud_team
+from app.repositories.box_score import BoxScoreBundle, load_box_score
 
 
 class ReportGenerator:
@@ -342,44 +343,38 @@ class ReportGenerator:
 
         return quarter_map
 
-    def get_game_box_score_data(self, game_id: int) -> tuple[list, dict]:
+    def get_game_box_score_data(self, game_id: int, bundle: BoxScoreBundle | None = None) -> tuple[list, dict]:
         """
         Generate a box score report for a game.
 
         Args:
             game_id: ID of the game to generate report for.
+            bundle: Pre-loaded box score data for the game. Loaded here when not supplied,
+                so callers that already hold a bundle do not query the game twice.
 
         Returns:
             A tuple containing:
             - List of player stats dictionaries (box score data)
             - Game summary dictionary (team totals, game information)
         """
-        # Fetch game and team data
-        game, playing_team, opponent_team = self._fetch_game_and_teams(game_id)
-        if not game:
+        if bundle is None:
+            bundle = load_box_score(self.db_session, game_id)
+        if bundle is None:
             raise ValueError(f"Game not found with id: {game_id}")
-        if not playing_team or not opponent_team:
-            raise ValueError(f"Teams not found for game with id: {game_id}")
 
-        # Fetch all player game stats for this game
-        player_game_stats = crud_player_game_stats.get_player_game_stats_by_game(self.db_session, game_id)
+        playing_team = bundle.playing_team
+        opponent_team = bundle.opponent_team
 
         player_stats_list = []
         team_totals = self._initialize_team_totals()
 
-        for pgs in player_game_stats:
-            # Get the player
-            player = crud_player.get_player_by_id(self.db_session, pgs.player_id)
-            if not player:
-                continue
-
-            # Get all quarter stats for this player in this game
-            quarter_stats = crud_player_quarter_stats.get_player_quarter_stats(self.db_session, pgs.id)
+        for line in bundle.lines:
+            player = line.player
 
             # Calculate player box score
-            quarter_stats = self._handle_missing_quarter_data(quarter_stats)
+            quarter_stats = self._handle_missing_quarter_data(line.quarter_stats)
             player_box_score, total_fgm, total_fga = self._calculate_player_box_score(
-                player, pgs, quarter_stats, playing_team, opponent_team
+                player, line, quarter_stats, playing_team, opponent_team
             )
 
             # Add player to report list
@@ -394,7 +389,7 @@ class ReportGenerator:
         self._calculate_team_percentages(team_totals)
 
         # Create game summary
-        game_summary = self._create_game_summary(game, playing_team, opponent_team, team_totals)
+        game_summary = self._create_game_summary(bundle, playing_team, opponent_team, team_totals)
 
         # Sort players by points (descending) for better display
         player_stats_list.sort(key=lambda x: x["points"], reverse=True)  # type: ignore
@@ -1,7 +1,25 @@
 """Repository layer for database operations."""
 
+from .box_score import BoxScoreBundle, PlayerInfo, PlayerLine, QuarterLine, TeamInfo, load_box_score
 from .game_repository import GameRepository
+from .player_profile import PlayerProfile, QuarterSplit, RecentGame, SeasonSplit, StatTotals, load_player_profile
 from .player_repository import PlayerRepository
 from .team_repository import TeamRepository
 
-__all__ = ["GameRepository", "PlayerRepository", "TeamRepository"]
+__all__ = [
+    "BoxScoreBundle",
+    "GameRepository",
+    "PlayerInfo",
+    "PlayerLine",
+    "PlayerProfile",
+    "PlayerRepository",
+    "QuarterLine",
+    "QuarterSplit",
+    "RecentGame",
+    "SeasonSplit",
+    "StatTotals",
+    "TeamInfo",
+    "TeamRepository",
+    "load_box_score",
+    "load_player_profile",
+]
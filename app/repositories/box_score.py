@@ -0,0 +1,197 @@
+"""Single-pass loader for everything a box score needs.
+
+The box score API, the box score report and the scorebook editor all need the
+same data: the game, both teams, every player line and every quarter line.
+``load_box_score`` fetches it in a fixed number of queries (the game with both
+teams joined, then the player lines with their players joined and their quarter
+lines selectin-loaded) and returns immutable snapshots that the callers share
+instead of issuing their own per-player lookups.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.data_access.models import Game, PlayerGameStats
+
+
+@dataclass(frozen=True, slots=True)
+class TeamInfo:
+    """Team fields used when rendering a box score."""
+
+    id: int
+    name: str
+    display_name: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerInfo:
+    """Player fields used when rendering a box score."""
+
+    id: int
+    name: str
+    jersey_number: str
+    position: str | None
+    team_id: int
+    thumbnail_image: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class QuarterLine:
+    """One player's shooting line for a single quarter."""
+
+    quarter_number: int
+    ftm: int
+    fta: int
+    fg2m: int
+    fg2a: int
+    fg3m: int
+    fg3a: int
+
+    @property
+    def points(self) -> int:
+        """Points scored in the quarter."""
+        return self.ftm + self.fg2m * 2 + self.fg3m * 3
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerLine:
+    """One player's game line with its quarter breakdown.
+
+    Attribute names mirror ``PlayerGameStats`` so the line can be passed to code
+    written against the ORM model.
+    """
+
+    id: int
+    player_id: int
+    player: PlayerInfo
+    fouls: int
+    total_ftm: int
+    total_fta: int
+    total_2pm: int
+    total_2pa: int
+    total_3pm: int
+    total_3pa: int
+    quarter_stats: tuple[QuarterLine, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class BoxScoreBundle:
+    """Immutable snapshot of a game and all of its stat lines.
+
+    Attribute names mirror ``Game`` so the bundle can stand in for the game
+    wherever only its scalar fields are read.
+    """
+
+    id: int
+    date: dt.date
+    playing_team_id: int
+    opponent_team_id: int
+    location: str | None
+    notes: str | None
+    is_playoff_game: bool
+    playing_team: TeamInfo
+    opponent_team: TeamInfo
+    lines: tuple[PlayerLine, ...]
+
+    @property
+    def max_quarter(self) -> int:
+        """Highest quarter number recorded for any player (0 when none)."""
+        return max((qs.quarter_number for line in self.lines for qs in line.quarter_stats), default=0)
+
+    def quarter_points(self, team_id: int) -> dict[int, int]:
+        """Points per quarter for players on ``team_id``."""
+        totals: dict[int, int] = {}
+        for line in self.lines:
+            if line.player.team_id != team_id:
+                continue
+            for qs in line.quarter_stats:
+                totals[qs.quarter_number] = totals.get(qs.quarter_number, 0) + qs.points
+        return totals
+
+
+def _team_info(team) -> TeamInfo:
+    return TeamInfo(id=team.id, name=team.name, display_name=team.display_name)
+
+
+def _player_line(pgs: PlayerGameStats) -> PlayerLine:
+    player = pgs.player
+    return PlayerLine(
+        id=pgs.id,
+        player_id=pgs.player_id,
+        player=PlayerInfo(
+            id=player.id,
+            name=player.name,
+            jersey_number=player.jersey_number,
+            position=player.position,
+            team_id=player.team_id,
+            thumbnail_image=player.thumbnail_image,
+        ),
+        fouls=pgs.fouls or 0,
+        total_ftm=pgs.total_ftm or 0,
+        total_fta=pgs.total_fta or 0,
+        total_2pm=pgs.total_2pm or 0,
+        total_2pa=pgs.total_2pa or 0,
+        total_3pm=pgs.total_3pm or 0,
+        total_3pa=pgs.total_3pa or 0,
+        quarter_stats=tuple(
+            QuarterLine(
+                quarter_number=qs.quarter_number,
+                ftm=qs.ftm or 0,
+                fta=qs.fta or 0,
+                fg2m=qs.fg2m or 0,
+                fg2a=qs.fg2a or 0,
+                fg3m=qs.fg3m or 0,
+                fg3a=qs.fg3a or 0,
+            )
+            for qs in sorted(pgs.quarter_stats, key=lambda qs: qs.quarter_number)
+        ),
+    )
+
+
+def load_box_score(session: Session, game_id: int, include_deleted: bool = True) -> BoxScoreBundle | None:
+    """Load a game with its teams, player lines and quarter lines.
+
+    Args:
+        session: The database session
+        game_id: ID of the game to load
+        include_deleted: Whether a soft-deleted game should still be returned
+
+    Returns:
+        The box score bundle, or None if the game does not exist
+    """
+    game_query = (
+        select(Game).options(joinedload(Game.playing_team), joinedload(Game.opponent_team)).where(Game.id == game_id)
+    )
+    if not include_deleted:
+        game_query = game_query.where(Game.is_deleted.is_not(True))
+
+    # populate_existing so objects already in the session reflect rows written earlier in the same transaction
+    game = session.scalars(game_query.execution_options(populate_existing=True)).first()
+    if game is None or game.playing_team is None or game.opponent_team is None:
+        return None
+
+    stats = session.scalars(
+        select(PlayerGameStats)
+        .options(joinedload(PlayerGameStats.player), selectinload(PlayerGameStats.quarter_stats))
+        .where(PlayerGameStats.game_id == game_id)
+        .order_by(PlayerGameStats.id)
+        .execution_options(populate_existing=True)
+    ).all()
+
+    return BoxScoreBundle(
+        id=game.id,
+        date=game.date,
+        playing_team_id=game.playing_team_id,
+        opponent_team_id=game.opponent_team_id,
+        location=game.location,
+        notes=game.notes,
+        is_playoff_game=bool(game.is_playoff_game),
+        playing_team=_team_info(game.playing_team),
+        opponent_team=_team_info(game.opponent_team),
+        lines=tuple(_player_line(pgs) for pgs in stats if pgs.player is not None),
+    )
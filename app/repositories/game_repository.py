@@ -2,9 +2,10 @@
 
 from datetime import date
 
+from sqlalchemy import func, literal
 from sqlalchemy.orm import Session
 
-from app.data_access.models import Game
+from app.data_access.models import Game, Player, PlayerGameStats, ScheduledGame, ScheduledGameStatus
 
 from .base import BaseRepository
 
@@ -74,3 +75,78 @@ class GameRepository(BaseRepository[Game]):
             List of recent games
         """
         return self.session.query(Game).order_by(Game.date.desc()).limit(limit).all()
+
+    def get_listing_page(self, limit: int = 20, offset: int = 0, team_id: int | None = None) -> list:
+        """Get one page of the combined completed + scheduled game listing.
+
+        Completed games and still-scheduled games are merged with a UNION ALL so that
+        ordering (newest first), team filtering and limit/offset all run in SQL.
+        Within the same date, completed games come before scheduled ones.
+
+        Args:
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+            team_id: Optional team ID filter (home or away)
+
+        Returns:
+            Rows with id, date, home_team_id, away_team_id and is_scheduled
+        """
+        completed = self.session.query(
+            Game.id.label("id"),
+            Game.date.label("date"),
+            Game.playing_team_id.label("home_team_id"),
+            Game.opponent_team_id.label("away_team_id"),
+            literal(0).label("is_scheduled"),
+        )
+        scheduled = self.session.query(
+            ScheduledGame.id.label("id"),
+            ScheduledGame.scheduled_date.label("date"),
+            ScheduledGame.home_team_id.label("home_team_id"),
+            ScheduledGame.away_team_id.label("away_team_id"),
+            literal(1).label("is_scheduled"),
+        ).filter(
+            ScheduledGame.status == ScheduledGameStatus.SCHEDULED,
+            ScheduledGame.is_deleted.is_not(True),
+        )
+
+        if team_id is not None:
+            completed = completed.filter((Game.playing_team_id == team_id) | (Game.opponent_team_id == team_id))
+            scheduled = scheduled.filter(
+                (ScheduledGame.home_team_id == team_id) | (ScheduledGame.away_team_id == team_id)
+            )
+
+        listing = completed.union_all(scheduled).subquery()
+        return (
+            self.session.query(listing)
+            .order_by(listing.c.date.desc(), listing.c.is_scheduled, listing.c.id)
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+    def get_team_points_by_game(self, game_ids: list[int]) -> dict[tuple[int, int], int]:
+        """Get points scored per team for a set of games in one aggregate query.
+
+        Args:
+            game_ids: IDs of the games to score
+
+        Returns:
+            Dictionary mapping (game_id, team_id) to total points
+        """
+        if not game_ids:
+            return {}
+
+        rows = (
+            self.session.query(
+                PlayerGameStats.game_id,
+                Player.team_id,
+                func.sum(
+                    PlayerGameStats.total_ftm + (PlayerGameStats.total_2pm * 2) + (PlayerGameStats.total_3pm * 3)
+                ).label("points"),
+            )
+            .join(Player, PlayerGameStats.player_id == Player.id)
+            .filter(PlayerGameStats.game_id.in_(game_ids))
+            .group_by(PlayerGameStats.game_id, Player.team_id)
+            .all()
+        )
+        return {(row.game_id, row.team_id): int(row.points or 0) for row in rows}
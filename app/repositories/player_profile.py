@@ -0,0 +1,229 @@
+"""Fixed-cost loader for a player's stats profile.
+
+The player stats page shows career totals, a split per season, the most recent
+games with both teams' scores and a per-quarter breakdown. ``load_player_profile``
+computes all of it with a fixed set of aggregate queries (season splits, the
+active season, the recent lines, the team scores of those games and the quarter
+splits), so the cost of a request does not grow with the number of games played.
+Career totals are the sum of the season splits.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session, aliased
+
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Season, Team
+
+TOTAL_FIELDS = ("fouls", "total_ftm", "total_fta", "total_2pm", "total_2pa", "total_3pm", "total_3pa")
+
+QUARTER_FIELDS = ("ftm", "fta", "fg2m", "fg2a", "fg3m", "fg3a")
+
+
+@dataclass(frozen=True, slots=True)
+class StatTotals:
+    """Summed stat lines over some set of games.
+
+    Attribute names mirror ``PlayerGameStats``.
+    """
+
+    games_played: int = 0
+    fouls: int = 0
+    total_ftm: int = 0
+    total_fta: int = 0
+    total_2pm: int = 0
+    total_2pa: int = 0
+    total_3pm: int = 0
+    total_3pa: int = 0
+
+    @property
+    def points(self) -> int:
+        """Points scored over the games."""
+        return self.total_ftm + self.total_2pm * 2 + self.total_3pm * 3
+
+    def __add__(self, other: StatTotals) -> StatTotals:
+        return StatTotals(
+            games_played=self.games_played + other.games_played,
+            **{field: getattr(self, field) + getattr(other, field) for field in TOTAL_FIELDS},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonSplit:
+    """A player's totals for one season (``season_id`` is None for games without a season)."""
+
+    season_id: int | None
+    season_code: str | None
+    season_name: str | None
+    totals: StatTotals
+
+
+@dataclass(frozen=True, slots=True)
+class RecentGame:
+    """One of a player's recent game lines with the scores of their team and its opponent."""
+
+    game_id: int
+    date: dt.date
+    opponent_name: str | None
+    team_score: int
+    opponent_score: int
+    line: StatTotals
+
+
+@dataclass(frozen=True, slots=True)
+class QuarterSplit:
+    """A player's totals for one quarter number across every game with a line for it."""
+
+    quarter_number: int
+    games: int
+    ftm: int
+    fta: int
+    fg2m: int
+    fg2a: int
+    fg3m: int
+    fg3a: int
+
+    @property
+    def points(self) -> int:
+        """Points scored in the quarter over all games."""
+        return self.ftm + self.fg2m * 2 + self.fg3m * 3
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerProfile:
+    """Immutable snapshot of a player's aggregated stats."""
+
+    player_id: int
+    seasons: tuple[SeasonSplit, ...]
+    active_season_id: int | None
+    recent_games: tuple[RecentGame, ...]
+    quarters: tuple[QuarterSplit, ...]
+
+    @property
+    def career(self) -> StatTotals:
+        """Totals over every game the player has a line in."""
+        return sum((split.totals for split in self.seasons), StatTotals())
+
+    @property
+    def current_season(self) -> SeasonSplit | None:
+        """The split for the active season, or for the player's latest season when no season is active.
+
+        None when the player has no games in the active season.
+        """
+        if self.active_season_id is not None:
+            return next((split for split in self.seasons if split.season_id == self.active_season_id), None)
+        return next((split for split in self.seasons if split.season_id is not None), None)
+
+
+def _totals(row, games_played: int) -> StatTotals:
+    return StatTotals(games_played=games_played, **{field: getattr(row, field) or 0 for field in TOTAL_FIELDS})
+
+
+def load_player_profile(session: Session, player_id: int, team_id: int, recent_limit: int = 10) -> PlayerProfile:
+    """Load a player's career, season, recent game and quarter stats.
+
+    Args:
+        session: The database session
+        player_id: ID of the player
+        team_id: The player's team, whose score is reported as the team score of recent games
+        recent_limit: Number of recent games to include
+
+    Returns:
+        The player's profile; players without games get empty splits
+    """
+    sums = [func.sum(getattr(PlayerGameStats, field)).label(field) for field in TOTAL_FIELDS]
+
+    season_rows = session.execute(
+        select(Season.id, Season.code, Season.name, func.count(PlayerGameStats.id).label("games_played"), *sums)
+        .select_from(PlayerGameStats)
+        .join(Game, PlayerGameStats.game_id == Game.id)
+        .outerjoin(Season, Game.season_id == Season.id)
+        .where(PlayerGameStats.player_id == player_id)
+        .group_by(Season.id, Season.code, Season.name, Season.start_date)
+        # Latest season first; games without a season last
+        .order_by(Season.start_date.is_(None), Season.start_date.desc())
+    ).all()
+    seasons = tuple(
+        SeasonSplit(season_id=row.id, season_code=row.code, season_name=row.name, totals=_totals(row, row.games_played))
+        for row in season_rows
+    )
+
+    active_season_id = session.scalar(select(Season.id).where(Season.is_active).limit(1))
+
+    opponent = aliased(Team)
+    recent_rows = session.execute(
+        select(
+            Game.id.label("game_id"),
+            Game.date,
+            Game.playing_team_id,
+            Game.opponent_team_id,
+            opponent.name.label("opponent_name"),
+            *(getattr(PlayerGameStats, field) for field in TOTAL_FIELDS),
+        )
+        .select_from(PlayerGameStats)
+        .join(Game, PlayerGameStats.game_id == Game.id)
+        # The opponent is whichever side of the game is not the player's team
+        .outerjoin(
+            opponent,
+            opponent.id == case((Game.playing_team_id == team_id, Game.opponent_team_id), else_=Game.playing_team_id),
+        )
+        .where(PlayerGameStats.player_id == player_id)
+        .order_by(Game.date.desc(), Game.id.desc())
+        .limit(recent_limit)
+    ).all()
+
+    team_points: dict[tuple[int, int], int] = {}
+    if recent_rows:
+        points = PlayerGameStats.total_ftm + PlayerGameStats.total_2pm * 2 + PlayerGameStats.total_3pm * 3
+        for game_id, points_team_id, total in session.execute(
+            select(PlayerGameStats.game_id, Player.team_id, func.sum(points))
+            .join(Player, PlayerGameStats.player_id == Player.id)
+            .where(PlayerGameStats.game_id.in_([row.game_id for row in recent_rows]))
+            .group_by(PlayerGameStats.game_id, Player.team_id)
+        ):
+            team_points[(game_id, points_team_id)] = total or 0
+
+    recent_games = []
+    for row in recent_rows:
+        opponent_team_id = row.opponent_team_id if row.playing_team_id == team_id else row.playing_team_id
+        recent_games.append(
+            RecentGame(
+                game_id=row.game_id,
+                date=row.date,
+                opponent_name=row.opponent_name,
+                team_score=team_points.get((row.game_id, team_id), 0),
+                opponent_score=team_points.get((row.game_id, opponent_team_id), 0),
+                line=_totals(row, 1),
+            )
+        )
+
+    quarter_rows = session.execute(
+        select(
+            PlayerQuarterStats.quarter_number,
+            func.count(PlayerQuarterStats.id).label("games"),
+            *(func.sum(getattr(PlayerQuarterStats, field)).label(field) for field in QUARTER_FIELDS),
+        )
+        .join(PlayerGameStats, PlayerQuarterStats.player_game_stat_id == PlayerGameStats.id)
+        .where(PlayerGameStats.player_id == player_id)
+        .group_by(PlayerQuarterStats.quarter_number)
+        .order_by(PlayerQuarterStats.quarter_number)
+    ).all()
+    quarters = tuple(
+        QuarterSplit(
+            quarter_number=row.quarter_number,
+            games=row.games,
+            **{field: getattr(row, field) or 0 for field in QUARTER_FIELDS},
+        )
+        for row in quarter_rows
+    )
+
+    return PlayerProfile(
+        player_id=player_id,
+        seasons=seasons,
+        active_season_id=active_season_id,
+        recent_games=tuple(recent_games),
+        quarters=quarters,
+    )
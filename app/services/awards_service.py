@@ -118,12 +118,11 @@ def calculate_player_of_the_week(
         for week_start, weekly_games in weeks.items():
             logger.info(f"  🗓️  Processing week {week_start} with {len(weekly_games)} games")
             # Calculate winner(s) for this week (safe function handles existing awards)
-            _ = _calculate_week_winners(session, weekly_games, week_start, season_key, recalculate)
+            winners = _calculate_week_winners(session, weekly_games, week_start, season_key, recalculate)
 
-            # Count awards (both new and existing)
-            week_awards = get_awards_by_week(session, "player_of_the_week", week_start, season_key)
-            awards_given[season_key] += len(week_awards)
-            logger.info(f"    ✅ Week {week_start} completed, {len(week_awards)} awards")
+            # Every winner maps to exactly one award record (new or existing), so no re-query is needed
+            awards_given[season_key] += len(winners)
+            logger.info(f"    ✅ Week {week_start} completed, {len(winners)} awards")
 
     session.commit()
     logger.info(f"POTW calculation completed. Awards given by season: {dict(awards_given)}")
@@ -263,44 +262,12 @@ def calculate_all_weekly_awards(
     Returns:
         Dict with award_type -> season -> awards_given count
     """
-    logger.info(f"🏆 Starting calculation of ALL weekly awards for season: {season}, recalculate: {recalculate}")
-    results = {}
-
-    logger.info("📊 Calculating Player of the Week...")
-    results["player_of_the_week"] = calculate_player_of_the_week(session, season, recalculate)
-
-    logger.info("🔥 Calculating Quarterly Firepower...")
-    results["quarterly_firepower"] = calculate_quarterly_firepower(session, season, recalculate)
-
-    logger.info("🎯 Calculating Weekly FT King...")
-    results["weekly_ft_king"] = calculate_weekly_ft_king(session, season, recalculate)
-
-    logger.info("🏀 Calculating Hot Hand Weekly...")
-    results["hot_hand_weekly"] = calculate_hot_hand_weekly(session, season, recalculate)
-
-    logger.info("⏰ Calculating Clutch-man...")
-    results["clutch_man"] = calculate_clutch_man(session, season, recalculate)
-
-    logger.info("🎪 Calculating Trigger Finger...")
-    results["trigger_finger"] = calculate_trigger_finger(session, season, recalculate)
-
-    logger.info("😅 Calculating Weekly Whiffer...")
-    results["weekly_whiffer"] = calculate_weekly_whiffer(session, season, recalculate)
-
-    logger.info("🚀 Calculating Human Howitzer...")
-    results["human_howitzer"] = calculate_human_howitzer(session, season, recalculate)
-
-    logger.info("🎖️ Calculating Dub Club...")
-    results["dub_club"] = calculate_dub_club(session, season, recalculate)
-
-    logger.info("🎯 Calculating Marksman Award...")
-    results["marksman_award"] = calculate_marksman_award(session, season, recalculate)
+    from app.services.weekly_awards_engine import run_weekly_awards
 
-    logger.info("💯 Calculating Perfect Performance...")
-    results["perfect_performance"] = calculate_perfect_performance(session, season, recalculate)
+    logger.info(f"🏆 Starting calculation of ALL weekly awards for season: {season}, recalculate: {recalculate}")
 
-    logger.info("⬆️ Calculating Breakout Performance...")
-    results["breakout_performance"] = calculate_breakout_performance(session, season, recalculate)
+    # Single scan of the season's stats, evaluated for every weekly award at once
+    results = run_weekly_awards(session, season, recalculate, list(WEEKLY_AWARD_TYPES))
 
     logger.info("✅ ALL weekly awards calculation completed!")
     return results
@@ -380,51 +347,12 @@ def calculate_all_season_awards(
     Returns:
         Dict with award_type -> season -> awards_given count
     """
-    logger.info(f"🏆 Starting calculation of ALL season awards for season: {season}, recalculate: {recalculate}")
-    results = {}
-
-    logger.info("⭐ Calculating The Rick Barry Award...")
-    results["rick_barry_award"] = calculate_rick_barry_award(session, season, recalculate)
-
-    logger.info("🏆 Calculating Top Scorer...")
-    top_scorer_count = calculate_top_scorer(session, season, recalculate)
-    results["top_scorer"] = {season: top_scorer_count} if season else {}
-
-    logger.info("🎯 Calculating Sharpshooter...")
-    sharpshooter_count = calculate_sharpshooter(session, season, recalculate)
-    results["sharpshooter"] = {season: sharpshooter_count} if season else {}
-
-    logger.info("💪 Calculating Efficiency Expert...")
-    efficiency_count = calculate_efficiency_expert(session, season, recalculate)
-    results["efficiency_expert"] = {season: efficiency_count} if season else {}
+    from app.services.season_awards_engine import run_season_awards
 
-    logger.info("🎪 Calculating Human Highlight Reel...")
-    highlight_count = calculate_human_highlight_reel(session, season, recalculate)
-    results["human_highlight_reel"] = {season: highlight_count} if season else {}
-
-    logger.info("🎯 Calculating Charity Stripe Regular...")
-    charity_count = calculate_charity_stripe_regular(session, season, recalculate)
-    results["charity_stripe_regular"] = {season: charity_count} if season else {}
-
-    logger.info("🛡️ Calculating Defensive Tackle...")
-    defensive_count = calculate_defensive_tackle(session, season, recalculate)
-    results["defensive_tackle"] = {season: defensive_count} if season else {}
-
-    logger.info("🎨 Calculating Air Ball Artist...")
-    airball_count = calculate_air_ball_artist(session, season, recalculate)
-    results["air_ball_artist"] = {season: airball_count} if season else {}
-
-    logger.info("✈️ Calculating Air Assault...")
-    assault_count = calculate_air_assault(session, season, recalculate)
-    results["air_assault"] = {season: assault_count} if season else {}
-
-    logger.info("🏹 Calculating Curry Wannabe...")
-    curry_count = calculate_curry_wannabe_award(session, season, recalculate)
-    results["curry_wannabe"] = {season: curry_count} if season else {}
+    logger.info(f"🏆 Starting calculation of ALL season awards for season: {season}, recalculate: {recalculate}")
 
-    logger.info("🚫 Calculating Hack-a-Shaq...")
-    hack_count = calculate_hack_a_shaq_award(session, season, recalculate)
-    results["hack_a_shaq"] = {season: hack_count} if season else {}
+    # One shared per-player aggregate, evaluated for every season award at once
+    results = run_season_awards(session, season, recalculate, SEASON_AWARD_TYPES)
 
     logger.info("✅ ALL season awards calculation completed!")
     return results
@@ -0,0 +1,218 @@
+"""Service layer for materialized box scores.
+
+Box scores for completed games only change when their stats are edited, so the
+computed player lines, team totals and quarter scores are stored per game in
+``game_box_scores`` and refreshed by the write paths (finalize, scorebook save
+and anything wrapped in ``SeasonStatsService.track_game_changes``). Names, jersey
+numbers and portraits are not stored; they are read fresh on every request so
+renames never leave a stale box score behind.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.data_access.models import Game, GameBoxScore, GameState, Player
+from app.reports.report_generator import ReportGenerator
+from app.repositories.box_score import load_box_score
+from app.utils import stats_calculator
+
+
+def _quarter_label(quarter: int) -> str:
+    return f"Q{quarter}" if quarter <= 4 else f"OT{quarter - 4}"
+
+
+class BoxScoreService:
+    """Builds, stores and serves materialized box scores."""
+
+    def __init__(self, db_session: Session):
+        """Initialize the box score service.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def compute(self, game_id: int) -> dict[str, Any] | None:
+        """Compute a game's box score payload from its stat lines.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            The payload, or None if the game does not exist
+        """
+        bundle = load_box_score(self.db_session, game_id)
+        if bundle is None:
+            return None
+
+        report_gen = ReportGenerator(self.db_session, stats_calculator)
+        player_stats, game_summary = report_gen.get_game_box_score_data(game_id, bundle=bundle)
+
+        team_by_player = {line.player_id: line.player.team_id for line in bundle.lines}
+        for p in player_stats:
+            p["team_id"] = team_by_player.get(p.get("player_id"))
+
+        quarter_scores = {}
+        for side, team_id in (("home", bundle.playing_team_id), ("away", bundle.opponent_team_id)):
+            points = bundle.quarter_points(team_id)
+            quarter_scores[side] = [
+                {"quarter": q, "label": _quarter_label(q), "score": points.get(q, 0)}
+                for q in range(1, bundle.max_quarter + 1)
+            ]
+
+        return {
+            "game_id": bundle.id,
+            "playing_team_id": bundle.playing_team_id,
+            "opponent_team_id": bundle.opponent_team_id,
+            "player_stats": player_stats,
+            "game_summary": game_summary,
+            "quarter_scores": quarter_scores,
+        }
+
+    def refresh(self, *game_ids: int) -> int:
+        """Recompute and store the box scores of the given games.
+
+        Games that are still being tracked live are dropped from the table instead,
+        since every event would otherwise rewrite them. Runs inside the caller's
+        transaction; the caller commits.
+
+        Args:
+            game_ids: IDs of the games whose stats changed
+
+        Returns:
+            Number of box scores written
+        """
+        if not game_ids:
+            return 0
+
+        self.db_session.flush()
+        live_ids = {
+            game_id
+            for (game_id,) in self.db_session.query(GameState.game_id).filter(
+                GameState.game_id.in_(game_ids), GameState.is_final.is_not(True)
+            )
+        }
+        stored = {
+            row.game_id: row
+            for row in self.db_session.query(GameBoxScore).filter(GameBoxScore.game_id.in_(game_ids)).all()
+        }
+
+        written = 0
+        for game_id in dict.fromkeys(game_ids):
+            payload = None if game_id in live_ids else self.compute(game_id)
+            row = stored.get(game_id)
+            if payload is None:
+                if row is not None:
+                    self.db_session.delete(row)
+            elif row is None:
+                self.db_session.add(GameBoxScore(game_id=game_id, payload=payload))
+                written += 1
+            else:
+                row.payload = payload
+                written += 1
+        return written
+
+    def get(self, game_id: int) -> dict[str, Any] | None:
+        """Get a game's box score, preferring the stored copy.
+
+        Falls back to computing it (without storing) for live games and games that
+        have not been backfilled. Current player and team names are overlaid on the
+        stored stats.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Box score payload with game_date, playing_team_name and opponent_team_name
+            added, or None if the game does not exist
+        """
+        game = (
+            self.db_session.query(Game)
+            .options(joinedload(Game.playing_team), joinedload(Game.opponent_team))
+            .filter(Game.id == game_id)
+            .first()
+        )
+        if game is None:
+            return None
+
+        row = self.db_session.get(GameBoxScore, game_id)
+        payload = row.payload if row is not None else self.compute(game_id)
+        if payload is None:
+            return None
+
+        return self._with_current_names(game, payload)
+
+    def rebuild(
+        self, game_ids: list[int] | None = None, progress_callback: Callable[[int, int], None] | None = None
+    ) -> dict[str, float]:
+        """Rebuild stored box scores for a backfill, committing once at the end.
+
+        Args:
+            game_ids: Games to rebuild (if None, rebuilds every game)
+            progress_callback: Optional callable receiving (games_done, games_total)
+
+        Returns:
+            Summary with games, written, stored (rows in the table afterwards) and elapsed seconds
+        """
+        started = time.perf_counter()
+        if game_ids is None:
+            game_ids = [game_id for (game_id,) in self.db_session.query(Game.id).order_by(Game.id)]
+
+        written = 0
+        try:
+            for done, game_id in enumerate(game_ids, start=1):
+                written += self.refresh(game_id)
+                if progress_callback:
+                    progress_callback(done, len(game_ids))
+            self.db_session.flush()
+            stored = self.db_session.query(GameBoxScore).count()
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+
+        return {
+            "games": len(game_ids),
+            "written": written,
+            "stored": stored,
+            "elapsed": time.perf_counter() - started,
+        }
+
+    def _with_current_names(self, game: Game, payload: dict[str, Any]) -> dict[str, Any]:
+        """Copy a payload and fill in current player and team names."""
+        team_names = {
+            team.id: team.display_name or team.name for team in (game.playing_team, game.opponent_team) if team
+        }
+        player_ids = {p["player_id"] for p in payload["player_stats"] if p.get("player_id")}
+        players = {
+            player.id: player for player in self.db_session.query(Player).filter(Player.id.in_(player_ids)).all()
+        }
+
+        player_stats = []
+        for stored in payload["player_stats"]:
+            p = dict(stored)
+            player = players.get(p.get("player_id"))
+            if player is not None:
+                p["name"] = player.name
+                p["jersey"] = player.jersey_number
+                p["position"] = player.position
+                p["thumbnail_image"] = player.thumbnail_image
+            p["team"] = team_names.get(p.get("team_id"), "Unknown Team")
+            player_stats.append(p)
+
+        game_summary = dict(payload["game_summary"])
+        game_summary["date"] = game.date.strftime("%Y-%m-%d")
+        game_summary["playing_team"] = team_names.get(game.playing_team_id, "")
+        game_summary["opponent_team"] = team_names.get(game.opponent_team_id, "")
+
+        return {
+            **payload,
+            "game_date": str(game.date),
+            "playing_team_name": game_summary["playing_team"],
+            "opponent_team_name": game_summary["opponent_team"],
+            "player_stats": player_stats,
+            "game_summary": game_summary,
+        }
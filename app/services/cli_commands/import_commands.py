@@ -18,12 +18,13 @@ class ImportCommands:
         return import_roster_from_csv(file, dry_run)
 
     @staticmethod
-    def import_game_stats(file: str, dry_run: bool = False):
+    def import_game_stats(file: str, dry_run: bool = False, stream: bool = False):
         """
         Import game statistics from a CSV file.
 
         Args:
             file: Path to the CSV file containing the game statistics
             dry_run: Preview what would be imported without making changes
+            stream: Parse rows lazily and write stats with bulk inserts
         """
-        return import_game_stats_from_csv(file, dry_run)
+        return import_game_stats_from_csv(file, dry_run, stream)
@@ -3,6 +3,8 @@
 import typer
 
 from app.data_access.database_manager import db_manager
+from app.services.box_score_service import BoxScoreService
+from app.services.game_replay_service import GameReplayService
 from app.services.season_stats_service import SeasonStatsService
 
 
@@ -10,22 +12,154 @@ class StatsCommands:
     """Handles statistics-related CLI commands."""
 
     @staticmethod
-    def update_season_stats(season: str | None = None) -> None:
+    def update_season_stats(season: str | None = None, batch_size: int = 500) -> None:
         """
         Update season statistics for all players and teams.
-        This command recalculates all season statistics based on game data.
+        This command rebuilds all season statistics from game data in one transaction.
 
         Args:
-            season: Season to update (e.g., '2024-2025'). If not specified, updates current season.
+            season: Season code to update (e.g., '2024-25'). If not specified, rebuilds every season.
+            batch_size: Number of rows written per batch
         """
-        typer.echo(f"Updating season statistics{f' for {season}' if season else ' for current season'}...")
+        typer.echo(f"Updating season statistics{f' for {season}' if season else ' for all seasons'}...")
+
+        def report_progress(done: int, total: int) -> None:
+            typer.echo(f"  {done}/{total} rows written ({done * 100 // total if total else 100}%)")
 
         with db_manager.get_db_session() as db_session:
             try:
                 season_service = SeasonStatsService(db_session)
-                season_service.update_all_season_stats(season)
+                summary = season_service.rebuild_season_stats(
+                    season, batch_size=batch_size, progress_callback=report_progress
+                )
+                typer.echo(
+                    f"Rebuilt {summary['players']} player and {summary['teams']} team season rows "
+                    f"({summary['inserted']} inserted, {summary['updated']} updated, {summary['deleted']} removed) "
+                    f"in {summary['elapsed']:.2f}s ({summary['rows_per_second']:.0f} rows/sec)"
+                )
                 typer.echo("Season statistics updated successfully!")
 
             except Exception as e:  # pylint: disable=broad-except
                 typer.echo(f"Error updating season statistics: {e}")
                 typer.echo("Please check that the database has been initialized and contains game data.")
+
+    @staticmethod
+    def verify_season_stats(season: str | None = None, show_limit: int = 20) -> bool:
+        """
+        Compare the stored season statistics against a full rebuild from game data.
+
+        Args:
+            season: Season code to verify (e.g., '2024-25'). If not specified, verifies all seasons.
+            show_limit: Maximum number of mismatched rows to print per table
+
+        Returns:
+            True if the stored tables match the rebuild, False otherwise
+        """
+        typer.echo(f"Verifying season statistics{f' for {season}' if season else ' for all seasons'}...")
+
+        with db_manager.get_db_session() as db_session:
+            season_service = SeasonStatsService(db_session)
+            mismatches = season_service.verify_season_stats(season)
+
+        total = 0
+        for table, owner_column in (("players", "player_id"), ("teams", "team_id")):
+            rows = mismatches[table]
+            total += len(rows)
+            typer.echo(f"{table.capitalize()}: {len(rows)} mismatched row(s)")
+            for row in rows[:show_limit]:
+                typer.echo(
+                    f"  {owner_column}={row[owner_column]} season={row['season']} "
+                    f"stored={row['stored']} expected={row['expected']}"
+                )
+            if len(rows) > show_limit:
+                typer.echo(f"  ... and {len(rows) - show_limit} more")
+
+        if total:
+            typer.echo("Season statistics are out of sync. Run 'update-season-stats' to rebuild them.")
+            return False
+
+        typer.echo("Season statistics match a full rebuild.")
+        return True
+
+    @staticmethod
+    def rebuild_box_scores(game_ids: list[int] | None = None) -> None:
+        """
+        Rebuild the stored box scores from game data in one transaction.
+
+        Args:
+            game_ids: Games to rebuild. If not specified, rebuilds every game.
+        """
+        target = f"{len(game_ids)} game(s)" if game_ids else "all games"
+        typer.echo(f"Rebuilding box scores for {target}...")
+
+        def report_progress(done: int, total: int) -> None:
+            if done == total or done % 100 == 0:
+                typer.echo(f"  {done}/{total} games processed")
+
+        with db_manager.get_db_session() as db_session:
+            try:
+                summary = BoxScoreService(db_session).rebuild(game_ids or None, progress_callback=report_progress)
+                typer.echo(
+                    f"Wrote {summary['written']} box score(s) for {summary['games']} game(s) "
+                    f"in {summary['elapsed']:.2f}s; {summary['stored']} stored in total"
+                )
+                typer.echo("Box scores rebuilt successfully!")
+
+            except Exception as e:  # pylint: disable=broad-except
+                typer.echo(f"Error rebuilding box scores: {e}")
+                typer.echo("Please check that the database has been initialized and migrated.")
+
+    @staticmethod
+    def verify_game_events(game_ids: list[int] | None = None, show_limit: int = 20) -> bool:
+        """
+        Compare the stored stat lines of live-entered games against a replay of their event logs.
+
+        Args:
+            game_ids: Games to check. If not specified, checks every game with recorded events.
+            show_limit: Maximum number of mismatches to print
+
+        Returns:
+            True if every stored line matches its event log, False otherwise
+        """
+        target = f"{len(game_ids)} game(s)" if game_ids else "all live-entered games"
+        typer.echo(f"Replaying event logs for {target}...")
+
+        with db_manager.get_db_session() as db_session:
+            mismatches = GameReplayService(db_session).verify(game_ids or None)
+
+        for row in mismatches[:show_limit]:
+            typer.echo(
+                f"  game={row['game_id']} player_id={row['player_id']} {row['field']}: "
+                f"stored={row['stored']} replayed={row['replayed']}"
+            )
+        if len(mismatches) > show_limit:
+            typer.echo(f"  ... and {len(mismatches) - show_limit} more")
+
+        if mismatches:
+            games = sorted({row["game_id"] for row in mismatches})
+            typer.echo(f"{len(mismatches)} mismatched field(s) in {len(games)} game(s): {', '.join(map(str, games))}")
+            typer.echo("Run 'rebuild-game-stats --game <id>' to rebuild a game's stats from its events.")
+            return False
+
+        typer.echo("Stored stats match the event logs.")
+        return True
+
+    @staticmethod
+    def rebuild_game_stats(game_ids: list[int]) -> None:
+        """
+        Rebuild games' stat lines from their event logs, one transaction per game.
+
+        Args:
+            game_ids: Games to rebuild
+        """
+        with db_manager.get_db_session() as db_session:
+            replay_service = GameReplayService(db_session)
+            for game_id in game_ids:
+                try:
+                    summary = replay_service.rebuild(game_id)
+                    typer.echo(
+                        f"Game {game_id}: replayed {summary['events']} event(s) "
+                        f"into {summary['players']} player line(s)"
+                    )
+                except Exception as e:  # pylint: disable=broad-except
+                    typer.echo(f"Error rebuilding game {game_id}: {e}")
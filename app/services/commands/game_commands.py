@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.data_access.crud import get_game_by_id
 from app.data_access.models import Game, PlayerGameStats, PlayerQuarterStats
 from app.services.commands.base import Command
+from app.services.season_stats_service import SeasonStatsService
 
 
 class UpdateGameCommand(Command):
@@ -38,15 +39,16 @@ class UpdateGameCommand(Command):
             raise ValueError(f"Game with ID {self.game_id} not found")
 
         # Store old values for undo
-        for field, new_value in self.updates.items():
-            if hasattr(game, field):
-                self.old_values[field] = getattr(game, field)
+        with SeasonStatsService(self.db).track_game_changes(self.game_id):
+            for field, new_value in self.updates.items():
+                if hasattr(game, field):
+                    self.old_values[field] = getattr(game, field)
 
-                # Handle date conversion if needed
-                if field == "date" and isinstance(new_value, str):
-                    new_value = datetime.strptime(new_value, "%Y-%m-%d").date()
+                    # Handle date conversion if needed
+                    if field == "date" and isinstance(new_value, str):
+                        new_value = datetime.strptime(new_value, "%Y-%m-%d").date()
 
-                setattr(game, field, new_value)
+                    setattr(game, field, new_value)
 
         # Log the update
         self.audit_service.log_update(
@@ -67,8 +69,9 @@ class UpdateGameCommand(Command):
             raise ValueError(f"Game with ID {self.game_id} not found")
 
         # Restore old values
-        for field, old_value in self.old_values.items():
-            setattr(game, field, old_value)
+        with SeasonStatsService(self.db).track_game_changes(self.game_id):
+            for field, old_value in self.old_values.items():
+                setattr(game, field, old_value)
 
         # Log the undo
         self.audit_service.log_update(
@@ -108,9 +111,10 @@ class DeleteGameCommand(Command):
             raise ValueError(f"Game {self.game_id} is already deleted")
 
         # Soft delete the game
-        game.is_deleted = True
-        game.deleted_at = datetime.utcnow()
-        game.deleted_by = self.user_id
+        with SeasonStatsService(self.db).track_game_changes(self.game_id):
+            game.is_deleted = True
+            game.deleted_at = datetime.utcnow()
+            game.deleted_by = self.user_id
 
         # Log the deletion
         self.audit_service.log_delete(
@@ -133,9 +137,10 @@ class DeleteGameCommand(Command):
             raise ValueError(f"Game {self.game_id} is not deleted")
 
         # Restore the game
-        game.is_deleted = False
-        game.deleted_at = None
-        game.deleted_by = None
+        with SeasonStatsService(self.db).track_game_changes(self.game_id):
+            game.is_deleted = False
+            game.deleted_at = None
+            game.deleted_by = None
 
         # Log the restore
         self.audit_service.log_restore(
@@ -177,10 +182,11 @@ class UpdatePlayerGameStatsCommand(Command):
             raise ValueError(f"PlayerGameStats with ID {self.player_game_stats_id} not found")
 
         # Store old values for undo
-        for field, new_value in self.updates.items():
-            if hasattr(stats, field):
-                self.old_values[field] = getattr(stats, field)
-                setattr(stats, field, new_value)
+        with SeasonStatsService(self.db).track_game_changes(stats.game_id):
+            for field, new_value in self.updates.items():
+                if hasattr(stats, field):
+                    self.old_values[field] = getattr(stats, field)
+                    setattr(stats, field, new_value)
 
         # Log the update
         self.audit_service.log_update(
@@ -201,8 +207,9 @@ class UpdatePlayerGameStatsCommand(Command):
             raise ValueError(f"PlayerGameStats with ID {self.player_game_stats_id} not found")
 
         # Restore old values
-        for field, old_value in self.old_values.items():
-            setattr(stats, field, old_value)
+        with SeasonStatsService(self.db).track_game_changes(stats.game_id):
+            for field, old_value in self.old_values.items():
+                setattr(stats, field, old_value)
 
         # Log the undo
         self.audit_service.log_update(
@@ -244,13 +251,14 @@ class UpdatePlayerQuarterStatsCommand(Command):
             raise ValueError(f"PlayerQuarterStats with ID {self.quarter_stats_id} not found")
 
         # Store old values for undo
-        for field, new_value in self.updates.items():
-            if hasattr(stats, field):
-                self.old_values[field] = getattr(stats, field)
-                setattr(stats, field, new_value)
+        with SeasonStatsService(self.db).track_game_changes(stats.player_game_stat.game_id):
+            for field, new_value in self.updates.items():
+                if hasattr(stats, field):
+                    self.old_values[field] = getattr(stats, field)
+                    setattr(stats, field, new_value)
 
-        # Also update the parent game stats totals
-        self._update_game_totals(stats)
+            # Also update the parent game stats totals
+            self._update_game_totals(stats)
 
         # Log the update
         self.audit_service.log_update(
@@ -271,11 +279,12 @@ class UpdatePlayerQuarterStatsCommand(Command):
             raise ValueError(f"PlayerQuarterStats with ID {self.quarter_stats_id} not found")
 
         # Restore old values
-        for field, old_value in self.old_values.items():
-            setattr(stats, field, old_value)
+        with SeasonStatsService(self.db).track_game_changes(stats.player_game_stat.game_id):
+            for field, old_value in self.old_values.items():
+                setattr(stats, field, old_value)
 
-        # Update parent game stats totals
-        self._update_game_totals(stats)
+            # Update parent game stats totals
+            self._update_game_totals(stats)
 
         # Log the undo
         self.audit_service.log_update(
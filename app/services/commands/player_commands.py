@@ -6,8 +6,9 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from app.data_access.crud import get_player_by_id
-from app.data_access.models import Player
+from app.data_access.models import Player, PlayerGameStats
 from app.services.commands.base import Command
+from app.services.season_stats_service import SeasonStatsService
 
 
 class UpdatePlayerCommand(Command):
@@ -188,8 +189,9 @@ class TransferPlayerCommand(Command):
         if existing_player and existing_player.id != self.player_id:
             raise ValueError(f"Jersey number {player.jersey_number} is already taken on team {self.new_team_id}")
 
-        # Update team
-        player.team_id = self.new_team_id
+        # Update team; team season totals follow the player's current team
+        with SeasonStatsService(self.db).track_game_changes(*self._played_game_ids()):
+            player.team_id = self.new_team_id
 
         # Log the transfer
         self.audit_service.log_update(
@@ -213,7 +215,8 @@ class TransferPlayerCommand(Command):
             raise ValueError("Cannot undo transfer: original team ID is None")
 
         # Restore old team
-        player.team_id = self.old_team_id
+        with SeasonStatsService(self.db).track_game_changes(*self._played_game_ids()):
+            player.team_id = self.old_team_id
 
         # Log the undo
         self.audit_service.log_update(
@@ -226,6 +229,11 @@ class TransferPlayerCommand(Command):
 
         self.db.flush()
 
+    def _played_game_ids(self) -> list[int]:
+        """Get the IDs of games the player has stats in."""
+        rows = self.db.query(PlayerGameStats.game_id).filter(PlayerGameStats.player_id == self.player_id).all()
+        return [row[0] for row in rows]
+
 
 class ChangeJerseyNumberCommand(Command):
     """Command to change a player's jersey number."""
@@ -20,18 +20,19 @@ def import_roster_from_csv(roster_file: str, dry_run: bool = False) -> bool:
     return orchestrator.import_roster_from_csv(roster_file, dry_run)
 
 
-def import_game_stats_from_csv(game_stats_file: str, dry_run: bool = False) -> bool:
+def import_game_stats_from_csv(game_stats_file: str, dry_run: bool = False, stream: bool = False) -> bool:
     """Import game statistics from a CSV file.
 
     Args:
         game_stats_file: Path to the game stats CSV file
         dry_run: If True, validate but don't commit changes
+        stream: If True, parse rows lazily and write stats with bulk inserts
 
     Returns:
         True on success, False on error
     """
     orchestrator = ImportOrchestrator()
-    return orchestrator.import_game_stats_from_csv(game_stats_file, dry_run)
+    return orchestrator.import_game_stats_from_csv(game_stats_file, dry_run, stream)
 
 
 # Expose internal functions for backward compatibility with tests
@@ -20,6 +20,7 @@ from app.services.commands import (
     UpdatePlayerQuarterStatsCommand,
     UpdateTeamCommand,
 )
+from app.services.season_stats_service import SeasonStatsService
 
 
 class DataCorrectionService:
@@ -283,11 +284,12 @@ class DataCorrectionService:
                 game_query = game_query.filter(Game.deleted_at >= start_date, Game.deleted_at <= end_date)
 
             games = game_query.all()
-            for game in games:
-                game.is_deleted = False
-                game.deleted_at = None
-                game.deleted_by = None
-                count += 1
+            with SeasonStatsService(self.db).track_game_changes(*(game.id for game in games)):
+                for game in games:
+                    game.is_deleted = False
+                    game.deleted_at = None
+                    game.deleted_by = None
+                    count += 1
 
         if count > 0:
             self.db.commit()
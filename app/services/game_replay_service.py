@@ -0,0 +1,352 @@
+"""Event-sourced replay of live-entered games.
+
+Live entry writes a ``GameEvent`` row for every action and also bumps the
+``PlayerGameStats``/``PlayerQuarterStats`` counters in place (undo deletes the
+original event and reverses the counters). The event log therefore fully
+describes the stat lines of any game entered live, and ``GameReplayService``
+folds it back into stat lines in a single ordered pass over the log. That gives
+deterministic rebuilds of the stored counters, the state of a game as of any
+event, and a cheap check that the stored counters still agree with the log.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.data_access.models import Game, GameEvent, PlayerGameStats, PlayerQuarterStats
+from app.services.season_stats_service import SeasonStatsService
+
+# Counter order used for quarter tallies: free throws, twos, threes (made, attempted)
+SHOT_FIELDS = ("ftm", "fta", "fg2m", "fg2a", "fg3m", "fg3a")
+GAME_FIELDS = ("fouls", "total_ftm", "total_fta", "total_2pm", "total_2pa", "total_3pm", "total_3pa")
+
+_SHOT_SLOTS = {"ft": (0, 1), "2pt": (2, 3), "3pt": (4, 5)}
+_SHOT_POINTS = {"ft": 1, "2pt": 2, "3pt": 3}
+
+# Rows fetched per round trip while streaming the event log
+STREAM_BATCH_SIZE = 1000
+
+
+@dataclass(slots=True)
+class ReplayLine:
+    """One player's stat line rebuilt from events."""
+
+    player_id: int
+    team_id: int | None
+    fouls: int = 0
+    quarters: dict[int, list[int]] = field(default_factory=dict)
+
+    def totals(self) -> dict[str, int]:
+        """Game totals keyed like the ``PlayerGameStats`` columns."""
+        sums = [sum(q[i] for q in self.quarters.values()) for i in range(len(SHOT_FIELDS))]
+        return {
+            "fouls": self.fouls,
+            "total_ftm": sums[0],
+            "total_fta": sums[1],
+            "total_2pm": sums[2],
+            "total_2pa": sums[3],
+            "total_3pm": sums[4],
+            "total_3pa": sums[5],
+        }
+
+    @property
+    def points(self) -> int:
+        """Points scored in the game."""
+        return sum(q[0] + q[2] * 2 + q[4] * 3 for q in self.quarters.values())
+
+
+@dataclass(slots=True)
+class GameReplay:
+    """State of a game after folding its events up to ``last_event_id``."""
+
+    game_id: int
+    home_team_id: int
+    away_team_id: int
+    current_quarter: int = 1
+    is_live: bool = False
+    is_final: bool = False
+    last_event_id: int | None = None
+    events_applied: int = 0
+    scores: dict[int, int] = field(default_factory=dict)
+    lines: dict[int, ReplayLine] = field(default_factory=dict)
+    on_court: dict[int, set[int]] = field(default_factory=dict)
+
+    @property
+    def home_score(self) -> int:
+        return self.scores.get(self.home_team_id, 0)
+
+    @property
+    def away_score(self) -> int:
+        return self.scores.get(self.away_team_id, 0)
+
+    def apply(self, event_id: int, event_type: str, player_id, team_id, quarter: int, details: dict | None) -> None:
+        """Fold one event into the state."""
+        details = details or {}
+        if event_type == "shot" and player_id is not None:
+            slots = _SHOT_SLOTS.get(details.get("shot_type"))
+            if slots is not None:
+                tally = self._line(player_id, team_id).quarters.setdefault(quarter, [0] * len(SHOT_FIELDS))
+                made_slot, attempt_slot = slots
+                tally[attempt_slot] += 1
+                if details.get("made"):
+                    tally[made_slot] += 1
+                    self.scores[team_id] = self.scores.get(team_id, 0) + _SHOT_POINTS[details["shot_type"]]
+        elif event_type == "foul" and player_id is not None:
+            self._line(player_id, team_id).fouls += 1
+        elif event_type == "game_start":
+            self.is_live = True
+            self.on_court = {
+                self.home_team_id: set(details.get("home_starters", [])),
+                self.away_team_id: set(details.get("away_starters", [])),
+            }
+        elif event_type == "substitution":
+            court = self.on_court.setdefault(team_id, set())
+            court.difference_update(details.get("players_out", []))
+            court.update(details.get("players_in", []))
+        elif event_type == "quarter_end":
+            self.current_quarter = quarter + 1
+        elif event_type == "game_end":
+            self.is_live = False
+            self.is_final = True
+
+        self.last_event_id = event_id
+        self.events_applied += 1
+
+    def _line(self, player_id: int, team_id: int | None) -> ReplayLine:
+        line = self.lines.get(player_id)
+        if line is None:
+            line = self.lines[player_id] = ReplayLine(player_id=player_id, team_id=team_id)
+        return line
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the replayed state."""
+        return {
+            "game_id": self.game_id,
+            "last_event_id": self.last_event_id,
+            "events_applied": self.events_applied,
+            "current_quarter": self.current_quarter,
+            "is_live": self.is_live,
+            "is_final": self.is_final,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "on_court": {
+                "home": sorted(self.on_court.get(self.home_team_id, ())),
+                "away": sorted(self.on_court.get(self.away_team_id, ())),
+            },
+            "players": [
+                {"player_id": line.player_id, "team_id": line.team_id, "points": line.points, **line.totals()}
+                for line in sorted(self.lines.values(), key=lambda line: line.player_id)
+            ],
+        }
+
+
+class GameReplayService:
+    """Rebuilds, snapshots and verifies game stats from the event log."""
+
+    def __init__(self, db_session: Session):
+        """Initialize the replay service.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def replay(self, game_id: int, until_event_id: int | None = None) -> GameReplay:
+        """Fold a game's events into its state.
+
+        Args:
+            game_id: ID of the game
+            until_event_id: Stop after this event (inclusive); None replays the whole log
+
+        Returns:
+            The replayed game state
+        """
+        game = self.db_session.get(Game, game_id)
+        if game is None:
+            raise ValueError(f"Game {game_id} not found")
+
+        replay = GameReplay(game_id=game_id, home_team_id=game.playing_team_id, away_team_id=game.opponent_team_id)
+        for row in self._stream_events([game_id], until_event_id):
+            replay.apply(*row[1:])
+        return replay
+
+    def score_timeline(self, game_id: int) -> list[dict[str, Any]]:
+        """Score after every scoring event, in one pass over the log.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            List of {event_id, quarter, home_score, away_score} for each made shot
+        """
+        game = self.db_session.get(Game, game_id)
+        if game is None:
+            raise ValueError(f"Game {game_id} not found")
+
+        replay = GameReplay(game_id=game_id, home_team_id=game.playing_team_id, away_team_id=game.opponent_team_id)
+        timeline = []
+        for row in self._stream_events([game_id]):
+            before = (replay.home_score, replay.away_score)
+            replay.apply(*row[1:])
+            if (replay.home_score, replay.away_score) != before:
+                timeline.append(
+                    {
+                        "event_id": replay.last_event_id,
+                        "quarter": row[5],
+                        "home_score": replay.home_score,
+                        "away_score": replay.away_score,
+                    }
+                )
+        return timeline
+
+    def rebuild(self, game_id: int) -> dict[str, int]:
+        """Overwrite a game's stored stat lines with the ones replayed from its events.
+
+        Players with stored lines but no events are zeroed rather than deleted.
+        Season tables and the stored box score follow through
+        ``SeasonStatsService.track_game_changes``. Commits on success.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Summary with the number of events replayed and player lines written
+        """
+        replay = self.replay(game_id)
+        if not replay.events_applied:
+            raise ValueError(f"Game {game_id} has no recorded events to replay")
+
+        try:
+            with SeasonStatsService(self.db_session).track_game_changes(game_id):
+                stored = {
+                    stats.player_id: stats
+                    for stats in self.db_session.query(PlayerGameStats).filter(PlayerGameStats.game_id == game_id)
+                }
+                for player_id in replay.lines.keys() - stored.keys():
+                    stored[player_id] = PlayerGameStats(game_id=game_id, player_id=player_id)
+                    self.db_session.add(stored[player_id])
+
+                for player_id, stats in stored.items():
+                    line = replay.lines.get(player_id) or ReplayLine(player_id=player_id, team_id=None)
+                    for name, value in line.totals().items():
+                        setattr(stats, name, value)
+                    self._write_quarters(stats, line)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+
+        return {"events": replay.events_applied, "players": len(stored)}
+
+    def verify(self, game_ids: Iterable[int] | None = None) -> list[dict[str, Any]]:
+        """Compare stored stat lines with the event log for live-entered games.
+
+        Streams every event of the selected games in one ordered query and loads
+        the stored lines in two more, so the cost does not grow with the number of
+        games beyond the rows themselves.
+
+        Args:
+            game_ids: Games to check; None checks every game that has events
+
+        Returns:
+            One mismatch per differing field with game_id, player_id, field,
+            stored and replayed values
+        """
+        if game_ids is None:
+            game_ids = [game_id for (game_id,) in self.db_session.query(GameEvent.game_id).distinct()]
+        game_ids = sorted(set(game_ids))
+        if not game_ids:
+            return []
+
+        games = {
+            game_id: (home, away)
+            for game_id, home, away in self.db_session.query(
+                Game.id, Game.playing_team_id, Game.opponent_team_id
+            ).filter(Game.id.in_(game_ids))
+        }
+        replays = {
+            game_id: GameReplay(game_id=game_id, home_team_id=home, away_team_id=away)
+            for game_id, (home, away) in games.items()
+        }
+        for row in self._stream_events(list(replays)):
+            replays[row[0]].apply(*row[1:])
+
+        stored = {
+            (stats.game_id, stats.player_id): stats
+            for stats in self.db_session.query(PlayerGameStats).filter(PlayerGameStats.game_id.in_(list(replays)))
+        }
+        stored_quarters: dict[int, dict[int, PlayerQuarterStats]] = {}
+        for quarter in (
+            self.db_session.query(PlayerQuarterStats)
+            .join(PlayerGameStats, PlayerQuarterStats.player_game_stat_id == PlayerGameStats.id)
+            .filter(PlayerGameStats.game_id.in_(list(replays)))
+        ):
+            stored_quarters.setdefault(quarter.player_game_stat_id, {})[quarter.quarter_number] = quarter
+
+        mismatches = []
+        keys = {(game_id, player_id) for game_id, replay in replays.items() for player_id in replay.lines}
+        for game_id, player_id in sorted(keys | stored.keys()):
+            line = replays[game_id].lines.get(player_id) or ReplayLine(player_id=player_id, team_id=None)
+            stats = stored.get((game_id, player_id))
+            expected = line.totals()
+            for name in GAME_FIELDS:
+                actual = (getattr(stats, name) or 0) if stats is not None else 0
+                if actual != expected[name]:
+                    mismatches.append(
+                        {
+                            "game_id": game_id,
+                            "player_id": player_id,
+                            "field": name,
+                            "stored": actual,
+                            "replayed": expected[name],
+                        }
+                    )
+
+            quarters = stored_quarters.get(stats.id, {}) if stats is not None else {}
+            for quarter_number in sorted(line.quarters.keys() | quarters.keys()):
+                tally = line.quarters.get(quarter_number, [0] * len(SHOT_FIELDS))
+                row = quarters.get(quarter_number)
+                for i, name in enumerate(SHOT_FIELDS):
+                    actual = (getattr(row, name) or 0) if row is not None else 0
+                    if actual != tally[i]:
+                        mismatches.append(
+                            {
+                                "game_id": game_id,
+                                "player_id": player_id,
+                                "field": f"q{quarter_number}_{name}",
+                                "stored": actual,
+                                "replayed": tally[i],
+                            }
+                        )
+        return mismatches
+
+    def _stream_events(self, game_ids: list[int], until_event_id: int | None = None) -> Iterator[tuple]:
+        """Yield (game_id, id, event_type, player_id, team_id, quarter, details) in log order."""
+        query = self.db_session.query(
+            GameEvent.game_id,
+            GameEvent.id,
+            GameEvent.event_type,
+            GameEvent.player_id,
+            GameEvent.team_id,
+            GameEvent.quarter,
+            GameEvent.details,
+        ).filter(GameEvent.game_id.in_(game_ids))
+        if until_event_id is not None:
+            query = query.filter(GameEvent.id <= until_event_id)
+        yield from query.order_by(GameEvent.game_id, GameEvent.id).yield_per(STREAM_BATCH_SIZE)
+
+    def _write_quarters(self, stats: PlayerGameStats, line: ReplayLine) -> None:
+        """Make a stats row's quarter lines match a replayed line."""
+        existing = {quarter.quarter_number: quarter for quarter in stats.quarter_stats}
+        for quarter_number in line.quarters.keys() | existing.keys():
+            tally = line.quarters.get(quarter_number, [0] * len(SHOT_FIELDS))
+            row = existing.get(quarter_number)
+            if row is None:
+                row = PlayerQuarterStats(player_game_stat=stats, quarter_number=quarter_number)
+                self.db_session.add(row)
+            for name, value in zip(SHOT_FIELDS, tally, strict=True):
+                setattr(row, name, value)
@@ -1,9 +1,10 @@
 """Service for managing live game state and events."""
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session, joinedload
 
 from app.data_access.models import (
@@ -15,18 +16,39 @@ from app.data_access.models import (
     PlayerGameStats,
     PlayerQuarterStats,
 )
+from app.services.box_score_service import BoxScoreService
+from app.services.live_game_feed import LiveGameFeed, live_game_feed
+from app.services.live_game_session import (
+    RECENT_EVENT_LIMIT,
+    SHOT_POINTS,
+    LiveGameSession,
+    LiveGameSessionRegistry,
+    event_payload,
+    live_game_sessions,
+)
 
 
 class GameStateService:
     """Manages the state of live basketball games."""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        live_sessions: LiveGameSessionRegistry | None = None,
+        feed: LiveGameFeed | None = None,
+    ):
         """Initialize the game state service.
 
         Args:
             session: SQLAlchemy database session
+            live_sessions: Registry of in-memory live game sessions (defaults to the process-wide one)
+            feed: Feed notified of committed events (defaults to the process-wide one)
         """
         self.session = session
+        self.live_sessions = live_sessions if live_sessions is not None else live_game_sessions
+        self.feed = feed if feed is not None else live_game_feed
+        # Announcements of changes recorded with commit=False, held until the caller commits
+        self._pending_announcements: list[Callable[[], None]] = []
 
     def create_game(
         self,
@@ -38,6 +60,7 @@ class GameStateService:
         notes: str | None = None,
         season_id: int | None = None,
         is_playoff_game: bool = False,
+        commit: bool = True,
     ) -> Game:
         """Create a new game.
 
@@ -50,6 +73,7 @@ class GameStateService:
             notes: Additional notes (optional)
             season_id: Season ID (optional)
             is_playoff_game: Whether this is a playoff game (optional)
+            commit: Commit the game; when False it is only flushed and the caller commits
 
         Returns:
             Created Game object
@@ -75,7 +99,10 @@ class GameStateService:
             is_final=False,
         )
         self.session.add(game_state)
-        self.session.commit()
+        if commit:
+            self.session.commit()
+        else:
+            self.session.flush()
 
         return game
 
@@ -122,6 +149,10 @@ class GameStateService:
         self.session.add(start_event)
 
         self.session.commit()
+
+        # Starting lineups replace the on-court players; rebuild on the next read
+        self.live_sessions.discard(game_id)
+        self.feed.publish(game_id)
         return game_state
 
     def record_shot(
@@ -132,6 +163,7 @@ class GameStateService:
         made: bool,
         quarter: int | None = None,
         assisted_by: int | None = None,
+        commit: bool = True,
     ) -> dict[str, Any]:
         """Record a shot attempt.
 
@@ -142,6 +174,8 @@ class GameStateService:
             made: Whether the shot was made
             quarter: Quarter number (uses current quarter if not specified)
             assisted_by: ID of player who assisted (optional)
+            commit: Commit the shot; when False it is only flushed and the caller commits,
+                then calls ``announce_committed_events``
 
         Returns:
             Dictionary with event details and updated stats
@@ -160,11 +194,12 @@ class GameStateService:
         if assisted_by:
             event_details["assisted_by"] = assisted_by
 
+        team_id = self._get_player_team_id(player_id)
         event = GameEvent(
             game_id=game_id,
             event_type="shot",
             player_id=player_id,
-            team_id=self._get_player_team_id(player_id),
+            team_id=team_id,
             quarter=quarter,
             details=event_details,
         )
@@ -172,8 +207,12 @@ class GameStateService:
 
         # Update player stats
         self._update_player_stats(game_id, player_id, quarter, shot_type, made)
+        self.session.flush()
 
-        self.session.commit()
+        points = SHOT_POINTS.get(shot_type, 0) if made else 0
+        self._complete(
+            self._event_announcement(game_id, event, lambda live: live.add_points(player_id, team_id, points)), commit
+        )
 
         return {
             "event_id": event.id,
@@ -189,6 +228,7 @@ class GameStateService:
         player_id: int,
         foul_type: str = "personal",
         quarter: int | None = None,
+        commit: bool = True,
     ) -> dict[str, Any]:
         """Record a foul.
 
@@ -197,6 +237,8 @@ class GameStateService:
             player_id: ID of the player who committed the foul
             foul_type: Type of foul ('personal', 'technical', 'flagrant')
             quarter: Quarter number (uses current quarter if not specified)
+            commit: Commit the foul; when False it is only flushed and the caller commits,
+                then calls ``announce_committed_events``
 
         Returns:
             Dictionary with event details and player's total fouls
@@ -221,8 +263,9 @@ class GameStateService:
         # Update player fouls
         player_stats = self._get_or_create_player_game_stats(game_id, player_id)
         player_stats.fouls += 1
+        self.session.flush()
 
-        self.session.commit()
+        self._complete(self._event_announcement(game_id, event, lambda live: live.add_foul(player_id)), commit)
 
         return {
             "event_id": event.id,
@@ -285,6 +328,15 @@ class GameStateService:
 
         self.session.commit()
 
+        def apply(live: LiveGameSession) -> None:
+            incoming = {"home": [], "away": []}
+            for player in self.session.query(Player).filter(Player.id.in_(players_in)).all():
+                side = "home" if player.team_id == live.home_team_id else "away"
+                incoming[side].append(self._active_player_info(player, is_starter=False))
+            live.substitute(players_out, incoming)
+
+        self._event_committed(game_id, event, apply)
+
         return {
             "event_id": event.id,
             "team_id": team_id,
@@ -293,6 +345,151 @@ class GameStateService:
             "quarter": game_state.current_quarter,
         }
 
+    def record_events(self, game_id: int, events: list[dict[str, Any]], commit: bool = True) -> list[dict[str, Any]]:
+        """Apply an ordered batch of shots, fouls and substitutions in one transaction.
+
+        Each event is a dict with a ``client_event_id``, a ``type`` of ``"shot"``,
+        ``"foul"`` or ``"substitution"`` and the arguments of the matching single-event
+        method. Events whose client ID is already recorded for the game are reported
+        as duplicates and skipped, so a client can resend a batch after a dropped
+        connection. Players, stats rows and roster entries for the whole batch are
+        loaded up front, updated in memory and written in a single flush.
+
+        Args:
+            game_id: ID of the game
+            events: Events in the order they happened
+            commit: Commit the batch; when False it is only flushed and the caller commits,
+                then calls ``announce_committed_events``
+
+        Returns:
+            One result per event, in order, with ``client_event_id``, ``status``
+            (``"applied"``, ``"duplicate"`` or ``"rejected"``), ``event_id`` and ``error``
+        """
+        game_state = self._get_game_state(game_id)
+        if not game_state.is_live:
+            raise ValueError("Game is not in progress")
+
+        client_ids = {item.get("client_event_id") for item in events} - {None}
+        recorded = dict(
+            self.session.query(GameEvent.client_event_id, GameEvent.id)
+            .filter(GameEvent.game_id == game_id, GameEvent.client_event_id.in_(list(client_ids)))
+            .all()
+        )
+
+        stat_player_ids, roster_player_ids = set(), set()
+        for item in events:
+            if item.get("type") in ("shot", "foul") and item.get("player_id") is not None:
+                stat_player_ids.add(item["player_id"])
+            if item.get("type") == "substitution":
+                roster_player_ids.update(item.get("players_out") or [], item.get("players_in") or [])
+        player_teams = dict(
+            self.session.query(Player.id, Player.team_id)
+            .filter(Player.id.in_(list(stat_player_ids | roster_player_ids)))
+            .all()
+        )
+
+        game_stats = {
+            stats.player_id: stats
+            for stats in self.session.query(PlayerGameStats)
+            .filter(PlayerGameStats.game_id == game_id, PlayerGameStats.player_id.in_(list(stat_player_ids)))
+            .all()
+        }
+        player_by_stats_id = {stats.id: stats.player_id for stats in game_stats.values()}
+        quarter_stats = {
+            (player_by_stats_id[quarter.player_game_stat_id], quarter.quarter_number): quarter
+            for quarter in self.session.query(PlayerQuarterStats)
+            .filter(PlayerQuarterStats.player_game_stat_id.in_(list(player_by_stats_id)))
+            .all()
+        }
+        rosters = {
+            roster.player_id: roster
+            for roster in self.session.query(ActiveRoster)
+            .filter(ActiveRoster.game_id == game_id, ActiveRoster.player_id.in_(list(roster_player_ids)))
+            .all()
+        }
+
+        def stats_for(player_id: int) -> PlayerGameStats:
+            if player_id not in game_stats:
+                game_stats[player_id] = PlayerGameStats(
+                    game_id=game_id,
+                    player_id=player_id,
+                    fouls=0,
+                    total_ftm=0,
+                    total_fta=0,
+                    total_2pm=0,
+                    total_2pa=0,
+                    total_3pm=0,
+                    total_3pa=0,
+                )
+                self.session.add(game_stats[player_id])
+            return game_stats[player_id]
+
+        def quarter_for(player_id: int, quarter: int) -> PlayerQuarterStats:
+            key = (player_id, quarter)
+            if key not in quarter_stats:
+                # Attached through the relationship so new stats rows get their ID on the same flush
+                quarter_stats[key] = PlayerQuarterStats(
+                    player_game_stat=stats_for(player_id),
+                    quarter_number=quarter,
+                    ftm=0,
+                    fta=0,
+                    fg2m=0,
+                    fg2a=0,
+                    fg3m=0,
+                    fg3a=0,
+                )
+                self.session.add(quarter_stats[key])
+            return quarter_stats[key]
+
+        results: list[dict[str, Any]] = []
+        created: dict[str, GameEvent] = {}
+        for item in events:
+            client_event_id = item.get("client_event_id")
+            result = {"client_event_id": client_event_id, "status": "applied", "event_id": None, "error": None}
+            results.append(result)
+
+            if client_event_id in recorded or client_event_id in created:
+                result["status"] = "duplicate"
+                result["event_id"] = recorded.get(client_event_id)
+                continue
+
+            try:
+                if not client_event_id:
+                    raise ValueError("client_event_id is required")
+                quarter = item.get("quarter") or game_state.current_quarter
+                if not 1 <= quarter <= 6:
+                    raise ValueError(f"Invalid quarter {quarter}")
+                event_type = item.get("type")
+                if event_type == "shot":
+                    event = self._batch_shot(item, quarter, player_teams, stats_for, quarter_for)
+                elif event_type == "foul":
+                    event = self._batch_foul(item, quarter, player_teams, stats_for)
+                elif event_type == "substitution":
+                    event = self._batch_substitution(game_id, item, quarter, player_teams, rosters)
+                else:
+                    raise ValueError(f"Unknown event type {event_type!r}")
+            except ValueError as e:
+                result["status"] = "rejected"
+                result["error"] = str(e)
+                continue
+
+            event.game_id = game_id
+            event.client_event_id = client_event_id
+            event.timestamp = datetime.utcnow()
+            self.session.add(event)
+            created[client_event_id] = event
+
+        if not created:
+            return results
+
+        self.session.flush()
+        for result in results:
+            if result["event_id"] is None and result["client_event_id"] in created:
+                result["event_id"] = created[result["client_event_id"]].id
+
+        self._complete(lambda: self._announce_rewrite(game_id), commit)
+        return results
+
     def end_quarter(self, game_id: int) -> GameState:
         """End the current quarter and advance to the next quarter or finalize the game.
 
@@ -336,8 +533,11 @@ class GameStateService:
 
         # Advance to next quarter
         game_state.current_quarter += 1
+        next_quarter = game_state.current_quarter
 
         self.session.commit()
+
+        self._event_committed(game_id, event, lambda live: setattr(live, "current_quarter", next_quarter))
         return game_state
 
     def finalize_game(self, game_id: int) -> dict[str, Any]:
@@ -374,8 +574,17 @@ class GameStateService:
         )
         self.session.add(event)
 
+        # Store the finished box score so reads no longer rebuild it
+        BoxScoreService(self.session).refresh(game_id)
+
         self.session.commit()
 
+        def apply(live: LiveGameSession) -> None:
+            live.is_live = False
+            live.is_final = True
+
+        self._event_committed(game_id, event, apply)
+
         return {
             "game_id": game_id,
             "state": "final",
@@ -388,65 +597,47 @@ class GameStateService:
     def get_live_game_state(self, game_id: int) -> dict[str, Any]:
         """Get the current state of a live game.
 
+        Served from the game's in-memory session when it reflects the newest event
+        and the current state revision in the database; otherwise the session is
+        rebuilt first.
+
         Args:
             game_id: ID of the game
 
         Returns:
             Dictionary with game state, active players, and recent events
         """
-        game_state = self._get_game_state(game_id)
-        game = self.session.query(Game).filter(Game.id == game_id).first()
-
-        if not game:
-            raise ValueError(f"Game {game_id} not found")
+        latest_event_id, revision = self._live_version(game_id)
+        live = self.live_sessions.get(game_id)
+        if live is None or live.version is None or (live.version, live.revision) != (latest_event_id, revision):
+            live = self._refresh_live_session(game_id, latest_event_id, revision)
+        return live.snapshot()
 
-        # Get active players
-        active_players = self._get_active_players(game_id)
+    def get_events_since(self, game_id: int, after_event_id: int | None, limit: int = 500) -> list[dict[str, Any]]:
+        """Get a game's events recorded after a given event, oldest first.
 
-        # Get recent events
-        recent_events = (
-            self.session.query(GameEvent)
-            .filter(GameEvent.game_id == game_id)
-            .order_by(GameEvent.timestamp.desc())
-            .limit(10)
-            .all()
-        )
+        Used by the live stream to resume a client from the last event it saw.
 
-        # Calculate current scores
-        home_score = self._calculate_team_score(game_id, game.playing_team_id)
-        away_score = self._calculate_team_score(game_id, game.opponent_team_id)
+        Args:
+            game_id: ID of the game
+            after_event_id: ID of the last event the client has (None for every event)
+            limit: Maximum number of events to return
 
-        return {
-            "game_state": {
-                "game_id": game_id,
-                "current_quarter": game_state.current_quarter,
-                "is_live": game_state.is_live,
-                "is_final": game_state.is_final,
-                "home_score": home_score,
-                "away_score": away_score,
-                "home_timeouts": game_state.home_timeouts_remaining,
-                "away_timeouts": game_state.away_timeouts_remaining,
-            },
-            "active_players": active_players,
-            "recent_events": [
-                {
-                    "id": event.id,
-                    "type": event.event_type,
-                    "player_id": event.player_id,
-                    "team_id": event.team_id,
-                    "quarter": event.quarter,
-                    "timestamp": event.timestamp.isoformat(),
-                    "details": event.details,
-                }
-                for event in recent_events
-            ],
-        }
+        Returns:
+            List of serialized events in the live feed format
+        """
+        query = self.session.query(GameEvent).filter(GameEvent.game_id == game_id)
+        if after_event_id is not None:
+            query = query.filter(GameEvent.id > after_event_id)
+        return [event_payload(event) for event in query.order_by(GameEvent.id).limit(limit).all()]
 
-    def undo_last_event(self, game_id: int) -> dict[str, Any]:
+    def undo_last_event(self, game_id: int, commit: bool = True) -> dict[str, Any]:
         """Undo the last event in a game.
 
         Args:
             game_id: ID of the game
+            commit: Commit the undo; when False it is only flushed and the caller commits,
+                then calls ``announce_committed_events``
 
         Returns:
             Dictionary with details of the undone event
@@ -481,7 +672,8 @@ class GameStateService:
 
         # Delete the original event
         self.session.delete(last_event)
-        self.session.commit()
+        # Reversals are rare; reload the held session rather than patching it
+        self._complete(lambda: self._announce_rewrite(game_id), commit)
 
         return {
             "undone_event": {
@@ -506,6 +698,113 @@ class GameStateService:
             raise ValueError(f"Game state for game {game_id} not found")
         return game_state
 
+    def _live_version(self, game_id: int) -> tuple[int | None, int]:
+        """Get the ID of the newest event recorded for a game and its state revision."""
+        latest_event_id = (
+            self.session.query(func.max(GameEvent.id)).filter(GameEvent.game_id == game_id).scalar_subquery()
+        )
+        row = self.session.query(latest_event_id, GameState.revision).filter(GameState.game_id == game_id).first()
+        if not row:
+            raise ValueError(f"Game state for game {game_id} not found")
+        return row[0], row[1]
+
+    def _refresh_live_session(self, game_id: int, version: int | None, revision: int) -> LiveGameSession:
+        """Rebuild a game's live session from the database and store it in the registry."""
+        game_state = self._get_game_state(game_id)
+        game = self.session.query(Game).filter(Game.id == game_id).first()
+
+        if not game:
+            raise ValueError(f"Game {game_id} not found")
+
+        live = LiveGameSession(
+            game_id=game_id,
+            home_team_id=game.playing_team_id,
+            away_team_id=game.opponent_team_id,
+            current_quarter=game_state.current_quarter,
+            is_live=game_state.is_live,
+            is_final=game_state.is_final,
+            home_timeouts=game_state.home_timeouts_remaining,
+            away_timeouts=game_state.away_timeouts_remaining,
+            version=version,
+            revision=revision,
+        )
+        live.scores = {game.playing_team_id: 0, game.opponent_team_id: 0}
+        for player_id, team_id, points, fouls in self._get_player_lines(game_id):
+            live.set_player_line(player_id, team_id, points, fouls)
+        live.set_on_court(self._get_active_players(game_id))
+
+        recent_events = (
+            self.session.query(GameEvent)
+            .filter(GameEvent.game_id == game_id)
+            .order_by(GameEvent.timestamp.desc(), GameEvent.id.desc())
+            .limit(RECENT_EVENT_LIMIT)
+            .all()
+        )
+        live.recent_events.extend(event_payload(event) for event in recent_events)
+
+        self.live_sessions.put(live)
+        return live
+
+    def announce_committed_events(self) -> None:
+        """Publish the changes recorded with ``commit=False`` and apply them to live sessions.
+
+        Call once the transaction they were recorded in has been committed.
+        """
+        pending, self._pending_announcements = self._pending_announcements, []
+        for announce in pending:
+            announce()
+
+    def _complete(self, announce: Callable[[], None], commit: bool) -> None:
+        """Commit and announce recorded changes, or hold the announcement until the caller commits."""
+        if commit:
+            self.session.commit()
+            announce()
+        else:
+            self.session.flush()
+            self._pending_announcements.append(announce)
+
+    def _announce_rewrite(self, game_id: int) -> None:
+        """Announce changes to a game's event log and reload its live session, if one is held."""
+        self.feed.publish(game_id)
+        if self.live_sessions.get(game_id) is not None:
+            self._refresh_live_session(game_id, *self._live_version(game_id))
+
+    def _event_announcement(self, game_id: int, event: GameEvent, apply) -> Callable[[], None]:
+        """Build the announcement of a flushed event: publish it and apply it to the game's live session.
+
+        The session is only patched when the event directly follows the last one it
+        reflects; if anything else was written in between it is dropped and rebuilt
+        on the next read. The preceding event is looked up now, inside the event's
+        transaction, since the announcement runs after the commit.
+        """
+        previous_event_id = None
+        if self.live_sessions.get(game_id) is not None:
+            previous_event_id = (
+                self.session.query(func.max(GameEvent.id))
+                .filter(GameEvent.game_id == game_id, GameEvent.id < event.id)
+                .scalar()
+            )
+
+        def announce() -> None:
+            self.feed.publish(game_id)
+
+            live = self.live_sessions.get(game_id)
+            if live is None:
+                return
+            with live.lock:
+                if live.version is None or live.version != previous_event_id:
+                    self.live_sessions.discard(game_id)
+                    return
+                apply(live)
+                live.push_event(event_payload(event))
+                live.version = event.id
+
+        return announce
+
+    def _event_committed(self, game_id: int, event: GameEvent, apply) -> None:
+        """Announce a committed event and apply it to the game's live session, if one is held."""
+        self._event_announcement(game_id, event, apply)()
+
     def _get_player_team_id(self, player_id: int) -> int:
         """Get the team ID for a player."""
         player = self.session.query(Player).filter(Player.id == player_id).first()
@@ -539,6 +838,76 @@ class GameStateService:
             )
             self.session.add(roster_entry)
 
+    def _batch_shot(self, item: dict[str, Any], quarter: int, player_teams, stats_for, quarter_for) -> GameEvent:
+        """Validate and apply one shot from a batch."""
+        player_id = item.get("player_id")
+        shot_type = item.get("shot_type")
+        made = bool(item.get("made"))
+        if player_id not in player_teams:
+            raise ValueError(f"Player {player_id} not found")
+        if shot_type not in SHOT_POINTS:
+            raise ValueError(f"Invalid shot type {shot_type!r}")
+
+        self._apply_shot(stats_for(player_id), quarter_for(player_id, quarter), shot_type, made)
+
+        details = {"shot_type": shot_type, "made": made}
+        if item.get("assisted_by"):
+            details["assisted_by"] = item["assisted_by"]
+        return GameEvent(
+            event_type="shot", player_id=player_id, team_id=player_teams[player_id], quarter=quarter, details=details
+        )
+
+    def _batch_foul(self, item: dict[str, Any], quarter: int, player_teams, stats_for) -> GameEvent:
+        """Validate and apply one foul from a batch."""
+        player_id = item.get("player_id")
+        if player_id not in player_teams:
+            raise ValueError(f"Player {player_id} not found")
+
+        stats_for(player_id).fouls += 1
+
+        return GameEvent(
+            event_type="foul",
+            player_id=player_id,
+            team_id=player_teams[player_id],
+            quarter=quarter,
+            details={"foul_type": item.get("foul_type") or "personal"},
+        )
+
+    def _batch_substitution(
+        self, game_id: int, item: dict[str, Any], quarter: int, player_teams, rosters: dict[int, ActiveRoster]
+    ) -> GameEvent:
+        """Validate and apply one substitution from a batch."""
+        team_id = item.get("team_id")
+        players_out = list(item.get("players_out") or [])
+        players_in = list(item.get("players_in") or [])
+        if team_id is None or not players_out or not players_in:
+            raise ValueError("Substitutions need team_id, players_out and players_in")
+        unknown = [player_id for player_id in players_out + players_in if player_id not in player_teams]
+        if unknown:
+            raise ValueError(f"Players {unknown} not found")
+
+        now = datetime.utcnow()
+        for player_id in players_out:
+            roster = rosters.get(player_id)
+            if roster is not None and roster.checked_out_at is None:
+                roster.checked_out_at = now
+        for player_id in players_in:
+            roster = rosters.get(player_id)
+            if roster is None:
+                rosters[player_id] = ActiveRoster(game_id=game_id, player_id=player_id, team_id=team_id)
+                self.session.add(rosters[player_id])
+            elif roster.checked_out_at is not None:
+                # One roster row per player and game; checking back in reopens it
+                roster.checked_out_at = None
+                roster.checked_in_at = now
+
+        return GameEvent(
+            event_type="substitution",
+            team_id=team_id,
+            quarter=quarter,
+            details={"players_out": players_out, "players_in": players_in},
+        )
+
     def _get_or_create_player_game_stats(self, game_id: int, player_id: int) -> PlayerGameStats:
         """Get or create player game stats."""
         stats = (
@@ -599,7 +968,11 @@ class GameStateService:
             )
             self.session.add(quarter_stats)
 
-        # Update stats based on shot type
+        self._apply_shot(game_stats, quarter_stats, shot_type, made)
+
+    @staticmethod
+    def _apply_shot(game_stats: PlayerGameStats, quarter_stats: PlayerQuarterStats, shot_type: str, made: bool):
+        """Add a shot to a player's game and quarter totals."""
         if shot_type == "ft":
             if made:
                 game_stats.total_ftm += 1
@@ -643,6 +1016,26 @@ class GameStateService:
 
         return total_score
 
+    def _get_player_lines(self, game_id: int) -> list[tuple[int, int, int, int]]:
+        """Get (player_id, team_id, points, fouls) for every player with stats in a game."""
+        rows = (
+            self.session.query(
+                PlayerGameStats.player_id,
+                Player.team_id,
+                PlayerGameStats.total_ftm,
+                PlayerGameStats.total_2pm,
+                PlayerGameStats.total_3pm,
+                PlayerGameStats.fouls,
+            )
+            .join(Player, PlayerGameStats.player_id == Player.id)
+            .filter(PlayerGameStats.game_id == game_id)
+            .all()
+        )
+        return [
+            (player_id, team_id, (ftm or 0) + (fg2m or 0) * 2 + (fg3m or 0) * 3, fouls or 0)
+            for player_id, team_id, ftm, fg2m, fg3m, fouls in rows
+        ]
+
     def _get_active_players(self, game_id: int) -> dict[str, list[dict[str, Any]]]:
         """Get currently active players for both teams."""
         game = self.session.query(Game).filter(Game.id == game_id).first()
@@ -665,13 +1058,7 @@ class GameStateService:
         away_players = []
 
         for roster, player in active_rosters:
-            player_info = {
-                "id": player.id,
-                "name": player.name,
-                "jersey_number": str(player.jersey_number),  # Ensure jersey_number is a string
-                "position": player.position,
-                "is_starter": roster.is_starter,
-            }
+            player_info = self._active_player_info(player, roster.is_starter)
 
             if player.team_id == game.playing_team_id:
                 home_players.append(player_info)
@@ -680,6 +1067,17 @@ class GameStateService:
 
         return {"home": home_players, "away": away_players}
 
+    @staticmethod
+    def _active_player_info(player: Player, is_starter: bool) -> dict[str, Any]:
+        """Describe an on-court player for the live state."""
+        return {
+            "id": player.id,
+            "name": player.name,
+            "jersey_number": str(player.jersey_number),  # Ensure jersey_number is a string
+            "position": player.position,
+            "is_starter": is_starter,
+        }
+
     def _undo_shot(self, event: GameEvent):
         """Undo a shot event."""
         if event.player_id is None:
@@ -1,6 +1,9 @@
 """CSV parsing functionality for basketball stats imports."""
 
 import csv
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -109,34 +112,8 @@ class CSVParser:
                 typer.echo("Error: CSV file doesn't have enough rows.")
                 return None
 
-            # Parse new simplified format
-            # Row 0: Home,<team_name>
-            # Row 1: Visitor/Away,<team_name>
-            # Row 2: Date,<date>
-            # Row 3: Headers
-            # Row 4+: Player data
-
-            game_info_data = {}
-
-            # Parse home team (row 0)
-            if len(rows[0]) >= 2 and rows[0][0].lower() == "home":
-                game_info_data["Home"] = rows[0][1].strip()
-            else:
-                typer.echo("Error: First row should be 'Home,<team_name>'")
-                return None
-
-            # Parse visitor team (row 1)
-            if len(rows[1]) >= 2 and rows[1][0].lower() in ["visitor", "away"]:
-                game_info_data["Visitor"] = rows[1][1].strip()
-            else:
-                typer.echo("Error: Second row should be 'Visitor,<team_name>' or 'Away,<team_name>'")
-                return None
-
-            # Parse date (row 2)
-            if len(rows[2]) >= 2 and rows[2][0].lower() == "date":
-                game_info_data["Date"] = rows[2][1].strip()
-            else:
-                typer.echo("Error: Third row should be 'Date,<date>'")
+            game_info_data = CSVParser._parse_game_info_rows(rows[:3])
+            if game_info_data is None:
                 return None
 
             # Headers are in row 3
@@ -153,3 +130,72 @@ class CSVParser:
                 return None
 
             return game_info_data, player_stats_header, player_stats_rows
+
+    @staticmethod
+    @contextmanager
+    def open_game_stats_csv(
+        game_stats_path: Path,
+    ) -> Iterator[tuple[dict[str, str], list[str], Iterator[list[str]]] | None]:
+        """Open a game stats CSV for streaming.
+
+        Reads the game info and header rows up front and yields the player rows as
+        a lazy iterator, so the file is never held in memory as a whole. The rows
+        can only be consumed while the context is open.
+
+        Args:
+            game_stats_path: Path to the game stats CSV file
+
+        Yields:
+            Tuple of (game_info_data, player_stats_header, player_stats_rows) or None on error
+        """
+        with open(game_stats_path, newline="", encoding="utf-8") as csvfile:
+            reader = csv.reader(csvfile)
+            preamble = list(islice(reader, 4))
+
+            if len(preamble) < 4:
+                typer.echo("Error: CSV file doesn't have enough rows.")
+                yield None
+                return
+
+            game_info_data = CSVParser._parse_game_info_rows(preamble[:3])
+            if game_info_data is None:
+                yield None
+                return
+
+            player_stats_rows = (row for row in reader if any(cell.strip() for cell in row))
+            yield game_info_data, preamble[3], player_stats_rows
+
+    @staticmethod
+    def _parse_game_info_rows(rows: list[list[str]]) -> dict[str, str] | None:
+        """Parse the Home, Visitor/Away and Date rows at the top of a game stats CSV.
+
+        Args:
+            rows: The first three rows of the file
+
+        Returns:
+            Dictionary with "Home", "Visitor" and "Date" keys, or None on error
+        """
+        # Row 0: Home,<team_name>
+        # Row 1: Visitor/Away,<team_name>
+        # Row 2: Date,<date>
+        game_info_data = {}
+
+        if len(rows[0]) >= 2 and rows[0][0].lower() == "home":
+            game_info_data["Home"] = rows[0][1].strip()
+        else:
+            typer.echo("Error: First row should be 'Home,<team_name>'")
+            return None
+
+        if len(rows[1]) >= 2 and rows[1][0].lower() in ["visitor", "away"]:
+            game_info_data["Visitor"] = rows[1][1].strip()
+        else:
+            typer.echo("Error: Second row should be 'Visitor,<team_name>' or 'Away,<team_name>'")
+            return None
+
+        if len(rows[2]) >= 2 and rows[2][0].lower() == "date":
+            game_info_data["Date"] = rows[2][1].strip()
+        else:
+            typer.echo("Error: Third row should be 'Date,<date>'")
+            return None
+
+        return game_info_data
@@ -1,5 +1,6 @@
 """Data validation for CSV imports."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import typer
@@ -7,7 +8,10 @@ from pydantic import ValidationError
 
 from app.config import SHOT_MAPPING
 from app.schemas.csv_schemas import GameInfoSchema, GameStatsCSVInputSchema, PlayerStatsRowSchema
-from app.utils.input_parser import parse_quarter_shot_string
+from app.utils.input_parser import ShotStringParser
+
+# Shot strings may separate shots with whitespace; any other unmapped character is invalid
+_SHOT_STRING_PARSER = ShotStringParser(SHOT_MAPPING, allowed_chars=" \t")
 
 
 class DataValidator:
@@ -27,52 +31,78 @@ class DataValidator:
         Returns:
             Validated GameStatsCSVInputSchema or None if validation fails
         """
-        try:
-            # Map CSV fields to schema fields
-            mapped_game_info = {
-                "HomeTeam": game_info_data.get("Home", ""),
-                "VisitorTeam": game_info_data.get("Visitor", ""),
-                "Date": game_info_data.get("Date", ""),
-            }
-
-            # Validate game info
-            game_info = GameInfoSchema(**mapped_game_info)
-
-            # Validate player stats
-            player_stats = []
-            for row in player_stats_rows:
-                player_data = DataValidator._extract_player_data_from_row(row, player_stats_header)
-                if player_data:
-                    try:
-                        # Map extracted fields to schema fields
-                        mapped_player_data = {
-                            "TeamName": player_data.get("team_name", ""),
-                            "PlayerJersey": player_data.get("jersey_number", ""),
-                            "PlayerName": player_data.get("player_name", ""),
-                            "Fouls": int(player_data.get("fouls", 0)) if player_data.get("fouls") else 0,
-                            "QT1Shots": player_data.get("quarter_1", ""),
-                            "QT2Shots": player_data.get("quarter_2", ""),
-                            "QT3Shots": player_data.get("quarter_3", ""),
-                            "QT4Shots": player_data.get("quarter_4", ""),
-                            "OT1Shots": player_data.get("overtime_1", ""),
-                            "OT2Shots": player_data.get("overtime_2", ""),
-                        }
-                        validated_player = PlayerStatsRowSchema(**mapped_player_data)
-                        player_stats.append(validated_player)
-                    except ValidationError as e:
-                        typer.echo(f"Warning: Invalid player data - {e}")
-                        continue
-
-            if not player_stats:
-                typer.echo("Error: No valid player statistics found.")
-                return None
-
-            return GameStatsCSVInputSchema(game_info=game_info, player_stats=player_stats)
+        game_info = DataValidator.validate_game_info(game_info_data)
+        if game_info is None:
+            return None
+
+        player_stats = list(DataValidator.iter_player_stats(player_stats_header, player_stats_rows))
+        if not player_stats:
+            typer.echo("Error: No valid player statistics found.")
+            return None
+
+        return GameStatsCSVInputSchema(game_info=game_info, player_stats=player_stats)
+
+    @staticmethod
+    def validate_game_info(game_info_data: dict[str, str]) -> GameInfoSchema | None:
+        """Validate the game information section of a game stats CSV.
+
+        Args:
+            game_info_data: Dictionary containing game information
+
+        Returns:
+            Validated GameInfoSchema or None if validation fails
+        """
+        # Map CSV fields to schema fields
+        mapped_game_info = {
+            "HomeTeam": game_info_data.get("Home", ""),
+            "VisitorTeam": game_info_data.get("Visitor", ""),
+            "Date": game_info_data.get("Date", ""),
+        }
 
+        try:
+            return GameInfoSchema(**mapped_game_info)
         except ValidationError as e:
             typer.echo(f"Validation error: {e}")
             return None
 
+    @staticmethod
+    def iter_player_stats(
+        player_stats_header: list[str], player_stats_rows: Iterable[list[str]]
+    ) -> Iterator[PlayerStatsRowSchema]:
+        """Validate player statistics rows lazily.
+
+        Invalid rows are reported and skipped, so this can consume rows straight
+        from ``CSVParser.open_game_stats_csv``.
+
+        Args:
+            player_stats_header: List of column headers
+            player_stats_rows: Player statistics rows
+
+        Yields:
+            Validated PlayerStatsRowSchema for each valid row
+        """
+        for row in player_stats_rows:
+            player_data = DataValidator._extract_player_data_from_row(row, player_stats_header)
+            if not player_data:
+                continue
+
+            try:
+                # Map extracted fields to schema fields
+                yield PlayerStatsRowSchema(
+                    TeamName=player_data.get("team_name", ""),
+                    PlayerJersey=player_data.get("jersey_number", ""),
+                    PlayerName=player_data.get("player_name", ""),
+                    Fouls=int(player_data.get("fouls", 0)) if player_data.get("fouls") else 0,
+                    QT1Shots=player_data.get("quarter_1", ""),
+                    QT2Shots=player_data.get("quarter_2", ""),
+                    QT3Shots=player_data.get("quarter_3", ""),
+                    QT4Shots=player_data.get("quarter_4", ""),
+                    OT1Shots=player_data.get("overtime_1", ""),
+                    OT2Shots=player_data.get("overtime_2", ""),
+                )
+            except ValidationError as e:
+                typer.echo(f"Warning: Invalid player data - {e}")
+
     @staticmethod
     def _extract_player_data_from_row(row: list[str], header: list[str]) -> dict[str, Any] | None:
         """Extract player data from a CSV row.
@@ -142,9 +172,11 @@ class DataValidator:
         Returns:
             Dictionary of shot statistics or None if validation fails
         """
-        try:
-            shot_stats = parse_quarter_shot_string(shot_string, shot_mapping=SHOT_MAPPING)
-            return shot_stats
-        except ValueError as e:
-            typer.echo(f"Warning: Invalid shot string '{shot_string}' for {player_name} in Q{quarter}: {e}")
+        invalid = _SHOT_STRING_PARSER.invalid_chars(shot_string)
+        if invalid:
+            typer.echo(
+                f"Warning: Invalid shot string '{shot_string}' for {player_name} in Q{quarter}: "
+                f"unknown characters {invalid!r}"
+            )
             return None
+        return _SHOT_STRING_PARSER.parse(shot_string)
@@ -1,10 +1,13 @@
 """Orchestrates the CSV import process."""
 
+from collections.abc import Iterable
+from pathlib import Path
+
 import typer
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.data_access.database_manager import db_manager
-from app.schemas.csv_schemas import GameStatsCSVInputSchema
+from app.schemas.csv_schemas import GameInfoSchema, GameStatsCSVInputSchema, PlayerStatsRowSchema
 
 from .csv_parser import CSVParser
 from .data_validator import DataValidator
@@ -55,12 +58,13 @@ class ImportOrchestrator:
             typer.echo(f"Unexpected error importing roster: {e}")
             return False
 
-    def import_game_stats_from_csv(self, game_stats_file: str, dry_run: bool = False) -> bool:
+    def import_game_stats_from_csv(self, game_stats_file: str, dry_run: bool = False, stream: bool = False) -> bool:
         """Import game statistics from a CSV file.
 
         Args:
             game_stats_file: Path to the game stats CSV file
             dry_run: If True, validate but don't commit changes
+            stream: If True, parse rows lazily and write stats with bulk inserts
 
         Returns:
             True on success, False on error
@@ -71,6 +75,9 @@ class ImportOrchestrator:
             return False
 
         try:
+            if stream:
+                return self._import_game_stats_stream(game_stats_file, game_stats_path, dry_run)
+
             # Parse CSV file
             csv_sections = CSVParser.read_game_stats_csv(game_stats_path)
             if not csv_sections:
@@ -105,6 +112,32 @@ class ImportOrchestrator:
             typer.echo(f"Unexpected error importing game stats: {e}")
             return False
 
+    def _import_game_stats_stream(self, game_stats_file: str, game_stats_path: Path, dry_run: bool) -> bool:
+        """Import a game stats CSV without materializing its rows."""
+        with CSVParser.open_game_stats_csv(game_stats_path) as csv_sections:
+            if not csv_sections:
+                return False
+
+            game_info_data, player_stats_header, player_stats_rows = csv_sections
+
+            game_info = DataValidator.validate_game_info(game_info_data)
+            if not game_info:
+                return False
+
+            player_stats = DataValidator.iter_player_stats(player_stats_header, player_stats_rows)
+
+            typer.echo(f"\nStreaming game data from '{game_stats_file}':")
+            typer.echo(f"  - Home Team: {game_info.HomeTeam}")
+            typer.echo(f"  - Visitor Team: {game_info.VisitorTeam}")
+            typer.echo(f"  - Date: {game_info.Date}")
+
+            if dry_run:
+                typer.echo(f"  - Players with stats: {sum(1 for _ in player_stats)}")
+                typer.echo("\nDry run mode: No changes were made to the database.")
+                return True
+
+            return self._process_game_stats_stream(game_info, player_stats)
+
     def _display_roster_import_summary(self, roster_file: str, team_data: dict, player_data: list) -> None:
         """Display summary of roster import data."""
         typer.echo(f"\nParsed roster data from '{roster_file}':")
@@ -179,3 +212,26 @@ class ImportOrchestrator:
         except SQLAlchemyError as e:
             typer.echo(f"Database error: {e}")
             return False
+
+    def _process_game_stats_stream(
+        self, game_info: GameInfoSchema, player_stats: Iterable[PlayerStatsRowSchema]
+    ) -> bool:
+        """Process a streamed game stats import into the database."""
+        try:
+            with db_manager.get_db_session() as db:
+                processor = ImportProcessor(db)
+
+                success = processor.process_game_stats_stream(game_info, player_stats)
+
+                if success:
+                    db.commit()
+                    typer.echo("\nGame stats import completed successfully.")
+                else:
+                    db.rollback()
+                    typer.echo("\nGame stats import failed.")
+
+                return success
+
+        except SQLAlchemyError as e:
+            typer.echo(f"Database error: {e}")
+            return False
@@ -1,14 +1,17 @@
 """Database operations for CSV imports."""
 
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 
 import typer
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.config import SHOT_MAPPING
-from app.data_access.models import Game, Player, Team
-from app.schemas.csv_schemas import GameStatsCSVInputSchema
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Team
+from app.schemas.csv_schemas import GameInfoSchema, GameStatsCSVInputSchema, PlayerStatsRowSchema
 from app.services.game_service import GameService
 from app.services.game_state_service import GameStateService
 from app.services.player_service import PlayerService
@@ -16,7 +19,19 @@ from app.services.score_calculation_service import ScoreCalculationService
 from app.services.season_stats_service import SeasonStatsService
 from app.services.stats_entry_service import StatsEntryService
 from app.utils.fuzzy_matching import names_match_enhanced
-from app.utils.input_parser import parse_quarter_shot_string
+from app.utils.input_parser import get_shot_parser, parse_quarter_shot_string, shot_stats_at
+
+QUARTER_SHOT_FIELDS = ("QT1Shots", "QT2Shots", "QT3Shots", "QT4Shots", "OT1Shots", "OT2Shots")
+
+# Parsed shot stat -> PlayerGameStats total column
+QUARTER_STAT_FIELDS = {
+    "ftm": "total_ftm",
+    "fta": "total_fta",
+    "fg2m": "total_2pm",
+    "fg2a": "total_2pa",
+    "fg3m": "total_3pm",
+    "fg3a": "total_3pa",
+}
 
 
 class ImportProcessor:
@@ -173,94 +188,10 @@ class ImportProcessor:
             True if successful, False otherwise
         """
         try:
-            # Get or create teams
-            home_team = self._get_or_create_team(validated_data.game_info.HomeTeam)
-            visitor_team = self._get_or_create_team(validated_data.game_info.VisitorTeam)
-
-            if not home_team or not visitor_team:
+            prepared = self._prepare_game(validated_data.game_info)
+            if not prepared:
                 return False
-
-            # Convert date format if necessary
-            date_str = validated_data.game_info.Date
-            if "/" in date_str:
-                # Convert M/D/YYYY to YYYY-MM-DD
-                from datetime import datetime
-
-                date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                date_str = date_obj.strftime("%Y-%m-%d")
-
-            # Determine the season from the game date
-            from datetime import datetime
-
-            from app.services.season_service import SeasonService
-
-            game_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            # Use SeasonService to find appropriate season
-            season_service = SeasonService(self.db)
-            season = season_service.get_season_for_date(game_date)
-
-            if not season:
-                # No season found for this date, check for active season
-                season = season_service.get_active_season()
-                if season:
-                    typer.echo(
-                        f"Note: Game date {date_str} is outside active season '{season.name}', but using it anyway."
-                    )
-                else:
-                    # No seasons exist at all, create a default season
-                    typer.echo("No seasons found in database. Creating default season...")
-
-                    # Determine season based on game date
-                    # Basketball seasons typically run Oct-Apr
-                    year = game_date.year
-                    month = game_date.month
-
-                    # If game is in Oct-Dec, it's the start of season YYYY-(YYYY+1)
-                    # If game is in Jan-Apr, it's the end of season (YYYY-1)-YYYY
-                    if month >= 10:  # October or later
-                        start_year = year
-                        end_year = year + 1
-                    else:  # January through April
-                        start_year = year - 1
-                        end_year = year
-
-                    season_code = f"{start_year}-{end_year}"
-                    season_name = f"Season {season_code}"
-
-                    # Create the season
-                    from datetime import date as date_type
-
-                    success, message, season = season_service.create_season(
-                        name=season_name,
-                        code=season_code,
-                        start_date=date_type(start_year, 10, 1),
-                        end_date=date_type(end_year, 4, 30),
-                        description="Auto-created during game import",
-                        set_as_active=True,
-                    )
-
-                    if success and season:
-                        typer.echo(f"Created season: {season_name}")
-                    else:
-                        typer.echo(f"Warning: Could not create season - {message}")
-                        # Continue without season association
-
-            # Get or create the game (handles duplicates gracefully)
-            game = self.game_service.add_game(
-                date=date_str,
-                playing_team_name=home_team.name,
-                opponent_team_name=visitor_team.name,
-            )
-
-            if not game:
-                typer.echo("Error: Failed to create game.")
-                return False
-
-            # Update season if needed
-            if season and not game.season_id:
-                game.season_id = season.id
-                self.db.flush()
+            game, home_team, visitor_team = prepared
 
             typer.echo(f"\nProcessing game: {home_team.name} vs {visitor_team.name} on {validated_data.game_info.Date}")
 
@@ -334,6 +265,317 @@ class ImportProcessor:
             self.db.rollback()
             return False
 
+    def process_game_stats_stream(
+        self, game_info: GameInfoSchema, player_stats: Iterable[PlayerStatsRowSchema]
+    ) -> bool:
+        """Process a game statistics import from a stream of validated rows.
+
+        The rows are consumed once, as they are parsed. Players are resolved
+        against one prefetch of the teams' rosters instead of per-row lookups,
+        and player and quarter stats are written with bulk inserts. Season
+        tables and box scores are updated incrementally for the game.
+
+        Args:
+            game_info: Validated game information
+            player_stats: Validated player statistics rows, e.g. from ``DataValidator.iter_player_stats``
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            prepared = self._prepare_game(game_info)
+            if not prepared:
+                return False
+            game, home_team, visitor_team = prepared
+
+            typer.echo(f"\nProcessing game: {home_team.name} vs {visitor_team.name} on {game_info.Date}")
+
+            roster = _ImportRoster(self.db, [home_team, visitor_team])
+            lines: dict[Player, dict[str, Any]] = {}
+            players_processed = 0
+            players_error = 0
+
+            for row in player_stats:
+                if self._collect_player_line(roster, lines, row):
+                    players_processed += 1
+                else:
+                    players_error += 1
+
+            if players_processed + players_error == 0:
+                typer.echo("Error: No player statistics found in CSV file.")
+                return False
+
+            self._parse_line_quarters(lines)
+
+            with self.season_stats_service.track_game_changes(game.id):
+                # Assigns IDs to players created while resolving the rows
+                self.db.flush()
+                self._write_player_lines(game, lines)
+                ScoreCalculationService.update_game_scores(self.db, game, commit=False)
+
+            typer.echo(f"\nProcessed {players_processed} player stats successfully.")
+            if players_error > 0:
+                typer.echo(f"Failed to process {players_error} player stats.")
+
+            return players_error == 0
+
+        except SQLAlchemyError as e:
+            typer.echo(f"Database error: {e}")
+            self.db.rollback()
+            return False
+
+    def _collect_player_line(
+        self, roster: "_ImportRoster", lines: dict[Player, dict[str, Any]], player_stats: PlayerStatsRowSchema
+    ) -> bool:
+        """Resolve one streamed row's player and parse its quarters into ``lines``.
+
+        Mirrors ``_process_player_game_stats`` without touching the database.
+        Quarter shot strings are kept as-is for ``_parse_line_quarters``, and
+        quarters already collected for the player keep their first value.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not player_stats.PlayerJersey or not player_stats.PlayerJersey.strip():
+            typer.echo(f"Warning: Skipping player with empty jersey number: {player_stats.PlayerName}")
+            return True
+
+        if not player_stats.TeamName or not player_stats.TeamName.strip():
+            typer.echo(f"Warning: Skipping player with empty team name: {player_stats.PlayerName}")
+            return True
+
+        team = roster.get_team(player_stats.TeamName)
+        if not team:
+            typer.echo(f"Error: Team '{player_stats.TeamName}' not found.")
+            return False
+
+        playing_for_team_id = None
+        if player_stats.PlayerName and player_stats.PlayerName.strip().lower() in ["unknown", "unidentified"]:
+            player_name = f"Unknown #{player_stats.PlayerJersey} ({team.name})"
+            player = roster.get_or_create_player(team, player_stats.PlayerJersey, player_name)
+        else:
+            player = roster.get_substitute(player_stats.PlayerName, player_stats.PlayerJersey)
+            if player:
+                playing_for_team_id = team.id
+            else:
+                player = roster.get_or_create_player(team, player_stats.PlayerJersey, player_stats.PlayerName)
+
+        if not player:
+            typer.echo(
+                f"Error: Could not get or create player '{player_stats.PlayerName}' "
+                f"#{player_stats.PlayerJersey} on team '{player_stats.TeamName}'."
+            )
+            return False
+
+        quarters = {}
+        for quarter, quarter_key in enumerate(QUARTER_SHOT_FIELDS, start=1):
+            shot_string = getattr(player_stats, quarter_key)
+            if shot_string and shot_string.strip():
+                quarters[quarter] = shot_string
+
+        if not quarters and not player_stats.Fouls:
+            return True
+
+        line = lines.setdefault(
+            player, {"fouls": player_stats.Fouls or 0, "playing_for_team_id": playing_for_team_id, "quarters": {}}
+        )
+        for quarter, stats in quarters.items():
+            line["quarters"].setdefault(quarter, stats)
+        return True
+
+    @staticmethod
+    def _parse_line_quarters(lines: dict[Player, dict[str, Any]]) -> None:
+        """Replace the collected quarter shot strings of every line with parsed stats, in one batch."""
+        slots = [(line["quarters"], quarter) for line in lines.values() for quarter in line["quarters"]]
+        parsed = get_shot_parser(SHOT_MAPPING).parse_many(quarters[quarter] for quarters, quarter in slots)
+        for index, (quarters, quarter) in enumerate(slots):
+            quarters[quarter] = shot_stats_at(parsed, index)
+
+    def _write_player_lines(self, game: Game, lines: dict[Player, dict[str, Any]]) -> None:
+        """Write collected player lines for a game with bulk inserts.
+
+        Players without stats in the game get new ``PlayerGameStats`` rows. For
+        players the game already has stats for, only quarters not yet recorded
+        are added and the totals are recomputed, as ``StatsEntryService`` does.
+
+        Args:
+            game: The game being imported
+            lines: Collected lines keyed by player
+        """
+        if not lines:
+            return
+
+        existing = {
+            stats.player_id: stats
+            for stats in self.db.query(PlayerGameStats).filter(PlayerGameStats.game_id == game.id)
+        }
+        recorded_quarters: dict[int, dict[int, dict[str, int]]] = defaultdict(dict)
+        if existing:
+            quarter_rows = (
+                self.db.query(PlayerQuarterStats)
+                .join(PlayerGameStats, PlayerQuarterStats.player_game_stat_id == PlayerGameStats.id)
+                .filter(PlayerGameStats.game_id == game.id)
+            )
+            for quarter_row in quarter_rows:
+                recorded_quarters[quarter_row.player_game_stat_id][quarter_row.quarter_number] = {
+                    field: getattr(quarter_row, field) for field in QUARTER_STAT_FIELDS
+                }
+
+        new_lines = {}
+        quarter_inserts = []
+        for player, line in lines.items():
+            stats = existing.get(player.id)
+            if stats is None:
+                new_lines[player.id] = line
+                continue
+
+            quarters = recorded_quarters[stats.id]
+            for quarter, quarter_stats in line["quarters"].items():
+                if quarter not in quarters:
+                    quarters[quarter] = quarter_stats
+                    quarter_inserts.append(self._quarter_row(stats.id, quarter, quarter_stats))
+            for total_field, value in self._line_totals(quarters.values()).items():
+                setattr(stats, total_field, value)
+            if line["playing_for_team_id"] and not stats.playing_for_team_id:
+                stats.playing_for_team_id = line["playing_for_team_id"]
+
+        if new_lines:
+            inserted = self.db.execute(
+                insert(PlayerGameStats).returning(PlayerGameStats.id, PlayerGameStats.player_id),
+                [
+                    {
+                        "game_id": game.id,
+                        "player_id": player_id,
+                        "fouls": line["fouls"],
+                        "playing_for_team_id": line["playing_for_team_id"],
+                        **self._line_totals(line["quarters"].values()),
+                    }
+                    for player_id, line in new_lines.items()
+                ],
+            )
+            for stats_id, player_id in inserted:
+                for quarter, quarter_stats in new_lines[player_id]["quarters"].items():
+                    quarter_inserts.append(self._quarter_row(stats_id, quarter, quarter_stats))
+
+        if quarter_inserts:
+            self.db.execute(insert(PlayerQuarterStats), quarter_inserts)
+        self.db.flush()
+
+    @staticmethod
+    def _quarter_row(player_game_stat_id: int, quarter: int, stats: dict[str, int]) -> dict[str, int]:
+        """Build a ``PlayerQuarterStats`` insert row from parsed shot stats."""
+        row = {field: stats.get(field, 0) for field in QUARTER_STAT_FIELDS}
+        row["player_game_stat_id"] = player_game_stat_id
+        row["quarter_number"] = quarter
+        return row
+
+    @staticmethod
+    def _line_totals(quarters: Iterable[dict[str, int]]) -> dict[str, int]:
+        """Sum parsed quarter stats into ``PlayerGameStats`` total columns."""
+        totals = dict.fromkeys(QUARTER_STAT_FIELDS.values(), 0)
+        for stats in quarters:
+            for field, total_field in QUARTER_STAT_FIELDS.items():
+                totals[total_field] += stats.get(field, 0)
+        return totals
+
+    def _prepare_game(self, game_info: GameInfoSchema) -> tuple[Game, Team, Team] | None:
+        """Get or create the teams, season and game described by a game stats file.
+
+        Args:
+            game_info: Validated game information
+
+        Returns:
+            Tuple of (game, home_team, visitor_team) or None if the game could not be created
+        """
+        # Get or create teams
+        home_team = self._get_or_create_team(game_info.HomeTeam)
+        visitor_team = self._get_or_create_team(game_info.VisitorTeam)
+
+        if not home_team or not visitor_team:
+            return None
+
+        # Convert date format if necessary
+        date_str = game_info.Date
+        if "/" in date_str:
+            # Convert M/D/YYYY to YYYY-MM-DD
+            from datetime import datetime
+
+            date_obj = datetime.strptime(date_str, "%m/%d/%Y")
+            date_str = date_obj.strftime("%Y-%m-%d")
+
+        # Determine the season from the game date
+        from datetime import datetime
+
+        from app.services.season_service import SeasonService
+
+        game_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+
+        # Use SeasonService to find appropriate season
+        season_service = SeasonService(self.db)
+        season = season_service.get_season_for_date(game_date)
+
+        if not season:
+            # No season found for this date, check for active season
+            season = season_service.get_active_season()
+            if season:
+                typer.echo(f"Note: Game date {date_str} is outside active season '{season.name}', but using it anyway.")
+            else:
+                # No seasons exist at all, create a default season
+                typer.echo("No seasons found in database. Creating default season...")
+
+                # Determine season based on game date
+                # Basketball seasons typically run Oct-Apr
+                year = game_date.year
+                month = game_date.month
+
+                # If game is in Oct-Dec, it's the start of season YYYY-(YYYY+1)
+                # If game is in Jan-Apr, it's the end of season (YYYY-1)-YYYY
+                if month >= 10:  # October or later
+                    start_year = year
+                    end_year = year + 1
+                else:  # January through April
+                    start_year = year - 1
+                    end_year = year
+
+                season_code = f"{start_year}-{end_year}"
+                season_name = f"Season {season_code}"
+
+                # Create the season
+                from datetime import date as date_type
+
+                success, message, season = season_service.create_season(
+                    name=season_name,
+                    code=season_code,
+                    start_date=date_type(start_year, 10, 1),
+                    end_date=date_type(end_year, 4, 30),
+                    description="Auto-created during game import",
+                    set_as_active=True,
+                )
+
+                if success and season:
+                    typer.echo(f"Created season: {season_name}")
+                else:
+                    typer.echo(f"Warning: Could not create season - {message}")
+                    # Continue without season association
+
+        # Get or create the game (handles duplicates gracefully)
+        game = self.game_service.add_game(
+            date=date_str,
+            playing_team_name=home_team.name,
+            opponent_team_name=visitor_team.name,
+        )
+
+        if not game:
+            typer.echo("Error: Failed to create game.")
+            return None
+
+        # Update season if needed
+        if season and not game.season_id:
+            game.season_id = season.id
+            self.db.flush()
+
+        return game, home_team, visitor_team
+
     def _get_or_create_team(self, team_name: str) -> Team | None:
         """Get existing team or create new one.
 
@@ -416,23 +658,18 @@ class ImportProcessor:
                 )
                 return False
 
-        # Process quarter statistics
-        for i, quarter_key in enumerate(["QT1Shots", "QT2Shots", "QT3Shots", "QT4Shots", "OT1Shots", "OT2Shots"]):
-            quarter = i + 1
-            if hasattr(player_stats, quarter_key):
-                shot_string = getattr(player_stats, quarter_key)
-                if shot_string and shot_string.strip():
-                    try:
-                        shot_stats = parse_quarter_shot_string(shot_string, shot_mapping=SHOT_MAPPING)
-                        self.stats_service.add_player_quarter_stats(
-                            game_id=game.id,
-                            player_id=player.id,
-                            quarter=quarter,
-                            stats=shot_stats,
-                            playing_for_team_id=playing_for_team_id,
-                        )
-                    except ValueError as e:
-                        typer.echo(f"Warning: Invalid shot string for {player.name} Q{quarter}: {e}")
+        # Process quarter statistics, parsing all of the row's quarters at once
+        shot_strings = [getattr(player_stats, quarter_key, None) for quarter_key in QUARTER_SHOT_FIELDS]
+        parsed = get_shot_parser(SHOT_MAPPING).parse_many(shot_strings)
+        for i, shot_string in enumerate(shot_strings):
+            if shot_string and shot_string.strip():
+                self.stats_service.add_player_quarter_stats(
+                    game_id=game.id,
+                    player_id=player.id,
+                    quarter=i + 1,
+                    stats=shot_stats_at(parsed, i),
+                    playing_for_team_id=playing_for_team_id,
+                )
 
         return True
 
@@ -463,3 +700,76 @@ class ImportProcessor:
         )
 
         return existing_player is not None
+
+
+class _ImportRoster:
+    """In-memory index of the players a game stats file can refer to.
+
+    The game's two teams and the Guest Players team are loaded with one query up
+    front; any other team named in the file is loaded the first time it appears.
+    New players are added to the session but not flushed.
+    """
+
+    def __init__(self, db: Session, teams: list[Team]):
+        self.db = db
+        self._teams: dict[str, Team | None] = {team.name: team for team in teams}
+        guest_team = db.query(Team).filter_by(name="Guest Players").first()
+        self._guest_team_id = guest_team.id if guest_team else None
+        self._by_jersey: dict[tuple[int, str], Player] = {}
+        self._names: dict[int, set[str]] = defaultdict(set)
+        self._substitutes: dict[tuple[str, str], Player] = {}
+        self._loaded_team_ids: set[int] = set()
+
+        team_ids = [team.id for team in teams]
+        if self._guest_team_id is not None:
+            team_ids.append(self._guest_team_id)
+        self._load_players(team_ids)
+
+    def _load_players(self, team_ids: list[int]) -> None:
+        team_ids = [team_id for team_id in team_ids if team_id not in self._loaded_team_ids]
+        if not team_ids:
+            return
+        self._loaded_team_ids.update(team_ids)
+        for player in self.db.query(Player).filter(Player.team_id.in_(team_ids)).order_by(Player.id):
+            self._index(player)
+
+    def _index(self, player: Player) -> None:
+        self._by_jersey.setdefault((player.team_id, player.jersey_number), player)
+        self._names[player.team_id].add(player.name)
+        if player.team_id == self._guest_team_id and player.is_substitute:
+            self._substitutes.setdefault((player.name, player.jersey_number), player)
+
+    def get_team(self, team_name: str) -> Team | None:
+        """Get a team by name, loading its roster on first use."""
+        if team_name not in self._teams:
+            team = self.db.query(Team).filter(Team.name == team_name).first()
+            self._teams[team_name] = team
+            if team:
+                self._load_players([team.id])
+        return self._teams[team_name]
+
+    def get_substitute(self, player_name: str | None, jersey_number: str) -> Player | None:
+        """Get the Guest Players substitute with this name and jersey, if any."""
+        if not player_name:
+            return None
+        return self._substitutes.get((player_name, jersey_number))
+
+    def get_or_create_player(self, team: Team, jersey_number: str, player_name: str) -> Player | None:
+        """Get a player by team and jersey, or create them, like ``PlayerService.get_or_create_player``.
+
+        Returns:
+            The player, or None if a new player's name is already taken on the team
+        """
+        names = self._names[team.id]
+        player = self._by_jersey.get((team.id, jersey_number))
+        if player is None:
+            if player_name in names:
+                return None
+            player = Player(team_id=team.id, name=player_name, jersey_number=jersey_number)
+            self.db.add(player)
+            self._index(player)
+        elif player_name and player.name != player_name and player_name not in names:
+            names.discard(player.name)
+            player.name = player_name
+            names.add(player_name)
+        return player
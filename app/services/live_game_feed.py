@@ -0,0 +1,104 @@
+"""In-process wake-ups for live game streams.
+
+``GameStateService`` notifies the feed after every event it commits, and
+``GET /v1/games/{id}/live/stream`` waits on it instead of having clients poll.
+A notification only wakes the stream; the stream then reads the
+``game_events`` log from the last event id it sent. That way events written by
+other workers are still delivered in order, and a burst of events costs one read
+per stream rather than one per event.
+
+Streams also wake on a timer, which is how events written by another worker
+reach clients connected to this one.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+
+
+class LiveGameSubscription:
+    """One stream's wake-up signal for a game."""
+
+    def __init__(self, feed: "LiveGameFeed", game_id: int, loop: asyncio.AbstractEventLoop):
+        self.feed = feed
+        self.game_id = game_id
+        self.loop = loop
+        self._pending = asyncio.Event()
+
+    def notify(self) -> None:
+        """Mark that new events are available. Must run on the subscriber's loop."""
+        self._pending.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a notification.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            True if notified, False if the timeout elapsed first
+        """
+        try:
+            await asyncio.wait_for(self._pending.wait(), timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._pending.clear()
+        return True
+
+    def close(self) -> None:
+        """Stop receiving notifications."""
+        self.feed.unsubscribe(self)
+
+    def __enter__(self) -> "LiveGameSubscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LiveGameFeed:
+    """Per-game registry of streams waiting for new events."""
+
+    def __init__(self):
+        self._subscribers: dict[int, set[LiveGameSubscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, game_id: int) -> LiveGameSubscription:
+        """Subscribe the running event loop to a game's notifications."""
+        subscription = LiveGameSubscription(self, game_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[game_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LiveGameSubscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.game_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.game_id]
+
+    def subscriber_count(self, game_id: int) -> int:
+        """Number of streams currently subscribed to a game."""
+        with self._lock:
+            return len(self._subscribers.get(game_id, ()))
+
+    def publish(self, game_id: int) -> None:
+        """Wake every stream subscribed to a game.
+
+        Safe to call from any thread; the wake-up runs on each subscriber's loop.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(game_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.notify)
+            except RuntimeError:
+                # The subscriber's loop has shut down
+                self.unsubscribe(subscription)
+
+
+# Process-wide feed shared by every GameStateService
+live_game_feed = LiveGameFeed()
@@ -0,0 +1,202 @@
+"""In-memory state for games being tracked live.
+
+Scorekeepers' clients poll ``GET /games/{id}/live`` throughout a game. Instead of
+rebuilding the scores, rosters and event feed from the database on every poll,
+``GameStateService`` keeps one ``LiveGameSession`` per game in a process-wide
+registry and applies each recorded event to it after the event is committed.
+
+The database stays the durable log. Each session remembers the id of the last
+``GameEvent`` it reflects and the ``GameState.revision`` it was built at; readers
+compare both against the database and rebuild the session whenever another worker
+(or anything else) has written an event this process has not seen. Writes that
+change a game's stats without an event (scorebook saves, data corrections,
+replays, restores) bump the revision with ``bump_live_revision``.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.data_access.models import GameEvent, GameState
+
+RECENT_EVENT_LIMIT = 10
+
+SHOT_POINTS = {"ft": 1, "2pt": 2, "3pt": 3}
+
+
+def event_payload(event: GameEvent) -> dict[str, Any]:
+    """Serialize a game event the way the live feed returns it."""
+    return {
+        "id": event.id,
+        "type": event.event_type,
+        "player_id": event.player_id,
+        "team_id": event.team_id,
+        "quarter": event.quarter,
+        "timestamp": event.timestamp.isoformat(),
+        "details": event.details,
+    }
+
+
+def bump_live_revision(session: Session, *game_ids: int) -> None:
+    """Mark the live sessions of games stale after a write that bypasses the event log.
+
+    Increments ``GameState.revision`` in the caller's transaction, so every worker
+    rebuilds its session for the games on the next read after the commit.
+
+    Args:
+        session: SQLAlchemy database session
+        game_ids: IDs of the changed games
+    """
+    session.execute(update(GameState).where(GameState.game_id.in_(game_ids)).values(revision=GameState.revision + 1))
+
+
+@dataclass
+class LiveGameSession:
+    """Running state of one game, mirrored from its event log."""
+
+    game_id: int
+    home_team_id: int
+    away_team_id: int
+    current_quarter: int
+    is_live: bool
+    is_final: bool
+    home_timeouts: int
+    away_timeouts: int
+    version: int | None = None
+    revision: int = 0
+    scores: dict[int, int] = field(default_factory=dict)
+    player_points: dict[int, int] = field(default_factory=dict)
+    player_fouls: dict[int, int] = field(default_factory=dict)
+    on_court: dict[str, dict[int, dict[str, Any]]] = field(default_factory=lambda: {"home": {}, "away": {}})
+    recent_events: deque = field(default_factory=lambda: deque(maxlen=RECENT_EVENT_LIMIT))
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    @property
+    def home_score(self) -> int:
+        """Running score of the home (playing) team."""
+        return self.scores.get(self.home_team_id, 0)
+
+    @property
+    def away_score(self) -> int:
+        """Running score of the away (opponent) team."""
+        return self.scores.get(self.away_team_id, 0)
+
+    def fouls(self, player_id: int) -> int:
+        """Personal fouls recorded for a player."""
+        return self.player_fouls.get(player_id, 0)
+
+    def active_player_ids(self, side: str) -> list[int]:
+        """IDs of the players on court for ``"home"`` or ``"away"``."""
+        return list(self.on_court[side])
+
+    def set_player_line(self, player_id: int, team_id: int | None, points: int, fouls: int) -> None:
+        """Seed a player's totals, adjusting their team's score by the difference."""
+        delta = points - self.player_points.get(player_id, 0)
+        self.player_points[player_id] = points
+        self.player_fouls[player_id] = fouls
+        if team_id is not None:
+            self.scores[team_id] = self.scores.get(team_id, 0) + delta
+
+    def add_points(self, player_id: int, team_id: int | None, points: int) -> None:
+        """Credit points to a player and their team."""
+        self.set_player_line(player_id, team_id, self.player_points.get(player_id, 0) + points, self.fouls(player_id))
+
+    def add_foul(self, player_id: int) -> None:
+        """Charge a foul to a player."""
+        self.player_fouls[player_id] = self.fouls(player_id) + 1
+
+    def set_on_court(self, active_players: dict[str, list[dict[str, Any]]]) -> None:
+        """Replace the on-court players with the output of ``_get_active_players``."""
+        self.on_court = {
+            side: {player["id"]: dict(player) for player in active_players.get(side, [])} for side in ("home", "away")
+        }
+
+    def substitute(self, players_out: list[int], players_in: dict[str, list[dict[str, Any]]]) -> None:
+        """Take players off the court and put others on.
+
+        Args:
+            players_out: IDs of the players leaving the court
+            players_in: Incoming player descriptions keyed by ``"home"``/``"away"``
+        """
+        for court in self.on_court.values():
+            for player_id in players_out:
+                court.pop(player_id, None)
+        for side, players in players_in.items():
+            for player in players:
+                self.on_court[side].setdefault(player["id"], dict(player))
+
+    def push_event(self, event: dict[str, Any]) -> None:
+        """Add a serialized event to the front of the recent feed."""
+        self.recent_events.appendleft(event)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the live state in the shape of ``GameStateService.get_live_game_state``."""
+        with self.lock:
+            return {
+                "game_state": {
+                    "game_id": self.game_id,
+                    "current_quarter": self.current_quarter,
+                    "is_live": self.is_live,
+                    "is_final": self.is_final,
+                    "home_score": self.home_score,
+                    "away_score": self.away_score,
+                    "home_timeouts": self.home_timeouts,
+                    "away_timeouts": self.away_timeouts,
+                },
+                "active_players": {
+                    side: [dict(player) for player in players.values()] for side, players in self.on_court.items()
+                },
+                "recent_events": [dict(event) for event in self.recent_events],
+            }
+
+
+class LiveGameSessionRegistry:
+    """Thread-safe LRU map of game ID to ``LiveGameSession``."""
+
+    def __init__(self, max_sessions: int = 64):
+        """Initialize the registry.
+
+        Args:
+            max_sessions: Number of games kept in memory before the least recently used is dropped
+        """
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[int, LiveGameSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, game_id: int) -> LiveGameSession | None:
+        """Get the session for a game, if one is held."""
+        with self._lock:
+            live = self._sessions.get(game_id)
+            if live is not None:
+                self._sessions.move_to_end(game_id)
+            return live
+
+    def put(self, live: LiveGameSession) -> None:
+        """Store a session, evicting the least recently used one when full."""
+        with self._lock:
+            self._sessions[live.game_id] = live
+            self._sessions.move_to_end(live.game_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def discard(self, game_id: int) -> None:
+        """Drop a game's session so the next read rebuilds it from the database."""
+        with self._lock:
+            self._sessions.pop(game_id, None)
+
+    def clear(self) -> None:
+        """Drop every session."""
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+# Process-wide registry shared by every GameStateService
+live_game_sessions = LiveGameSessionRegistry()
@@ -0,0 +1,109 @@
+# app/services/parallel_awards_service.py
+
+"""
+Parallel award calculation across seasons.
+
+Award evaluation is split into (family, season) work units - one per calendar-year
+season for each award family (weekly, season). Units are evaluated in a process pool
+where every worker opens its own engine and session; the parent merges the evaluated
+award records and persists them in one transaction per family.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import extract
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.data_access.database_manager import DatabaseManager, is_memory_sqlite
+from app.data_access.models import Game
+from app.services.awards_service import SEASON_AWARD_TYPES, WEEKLY_AWARD_TYPES
+from app.services.season_awards_engine import evaluate_season_awards, load_season_matrices, persist_season_awards
+from app.services.weekly_awards_engine import evaluate_weekly_awards, load_weekly_frames, persist_weekly_awards
+
+logger = logging.getLogger(__name__)
+
+AWARD_FAMILIES = {
+    "weekly": list(WEEKLY_AWARD_TYPES),
+    "season": SEASON_AWARD_TYPES,
+}
+
+
+def list_award_seasons(session: Session) -> list[str]:
+    """Return every calendar-year season that has games, oldest first."""
+    year = extract("year", Game.date)
+    return [str(int(value)) for (value,) in session.query(year).distinct().order_by(year).all()]
+
+
+def _evaluate_unit(session: Session, family: str, season: str) -> tuple[list, list[dict]]:
+    """Evaluate one (family, season) unit, returning the evaluated keys and award records."""
+    if family == "weekly":
+        frames = load_weekly_frames(session, season)
+        return list(frames), evaluate_weekly_awards(frames, AWARD_FAMILIES[family])
+    matrices = load_season_matrices(session, season)
+    return list(matrices), evaluate_season_awards(matrices, AWARD_FAMILIES[family])
+
+
+def _evaluate_unit_in_worker(db_url: str, family: str, season: str) -> tuple[str, str, list, list[dict]]:
+    """Process pool entry point: evaluate one unit on the worker's shared engine and a private session."""
+    engine = DatabaseManager().get_engine(db_url)
+    with sessionmaker(bind=engine)() as session:
+        keys, awards = _evaluate_unit(session, family, season)
+    return family, season, keys, awards
+
+
+def calculate_awards_parallel(
+    session: Session, targets: dict[str, str | None], recalculate: bool = False, workers: int = 1
+) -> dict[str, dict[str, dict[str, int]]]:
+    """
+    Calculate award families across seasons, evaluating seasons in a process pool.
+
+    Args:
+        session: Database session used for planning and for persisting the merged results
+        targets: Award family ("weekly" or "season") -> season to calculate (None = all seasons)
+        recalculate: If True, replace existing awards of each type instead of adding to them
+        workers: Number of worker processes (1 evaluates every unit in this process)
+
+    Returns:
+        Dict with family -> award_type -> season -> awards_given count
+    """
+    all_seasons = None
+    units = []
+    for family, season in targets.items():
+        if family not in AWARD_FAMILIES:
+            raise ValueError(f"Unknown award family: {family}")
+        if season is None and all_seasons is None:
+            all_seasons = list_award_seasons(session)
+        units.extend((family, unit_season) for unit_season in ([season] if season else all_seasons))
+
+    db_url = session.get_bind().url.render_as_string(hide_password=False)
+    if workers > 1 and is_memory_sqlite(db_url):
+        logger.warning("In-memory database cannot be shared with worker processes; evaluating serially")
+        workers = 1
+
+    logger.info(f"🏆 Evaluating {len(units)} award units with {workers} worker(s)")
+    evaluated = {family: {"keys": [], "awards": []} for family in targets}
+    if workers > 1 and len(units) > 1:
+        # Spawned workers start clean instead of inheriting the parent's pooled connections
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(units)), mp_context=context) as executor:
+            futures = [executor.submit(_evaluate_unit_in_worker, db_url, family, season) for family, season in units]
+            for future in futures:
+                family, season, keys, awards = future.result()
+                evaluated[family]["keys"].extend(keys)
+                evaluated[family]["awards"].extend(awards)
+    else:
+        for family, season in units:
+            keys, awards = _evaluate_unit(session, family, season)
+            evaluated[family]["keys"].extend(keys)
+            evaluated[family]["awards"].extend(awards)
+
+    results = {}
+    for family, season in targets.items():
+        awards, keys = evaluated[family]["awards"], evaluated[family]["keys"]
+        if family == "weekly":
+            results[family] = persist_weekly_awards(session, awards, keys, AWARD_FAMILIES[family], season, recalculate)
+        else:
+            results[family] = persist_season_awards(session, awards, AWARD_FAMILIES[family], season, recalculate)
+    return results
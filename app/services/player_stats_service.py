@@ -2,10 +2,15 @@
 Player statistics service for calculating individual player performance metrics.
 """
 
+from typing import Any
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.data_access.crud.crud_player import get_all_players
-from app.data_access.crud.crud_player_game_stats import get_all_player_game_stats_for_player
+from app.data_access.models import Player, PlayerGameStats, Team
+
+# PlayerGameStats columns summed per player
+TOTAL_FIELDS = ("fouls", "total_ftm", "total_fta", "total_2pm", "total_2pa", "total_3pm", "total_3pa")
 
 
 class PlayerStatsService:
@@ -15,12 +20,27 @@ class PlayerStatsService:
         """Initialize with database session."""
         self._db_session = db_session
 
-    def get_player_stats(self, team_id: int | None = None) -> list[dict]:
+    def get_player_stats(
+        self,
+        team_id: int | None = None,
+        sort_by: str | None = None,
+        descending: bool = True,
+        limit: int | None = None,
+        min_games: int = 0,
+    ) -> list[dict]:
         """
         Calculate and return aggregated statistics for all players.
 
+        Totals for every player come from a single GROUP BY query, with the team
+        filter, minimum games, sorting and limit applied in SQL.
+
         Args:
             team_id: Optional team ID to filter players by team
+            sort_by: Optional statistic to rank players by, any numeric key of the
+                returned dictionaries (e.g. "points_per_game"); players are ordered by ID otherwise
+            descending: Rank the highest values first
+            limit: Optional maximum number of players to return
+            min_games: Only include players with at least this many games played
 
         Returns:
             List of dictionaries containing player statistics including:
@@ -28,46 +48,124 @@ class PlayerStatsService:
             - games_played, total_points, points_per_game
             - field goal percentages, free throw percentage
             - advanced metrics (true shooting %, effective field goal %)
+
+        Raises:
+            ValueError: If sort_by is not a known statistic
         """
-        players = get_all_players(self._db_session)
+        games_played = func.count(PlayerGameStats.id)
+        totals = {field: func.coalesce(func.sum(getattr(PlayerGameStats, field)), 0) for field in TOTAL_FIELDS}
+
+        query = (
+            select(
+                Player.id,
+                Player.name,
+                Player.jersey_number,
+                Player.team_id,
+                Player.position,
+                Team.name.label("team_name"),
+                Team.display_name.label("team_display_name"),
+                games_played.label("games_played"),
+                *(total.label(field) for field, total in totals.items()),
+            )
+            .join(Team, Player.team_id == Team.id)
+            .outerjoin(PlayerGameStats, PlayerGameStats.player_id == Player.id)
+            .group_by(Player.id, Team.id)
+        )
 
-        # Filter by team if specified
         if team_id is not None:
-            players = [p for p in players if p.team_id == team_id]
-
-        player_stats = []
-
-        for player in players:
-            # Get all game stats for this player
-            game_stats = get_all_player_game_stats_for_player(self._db_session, player.id)
+            query = query.where(Player.team_id == team_id)
+        if min_games > 0:
+            query = query.having(games_played >= min_games)
+
+        if sort_by is not None:
+            sort_expressions = self._sort_expressions(games_played, totals)
+            if sort_by not in sort_expressions:
+                raise ValueError(f"Unknown sort key '{sort_by}'. Expected one of: {', '.join(sort_expressions)}")
+            order = sort_expressions[sort_by]
+            query = query.order_by(order.desc() if descending else order.asc(), Player.id)
+        else:
+            query = query.order_by(Player.id)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [
+            self._build_player_stats(
+                {
+                    "player_id": row.id,
+                    "player_name": row.name,
+                    "jersey_number": row.jersey_number,
+                    "team_id": row.team_id,
+                    "team_name": row.team_display_name or row.team_name,
+                    "position": row.position,
+                },
+                row.games_played,
+                {field: getattr(row, field) for field in TOTAL_FIELDS},
+            )
+            for row in self._db_session.execute(query)
+        ]
+
+    @staticmethod
+    def _sort_expressions(games_played: Any, totals: dict[str, Any]) -> dict[str, Any]:
+        """SQL expressions for each sort key, matching the values computed by ``_build_player_stats``."""
+        fgm = totals["total_2pm"] + totals["total_3pm"]
+        fga = totals["total_2pa"] + totals["total_3pa"]
+        points = totals["total_ftm"] + totals["total_2pm"] * 2 + totals["total_3pm"] * 3
+
+        def ratio(numerator: Any, denominator: Any) -> Any:
+            # Players without attempts (or games) rank as zero, as in the computed stats
+            return func.coalesce(numerator * 1.0 / func.nullif(denominator, 0), 0)
 
-            # Calculate aggregated statistics
-            stats = self._calculate_player_stats(player, game_stats)
-            player_stats.append(stats)
-
-        return player_stats
+        return {
+            "games_played": games_played,
+            "total_points": points,
+            "points_per_game": ratio(points, games_played),
+            "total_fouls": totals["fouls"],
+            "fouls_per_game": ratio(totals["fouls"], games_played),
+            "total_ftm": totals["total_ftm"],
+            "total_fta": totals["total_fta"],
+            "ft_percentage": ratio(totals["total_ftm"], totals["total_fta"]),
+            "total_fgm": fgm,
+            "total_fga": fga,
+            "fg_percentage": ratio(fgm, fga),
+            "total_2pm": totals["total_2pm"],
+            "total_2pa": totals["total_2pa"],
+            "fg2_percentage": ratio(totals["total_2pm"], totals["total_2pa"]),
+            "total_3pm": totals["total_3pm"],
+            "total_3pa": totals["total_3pa"],
+            "fg3_percentage": ratio(totals["total_3pm"], totals["total_3pa"]),
+            "effective_fg_percentage": ratio(fgm + totals["total_3pm"] * 0.5, fga),
+            "true_shooting_percentage": ratio(points, (fga + totals["total_fta"] * 0.44) * 2),
+        }
 
     def _calculate_player_stats(self, player, game_stats) -> dict:
         """Calculate aggregated statistics for a single player."""
-        # Initialize totals
-        games_played = len(game_stats)
-        total_fouls = 0
-        total_ftm = 0
-        total_fta = 0
-        total_2pm = 0
-        total_2pa = 0
-        total_3pm = 0
-        total_3pa = 0
+        totals = dict.fromkeys(TOTAL_FIELDS, 0)
 
         # Sum up all game stats
         for game_stat in game_stats:
-            total_fouls += game_stat.fouls
-            total_ftm += game_stat.total_ftm
-            total_fta += game_stat.total_fta
-            total_2pm += game_stat.total_2pm
-            total_2pa += game_stat.total_2pa
-            total_3pm += game_stat.total_3pm
-            total_3pa += game_stat.total_3pa
+            for field in TOTAL_FIELDS:
+                totals[field] += getattr(game_stat, field)
+
+        player_info = {
+            "player_id": player.id,
+            "player_name": player.name,
+            "jersey_number": player.jersey_number,
+            "team_id": player.team_id,
+            "team_name": player.team.display_name or player.team.name,
+            "position": player.position,
+        }
+        return self._build_player_stats(player_info, len(game_stats), totals)
+
+    def _build_player_stats(self, player_info: dict, games_played: int, totals: dict[str, int]) -> dict:
+        """Derive percentages, averages and advanced metrics from a player's totals."""
+        total_fouls = totals["fouls"]
+        total_ftm = totals["total_ftm"]
+        total_fta = totals["total_fta"]
+        total_2pm = totals["total_2pm"]
+        total_2pa = totals["total_2pa"]
+        total_3pm = totals["total_3pm"]
+        total_3pa = totals["total_3pa"]
 
         # Calculate derived statistics
         total_fgm = total_2pm + total_3pm
@@ -89,12 +187,7 @@ class PlayerStatsService:
         fouls_per_game = total_fouls / games_played if games_played > 0 else 0
 
         return {
-            "player_id": player.id,
-            "player_name": player.name,
-            "jersey_number": player.jersey_number,
-            "team_id": player.team_id,
-            "team_name": player.team.display_name or player.team.name,
-            "position": player.position,
+            **player_info,
             "games_played": games_played,
             "total_points": total_points,
             "points_per_game": round(ppg, 1),
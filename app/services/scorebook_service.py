@@ -0,0 +1,206 @@
+"""Service layer for saving scorebook entries.
+
+A scorebook save carries every player line of a game. Instead of deleting the
+game's stats and recreating them row by row, the incoming lines are diffed
+against the stored ``PlayerGameStats`` and ``PlayerQuarterStats`` rows and only
+the differences are written, with bulk statements, in the caller's transaction.
+Stored rows are read as plain columns rather than entities so the bulk writes
+never leave stale objects in the session.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats
+from app.utils.input_parser import SHOT_STAT_FIELDS
+
+# Parsed shot stat -> PlayerGameStats total column
+TOTAL_COLUMNS = {
+    "ftm": "total_ftm",
+    "fta": "total_fta",
+    "fg2m": "total_2pm",
+    "fg2a": "total_2pa",
+    "fg3m": "total_3pm",
+    "fg3a": "total_3pa",
+}
+
+LINE_FIELDS = ("fouls", *TOTAL_COLUMNS.values())
+
+
+@dataclass(slots=True)
+class ScorebookChanges:
+    """What saving a scorebook changed in a game."""
+
+    home_score: int = 0
+    away_score: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    player_ids: set[int] = field(default_factory=set)
+
+
+class ScorebookService:
+    """Applies parsed scorebook entries to a game's stat lines."""
+
+    def __init__(self, db_session: Session):
+        """Initialize the scorebook service.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def save(self, game: Game, entries: list[dict[str, Any]]) -> ScorebookChanges:
+        """Bring a game's player and quarter stats in line with its scorebook.
+
+        Lines for new players are inserted, changed lines and quarters are
+        updated, and lines of players missing from the scorebook are deleted.
+        Unchanged rows are not written. Runs inside the caller's transaction;
+        the caller commits.
+
+        Args:
+            game: The game, with its teams already set
+            entries: Parsed entries, as returned by ``parse_scorebook_entries``
+
+        Returns:
+            The game's scores and a summary of the rows written
+
+        Raises:
+            ValueError: If a player does not exist or has more than one entry
+        """
+        entries_by_player: dict[int, dict[str, Any]] = {}
+        for entry in entries:
+            if entry["player_id"] in entries_by_player:
+                raise ValueError(f"Player {entry['player_id']} has more than one entry")
+            entries_by_player[entry["player_id"]] = entry
+
+        team_by_player = self._load_roster(game, list(entries_by_player))
+        for player_id in entries_by_player:
+            if player_id not in team_by_player:
+                raise ValueError(f"Player {player_id} not found")
+
+        stored_lines = self._load_lines(game.id)
+        stored_quarters = self._load_quarters(game.id) if stored_lines else {}
+
+        changes = ScorebookChanges()
+        new_lines = {}
+        line_updates = []
+        quarter_inserts = []
+        quarter_updates = []
+        for player_id, entry in entries_by_player.items():
+            line = {column: entry["total_stats"][stat] for stat, column in TOTAL_COLUMNS.items()}
+            line["fouls"] = entry["fouls"]
+            quarters = {
+                quarter["quarter_number"]: {stat: quarter[stat] for stat in SHOT_STAT_FIELDS}
+                for quarter in entry["quarter_stats"]
+            }
+
+            points = line["total_ftm"] + line["total_2pm"] * 2 + line["total_3pm"] * 3
+            if team_by_player[player_id] == game.playing_team_id:
+                changes.home_score += points
+            elif team_by_player[player_id] == game.opponent_team_id:
+                changes.away_score += points
+
+            stored = stored_lines.get(player_id)
+            if stored is None:
+                new_lines[player_id] = (line, quarters)
+                continue
+
+            stat_id = stored["id"]
+            changed = False
+            if any(stored[column] != value for column, value in line.items()):
+                line_updates.append({"id": stat_id, **line})
+                changed = True
+
+            recorded = stored_quarters.get(stat_id, {})
+            for quarter, stats in quarters.items():
+                if quarter in recorded:
+                    quarter_id, recorded_stats = recorded[quarter]
+                    if recorded_stats != stats:
+                        quarter_updates.append({"id": quarter_id, **stats})
+                        changed = True
+                elif any(stats.values()):
+                    quarter_inserts.append(self._quarter_row(stat_id, quarter, stats))
+                    changed = True
+
+            if changed:
+                changes.updated += 1
+                changes.player_ids.add(player_id)
+
+        removed = {
+            player_id: stored["id"] for player_id, stored in stored_lines.items() if player_id not in entries_by_player
+        }
+        if removed:
+            removed_ids = list(removed.values())
+            self.db_session.execute(
+                delete(PlayerQuarterStats).where(PlayerQuarterStats.player_game_stat_id.in_(removed_ids))
+            )
+            self.db_session.execute(delete(PlayerGameStats).where(PlayerGameStats.id.in_(removed_ids)))
+            changes.deleted = len(removed)
+            changes.player_ids.update(removed)
+
+        if line_updates:
+            self.db_session.execute(update(PlayerGameStats), line_updates)
+        if quarter_updates:
+            self.db_session.execute(update(PlayerQuarterStats), quarter_updates)
+
+        if new_lines:
+            inserted = self.db_session.execute(
+                insert(PlayerGameStats).returning(PlayerGameStats.id, PlayerGameStats.player_id),
+                [{"game_id": game.id, "player_id": player_id, **line} for player_id, (line, _) in new_lines.items()],
+            )
+            for stat_id, player_id in inserted:
+                for quarter, stats in new_lines[player_id][1].items():
+                    if any(stats.values()):
+                        quarter_inserts.append(self._quarter_row(stat_id, quarter, stats))
+            changes.inserted = len(new_lines)
+            changes.player_ids.update(new_lines)
+
+        if quarter_inserts:
+            self.db_session.execute(insert(PlayerQuarterStats), quarter_inserts)
+
+        return changes
+
+    def _load_roster(self, game: Game, player_ids: list[int]) -> dict[int, int]:
+        """Map the players of both teams, plus any other players in the scorebook, to their team."""
+        rows = self.db_session.execute(
+            select(Player.id, Player.team_id).where(
+                or_(Player.team_id.in_([game.playing_team_id, game.opponent_team_id]), Player.id.in_(player_ids))
+            )
+        )
+        return dict(rows.all())
+
+    def _load_lines(self, game_id: int) -> dict[int, dict[str, int]]:
+        """Stored stat lines of a game, keyed by player."""
+        columns = [getattr(PlayerGameStats, name) for name in LINE_FIELDS]
+        rows = self.db_session.execute(
+            select(PlayerGameStats.id, PlayerGameStats.player_id, *columns).where(PlayerGameStats.game_id == game_id)
+        )
+        return {row.player_id: row._asdict() for row in rows}
+
+    def _load_quarters(self, game_id: int) -> dict[int, dict[int, tuple[int, dict[str, int]]]]:
+        """Stored quarter rows of a game as ``{stat_id: {quarter: (row_id, stats)}}``."""
+        columns = [getattr(PlayerQuarterStats, name) for name in SHOT_STAT_FIELDS]
+        rows = self.db_session.execute(
+            select(
+                PlayerQuarterStats.id,
+                PlayerQuarterStats.player_game_stat_id,
+                PlayerQuarterStats.quarter_number,
+                *columns,
+            )
+            .join(PlayerGameStats, PlayerQuarterStats.player_game_stat_id == PlayerGameStats.id)
+            .where(PlayerGameStats.game_id == game_id)
+        )
+        quarters: dict[int, dict[int, tuple[int, dict[str, int]]]] = {}
+        for row in rows:
+            stats = {stat: getattr(row, stat) for stat in SHOT_STAT_FIELDS}
+            quarters.setdefault(row.player_game_stat_id, {})[row.quarter_number] = (row.id, stats)
+        return quarters
+
+    @staticmethod
+    def _quarter_row(player_game_stat_id: int, quarter: int, stats: dict[str, int]) -> dict[str, int]:
+        """Build a ``PlayerQuarterStats`` insert row from parsed shot stats."""
+        return {"player_game_stat_id": player_game_stat_id, "quarter_number": quarter, **stats}
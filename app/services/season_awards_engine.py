@@ -0,0 +1,253 @@
+# app/services/season_awards_engine.py
+
+"""
+Shared-aggregate engine for season awards.
+
+Builds one per-season player stat matrix (columnar totals per player) with a single
+grouped query, then evaluates every season award as a max/threshold rule over those
+columns. Winners are written back in one batch.
+"""
+
+import logging
+from datetime import date
+
+from sqlalchemy import extract, func
+from sqlalchemy.orm import Session
+
+from app.data_access.crud.crud_player_award import (
+    create_player_awards_batch,
+    replace_award_slices,
+)
+from app.data_access.models import Game, Player, PlayerGameStats
+
+logger = logging.getLogger(__name__)
+
+MATRIX_COLUMNS = (
+    "player_id",
+    "games",
+    "fouls",
+    "ftm",
+    "fta",
+    "fg2m",
+    "fg2a",
+    "fg3m",
+    "fg3a",
+    "points",
+    "fgm",
+    "fga",
+    "fg3_misses",
+    "ft_misses",
+    "attempts",
+)
+
+
+def load_season_matrices(session: Session, season: str | None = None) -> dict[str, dict[str, list]]:
+    """
+    Load per-player season totals as columnar matrices keyed by calendar-year season.
+
+    Args:
+        session: Database session
+        season: Calendar-year season (e.g., "2024"). If None, loads all seasons.
+
+    Returns:
+        Dict mapping season to a dict of column name -> list of per-player totals
+    """
+    year = extract("year", Game.date)
+    query = (
+        session.query(
+            year,
+            PlayerGameStats.player_id,
+            func.count(PlayerGameStats.id),
+            func.sum(PlayerGameStats.fouls),
+            func.sum(PlayerGameStats.total_ftm),
+            func.sum(PlayerGameStats.total_fta),
+            func.sum(PlayerGameStats.total_2pm),
+            func.sum(PlayerGameStats.total_2pa),
+            func.sum(PlayerGameStats.total_3pm),
+            func.sum(PlayerGameStats.total_3pa),
+        )
+        .join(PlayerGameStats, PlayerGameStats.game_id == Game.id)
+        .join(Player, Player.id == PlayerGameStats.player_id)
+    )
+    if season:
+        if not season.isdigit():
+            logger.warning(f"Season must be a calendar year for season awards, got: {season}")
+            return {}
+        season_year = int(season)
+        query = query.filter(Game.date >= date(season_year, 1, 1), Game.date <= date(season_year, 12, 31))
+
+    matrices: dict[str, dict[str, list]] = {}
+    for row in query.group_by(year, PlayerGameStats.player_id).order_by(year, PlayerGameStats.player_id).all():
+        season_year, player_id, games, *totals = row
+        fouls, ftm, fta, fg2m, fg2a, fg3m, fg3a = (value or 0 for value in totals)
+        key = str(int(season_year))
+        matrix = matrices.get(key)
+        if matrix is None:
+            matrix = matrices[key] = {column: [] for column in MATRIX_COLUMNS}
+        for column, value in (
+            ("player_id", player_id),
+            ("games", games),
+            ("fouls", fouls),
+            ("ftm", ftm),
+            ("fta", fta),
+            ("fg2m", fg2m),
+            ("fg2a", fg2a),
+            ("fg3m", fg3m),
+            ("fg3a", fg3a),
+            ("points", ftm + fg2m * 2 + fg3m * 3),
+            ("fgm", fg2m + fg3m),
+            ("fga", fg2a + fg3a),
+            ("fg3_misses", fg3a - fg3m),
+            ("ft_misses", fta - ftm),
+            ("attempts", fg2a + fg3a + fta),
+        ):
+            matrix[column].append(value)
+
+    return matrices
+
+
+def _winners(matrix: dict[str, list], values: list, eligible: list[bool] | None = None) -> tuple[object, list[int]]:
+    """Return the maximum eligible value and the players who reached it."""
+    candidates = [i for i in range(len(values)) if eligible is None or eligible[i]]
+    if not candidates:
+        return None, []
+    max_value = max(values[i] for i in candidates)
+    return max_value, [matrix["player_id"][i] for i in candidates if values[i] == max_value]
+
+
+def _most(column: str):
+    """Build a rule awarding the highest season total of one stat column."""
+
+    def rule(matrix) -> list[dict]:
+        max_value, winners = _winners(matrix, matrix[column])
+        return [{"player_id": player_id, "stat_value": float(max_value)} for player_id in winners]
+
+    return rule
+
+
+def _best_pct(made: str, attempted: str, min_attempts: int):
+    """Build a rule awarding the best season percentage with a minimum number of attempts."""
+
+    def rule(matrix) -> list[dict]:
+        attempts = matrix[attempted]
+        pct = [m / a if a > 0 else 0.0 for m, a in zip(matrix[made], attempts, strict=True)]
+        max_pct, winners = _winners(matrix, pct, [a >= min_attempts for a in attempts])
+        return [{"player_id": player_id, "stat_value": max_pct} for player_id in winners]
+
+    return rule
+
+
+def _top_scorer(matrix) -> list[dict]:
+    """Most points scored, recorded as points_scored as well."""
+    max_points, winners = _winners(matrix, matrix["points"])
+    return [
+        {"player_id": player_id, "points_scored": max_points, "stat_value": float(max_points)} for player_id in winners
+    ]
+
+
+def _defensive_tackle(matrix) -> list[dict]:
+    """Highest fouls per game (min 10 fouls), tie-broken by total fouls."""
+    fouls = matrix["fouls"]
+    fpg = [f / g if g > 0 else 0.0 for f, g in zip(fouls, matrix["games"], strict=True)]
+    max_fpg, winners = _winners(matrix, fpg, [f >= 10 for f in fouls])
+    if len(winners) > 1:
+        row_of = {player_id: i for i, player_id in enumerate(matrix["player_id"])}
+        max_fouls = max(fouls[row_of[player_id]] for player_id in winners)
+        winners = [player_id for player_id in winners if fouls[row_of[player_id]] == max_fouls]
+    return [{"player_id": player_id, "stat_value": max_fpg} for player_id in winners]
+
+
+SEASON_AWARD_RULES = {
+    "rick_barry_award": _best_pct("ftm", "fta", 10),
+    "top_scorer": _top_scorer,
+    "sharpshooter": _best_pct("fg3m", "fg3a", 5),
+    "efficiency_expert": _best_pct("fgm", "fga", 10),
+    "human_highlight_reel": _most("fgm"),
+    "charity_stripe_regular": _most("ftm"),
+    "defensive_tackle": _defensive_tackle,
+    "air_ball_artist": _most("fg3_misses"),
+    "air_assault": _most("attempts"),
+    "curry_wannabe": _most("fg3m"),
+    "hack_a_shaq": _most("ft_misses"),
+}
+
+
+def evaluate_season_awards(matrices: dict[str, dict[str, list]], award_types: list[str] | None = None) -> list[dict]:
+    """
+    Evaluate season award rules over pre-loaded matrices.
+
+    Args:
+        matrices: Matrices from load_season_matrices
+        award_types: Award types to evaluate (defaults to all season awards)
+
+    Returns:
+        List of award dicts ready for create_player_awards_batch
+    """
+    award_types = award_types or list(SEASON_AWARD_RULES)
+
+    awards = []
+    for season, matrix in matrices.items():
+        for award_type in award_types:
+            for award in SEASON_AWARD_RULES[award_type](matrix):
+                award.update({"award_type": award_type, "season": season, "week_date": None})
+                awards.append(award)
+    return awards
+
+
+def persist_season_awards(
+    session: Session,
+    awards: list[dict],
+    award_types: list[str],
+    season: str | None = None,
+    recalculate: bool = False,
+) -> dict[str, dict[str, int]]:
+    """
+    Write evaluated season awards and count them per season.
+
+    Args:
+        session: Database session
+        awards: Award dicts from evaluate_season_awards
+        award_types: Award types that were evaluated
+        season: Season that was requested (None replaces every season on recalculate)
+        recalculate: If True, replace each award type's slice instead of adding to it
+
+    Returns:
+        Dict with award_type -> season -> awards_given count
+    """
+    if recalculate:
+        # Replace each award type's slice wholesale, clearing slices that lost their winners
+        replace_award_slices(session, awards, [(award_type, season) for award_type in award_types])
+    else:
+        create_player_awards_batch(session, awards)
+    session.commit()
+    logger.info(f"✅ Wrote {len(awards)} season award records")
+
+    results: dict[str, dict[str, int]] = {award_type: {} for award_type in award_types}
+    for award in awards:
+        counts = results[award["award_type"]]
+        counts[award["season"]] = counts.get(award["season"], 0) + 1
+    return results
+
+
+def run_season_awards(
+    session: Session, season: str | None = None, recalculate: bool = False, award_types: list[str] | None = None
+) -> dict[str, dict[str, int]]:
+    """
+    Calculate season awards from one shared per-player aggregate.
+
+    Args:
+        session: Database session
+        season: Calendar-year season (e.g., "2024"). If None, calculates all seasons.
+        recalculate: If True, delete existing awards of each type before calculation
+        award_types: Award types to calculate (defaults to all season awards)
+
+    Returns:
+        Dict with award_type -> season -> awards_given count
+    """
+    award_types = award_types or list(SEASON_AWARD_RULES)
+
+    matrices = load_season_matrices(session, season)
+    logger.info(f"📊 Loaded {sum(len(m['player_id']) for m in matrices.values())} player seasons")
+
+    awards = evaluate_season_awards(matrices, award_types)
+    return persist_season_awards(session, awards, award_types, season, recalculate)
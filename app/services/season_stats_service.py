@@ -1,10 +1,13 @@
 """Service layer for season statistics management."""
 
 import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, desc, func, union_all, update
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from app.data_access.models import (
     Game,
@@ -15,10 +18,37 @@ from app.data_access.models import (
     Team,
     TeamSeasonStats,
 )
+from app.services.box_score_service import BoxScoreService
+from app.services.live_game_session import bump_live_revision
 from app.utils.stats_calculator import calculate_efg, calculate_percentage
 
 logger = logging.getLogger(__name__)
 
+PLAYER_SEASON_FIELDS = (
+    "games_played",
+    "total_fouls",
+    "total_ftm",
+    "total_fta",
+    "total_2pm",
+    "total_2pa",
+    "total_3pm",
+    "total_3pa",
+)
+
+TEAM_SEASON_FIELDS = (
+    "games_played",
+    "wins",
+    "losses",
+    "total_points_for",
+    "total_points_against",
+    "total_ftm",
+    "total_fta",
+    "total_2pm",
+    "total_2pa",
+    "total_3pm",
+    "total_3pa",
+)
+
 
 class SeasonStatsService:
     """Service for managing season-long statistics."""
@@ -49,6 +79,27 @@ class SeasonStatsService:
         # Otherwise, it's part of the current year's season
         return f"{game_date.year - 1}-{game_date.year}"
 
+    def get_current_season(self) -> str | None:
+        """Get the code of the season the season tables default to.
+
+        The active season, or the season of the latest game when none is active.
+        Season tables are keyed by ``Season.code``.
+
+        Returns:
+            Season code, or None if no season is active and no game has a season
+        """
+        active_season = self.db_session.query(Season).filter(Season.is_active).first()
+        if active_season:
+            return active_season.code
+
+        latest_game = (
+            self.db_session.query(Game)
+            .filter(Game.season_id.is_not(None), Game.is_deleted.is_not(True))
+            .order_by(desc(Game.date))
+            .first()
+        )
+        return latest_game.season.code if latest_game else None
+
     def get_or_create_season_from_date(self, game_date: date) -> "Season | None":
         """Get or create a Season object based on a date.
 
@@ -96,28 +147,38 @@ class SeasonStatsService:
     def update_player_season_stats(self, player_id: int, season: str | None = None) -> PlayerSeasonStats | None:
         """Update or create season statistics for a player.
 
+        Soft-deleted games are excluded, as in compute_season_totals.
+
         Args:
             player_id: ID of the player
-            season: Season to update (if None, updates current season)
+            season: Season code to update (if None, updates current season)
 
         Returns:
             Updated PlayerSeasonStats object or None if:
             - No games found for the player in the specified season
             - Specified season record is not found in the database
-            - Unable to determine season from game data
+            - No current season could be determined
         """
+        if not season:
+            season = self.get_current_season()
+            if not season:
+                logger.warning(f"No current season to update for player {player_id}")
+                return None
+
         # Get all games for the player in the season
-        query = self.db_session.query(PlayerGameStats).join(Game).filter(PlayerGameStats.player_id == player_id)
+        query = (
+            self.db_session.query(PlayerGameStats)
+            .join(Game)
+            .filter(PlayerGameStats.player_id == player_id, Game.is_deleted.is_not(True))
+        )
 
-        if season:
-            # Look up the actual season record
-            season_record = self.db_session.query(Season).filter(Season.code == season).first()
-            if season_record:
-                # Use season_id for filtering when available
-                query = query.filter(Game.season_id == season_record.id)
-            else:
-                logger.warning(f"Season {season} not found in database")
-                return None
+        # Look up the actual season record
+        season_record = self.db_session.query(Season).filter(Season.code == season).first()
+        if season_record:
+            query = query.filter(Game.season_id == season_record.id)
+        else:
+            logger.warning(f"Season {season} not found in database")
+            return None
 
         game_stats = query.all()
 
@@ -125,15 +186,6 @@ class SeasonStatsService:
             logger.warning(f"No games found for player {player_id} in season {season}")
             return None
 
-        # Determine season from first game if not provided
-        if not season and game_stats:
-            first_game = self.db_session.query(Game).get(game_stats[0].game_id)
-            if first_game:
-                season = self.get_season_from_date(first_game.date)
-            else:
-                logger.warning(f"Could not find game with ID {game_stats[0].game_id}")
-                return None
-
         # Calculate totals
         games_played = len(game_stats)
         total_fouls = sum(gs.fouls for gs in game_stats)
@@ -168,29 +220,36 @@ class SeasonStatsService:
     def update_team_season_stats(self, team_id: int, season: str | None = None) -> TeamSeasonStats | None:
         """Update or create season statistics for a team.
 
+        Soft-deleted games are excluded, as in compute_season_totals.
+
         Args:
             team_id: ID of the team
-            season: Season to update (if None, updates current season)
+            season: Season code to update (if None, updates current season)
 
         Returns:
             Updated TeamSeasonStats object or None if:
             - No games found for the team in the specified season
             - Specified season record is not found in the database
+            - No current season could be determined
         """
+        if not season:
+            season = self.get_current_season()
+            if not season:
+                logger.debug(f"No current season to update for team {team_id}")
+                return None
+
         # Get all games for the team in the season
         query = self.db_session.query(Game).filter(
-            (Game.playing_team_id == team_id) | (Game.opponent_team_id == team_id)
+            (Game.playing_team_id == team_id) | (Game.opponent_team_id == team_id), Game.is_deleted.is_not(True)
         )
 
-        if season:
-            # Look up the actual season record
-            season_record = self.db_session.query(Season).filter(Season.code == season).first()
-            if season_record:
-                # Use season_id for filtering when available
-                query = query.filter(Game.season_id == season_record.id)
-            else:
-                logger.warning(f"Season {season} not found in database")
-                return None
+        # Look up the actual season record
+        season_record = self.db_session.query(Season).filter(Season.code == season).first()
+        if season_record:
+            query = query.filter(Game.season_id == season_record.id)
+        else:
+            logger.warning(f"Season {season} not found in database")
+            return None
 
         games = query.all()
 
@@ -198,10 +257,6 @@ class SeasonStatsService:
             logger.debug(f"No games found for team {team_id} in season {season}")
             return None
 
-        # Determine season from first game if not provided
-        if not season and games:
-            season = self.get_season_from_date(games[0].date)
-
         # Calculate team statistics
         games_played = len(games)
         wins = 0
@@ -300,34 +355,365 @@ class SeasonStatsService:
         self.db_session.commit()
         return season_stats
 
-    def update_all_season_stats(self, season: str | None = None):
+    def update_all_season_stats(self, season: str | None = None) -> dict[str, float]:
         """Update season statistics for all players and teams.
 
         Args:
-            season: Season to update (if None, updates current season)
+            season: Season code to update (if None, rebuilds every season)
+
+        Returns:
+            Rebuild summary as returned by rebuild_season_stats
         """
-        # Update all player stats
-        players = self.db_session.query(Player).filter_by(is_active=True).all()
-        for player in players:
-            try:
-                self.update_player_season_stats(player.id, season)
-            except Exception as e:
-                logger.error(f"Error updating stats for player {player.id}: {e}")
-
-        # Update team stats only for teams that have games
-        # This avoids processing thousands of test teams with no games
-        teams_with_games = (
-            self.db_session.query(Team)
-            .join(Game, (Team.id == Game.playing_team_id) | (Team.id == Game.opponent_team_id))
-            .distinct()
-            .all()
+        return self.rebuild_season_stats(season)
+
+    def rebuild_season_stats(
+        self,
+        season: str | None = None,
+        batch_size: int = 500,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> dict[str, float]:
+        """Rebuild the season tables from game data in a single transaction.
+
+        Totals come from compute_season_totals, then rows are inserted, updated or
+        removed in batches and committed once at the end.
+
+        Args:
+            season: Season code to rebuild (if None, rebuilds every season)
+            batch_size: Number of rows written per batch
+            progress_callback: Optional callable receiving (rows_done, rows_total)
+
+        Returns:
+            Summary with players, teams, inserted, updated, deleted, rows,
+            elapsed seconds and rows_per_second
+        """
+        started = time.perf_counter()
+        totals = self.compute_season_totals(season)
+        now = datetime.utcnow()
+
+        plans = []
+        for model, owner_column, rows in (
+            (PlayerSeasonStats, "player_id", totals["players"]),
+            (TeamSeasonStats, "team_id", totals["teams"]),
+        ):
+            owner_attr = getattr(model, owner_column)
+            existing_query = self.db_session.query(model.id, owner_attr, model.season)
+            if season:
+                existing_query = existing_query.filter(model.season == season)
+            existing = {(owner_id, row_season): row_id for row_id, owner_id, row_season in existing_query.all()}
+
+            inserts = []
+            updates = []
+            for (owner_id, row_season), values in rows.items():
+                mapping = {**values, "last_updated": now}
+                row_id = existing.pop((owner_id, row_season), None)
+                if row_id is None:
+                    inserts.append({owner_column: owner_id, "season": row_season, **mapping})
+                else:
+                    updates.append({"id": row_id, **mapping})
+            plans.append((model, inserts, updates, list(existing.values())))
+
+        rows_total = sum(len(inserts) + len(updates) + len(stale) for _, inserts, updates, stale in plans)
+        rows_done = 0
+        try:
+            for model, inserts, updates, stale in plans:
+                for start in range(0, len(stale), batch_size):
+                    chunk = stale[start : start + batch_size]
+                    self.db_session.query(model).filter(model.id.in_(chunk)).delete(synchronize_session=False)
+                    rows_done += len(chunk)
+                    if progress_callback:
+                        progress_callback(rows_done, rows_total)
+                for mappings, write in (
+                    (updates, self.db_session.bulk_update_mappings),
+                    (inserts, self.db_session.bulk_insert_mappings),
+                ):
+                    for start in range(0, len(mappings), batch_size):
+                        chunk = mappings[start : start + batch_size]
+                        write(model, chunk)
+                        rows_done += len(chunk)
+                        if progress_callback:
+                            progress_callback(rows_done, rows_total)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+
+        elapsed = time.perf_counter() - started
+        return {
+            "players": len(totals["players"]),
+            "teams": len(totals["teams"]),
+            "inserted": sum(len(inserts) for _, inserts, _, _ in plans),
+            "updated": sum(len(updates) for _, _, updates, _ in plans),
+            "deleted": sum(len(stale) for _, _, _, stale in plans),
+            "rows": rows_total,
+            "elapsed": elapsed,
+            "rows_per_second": rows_total / elapsed if elapsed > 0 else float(rows_total),
+        }
+
+    def compute_season_totals(self, season: str | None = None, game_ids: list[int] | None = None) -> dict[str, dict]:
+        """Compute season totals straight from the game tables.
+
+        Soft-deleted games and games without a season are excluded, and rows are
+        keyed by ``Season.code``. Player totals come from one grouped query and
+        team totals (including wins and points against) from a second one.
+
+        Args:
+            season: Optional season code to restrict the totals to
+            game_ids: Optional game IDs to restrict the totals to
+
+        Returns:
+            Dictionary with "players" mapping (player_id, season) and "teams"
+            mapping (team_id, season) to dictionaries of season stat fields
+        """
+        player_query = (
+            self.db_session.query(
+                PlayerGameStats.player_id,
+                Season.code,
+                func.count(PlayerGameStats.id),
+                func.sum(PlayerGameStats.fouls),
+                func.sum(PlayerGameStats.total_ftm),
+                func.sum(PlayerGameStats.total_fta),
+                func.sum(PlayerGameStats.total_2pm),
+                func.sum(PlayerGameStats.total_2pa),
+                func.sum(PlayerGameStats.total_3pm),
+                func.sum(PlayerGameStats.total_3pa),
+            )
+            .join(Game, PlayerGameStats.game_id == Game.id)
+            .join(Season, Game.season_id == Season.id)
+            .filter(Game.is_deleted.is_not(True))
         )
+        if season:
+            player_query = player_query.filter(Season.code == season)
+        if game_ids is not None:
+            player_query = player_query.filter(Game.id.in_(game_ids))
+
+        players = {}
+        for row in player_query.group_by(PlayerGameStats.player_id, Season.code).all():
+            players[(row[0], row[1])] = {
+                field: int(value or 0) for field, value in zip(PLAYER_SEASON_FIELDS, row[2:], strict=True)
+            }
 
-        for team in teams_with_games:
-            try:
-                self.update_team_season_stats(team.id, season)
-            except Exception as e:
-                logger.error(f"Error updating stats for team {team.id}: {e}")
+        # Per-team shooting lines for each game, attributed by the player's team
+        lines_query = self.db_session.query(
+            PlayerGameStats.game_id.label("game_id"),
+            Player.team_id.label("team_id"),
+            func.sum(PlayerGameStats.total_ftm).label("ftm"),
+            func.sum(PlayerGameStats.total_fta).label("fta"),
+            func.sum(PlayerGameStats.total_2pm).label("fg2m"),
+            func.sum(PlayerGameStats.total_2pa).label("fg2a"),
+            func.sum(PlayerGameStats.total_3pm).label("fg3m"),
+            func.sum(PlayerGameStats.total_3pa).label("fg3a"),
+            func.sum(PlayerGameStats.total_ftm + PlayerGameStats.total_2pm * 2 + PlayerGameStats.total_3pm * 3).label(
+                "points"
+            ),
+        ).join(Player, PlayerGameStats.player_id == Player.id)
+        if game_ids is not None:
+            lines_query = lines_query.filter(PlayerGameStats.game_id.in_(game_ids))
+        lines = lines_query.group_by(PlayerGameStats.game_id, Player.team_id).subquery()
+
+        # Each game appears once per participating team, paired with its opponent
+        sides_filters = [Game.is_deleted.is_not(True)]
+        if season:
+            sides_filters.append(Season.code == season)
+        if game_ids is not None:
+            sides_filters.append(Game.id.in_(game_ids))
+        home = (
+            self.db_session.query(
+                Game.id.label("game_id"),
+                Game.playing_team_id.label("team_id"),
+                Game.opponent_team_id.label("opponent_id"),
+                Season.code.label("season"),
+            )
+            .join(Season, Game.season_id == Season.id)
+            .filter(*sides_filters)
+        )
+        away = (
+            self.db_session.query(
+                Game.id.label("game_id"),
+                Game.opponent_team_id.label("team_id"),
+                Game.playing_team_id.label("opponent_id"),
+                Season.code.label("season"),
+            )
+            .join(Season, Game.season_id == Season.id)
+            .filter(*sides_filters)
+        )
+        sides = union_all(home.statement, away.statement).subquery()
+
+        own = aliased(lines)
+        opp = aliased(lines)
+        own_points = func.coalesce(own.c.points, 0)
+        opp_points = func.coalesce(opp.c.points, 0)
+        team_query = (
+            self.db_session.query(
+                sides.c.team_id,
+                sides.c.season,
+                func.count(sides.c.game_id),
+                func.sum(case((own_points > opp_points, 1), else_=0)),
+                func.sum(case((own_points > opp_points, 0), else_=1)),
+                func.sum(own_points),
+                func.sum(opp_points),
+                func.sum(func.coalesce(own.c.ftm, 0)),
+                func.sum(func.coalesce(own.c.fta, 0)),
+                func.sum(func.coalesce(own.c.fg2m, 0)),
+                func.sum(func.coalesce(own.c.fg2a, 0)),
+                func.sum(func.coalesce(own.c.fg3m, 0)),
+                func.sum(func.coalesce(own.c.fg3a, 0)),
+            )
+            .select_from(sides)
+            .outerjoin(own, (own.c.game_id == sides.c.game_id) & (own.c.team_id == sides.c.team_id))
+            .outerjoin(opp, (opp.c.game_id == sides.c.game_id) & (opp.c.team_id == sides.c.opponent_id))
+            .group_by(sides.c.team_id, sides.c.season)
+        )
+
+        teams = {}
+        for row in team_query.all():
+            teams[(row[0], row[1])] = {
+                field: int(value or 0) for field, value in zip(TEAM_SEASON_FIELDS, row[2:], strict=True)
+            }
+
+        return {"players": players, "teams": teams}
+
+    def get_game_contribution(self, *game_ids: int) -> dict[str, dict]:
+        """Get what the given games currently contribute to the season tables.
+
+        Args:
+            game_ids: IDs of the games
+
+        Returns:
+            Same structure as compute_season_totals; missing, soft-deleted and
+            season-less games contribute nothing
+        """
+        if not game_ids:
+            return {"players": {}, "teams": {}}
+        return self.compute_season_totals(game_ids=list(game_ids))
+
+    def apply_game_delta(self, before: dict[str, dict], after: dict[str, dict]) -> None:
+        """Apply the difference between two game contributions to the season tables.
+
+        Rows are created on demand and removed once their games_played drops to
+        zero. Changes are only flushed so they commit with the caller's transaction.
+
+        Args:
+            before: Game contribution captured before the change
+            after: Game contribution captured after the change
+        """
+        self._apply_delta(
+            PlayerSeasonStats, "player_id", PLAYER_SEASON_FIELDS, before.get("players", {}), after.get("players", {})
+        )
+        self._apply_delta(
+            TeamSeasonStats, "team_id", TEAM_SEASON_FIELDS, before.get("teams", {}), after.get("teams", {})
+        )
+        self.db_session.flush()
+
+    def _apply_delta(self, model, owner_column: str, fields: tuple[str, ...], before: dict, after: dict) -> None:
+        """Apply per-row field differences to one season stats table."""
+        deltas = {}
+        for key in before.keys() | after.keys():
+            old = before.get(key, {})
+            new = after.get(key, {})
+            delta = {field: new.get(field, 0) - old.get(field, 0) for field in fields}
+            if any(delta.values()):
+                deltas[key] = delta
+
+        if not deltas:
+            return
+
+        owner_attr = getattr(model, owner_column)
+        existing = {
+            (getattr(row, owner_column), row.season): row
+            for row in self.db_session.query(model)
+            .filter(
+                owner_attr.in_({key[0] for key in deltas}),
+                model.season.in_({key[1] for key in deltas}),
+            )
+            .all()
+        }
+
+        now = datetime.utcnow()
+        for key, delta in deltas.items():
+            row = existing.get(key)
+            if row is None:
+                if delta["games_played"] <= 0:
+                    logger.warning(f"Skipping negative season delta for missing {model.__tablename__} row {key}")
+                    continue
+                row = model(**{owner_column: key[0], "season": key[1]}, **dict.fromkeys(fields, 0))
+                self.db_session.add(row)
+
+            for field, value in delta.items():
+                setattr(row, field, (getattr(row, field) or 0) + value)
+            row.last_updated = now
+
+            if row.games_played <= 0:
+                self.db_session.delete(row)
+
+    @contextmanager
+    def track_game_changes(self, *game_ids: int, event_log: bool = False) -> Iterator[None]:
+        """Keep season tables and stored box scores in sync with changes made to the given games.
+
+        Captures the games' contribution on entry and applies the delta on exit,
+        then refreshes the games' materialized box scores, all within the caller's
+        transaction. Unless the changes are recorded as game events, the games' live
+        sessions are marked stale as well. Enter before modifying the games, and
+        commit the changes and the delta together once the block exits.
+
+        The games' rows are write-locked before the contribution is captured, so
+        concurrent writers to the same game take turns: each one's baseline already
+        includes the other's committed changes, and none is counted twice.
+
+        Args:
+            game_ids: IDs of the games being changed
+            event_log: True when the changes are recorded as game events, which live sessions already follow
+        """
+        if game_ids:
+            # A no-op write takes the row locks on every backend, including SQLite
+            self.db_session.execute(
+                update(Game)
+                .where(Game.id.in_(game_ids))
+                .values(date=Game.date)
+                .execution_options(synchronize_session=False)
+            )
+        before = self.get_game_contribution(*game_ids)
+        yield
+        self.db_session.flush()
+        self.apply_game_delta(before, self.get_game_contribution(*game_ids))
+        BoxScoreService(self.db_session).refresh(*game_ids)
+        if not event_log:
+            bump_live_revision(self.db_session, *game_ids)
+
+    def verify_season_stats(self, season: str | None = None) -> dict[str, list[dict]]:
+        """Diff the stored season tables against a full rebuild.
+
+        Args:
+            season: Optional season code to restrict verification to
+
+        Returns:
+            Dictionary with "players" and "teams" lists of mismatches, each holding
+            the row key, the stored values and the expected values
+        """
+        expected = self.compute_season_totals(season)
+
+        player_query = self.db_session.query(PlayerSeasonStats)
+        team_query = self.db_session.query(TeamSeasonStats)
+        if season:
+            player_query = player_query.filter(PlayerSeasonStats.season == season)
+            team_query = team_query.filter(TeamSeasonStats.season == season)
+
+        return {
+            "players": self._diff_rows(player_query.all(), "player_id", PLAYER_SEASON_FIELDS, expected["players"]),
+            "teams": self._diff_rows(team_query.all(), "team_id", TEAM_SEASON_FIELDS, expected["teams"]),
+        }
+
+    def _diff_rows(self, rows, owner_column: str, fields: tuple[str, ...], expected: dict) -> list[dict]:
+        """Compare stored season rows with expected totals."""
+        stored = {
+            (getattr(row, owner_column), row.season): {field: getattr(row, field) for field in fields} for row in rows
+        }
+        mismatches = []
+        for key in sorted(stored.keys() | expected.keys(), key=lambda k: (k[1], k[0])):
+            actual = stored.get(key)
+            wanted = expected.get(key)
+            if actual != wanted:
+                mismatches.append({owner_column: key[0], "season": key[1], "stored": actual, "expected": wanted})
+        return mismatches
 
     def get_player_rankings(
         self, stat_category: str, season: str | None = None, limit: int = 10, min_games: int = 1
@@ -336,7 +722,7 @@ class SeasonStatsService:
 
         Args:
             stat_category: Category to rank by (ppg, fpg, ft_pct, fg_pct, etc.)
-            season: Season to get rankings for (if None, uses current season)
+            season: Season code to get rankings for (if None, uses current season)
             limit: Number of players to return
             min_games: Minimum games played to be included
 
@@ -344,11 +730,8 @@ class SeasonStatsService:
             List of player ranking dictionaries
         """
         if not season:
-            # Determine current season
-            latest_game = self.db_session.query(Game).order_by(desc(Game.date)).first()
-            if latest_game:
-                season = self.get_season_from_date(latest_game.date)
-            else:
+            season = self.get_current_season()
+            if not season:
                 return []
 
         query = (
@@ -408,23 +791,15 @@ class SeasonStatsService:
 
         Args:
             team_id: ID of the team
-            season: Season to get record for (if None, uses current season)
+            season: Season code to get record for (if None, uses current season)
 
         Returns:
             Tuple of (wins, losses)
         """
         if not season:
-            # Get the active season from the Season table
-            active_season = self.db_session.query(Season).filter(Season.is_active).first()
-            if active_season:
-                season = active_season.code
-            else:
-                # Fallback to determining season from latest game
-                latest_game = self.db_session.query(Game).order_by(desc(Game.date)).first()
-                if latest_game:
-                    season = self.get_season_from_date(latest_game.date)
-                else:
-                    return (0, 0)
+            season = self.get_current_season()
+            if not season:
+                return (0, 0)
 
         # Get team season stats
         stats = (
@@ -451,7 +826,7 @@ class SeasonStatsService:
 
         Args:
             team_ids: List of team IDs
-            season: Season to get records for (if None, uses current season)
+            season: Season code to get records for (if None, uses current season)
 
         Returns:
             Dictionary mapping team_id to (wins, losses) tuples
@@ -460,17 +835,9 @@ class SeasonStatsService:
             return {}
 
         if not season:
-            # Get the active season from the Season table
-            active_season = self.db_session.query(Season).filter(Season.is_active).first()
-            if active_season:
-                season = active_season.code
-            else:
-                # Fallback to determining season from latest game
-                latest_game = self.db_session.query(Game).order_by(desc(Game.date)).first()
-                if latest_game:
-                    season = self.get_season_from_date(latest_game.date)
-                else:
-                    return dict.fromkeys(team_ids, (0, 0))
+            season = self.get_current_season()
+            if not season:
+                return dict.fromkeys(team_ids, (0, 0))
 
         # Get all team season stats in one query
         stats_list = (
@@ -499,17 +866,14 @@ class SeasonStatsService:
         """Get team standings for a season.
 
         Args:
-            season: Season to get standings for (if None, uses current season)
+            season: Season code to get standings for (if None, uses current season)
 
         Returns:
             List of team standing dictionaries
         """
         if not season:
-            # Determine current season
-            latest_game = self.db_session.query(Game).order_by(desc(Game.date)).first()
-            if latest_game:
-                season = self.get_season_from_date(latest_game.date)
-            else:
+            season = self.get_current_season()
+            if not season:
                 return []
 
         standings: list[dict] = []
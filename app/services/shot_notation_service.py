@@ -39,22 +39,28 @@ class ShotNotationService:
 
     @staticmethod
     def player_game_stats_to_scorebook_format(
-        player_game_stats: PlayerGameStats, quarter_stats: list[PlayerQuarterStats] | None = None
+        player_game_stats: PlayerGameStats,
+        quarter_stats: list[PlayerQuarterStats] | None = None,
+        home_team_id: int | None = None,
     ) -> dict[str, any]:
         """Convert PlayerGameStats to scorebook format.
 
         Args:
             player_game_stats: The player's game statistics
             quarter_stats: Optional quarter-by-quarter statistics
+            home_team_id: ID of the home team; read from ``player_game_stats.game`` when omitted
 
         Returns:
             Dictionary with scorebook-compatible format
         """
+        if home_team_id is None:
+            home_team_id = player_game_stats.game.playing_team_id
+
         result = {
             "player_id": player_game_stats.player_id,
             "player_name": player_game_stats.player.name,
             "jersey_number": player_game_stats.player.jersey_number,
-            "team": "home" if player_game_stats.player.team_id == player_game_stats.game.playing_team_id else "away",
+            "team": "home" if player_game_stats.player.team_id == home_team_id else "away",
             "fouls": player_game_stats.fouls or 0,
             # Initialize all quarter fields to empty strings
             "shots_q1": "",
@@ -119,7 +125,7 @@ class ShotNotationService:
             },
             "player_stats": [
                 ShotNotationService.player_game_stats_to_scorebook_format(
-                    pgs, player_quarter_stats_dict.get(pgs.player_id, [])
+                    pgs, player_quarter_stats_dict.get(pgs.player_id, []), home_team_id=game.playing_team_id
                 )
                 for pgs in player_game_stats_list
             ],
@@ -2,11 +2,15 @@
 Team statistics service for calculating team rankings and performance metrics.
 """
 
-from sqlalchemy.orm import Session
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
 
-from app.data_access.crud.crud_game import get_all_games
-from app.data_access.crud.crud_player_game_stats import get_player_game_stats_for_game_and_team
 from app.data_access.crud.crud_team import get_all_teams
+from app.data_access.models import Game, Player, PlayerGameStats, Season
+
+logger = logging.getLogger(__name__)
 
 
 class TeamStatsService:
@@ -16,10 +20,16 @@ class TeamStatsService:
         """Initialize with database session."""
         self._db_session = db_session
 
-    def get_team_rankings(self) -> list[dict]:
+    def get_team_rankings(self, season: str | None = None) -> list[dict]:
         """
         Calculate and return aggregated offensive and defensive statistics for all teams.
 
+        All per-game team lines and opponent splits are computed by a single grouped
+        aggregate query instead of loading player stats game by game.
+
+        Args:
+            season: Optional season code to restrict the rankings to (e.g. "2024-25")
+
         Returns:
             List of dictionaries containing team ranking statistics including:
             - team_id, team_name
@@ -28,121 +38,135 @@ class TeamStatsService:
             - games_played
             - offensive_rating, defensive_rating (composite scores)
         """
-        team_stats = {}
+        season_id = None
+        if season:
+            season_record = self._db_session.query(Season).filter(Season.code == season).first()
+            if not season_record:
+                logger.warning(f"Season {season} not found in database")
+                return []
+            season_id = season_record.id
+
         teams = get_all_teams(self._db_session)
+        if not teams:
+            return []
 
-        # Initialize stats for all teams
+        totals_by_team = {row.team_id: row for row in self._query_team_totals(season_id)}
+
+        ranked_teams = []
         for team in teams:
-            team_stats[team.id] = {
+            totals = totals_by_team.get(team.id)
+            stats = {
                 "team_id": team.id,
                 "team_name": team.display_name or team.name,
-                "total_points_scored": 0,
-                "total_fgm": 0,
-                "total_fga": 0,
-                "total_points_allowed": 0,
-                "opponent_total_fgm": 0,
-                "opponent_total_fga": 0,
-                "games_played": 0,
+                "total_points_scored": int(totals.points) if totals else 0,
+                "total_fgm": int(totals.fgm) if totals else 0,
+                "total_fga": int(totals.fga) if totals else 0,
+                "total_points_allowed": int(totals.opponent_points) if totals else 0,
+                "opponent_total_fgm": int(totals.opponent_fgm) if totals else 0,
+                "opponent_total_fga": int(totals.opponent_fga) if totals else 0,
+                "games_played": int(totals.games_played) if totals else 0,
             }
+            ranked_teams.append(self._build_ranking_entry(stats))
 
-        games = get_all_games(self._db_session)
+        return ranked_teams
 
-        for game in games:
-            playing_team_id = game.playing_team_id
-            opponent_team_id = game.opponent_team_id
+    def _query_team_totals(self, season_id: int | None = None) -> list:
+        """
+        Aggregate scoring and shooting totals for every team in one grouped query.
 
-            # Skip if either team is not in our stats dictionary
-            if playing_team_id not in team_stats or opponent_team_id not in team_stats:
-                continue
+        Each game contributes one "side" per participating team. Player lines are
+        summed per (game, team) and joined back onto both sides of the game, so a
+        team's own totals and its opponents' totals come out of the same GROUP BY.
 
-            # Get player stats for both teams
-            playing_team_player_stats = get_player_game_stats_for_game_and_team(
-                self._db_session, game.id, playing_team_id
-            )
-            opponent_team_player_stats = get_player_game_stats_for_game_and_team(
-                self._db_session, game.id, opponent_team_id
-            )
+        Args:
+            season_id: Optional Season.id to filter games by
 
-            # Calculate team scores and field goal stats
-            playing_team_score = self._calculate_team_score(playing_team_player_stats)
-            opponent_team_score = self._calculate_team_score(opponent_team_player_stats)
-
-            playing_team_fgm, playing_team_fga = self._calculate_team_fg_stats(playing_team_player_stats)
-            opponent_team_fgm, opponent_team_fga = self._calculate_team_fg_stats(opponent_team_player_stats)
-
-            # Update stats for playing team (home team)
-            team_stats[playing_team_id]["total_points_scored"] += playing_team_score
-            team_stats[playing_team_id]["total_points_allowed"] += opponent_team_score
-            team_stats[playing_team_id]["total_fgm"] += playing_team_fgm
-            team_stats[playing_team_id]["total_fga"] += playing_team_fga
-            team_stats[playing_team_id]["opponent_total_fgm"] += opponent_team_fgm
-            team_stats[playing_team_id]["opponent_total_fga"] += opponent_team_fga
-            team_stats[playing_team_id]["games_played"] += 1
-
-            # Update stats for opponent team (away team)
-            team_stats[opponent_team_id]["total_points_scored"] += opponent_team_score
-            team_stats[opponent_team_id]["total_points_allowed"] += playing_team_score
-            team_stats[opponent_team_id]["total_fgm"] += opponent_team_fgm
-            team_stats[opponent_team_id]["total_fga"] += opponent_team_fga
-            team_stats[opponent_team_id]["opponent_total_fgm"] += playing_team_fgm
-            team_stats[opponent_team_id]["opponent_total_fga"] += playing_team_fga
-            team_stats[opponent_team_id]["games_played"] += 1
-
-        # Calculate percentages and composite ratings
-        ranked_teams = []
-        for _team_id, stats in team_stats.items():
-            # Calculate field goal percentages
-            fg_percentage = (stats["total_fgm"] / stats["total_fga"] * 100) if stats["total_fga"] > 0 else 0
-            opponent_fg_percentage = (
-                (stats["opponent_total_fgm"] / stats["opponent_total_fga"] * 100)
-                if stats["opponent_total_fga"] > 0
-                else 0
+        Returns:
+            Rows with team_id, games_played, points, fgm, fga, opponent_points,
+            opponent_fgm and opponent_fga
+        """
+        db = self._db_session
+
+        lines_query = (
+            db.query(
+                PlayerGameStats.game_id.label("game_id"),
+                Player.team_id.label("team_id"),
+                func.sum(
+                    PlayerGameStats.total_ftm + (PlayerGameStats.total_2pm * 2) + (PlayerGameStats.total_3pm * 3)
+                ).label("points"),
+                func.sum(PlayerGameStats.total_2pm + PlayerGameStats.total_3pm).label("fgm"),
+                func.sum(PlayerGameStats.total_2pa + PlayerGameStats.total_3pa).label("fga"),
             )
-
-            # Calculate average points per game
-            ppg = stats["total_points_scored"] / stats["games_played"] if stats["games_played"] > 0 else 0
-            opp_ppg = stats["total_points_allowed"] / stats["games_played"] if stats["games_played"] > 0 else 0
-
-            # Calculate composite ratings (0-100 scale)
-            offensive_rating = self._calculate_offensive_rating(ppg, fg_percentage)
-            defensive_rating = self._calculate_defensive_rating(opp_ppg, opponent_fg_percentage)
-
-            ranked_teams.append(
-                {
-                    "team_id": stats["team_id"],
-                    "team_name": stats["team_name"],
-                    "total_points_scored": stats["total_points_scored"],
-                    "avg_points_scored": round(ppg, 1),
-                    "fg_percentage": round(fg_percentage, 1),
-                    "total_points_allowed": stats["total_points_allowed"],
-                    "avg_points_allowed": round(opp_ppg, 1),
-                    "opponent_fg_percentage": round(opponent_fg_percentage, 1),
-                    "games_played": stats["games_played"],
-                    "offensive_rating": round(offensive_rating, 1),
-                    "defensive_rating": round(defensive_rating, 1),
-                    "point_differential": round(ppg - opp_ppg, 1),
-                }
+            .join(Player, PlayerGameStats.player_id == Player.id)
+            .join(Game, PlayerGameStats.game_id == Game.id)
+        )
+        home_sides = db.query(
+            Game.id.label("game_id"),
+            Game.playing_team_id.label("team_id"),
+            Game.opponent_team_id.label("opponent_id"),
+        )
+        away_sides = db.query(
+            Game.id.label("game_id"),
+            Game.opponent_team_id.label("team_id"),
+            Game.playing_team_id.label("opponent_id"),
+        )
+        if season_id is not None:
+            lines_query = lines_query.filter(Game.season_id == season_id)
+            home_sides = home_sides.filter(Game.season_id == season_id)
+            away_sides = away_sides.filter(Game.season_id == season_id)
+
+        lines = lines_query.group_by(PlayerGameStats.game_id, Player.team_id).subquery()
+        sides = home_sides.union_all(away_sides).subquery()
+        own = aliased(lines)
+        opp = aliased(lines)
+
+        return (
+            db.query(
+                sides.c.team_id,
+                func.count(sides.c.game_id).label("games_played"),
+                func.coalesce(func.sum(own.c.points), 0).label("points"),
+                func.coalesce(func.sum(own.c.fgm), 0).label("fgm"),
+                func.coalesce(func.sum(own.c.fga), 0).label("fga"),
+                func.coalesce(func.sum(opp.c.points), 0).label("opponent_points"),
+                func.coalesce(func.sum(opp.c.fgm), 0).label("opponent_fgm"),
+                func.coalesce(func.sum(opp.c.fga), 0).label("opponent_fga"),
             )
-
-        return ranked_teams
-
-    def _calculate_team_score(self, player_stats) -> int:
-        """Calculate total team score from player stats."""
-        total_score = 0
-        for pgs in player_stats:
-            # Points = FTM + (2PM * 2) + (3PM * 3)
-            total_score += pgs.total_ftm + (pgs.total_2pm * 2) + (pgs.total_3pm * 3)
-        return total_score
-
-    def _calculate_team_fg_stats(self, player_stats) -> tuple[int, int]:
-        """Calculate team field goal makes and attempts from player stats."""
-        total_fgm = 0
-        total_fga = 0
-        for pgs in player_stats:
-            # Field goals = 2-point + 3-point shots
-            total_fgm += pgs.total_2pm + pgs.total_3pm
-            total_fga += pgs.total_2pa + pgs.total_3pa
-        return total_fgm, total_fga
+            .outerjoin(own, (own.c.game_id == sides.c.game_id) & (own.c.team_id == sides.c.team_id))
+            .outerjoin(opp, (opp.c.game_id == sides.c.game_id) & (opp.c.team_id == sides.c.opponent_id))
+            .group_by(sides.c.team_id)
+            .all()
+        )
+
+    def _build_ranking_entry(self, stats: dict) -> dict:
+        """Derive percentages, per-game averages and composite ratings from raw team totals."""
+        # Calculate field goal percentages
+        fg_percentage = (stats["total_fgm"] / stats["total_fga"] * 100) if stats["total_fga"] > 0 else 0
+        opponent_fg_percentage = (
+            (stats["opponent_total_fgm"] / stats["opponent_total_fga"] * 100) if stats["opponent_total_fga"] > 0 else 0
+        )
+
+        # Calculate average points per game
+        ppg = stats["total_points_scored"] / stats["games_played"] if stats["games_played"] > 0 else 0
+        opp_ppg = stats["total_points_allowed"] / stats["games_played"] if stats["games_played"] > 0 else 0
+
+        # Calculate composite ratings (0-100 scale)
+        offensive_rating = self._calculate_offensive_rating(ppg, fg_percentage)
+        defensive_rating = self._calculate_defensive_rating(opp_ppg, opponent_fg_percentage)
+
+        return {
+            "team_id": stats["team_id"],
+            "team_name": stats["team_name"],
+            "total_points_scored": stats["total_points_scored"],
+            "avg_points_scored": round(ppg, 1),
+            "fg_percentage": round(fg_percentage, 1),
+            "total_points_allowed": stats["total_points_allowed"],
+            "avg_points_allowed": round(opp_ppg, 1),
+            "opponent_fg_percentage": round(opponent_fg_percentage, 1),
+            "games_played": stats["games_played"],
+            "offensive_rating": round(offensive_rating, 1),
+            "defensive_rating": round(defensive_rating, 1),
+            "point_differential": round(ppg - opp_ppg, 1),
+        }
 
     def _calculate_offensive_rating(self, ppg: float, fg_percentage: float) -> float:
         """
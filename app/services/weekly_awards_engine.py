@@ -0,0 +1,449 @@
+# app/services/weekly_awards_engine.py
+
+"""
+Single-scan engine for weekly awards.
+
+Loads every player game line (with its quarter aggregates) for the requested season
+in one query, buckets the lines into per-week columns and evaluates all weekly award
+rules against those columns. Winners are written back in one batch.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.data_access.crud.crud_player_award import (
+    count_awards_by_week,
+    create_player_awards_batch,
+    replace_award_slices,
+)
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats
+from app.services.awards_service import DUB_CLUB_POINT_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+FRAME_COLUMNS = (
+    "game_id",
+    "game_date",
+    "player_id",
+    "ftm",
+    "fta",
+    "fg2m",
+    "fg2a",
+    "fg3m",
+    "fg3a",
+    "points",
+    "fgm",
+    "fga",
+    "misses",
+    "max_quarter_points",
+    "q4_points",
+)
+
+
+def _empty_frame() -> dict[str, list]:
+    """Create an empty columnar frame."""
+    return {column: [] for column in FRAME_COLUMNS}
+
+
+def load_weekly_frames(session: Session, season: str | None = None) -> dict[tuple[str, date], dict[str, list]]:
+    """
+    Load player game lines into columnar frames grouped by (season, week_start).
+
+    Quarter stats are pre-aggregated per game line in SQL (best quarter and Q4 points),
+    so the whole history is read in a single query.
+
+    Args:
+        session: Database session
+        season: Calendar-year season (e.g., "2024"). If None, loads all seasons.
+
+    Returns:
+        Dict mapping (season, week_start) to a dict of column name -> list of values
+    """
+    quarter_points = PlayerQuarterStats.fg2m * 2 + PlayerQuarterStats.fg3m * 3 + PlayerQuarterStats.ftm
+    quarters = (
+        session.query(
+            PlayerQuarterStats.player_game_stat_id.label("player_game_stat_id"),
+            func.max(quarter_points).label("max_quarter_points"),
+            func.sum(case((PlayerQuarterStats.quarter_number == 4, quarter_points))).label("q4_points"),
+        )
+        .group_by(PlayerQuarterStats.player_game_stat_id)
+        .subquery()
+    )
+
+    query = (
+        session.query(
+            Game.id,
+            Game.date,
+            PlayerGameStats.player_id,
+            PlayerGameStats.total_ftm,
+            PlayerGameStats.total_fta,
+            PlayerGameStats.total_2pm,
+            PlayerGameStats.total_2pa,
+            PlayerGameStats.total_3pm,
+            PlayerGameStats.total_3pa,
+            quarters.c.max_quarter_points,
+            quarters.c.q4_points,
+        )
+        .join(PlayerGameStats, PlayerGameStats.game_id == Game.id)
+        .join(Player, Player.id == PlayerGameStats.player_id)
+        .outerjoin(quarters, quarters.c.player_game_stat_id == PlayerGameStats.id)
+    )
+    if season:
+        if not season.isdigit():
+            logger.warning(f"Season must be a calendar year for weekly awards, got: {season}")
+            return {}
+        year = int(season)
+        query = query.filter(Game.date >= date(year, 1, 1), Game.date <= date(year, 12, 31))
+
+    frames: dict[tuple[str, date], dict[str, list]] = {}
+    for row in query.order_by(Game.id, PlayerGameStats.id).all():
+        game_id, game_date, player_id, ftm, fta, fg2m, fg2a, fg3m, fg3a, max_quarter_points, q4_points = row
+        key = (str(game_date.year), game_date - timedelta(days=game_date.weekday()))
+        frame = frames.get(key)
+        if frame is None:
+            frame = frames[key] = _empty_frame()
+        for column, value in (
+            ("game_id", game_id),
+            ("game_date", game_date),
+            ("player_id", player_id),
+            ("ftm", ftm),
+            ("fta", fta),
+            ("fg2m", fg2m),
+            ("fg2a", fg2a),
+            ("fg3m", fg3m),
+            ("fg3a", fg3a),
+            ("points", ftm + fg2m * 2 + fg3m * 3),
+            ("fgm", fg2m + fg3m),
+            ("fga", fg2a + fg3a),
+            ("misses", (fg2a - fg2m) + (fg3a - fg3m)),
+            ("max_quarter_points", max_quarter_points),
+            ("q4_points", q4_points),
+        ):
+            frame[column].append(value)
+
+    return frames
+
+
+def _best_per_player(frame: dict[str, list], values: list, eligible: list[bool] | None = None) -> dict[int, dict]:
+    """Track each player's best single-game value (first game wins on ties)."""
+    best: dict[int, dict] = {}
+    for i, player_id in enumerate(frame["player_id"]):
+        if eligible is not None and not eligible[i]:
+            continue
+        value = values[i]
+        if player_id not in best or value > best[player_id]["value"]:
+            best[player_id] = {"value": value, "row": i}
+    return best
+
+
+def _top(best: dict[int, dict]) -> tuple[object, list[int]]:
+    """Return the maximum value and the players who reached it."""
+    max_value = max(data["value"] for data in best.values())
+    return max_value, [player_id for player_id, data in best.items() if data["value"] == max_value]
+
+
+def _player_of_the_week(frame, season, week_start, context) -> list[dict]:
+    """Best single-game points, tie-broken by FG% in that game."""
+    best = _best_per_player(frame, frame["points"])
+    if not best:
+        return []
+    max_points, winners = _top(best)
+
+    def fg_pct(player_id):
+        row = best[player_id]["row"]
+        return frame["fgm"][row] / frame["fga"][row] if frame["fga"][row] > 0 else 0.0
+
+    if len(winners) > 1:
+        max_fg_pct = max(fg_pct(player_id) for player_id in winners)
+        winners = [player_id for player_id in winners if fg_pct(player_id) == max_fg_pct]
+
+    return [
+        {
+            "player_id": player_id,
+            "points_scored": max_points,
+            "game_id": frame["game_id"][best[player_id]["row"]],
+        }
+        for player_id in winners
+    ]
+
+
+def _quarterly_firepower(frame, season, week_start, context) -> list[dict]:
+    """Highest single-quarter point total in the week."""
+    player_max = {}
+    for player_id, points in zip(frame["player_id"], frame["max_quarter_points"], strict=True):
+        if points is None:
+            continue
+        player_max[player_id] = max(player_max.get(player_id, 0), points)
+    if not player_max:
+        return []
+    max_points = max(player_max.values())
+    return [
+        {"player_id": player_id, "stat_value": float(max_points)}
+        for player_id, points in player_max.items()
+        if points == max_points
+    ]
+
+
+def _per_game_stat(column: str):
+    """Build a rule awarding the best single-game value of one stat column."""
+
+    def rule(frame, season, week_start, context) -> list[dict]:
+        best = _best_per_player(frame, frame[column])
+        if not best:
+            return []
+        max_value, winners = _top(best)
+        return [
+            {
+                "player_id": player_id,
+                "game_id": frame["game_id"][best[player_id]["row"]],
+                "stat_value": float(max_value),
+            }
+            for player_id in winners
+        ]
+
+    return rule
+
+
+def _best_fg_pct(min_attempts: int, max_attempts: int | None = None):
+    """Build a rule awarding the best single-game FG% within an attempts window."""
+
+    def rule(frame, season, week_start, context) -> list[dict]:
+        fga = frame["fga"]
+        eligible = [a >= min_attempts and (max_attempts is None or a <= max_attempts) for a in fga]
+        pct = [fgm / a if a > 0 else 0.0 for fgm, a in zip(frame["fgm"], fga, strict=True)]
+        best = _best_per_player(frame, pct, eligible)
+        if not best:
+            return []
+        max_pct, winners = _top(best)
+        return [
+            {
+                "player_id": player_id,
+                "game_id": frame["game_id"][best[player_id]["row"]],
+                "stat_value": max_pct,
+            }
+            for player_id in winners
+        ]
+
+    return rule
+
+
+def _clutch_man(frame, season, week_start, context) -> list[dict]:
+    """Most fourth-quarter points across the week."""
+    totals: dict[int, int] = {}
+    for player_id, points in zip(frame["player_id"], frame["q4_points"], strict=True):
+        if points is None:
+            continue
+        totals[player_id] = totals.get(player_id, 0) + points
+    if not totals:
+        return []
+    max_points = max(totals.values())
+    return [
+        {"player_id": player_id, "stat_value": float(max_points)}
+        for player_id, points in totals.items()
+        if points == max_points
+    ]
+
+
+def _dub_club(frame, season, week_start, context) -> list[dict]:
+    """Every performance of DUB_CLUB_POINT_THRESHOLD+ points."""
+    return [
+        {"player_id": frame["player_id"][i], "points_scored": points, "game_id": frame["game_id"][i]}
+        for i, points in enumerate(frame["points"])
+        if points >= DUB_CLUB_POINT_THRESHOLD
+    ]
+
+
+def _perfect_performance(frame, season, week_start, context) -> list[dict]:
+    """Perfect shooting from every zone with at least 3 makes."""
+    awards = []
+    for i in range(len(frame["player_id"])):
+        makes = frame["fg2m"][i] + frame["fg3m"][i] + frame["ftm"][i]
+        if (
+            makes >= 3
+            and frame["fg2a"][i] == frame["fg2m"][i]
+            and frame["fg3a"][i] == frame["fg3m"][i]
+            and frame["fta"][i] == frame["ftm"][i]
+        ):
+            awards.append(
+                {"player_id": frame["player_id"][i], "game_id": frame["game_id"][i], "stat_value": float(makes)}
+            )
+    return awards
+
+
+def _breakout_performance(frame, season, week_start, context) -> list[dict]:
+    """Biggest single-game improvement over the player's prior season average."""
+    averages = context["averages"]
+    if not averages:
+        return []
+
+    best: dict[int, dict] = {}
+    for i, player_id in enumerate(frame["player_id"]):
+        avg_ppg = averages.get(player_id)
+        if avg_ppg is None:
+            continue
+        score = (frame["points"][i] - avg_ppg) / avg_ppg
+        if player_id not in best or score > best[player_id]["value"]:
+            best[player_id] = {"value": score, "row": i}
+    if not best:
+        return []
+
+    max_score, winners = _top(best)
+    return [
+        {
+            "player_id": player_id,
+            "points_scored": frame["points"][best[player_id]["row"]],
+            "game_id": frame["game_id"][best[player_id]["row"]],
+            "stat_value": max_score,
+        }
+        for player_id in winners
+    ]
+
+
+WEEKLY_AWARD_RULES = {
+    "player_of_the_week": _player_of_the_week,
+    "quarterly_firepower": _quarterly_firepower,
+    "weekly_ft_king": _per_game_stat("ftm"),
+    "hot_hand_weekly": _best_fg_pct(10),
+    "clutch_man": _clutch_man,
+    "trigger_finger": _per_game_stat("fga"),
+    "weekly_whiffer": _per_game_stat("misses"),
+    "human_howitzer": _per_game_stat("fg3m"),
+    "dub_club": _dub_club,
+    "marksman_award": _best_fg_pct(4, 8),
+    "perfect_performance": _perfect_performance,
+    "breakout_performance": _breakout_performance,
+}
+
+
+def _prior_averages_by_week(frames: dict[tuple[str, date], dict[str, list]]) -> dict[tuple[str, date], dict]:
+    """
+    Compute each player's season scoring average from games before every week.
+
+    Only players with 3+ prior games averaging more than 2.0 points qualify.
+    """
+    rows_by_season = defaultdict(list)
+    for (season, _), frame in frames.items():
+        rows_by_season[season].extend(zip(frame["game_date"], frame["player_id"], frame["points"], strict=True))
+
+    averages = {}
+    for season, rows in rows_by_season.items():
+        rows.sort(key=lambda row: row[0])
+        totals: dict[int, list[int]] = {}
+        position = 0
+        for week_start in sorted(week for s, week in frames if s == season):
+            while position < len(rows) and rows[position][0] < week_start:
+                _, player_id, points = rows[position]
+                games_points = totals.setdefault(player_id, [0, 0])
+                games_points[0] += 1
+                games_points[1] += points
+                position += 1
+            qualified = {}
+            for player_id, (games, points) in totals.items():
+                avg_ppg = points / games
+                if games >= 3 and avg_ppg > 2.0:
+                    qualified[player_id] = avg_ppg
+            averages[(season, week_start)] = qualified
+    return averages
+
+
+def evaluate_weekly_awards(
+    frames: dict[tuple[str, date], dict[str, list]], award_types: list[str] | None = None
+) -> list[dict]:
+    """
+    Evaluate weekly award rules over pre-loaded frames.
+
+    Args:
+        frames: Frames from load_weekly_frames
+        award_types: Award types to evaluate (defaults to all weekly awards)
+
+    Returns:
+        List of award dicts ready for create_player_awards_batch
+    """
+    award_types = award_types or list(WEEKLY_AWARD_RULES)
+    averages = _prior_averages_by_week(frames) if "breakout_performance" in award_types else {}
+
+    awards = []
+    for (season, week_start), frame in frames.items():
+        context = {"averages": averages.get((season, week_start), {})}
+        for award_type in award_types:
+            for award in WEEKLY_AWARD_RULES[award_type](frame, season, week_start, context):
+                award.update({"award_type": award_type, "season": season, "week_date": week_start})
+                awards.append(award)
+    return awards
+
+
+def persist_weekly_awards(
+    session: Session,
+    awards: list[dict],
+    weeks: list[tuple[str, date]],
+    award_types: list[str],
+    season: str | None = None,
+    recalculate: bool = False,
+) -> dict[str, dict[str, int]]:
+    """
+    Write evaluated weekly awards and count them per season.
+
+    Args:
+        session: Database session
+        awards: Award dicts from evaluate_weekly_awards
+        weeks: (season, week_start) keys that were evaluated
+        award_types: Award types that were evaluated
+        season: Season that was requested (None replaces every season on recalculate)
+        recalculate: If True, replace each award type's slice instead of adding to it
+
+    Returns:
+        Dict with award_type -> season -> awards_given count
+    """
+    seasons = sorted({week_season for week_season, _ in weeks})
+
+    if recalculate:
+        # Replace each award type's slice wholesale; the written records are the counts
+        counts = replace_award_slices(session, awards, [(award_type, season) for award_type in award_types])
+        session.commit()
+        logger.info(f"✅ Replaced {len(award_types)} weekly award types with {sum(counts.values())} records")
+        return {
+            award_type: {week_season: counts.get((award_type, week_season), 0) for week_season in seasons}
+            for award_type in award_types
+        }
+
+    create_player_awards_batch(session, awards)
+    session.commit()
+    logger.info(f"✅ Wrote {len(awards)} weekly award records")
+
+    # Count awards (new and existing) for the weeks that were processed
+    counts = count_awards_by_week(session, award_types, seasons)
+    results: dict[str, dict[str, int]] = {award_type: {} for award_type in award_types}
+    for award_type in award_types:
+        for week_season, week_start in weeks:
+            results[award_type][week_season] = results[award_type].get(week_season, 0) + counts.get(
+                (award_type, week_season, week_start), 0
+            )
+    return results
+
+
+def run_weekly_awards(
+    session: Session, season: str | None = None, recalculate: bool = False, award_types: list[str] | None = None
+) -> dict[str, dict[str, int]]:
+    """
+    Calculate weekly awards from a single scan of the season's stats.
+
+    Args:
+        session: Database session
+        season: Calendar-year season (e.g., "2024"). If None, calculates all seasons.
+        recalculate: If True, delete existing awards of each type before calculation
+        award_types: Award types to calculate (defaults to all weekly awards)
+
+    Returns:
+        Dict with award_type -> season -> awards_given count
+    """
+    award_types = award_types or list(WEEKLY_AWARD_RULES)
+
+    frames = load_weekly_frames(session, season)
+    logger.info(f"📊 Loaded {sum(len(f['player_id']) for f in frames.values())} stat lines in {len(frames)} weeks")
+
+    awards = evaluate_weekly_awards(frames, award_types)
+    return persist_weekly_awards(session, awards, list(frames), award_types, season, recalculate)
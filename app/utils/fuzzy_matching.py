@@ -6,7 +6,10 @@ allowing for common variations, abbreviations, and minor typos in player names.
 """
 
 import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from difflib import SequenceMatcher
+from typing import NamedTuple
 
 # Common nickname mappings for fuzzy name matching
 COMMON_NICKNAMES = {
@@ -32,6 +35,9 @@ COMMON_NICKNAMES = {
     "stephen": ["steve", "steph"],
 }
 
+# Nickname -> full name, so related first names are found with one dict lookup
+NICKNAME_TO_NAME = {nickname: full_name for full_name, nicknames in COMMON_NICKNAMES.items() for nickname in nicknames}
+
 
 def levenshtein_distance(s1: str, s2: str) -> int:
     """
@@ -63,6 +69,43 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
+def bounded_levenshtein(s1: str, s2: str, max_distance: int) -> int:
+    """
+    Calculate the Levenshtein distance between two strings, giving up early once it exceeds a bound.
+
+    Args:
+        s1: First string
+        s2: Second string
+        max_distance: Largest distance the caller cares about
+
+    Returns:
+        The distance if it is at most max_distance, otherwise max_distance + 1
+    """
+    if abs(len(s1) - len(s2)) > max_distance:
+        return max_distance + 1
+
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if len(s2) == 0:
+        return len(s1)
+
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        # Distances never shrink from one row to the next
+        if min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+
+    return min(previous_row[-1], max_distance + 1)
+
+
 def similarity_ratio(s1: str, s2: str) -> float:
     """
     Calculate similarity ratio between two strings using SequenceMatcher.
@@ -147,6 +190,71 @@ def is_initial_match(full_name: str, initial: str) -> bool:
     return len(clean_initial) == 1 and full_name.lower().startswith(clean_initial)
 
 
+class NameKey(NamedTuple):
+    """A name broken down once for repeated matching."""
+
+    normalized: str
+    first: str
+    middle: str | None
+    last: str | None
+
+
+def name_key(name: str) -> NameKey:
+    """
+    Precompute the normalized form and components of a name.
+
+    Args:
+        name: Raw name string
+
+    Returns:
+        NameKey for the name
+    """
+    return NameKey(normalize_name(name), *extract_name_components(name))
+
+
+def first_names_related(first1: str, first2: str) -> bool:
+    """
+    Check whether two first names could belong to the same person.
+
+    They are related if they are equal, one is the initial of the other, one is a
+    reasonable abbreviation of the other (e.g. "Jon" and "Jonathan"), they are the
+    same length and within two edits (a typo), or one is a common nickname for the
+    other.
+
+    Args:
+        first1: First name
+        first2: Other first name
+
+    Returns:
+        True if the first names are related
+    """
+    if not first1 or not first2:
+        return False
+
+    if first1 == first2:
+        return True
+
+    # Check for initial matching (e.g., "Michael" vs "M")
+    # Allow this for now, will filter single-letter-only names later
+    if is_initial_match(first1, first2) or is_initial_match(first2, first1):
+        return True
+
+    # Check for abbreviations
+    shorter = min(first1, first2, key=len)
+    longer = max(first1, first2, key=len)
+
+    if len(shorter) >= 3 and 0 < len(longer) - len(shorter) <= 4 and longer.startswith(shorter):
+        # Allow reasonable abbreviations
+        return True
+
+    # Check for typos in names of the same length (e.g., "John" vs "Jhon")
+    if len(first1) == len(first2) >= 3 and bounded_levenshtein(first1, first2, 2) <= 2:
+        return True
+
+    # Check for common nicknames
+    return NICKNAME_TO_NAME.get(first1) == first2 or NICKNAME_TO_NAME.get(first2) == first1
+
+
 def fuzzy_name_match(existing_name: str, new_name: str, threshold: float = 0.8) -> bool:
     """
     Enhanced fuzzy matching for player names with multiple strategies.
@@ -169,68 +277,50 @@ def fuzzy_name_match(existing_name: str, new_name: str, threshold: float = 0.8)
     if not existing_name or not new_name:
         return False
 
-    existing_norm = normalize_name(existing_name)
-    new_norm = normalize_name(new_name)
+    return name_keys_match(name_key(existing_name), name_key(new_name))
+
+
+def name_keys_match(existing: NameKey, new: NameKey) -> bool:
+    """
+    Apply the ``fuzzy_name_match`` strategies to two precomputed name keys.
+
+    Args:
+        existing: Key of the name currently in database
+        new: Key of the name from CSV import
+
+    Returns:
+        True if names are similar enough to be considered the same player
+    """
+    existing_norm, existing_first, existing_middle, existing_last = existing
+    new_norm, new_first, new_middle, new_last = new
 
     # Strategy 1: Exact match
     if existing_norm == new_norm:
         return True
 
     # Strategy 2: High similarity with short distance (only for very similar names)
-    ratio = similarity_ratio(existing_norm, new_norm)
+    # Every strategy below needs a ratio of at least 0.8; quick_ratio() is a cheap upper bound
+    matcher = SequenceMatcher(None, existing_norm, new_norm)
+    ratio = matcher.ratio() if matcher.quick_ratio() >= 0.8 else 0.0
     if ratio >= 0.95:  # Very high similarity only
         return True
 
-    # Extract name components
-    existing_first, existing_middle, existing_last = extract_name_components(existing_name)
-    new_first, new_middle, new_last = extract_name_components(new_name)
-
     # Require that first names are related somehow for any match
-    first_names_related = False
-
-    if existing_first and new_first:
-        # Check for exact first name match
-        if existing_first == new_first:
-            first_names_related = True
-        else:
-            # Check for initial matching (e.g., "Michael" vs "M")
-            # Allow this for now, will filter single-letter-only names later
-            if is_initial_match(existing_first, new_first) or is_initial_match(new_first, existing_first):
-                first_names_related = True
-
-            # Check for abbreviations
-            shorter = min(existing_first, new_first, key=len)
-            longer = max(existing_first, new_first, key=len)
-
-            if (
-                len(shorter) >= 3 and longer.startswith(shorter) and len(longer) - len(shorter) <= 4
-            ):  # Allow reasonable abbreviations
-                first_names_related = True
-
-            # Check for common nicknames
-            for full_name, nicknames in COMMON_NICKNAMES.items():
-                if (
-                    (existing_first == full_name and new_first in nicknames)
-                    or (new_first == full_name and existing_first in nicknames)
-                    or (existing_first in nicknames and new_first == full_name)
-                    or (new_first in nicknames and existing_first == full_name)
-                ):
-                    first_names_related = True
-                    break
+    names_related = first_names_related(existing_first, new_first)
 
     # Only proceed with matching if first names are related OR we have very high similarity for single names
-    if not first_names_related:
+    if not names_related:
         # For single letter names, be much more strict
         if len(existing_norm) == 1 or len(new_norm) == 1:
             return False
 
         # Allow very high similarity matches for single names (like last names) with strict distance check
-        if ratio >= 0.9 and (not existing_last or not new_last):
-            # Additional check: ensure the difference is just 1-2 characters for single names
-            distance = levenshtein_distance(existing_norm, new_norm)
-            if distance <= 2:
-                return True
-        return False
+        # Additional check: ensure the difference is just 1-2 characters for single names
+        return (
+            ratio >= 0.9
+            and (not existing_last or not new_last)
+            and bounded_levenshtein(existing_norm, new_norm, 2) <= 2
+        )
 
     # Strategy 3: First name + last initial matching - but only if last initials match
     if existing_first and new_first and existing_last and new_last:
@@ -247,14 +337,7 @@ def fuzzy_name_match(existing_name: str, new_name: str, threshold: float = 0.8)
             return True
 
     # Strategy 4: First name + middle initial matching
-    if (
-        existing_first
-        and new_first
-        and first_names_related
-        and existing_last
-        and new_last
-        and existing_last == new_last
-    ):
+    if existing_first and new_first and existing_last and new_last and existing_last == new_last:
         # Only check middle names if both first and last names have some similarity
         if existing_middle and new_middle:
             # Both have middle names/initials - they must match or be initials of each other
@@ -263,16 +346,12 @@ def fuzzy_name_match(existing_name: str, new_name: str, threshold: float = 0.8)
                 or is_initial_match(new_middle, existing_middle)
                 or existing_middle == new_middle
             )
-        elif (existing_middle and not new_middle) or (new_middle and not existing_middle):
-            # One has middle name, other doesn't - still a potential match if first names are related
-            return True
-        else:
-            # Neither has middle names, just first + last match with related first names
-            return True
+        # One or neither has a middle name - still a match since first names are related
+        return True
 
     # Strategy 5: Handle cases where one name has last and other has middle initial
     # e.g. "John Smith" vs "John B" - need to check if last name matches middle initial
-    if first_names_related and (not existing_last or not new_last):
+    if not existing_last or not new_last:
         # If one has a last name and the other has a middle initial, check if they match
         if existing_last and new_middle and not new_last:
             # e.g., "John Smith" vs "John B" -> check if "Smith" starts with "B"
@@ -280,29 +359,163 @@ def fuzzy_name_match(existing_name: str, new_name: str, threshold: float = 0.8)
         elif new_last and existing_middle and not existing_last:
             # e.g., "John B" vs "John Smith" -> check if "Smith" starts with "B"
             return is_initial_match(new_last, existing_middle)
-        elif not existing_last and not new_last:
-            # Both are single names - but don't allow single letter matches like "J" vs "John"
-            return not (len(existing_norm) == 1 or len(new_norm) == 1)
-        else:
-            # One has last name, other doesn't - allow if not single letter
-            return not (len(existing_norm) == 1 or len(new_norm) == 1)
+        # Single names, or one has a last name and the other doesn't - but don't allow
+        # single letter matches like "J" vs "John"
+        return not (len(existing_norm) == 1 or len(new_norm) == 1)
 
     # Strategy 6: Medium similarity with distance check (only if first names are related)
-    if first_names_related and ratio >= 0.8:
+    if ratio >= 0.8:
         # Additional check: Levenshtein distance should be reasonable
         max_distance = max(2, min(len(existing_norm), len(new_norm)) // 4)
-        if levenshtein_distance(existing_norm, new_norm) <= max_distance:
+        if bounded_levenshtein(existing_norm, new_norm, max_distance) <= max_distance:
             return True
 
     return False
 
 
+def _padded_trigrams(normalized: str) -> Counter[str]:
+    """Trigrams of a normalized name padded at both ends, counted with multiplicity."""
+    padded = f"\0\0{normalized}\0\0"
+    return Counter(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class NameIndex:
+    """
+    Precomputed index for matching names against a fixed list, such as a team's roster.
+
+    Matching a name with ``fuzzy_name_match`` against every candidate costs a
+    similarity ratio and edit distance per pair. The index instead keeps each
+    candidate's ``NameKey``, groups candidates by first name and buckets them by
+    padded trigrams. A lookup scores only the shortlisted candidates, and the
+    shortlist always contains every candidate ``fuzzy_name_match`` could accept:
+
+    - Matches that need related first names are found by checking the target's
+      first name against each distinct first name once, rather than per player.
+    - Every other match needs a similarity ratio of at least 0.95, or at least
+      0.9 plus an edit distance of at most 2. Either bounds the edit distance k,
+      and two names within distance k share at least
+      ``max(len) + 2 - 3 * k`` padded trigrams. Names too short for that bound to
+      help are compared by length instead.
+    """
+
+    SHORT_NAME_LENGTH = 4
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Build the index.
+
+        Args:
+            names: Candidate names, in priority order for ties
+        """
+        self.names = list(names)
+        self._keys = [name_key(name) for name in self.names]
+        self._by_first_name: dict[str, list[int]] = defaultdict(list)
+        self._by_trigram: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self._short: list[int] = []
+        self._related_first_names: dict[str, list[str]] = {}
+
+        for index, key in enumerate(self._keys):
+            if not self.names[index]:
+                continue
+            self._by_first_name[key.first].append(index)
+            for trigram, count in _padded_trigrams(key.normalized).items():
+                self._by_trigram[trigram].append((index, count))
+            if len(key.normalized) <= self.SHORT_NAME_LENGTH:
+                self._short.append(index)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _first_names_related_to(self, first: str) -> list[str]:
+        """Indexed first names related to ``first``, computed once per distinct first name."""
+        related = self._related_first_names.get(first)
+        if related is None:
+            related = [other for other in self._by_first_name if first_names_related(first, other)]
+            self._related_first_names[first] = related
+        return related
+
+    def candidates(self, key: NameKey) -> list[int]:
+        """
+        Shortlist the candidates a name could match.
+
+        Args:
+            key: Key of the name to look up
+
+        Returns:
+            Candidate positions in ascending order
+        """
+        shortlist = set()
+        for first in self._first_names_related_to(key.first):
+            shortlist.update(self._by_first_name[first])
+
+        length = len(key.normalized)
+        if length <= self.SHORT_NAME_LENGTH:
+            shortlist.update(i for i in self._short if abs(len(self._keys[i].normalized) - length) <= 2)
+
+        shared: Counter[int] = Counter()
+        for trigram, count in _padded_trigrams(key.normalized).items():
+            for index, candidate_count in self._by_trigram.get(trigram, ()):
+                shared[index] += min(count, candidate_count)
+        for index, common in shared.items():
+            if index in shortlist:
+                continue
+            candidate_length = len(self._keys[index].normalized)
+            max_distance = max(2, (length + candidate_length) // 20)
+            if (
+                abs(length - candidate_length) <= max_distance
+                and common >= max(length, candidate_length) + 2 - 3 * max_distance
+            ):
+                shortlist.add(index)
+
+        return sorted(shortlist)
+
+    def matches(self, name: str) -> list[str]:
+        """
+        Find every indexed name that ``fuzzy_name_match(name, candidate)`` accepts.
+
+        Args:
+            name: Name to match
+
+        Returns:
+            Matching names in index order
+        """
+        if not name:
+            return []
+        key = name_key(name)
+        return [self.names[i] for i in self.candidates(key) if name_keys_match(key, self._keys[i])]
+
+    def find_best_match(self, target_name: str, threshold: float = 0.8) -> tuple[str, float] | None:
+        """
+        Find the best matching indexed name, as ``find_best_name_match`` does.
+
+        Args:
+            target_name: Name to match against
+            threshold: Minimum similarity threshold
+
+        Returns:
+            Tuple of (best_match_name, similarity_score) or None if no good match found
+        """
+        best_match = None
+        best_score = 0.0
+
+        for candidate in self.matches(target_name):
+            score = similarity_ratio(target_name, candidate)
+            if score > best_score:
+                best_score = score
+                best_match = candidate
+
+        return (best_match, best_score) if best_match else None
+
+
 def find_best_name_match(
     target_name: str, candidate_names: list[str], threshold: float = 0.8
 ) -> tuple[str, float] | None:
     """
     Find the best matching name from a list of candidates.
 
+    Builds a throwaway ``NameIndex``; when matching many names against the same
+    roster, build the index once and call ``NameIndex.find_best_match`` instead.
+
     Args:
         target_name: Name to match against
         candidate_names: List of candidate names to check
@@ -311,17 +524,7 @@ def find_best_name_match(
     Returns:
         Tuple of (best_match_name, similarity_score) or None if no good match found
     """
-    best_match = None
-    best_score = 0.0
-
-    for candidate in candidate_names:
-        if fuzzy_name_match(target_name, candidate, threshold):
-            score = similarity_ratio(target_name, candidate)
-            if score > best_score:
-                best_score = score
-                best_match = candidate
-
-    return (best_match, best_score) if best_match else None
+    return NameIndex(candidate_names).find_best_match(target_name, threshold)
 
 
 # Backward compatibility: keep the same interface as the existing function
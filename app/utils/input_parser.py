@@ -2,8 +2,176 @@
 Utility for parsing shot strings from game statistics input.
 """
 
+from array import array
+from collections.abc import Iterable, Sequence
 from typing import Any
 
+# Order of the counts in parsed shot arrays
+SHOT_STAT_FIELDS = ("ftm", "fta", "fg2m", "fg2a", "fg3m", "fg3a")
+
+# Shot type -> (index of the made counter, index of the attempted counter)
+_SHOT_TYPE_SLOTS = {"FT": (0, 1), "2P": (2, 3), "3P": (4, 5)}
+
+_NO_SHOTS = (0,) * len(SHOT_STAT_FIELDS)
+
+
+class ShotStringParser:
+    """
+    Shot string parser compiled from a shot mapping.
+
+    Each mapped character is resolved to the counters it increments once, up
+    front. Parsing a string is then one ``str.count`` per shot character rather
+    than a dict lookup per character in the string, and validation is a single
+    ``str.translate`` that deletes every valid character.
+    """
+
+    def __init__(self, shot_mapping: dict[str, dict[str, Any]], ignore_case: bool = False, allowed_chars: str = ""):
+        """
+        Compile a parser.
+
+        Args:
+            shot_mapping: A dictionary mapping shot characters to their properties (type, made, points)
+            ignore_case: Lowercase shot strings before parsing them
+            allowed_chars: Extra characters, such as whitespace, that are ignored without being invalid
+        """
+        self.ignore_case = ignore_case
+        self._shots: list[tuple[str, int | None, int, int]] = []
+        for char, shot_info in shot_mapping.items():
+            slots = _SHOT_TYPE_SLOTS.get(shot_info.get("type"))
+            if slots is None:
+                continue
+            made_slot, attempt_slot = slots
+            points = shot_info.get("points", 0) if shot_info.get("made") else 0
+            self._shots.append((char, made_slot if shot_info.get("made") else None, attempt_slot, points))
+        self._delete_valid = str.maketrans("", "", "".join(shot_mapping) + allowed_chars)
+
+    def _prepare(self, shot_string: str) -> str:
+        return shot_string.lower() if self.ignore_case else shot_string
+
+    def counts(self, shot_string: str | None) -> tuple[int, ...]:
+        """
+        Count makes and attempts in a shot string.
+
+        Characters that are not in the shot mapping are skipped.
+
+        Args:
+            shot_string: The string representing shots taken in a quarter, e.g., "22-1x/"
+
+        Returns:
+            Counts in ``SHOT_STAT_FIELDS`` order
+        """
+        if not shot_string:
+            return _NO_SHOTS
+
+        shot_string = self._prepare(shot_string)
+        totals = [0] * len(SHOT_STAT_FIELDS)
+        for char, made_slot, attempt_slot, _ in self._shots:
+            count = shot_string.count(char)
+            if count:
+                totals[attempt_slot] += count
+                if made_slot is not None:
+                    totals[made_slot] += count
+        return tuple(totals)
+
+    def parse(self, shot_string: str | None) -> dict[str, int]:
+        """
+        Parse a shot string into a dictionary keyed by ``SHOT_STAT_FIELDS``.
+
+        Args:
+            shot_string: The string representing shots taken in a quarter
+
+        Returns:
+            A dictionary with ftm, fta, fg2m, fg2a, fg3m and fg3a counts
+        """
+        return dict(zip(SHOT_STAT_FIELDS, self.counts(shot_string), strict=True))
+
+    def parse_many(self, shot_strings: Iterable[str | None]) -> array:
+        """
+        Parse many shot strings in one call, e.g. every quarter of every player in a game.
+
+        Args:
+            shot_strings: Shot strings in any order; empty strings and None parse to zeros
+
+        Returns:
+            A flat integer array holding ``len(SHOT_STAT_FIELDS)`` counts per shot string,
+            in input order. Use ``shot_stats_at`` to read one entry back as a dictionary.
+        """
+        parsed = array("l")
+        for shot_string in shot_strings:
+            parsed.extend(self.counts(shot_string))
+        return parsed
+
+    def points(self, shot_string: str | None) -> int:
+        """
+        Total points scored in a shot string.
+
+        Args:
+            shot_string: The string representing shots taken
+
+        Returns:
+            Points from made shots
+        """
+        if not shot_string:
+            return 0
+
+        shot_string = self._prepare(shot_string)
+        return sum(shot_string.count(char) * points for char, _, _, points in self._shots if points)
+
+    def invalid_chars(self, shot_string: str | None) -> str:
+        """
+        Characters of a shot string that are neither shots nor allowed extras.
+
+        Args:
+            shot_string: The string to check
+
+        Returns:
+            The invalid characters in order of appearance (after lowercasing if the parser ignores case)
+        """
+        if not shot_string:
+            return ""
+        return self._prepare(shot_string).translate(self._delete_valid)
+
+
+def shot_stats_at(parsed: Sequence[int], index: int) -> dict[str, int]:
+    """
+    Read one shot string's counts back from a ``ShotStringParser.parse_many`` array.
+
+    Args:
+        parsed: Array returned by ``parse_many``
+        index: Position of the shot string in the ``parse_many`` input
+
+    Returns:
+        A dictionary with ftm, fta, fg2m, fg2a, fg3m and fg3a counts
+    """
+    start = index * len(SHOT_STAT_FIELDS)
+    return dict(zip(SHOT_STAT_FIELDS, parsed[start : start + len(SHOT_STAT_FIELDS)], strict=True))
+
+
+# Parsers compiled for shot mappings passed to parse_quarter_shot_string, keyed by id().
+# The mapping is kept alongside its parser so its id cannot be reused by another object.
+_compiled_parsers: dict[int, tuple[dict[str, dict[str, Any]], ShotStringParser]] = {}
+
+
+def get_shot_parser(shot_mapping: dict[str, dict[str, Any]]) -> ShotStringParser:
+    """
+    Get the compiled parser for a shot mapping, compiling it on first use.
+
+    Args:
+        shot_mapping: A dictionary mapping shot characters to their properties (type, made, points)
+
+    Returns:
+        The shared ShotStringParser for the mapping
+    """
+    cached = _compiled_parsers.get(id(shot_mapping))
+    if cached is not None and cached[0] is shot_mapping:
+        return cached[1]
+
+    parser = ShotStringParser(shot_mapping)
+    if len(_compiled_parsers) >= 32:
+        _compiled_parsers.clear()
+    _compiled_parsers[id(shot_mapping)] = (shot_mapping, parser)
+    return parser
+
 
 def parse_quarter_shot_string(shot_string: str, shot_mapping: dict[str, dict[str, Any]]) -> dict[str, int]:
     """
@@ -26,33 +194,4 @@ def parse_quarter_shot_string(shot_string: str, shot_mapping: dict[str, dict[str
         >>> parse_quarter_shot_string("22-1x/", SHOT_MAPPING)
         {'ftm': 1, 'fta': 2, 'fg2m': 2, 'fg2a': 3, 'fg3m': 0, 'fg3a': 1}
     """
-    # Initialize counters for all shot types
-    results = {"ftm": 0, "fta": 0, "fg2m": 0, "fg2a": 0, "fg3m": 0, "fg3a": 0}
-
-    # Return default values if shot_string is empty
-    if not shot_string or shot_string.strip() == "":
-        return results
-
-    # Count shots by type
-    for char in shot_string:
-        if char not in shot_mapping:
-            continue  # Skip any characters not in the mapping
-
-        shot_info = shot_mapping[char]
-        shot_type = shot_info.get("type")
-
-        # Update the appropriate counters based on shot type and outcome
-        if shot_type == "FT":
-            results["fta"] += 1
-            if shot_info.get("made"):
-                results["ftm"] += 1
-        elif shot_type == "2P":
-            results["fg2a"] += 1
-            if shot_info.get("made"):
-                results["fg2m"] += 1
-        elif shot_type == "3P":
-            results["fg3a"] += 1
-            if shot_info.get("made"):
-                results["fg3m"] += 1
-
-    return results
+    return get_shot_parser(shot_mapping).parse(shot_string)
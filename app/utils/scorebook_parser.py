@@ -4,6 +4,14 @@ Utility module for parsing scorebook notation into basketball statistics.
 
 from typing import Any
 
+from app.config import SHOT_MAPPING
+from app.utils.input_parser import SHOT_STAT_FIELDS, ShotStringParser, shot_stats_at
+
+# Scorebook notation uses the shot mapping characters, in either case, optionally separated by whitespace
+NOTATION_PARSER = ShotStringParser(SHOT_MAPPING, ignore_case=True, allowed_chars=" \t")
+
+QUARTER_NOTATION_KEYS = ("qt1_shots", "qt2_shots", "qt3_shots", "qt4_shots", "ot1_shots", "ot2_shots")
+
 
 def parse_scoring_notation(notation: str) -> dict[str, int]:
     """
@@ -28,45 +36,7 @@ def parse_scoring_notation(notation: str) -> dict[str, int]:
         >>> parse_scoring_notation("3/2")
         {'ftm': 0, 'fta': 0, 'fg2m': 1, 'fg2a': 1, 'fg3m': 1, 'fg3a': 2}
     """
-    if not notation:
-        return {"ftm": 0, "fta": 0, "fg2m": 0, "fg2a": 0, "fg3m": 0, "fg3a": 0}
-
-    # Initialize stats
-    stats = {
-        "ftm": 0,  # Free throws made
-        "fta": 0,  # Free throws attempted
-        "fg2m": 0,  # 2-point field goals made
-        "fg2a": 0,  # 2-point field goals attempted
-        "fg3m": 0,  # 3-point field goals made
-        "fg3a": 0,  # 3-point field goals attempted
-    }
-
-    # Parse each character in the notation
-    for char in notation.lower():
-        if char == "1":
-            # Made free throw
-            stats["ftm"] += 1
-            stats["fta"] += 1
-        elif char == "x":
-            # Missed free throw
-            stats["fta"] += 1
-        elif char == "2":
-            # Made 2-point shot
-            stats["fg2m"] += 1
-            stats["fg2a"] += 1
-        elif char == "-":
-            # Missed 2-point shot
-            stats["fg2a"] += 1
-        elif char == "3":
-            # Made 3-point shot
-            stats["fg3m"] += 1
-            stats["fg3a"] += 1
-        elif char == "/":
-            # Missed 3-point shot
-            stats["fg3a"] += 1
-        # Ignore any other characters (spaces, etc.)
-
-    return stats
+    return NOTATION_PARSER.parse(notation)
 
 
 def calculate_points_from_notation(notation: str) -> int:
@@ -86,20 +56,7 @@ def calculate_points_from_notation(notation: str) -> int:
         >>> calculate_points_from_notation("3/2")
         5
     """
-    if not notation:
-        return 0
-
-    points = 0
-    for char in notation.lower():
-        if char == "1":
-            points += 1  # Free throw
-        elif char == "2":
-            points += 2  # 2-point shot
-        elif char == "3":
-            points += 3  # 3-point shot
-        # Misses don't add points
-
-    return points
+    return NOTATION_PARSER.points(notation)
 
 
 def validate_scoring_notation(notation: str) -> tuple[bool, str]:
@@ -119,14 +76,9 @@ def validate_scoring_notation(notation: str) -> tuple[bool, str]:
         >>> validate_scoring_notation("22-1z")
         (False, "Invalid character 'z' in scoring notation")
     """
-    if not notation:
-        return True, ""
-
-    valid_chars = {"1", "x", "2", "-", "3", "/", " ", "\t"}
-
-    for char in notation.lower():
-        if char not in valid_chars:
-            return False, f"Invalid character '{char}' in scoring notation"
+    invalid = NOTATION_PARSER.invalid_chars(notation)
+    if invalid:
+        return False, f"Invalid character '{invalid[0]}' in scoring notation"
 
     return True, ""
 
@@ -147,43 +99,63 @@ def parse_scorebook_entry(player_data: dict[str, Any]) -> dict[str, Any]:
     Raises:
         ValueError: If scoring notation is invalid
     """
-    # Validate required fields
-    if "player_id" not in player_data:
-        raise ValueError("player_id is required")
-
-    if "fouls" not in player_data:
-        raise ValueError("fouls is required")
-
-    # Initialize result
-    result = {
-        "player_id": player_data["player_id"],
-        "fouls": int(player_data.get("fouls", 0)),
-        "total_stats": {"ftm": 0, "fta": 0, "fg2m": 0, "fg2a": 0, "fg3m": 0, "fg3a": 0},
-        "quarter_stats": [],
-    }
+    return parse_scorebook_entries([player_data])[0]
 
-    # Process each quarter (Q1-Q4 and OT1-OT2)
-    quarter_mappings = {1: "qt1_shots", 2: "qt2_shots", 3: "qt3_shots", 4: "qt4_shots", 5: "ot1_shots", 6: "ot2_shots"}
 
-    for quarter in range(1, 7):
-        quarter_key = quarter_mappings.get(quarter, f"qt{quarter}_shots")
-        notation = player_data.get(quarter_key, "")
+def parse_scorebook_entries(players_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Parse the scorebook entries of every player in a game.
+
+    All entries are validated before any is parsed, and the notation of every
+    quarter of every player is then parsed in a single batch.
 
-        # Validate notation
-        is_valid, error_msg = validate_scoring_notation(notation)
-        if not is_valid:
-            raise ValueError(f"Quarter {quarter}: {error_msg}")
+    Args:
+        players_data: List of player data dictionaries, as accepted by parse_scorebook_entry
+
+    Returns:
+        List of parsed entries in input order, as returned by parse_scorebook_entry
 
-        # Parse quarter stats
-        quarter_stats = parse_scoring_notation(notation)
-        quarter_stats["quarter_number"] = quarter
-        result["quarter_stats"].append(quarter_stats)
+    Raises:
+        ValueError: If any entry is missing a required field or has invalid notation
+    """
+    notations = []
+    for player_data in players_data:
+        # Validate required fields
+        if "player_id" not in player_data:
+            raise ValueError("player_id is required")
 
-        # Add to total stats
-        for key in ["ftm", "fta", "fg2m", "fg2a", "fg3m", "fg3a"]:
-            result["total_stats"][key] += quarter_stats[key]
+        if "fouls" not in player_data:
+            raise ValueError("fouls is required")
 
-    return result
+        # Validate each quarter (Q1-Q4 and OT1-OT2)
+        for quarter, quarter_key in enumerate(QUARTER_NOTATION_KEYS, start=1):
+            notation = player_data.get(quarter_key, "")
+            is_valid, error_msg = validate_scoring_notation(notation)
+            if not is_valid:
+                raise ValueError(f"Quarter {quarter}: {error_msg}")
+            notations.append(notation)
+
+    parsed = NOTATION_PARSER.parse_many(notations)
+
+    results = []
+    for entry, player_data in enumerate(players_data):
+        first = entry * len(QUARTER_NOTATION_KEYS)
+        quarter_stats = []
+        for quarter in range(1, len(QUARTER_NOTATION_KEYS) + 1):
+            stats = shot_stats_at(parsed, first + quarter - 1)
+            stats["quarter_number"] = quarter
+            quarter_stats.append(stats)
+
+        results.append(
+            {
+                "player_id": player_data["player_id"],
+                "fouls": int(player_data.get("fouls", 0)),
+                "total_stats": {key: sum(stats[key] for stats in quarter_stats) for key in SHOT_STAT_FIELDS},
+                "quarter_stats": quarter_stats,
+            }
+        )
+
+    return results
 
 
 def format_scoring_notation_help() -> dict[str, Any]:
@@ -220,10 +192,8 @@ def calculate_team_score_from_players(players_data: list[dict[str, Any]]) -> int
     total_score = 0
 
     for player_data in players_data:
-        for quarter in range(1, 5):
-            quarter_key = f"qt{quarter}_shots"
-            notation = player_data.get(quarter_key, "")
-            total_score += calculate_points_from_notation(notation)
+        for quarter_key in QUARTER_NOTATION_KEYS[:4]:
+            total_score += NOTATION_PARSER.points(player_data.get(quarter_key, ""))
 
     return total_score
 
@@ -1,104 +1,721 @@
-"""Simple in-memory cache for Basketball Stats Tracker."""
+"""Response cache for Basketball Stats Tracker.
+
+Two backends share one interface: SimpleCache keeps entries in process memory, and
+SQLiteCache keeps them in a SQLite file that every uvicorn worker on the host opens, so
+workers share warm entries and an invalidation made by one worker applies to all of them.
+The backend is chosen with the CACHE_BACKEND setting.
+"""
 
 import asyncio
+import inspect
+import json
 import logging
+import os
+import pickle
+import sqlite3
+import stat
+import sys
+import tempfile
+import threading
 import time
-from collections.abc import Callable
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from datetime import date
 from functools import wraps
 from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Tags collected while a cached function computes its value (see add_cache_tags)
+_collected_tags: ContextVar[set[str] | None] = ContextVar("collected_cache_tags", default=None)
+
+# Endpoint arguments that never identify a resource and are left out of cache keys
+_UNKEYED_ARGUMENTS = {"auth_context", "request", "current_user", "db", "session"}
+_KEYABLE_TYPES = (str, int, float, bool, date)
+
 
-class SimpleCache:
-    """Thread-safe in-memory cache with TTL support."""
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory held by a cached value, in bytes."""
+    if isinstance(value, str | bytes | bytearray):
+        return len(value)
+    body = getattr(value, "body", None)  # Rendered responses (HTMLResponse, TemplateResponse, ...)
+    if isinstance(body, bytes | bytearray):
+        return len(body)
+    if hasattr(value, "model_dump_json"):
+        return len(value.model_dump_json())
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class CacheBackend(ABC):
+    """Interface implemented by cache backends.
+
+    Backends store values with a TTL and a set of entity tags, and bump a generation
+    counter on every invalidation. get_or_compute() is shared: it coalesces concurrent
+    misses for one key within the process.
+    """
 
     def __init__(self):
-        self._cache: dict[str, dict[str, Any]] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._coalesced = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """Get value from cache if not expired."""
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int = 3600, tags: Iterable[str] = (), generation: int | None = None
+    ):
+        """Set value in cache with TTL and the tags it depends on.
+
+        When ``generation`` is given the value is only stored if no invalidation happened since
+        that generation was read.
+        """
+
+    @abstractmethod
+    async def generation(self) -> int:
+        """Return the invalidation counter."""
+
+    @abstractmethod
+    async def invalidate(self, pattern: str = None):
+        """Invalidate cache entries matching pattern or all if no pattern."""
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every entry that declared any of the given tags."""
+
+    @abstractmethod
+    def reset(self):
+        """Drop all entries and metrics (for tests and startup)."""
+
+    @abstractmethod
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[tuple[Any, Iterable[str]]]], ttl_seconds: int = 3600
+    ) -> Any:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        ``compute`` returns the value and the tags it depends on. While one coroutine computes
+        a key, concurrent misses for the same key wait for its result instead of recomputing.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._coalesced += 1
+            logger.debug(f"Cache WAIT for in-flight key: {key}")
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            generation = await self.generation()
+            value, tags = await compute()
+            # A value computed across an invalidation may already be stale, so it is served but not stored
+            await self.set(key, value, ttl_seconds, tags=tags, generation=generation)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; mark it retrieved when there are none
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+
+class SimpleCache(CacheBackend):
+    """Thread-safe in-memory LRU cache with TTL support and tag-based invalidation.
+
+    The cache is bounded by entry count and by approximate size in bytes; once either limit
+    is exceeded the least recently used entries are evicted. Entries can declare the entities
+    they depend on as tags (e.g. "team:5", "game:812", "season:2025"). Invalidating a tag
+    removes only the entries that declared it, and hits, misses and invalidations are tracked
+    per tag. Concurrent misses for one key are coalesced by get_or_compute().
+    """
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None):
+        super().__init__()
+        self.max_entries = max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else settings.CACHE_MAX_BYTES
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._tag_index: dict[str, set[str]] = {}
+        self._tag_stats: dict[str, dict[str, int]] = {}
+        self._total_bytes = 0
+        self._evictions = 0
+        self._generation = 0  # Bumped by every invalidation
         self._lock = asyncio.Lock()
 
+    def _count(self, tags: Iterable[str], metric: str, amount: int = 1):
+        """Add to a per-tag metric."""
+        for tag in tags:
+            stats = self._tag_stats.setdefault(tag, {"hits": 0, "misses": 0, "invalidations": 0})
+            stats[metric] += amount
+
+    def _remove(self, key: str) -> dict[str, Any]:
+        """Remove an entry and drop it from the tag index."""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry["size"]
+        for tag in entry["tags"]:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        return entry
+
+    def _evict(self):
+        """Evict least recently used entries until the cache is within its bounds."""
+        while self._cache and (len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
+            logger.debug(f"Cache EVICTED key: {key}")
+
     async def get(self, key: str) -> Any | None:
         """Get value from cache if not expired."""
         async with self._lock:
             if key in self._cache:
                 entry = self._cache[key]
                 if time.time() < entry["expires_at"]:
+                    self._cache.move_to_end(key)
+                    self._count(entry["tags"], "hits")
                     logger.debug(f"Cache HIT for key: {key}")
                     return entry["value"]
                 else:
                     # Expired, remove it
-                    del self._cache[key]
+                    self._remove(key)
                     logger.debug(f"Cache EXPIRED for key: {key}")
 
             logger.debug(f"Cache MISS for key: {key}")
             return None
 
-    async def set(self, key: str, value: Any, ttl_seconds: int = 3600):
-        """Set value in cache with TTL."""
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int = 3600, tags: Iterable[str] = (), generation: int | None = None
+    ):
+        """Set value in cache with TTL and the tags it depends on.
+
+        A set follows a miss, so it is counted as a miss for each of the entry's tags.
+        Values larger than the whole byte budget, or computed across an invalidation
+        (see ``generation``), are not stored.
+        """
+        tags = frozenset(tags)
+        size = _estimate_size(value)
         async with self._lock:
-            self._cache[key] = {"value": value, "expires_at": time.time() + ttl_seconds, "created_at": time.time()}
-            logger.debug(f"Cache SET for key: {key}, TTL: {ttl_seconds}s")
+            self._count(tags, "misses")
+            if generation is not None and generation != self._generation:
+                logger.debug(f"Cache SKIP for key: {key}, invalidated while computing")
+                return
+            if key in self._cache:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.warning(f"Cache SKIP for key: {key}, {size} bytes exceeds the {self.max_bytes} byte budget")
+                return
+            self._cache[key] = {
+                "value": value,
+                "expires_at": time.time() + ttl_seconds,
+                "created_at": time.time(),
+                "tags": tags,
+                "size": size,
+            }
+            self._total_bytes += size
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            self._evict()
+            logger.debug(f"Cache SET for key: {key}, TTL: {ttl_seconds}s, {size} bytes, tags: {sorted(tags)}")
+
+    async def generation(self) -> int:
+        """Return the invalidation counter."""
+        return self._generation
 
     async def invalidate(self, pattern: str = None):
         """Invalidate cache entries matching pattern or all if no pattern."""
         async with self._lock:
+            self._generation += 1
             if pattern is None:
                 # Clear all cache
                 count = len(self._cache)
+                for entry in self._cache.values():
+                    self._count(entry["tags"], "invalidations")
                 self._cache.clear()
+                self._tag_index.clear()
+                self._total_bytes = 0
                 logger.info(f"Cache cleared: {count} entries removed")
             else:
                 # Clear entries matching pattern
                 keys_to_remove = [k for k in self._cache if pattern in k]
                 for key in keys_to_remove:
-                    del self._cache[key]
+                    self._count(self._remove(key)["tags"], "invalidations")
                 logger.info(f"Cache invalidated: {len(keys_to_remove)} entries matching '{pattern}' removed")
 
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every entry that declared any of the given tags."""
+        tags = set(tags)
+        async with self._lock:
+            self._generation += 1
+            keys_to_remove = set()
+            for tag in tags:
+                keys_to_remove.update(self._tag_index.get(tag, ()))
+            for key in keys_to_remove:
+                entry = self._remove(key)
+                self._count(entry["tags"] & tags, "invalidations")
+            logger.info(f"Cache invalidated: {len(keys_to_remove)} entries tagged {sorted(tags)} removed")
+            return len(keys_to_remove)
+
+    def reset(self):
+        """Drop all entries and per-tag metrics without waiting for the lock (for tests and startup)."""
+        self._cache.clear()
+        self._tag_index.clear()
+        self._tag_stats.clear()
+        self._inflight.clear()
+        self._total_bytes = 0
+        self._evictions = 0
+        self._coalesced = 0
+
     async def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics, including size, evictions and per-tag entries, hits, misses and invalidations."""
         async with self._lock:
             now = time.time()
             total_entries = len(self._cache)
             expired_entries = sum(1 for entry in self._cache.values() if now >= entry["expires_at"])
             active_entries = total_entries - expired_entries
 
+            tags = {
+                tag: {"entries": len(self._tag_index.get(tag, ())), **stats}
+                for tag, stats in sorted(self._tag_stats.items())
+            }
+
             return {
+                "backend": "memory",
                 "total_entries": total_entries,
                 "active_entries": active_entries,
                 "expired_entries": expired_entries,
+                "max_entries": self.max_entries,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "coalesced_misses": self._coalesced,
+                "tags": tags,
             }
 
 
+# Stored values start with a format marker: JSON data, or a rendered response's JSON metadata line and raw body
+_JSON_VALUE = b"J"
+_RESPONSE_VALUE = b"R"
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for a shared backend: responses as their raw body, anything else as JSON."""
+    if isinstance(value, Response):
+        headers = {name: header for name, header in value.headers.items() if name != "content-length"}
+        meta = {"status_code": value.status_code, "headers": headers, "media_type": value.media_type}
+        return _RESPONSE_VALUE + json.dumps(meta).encode() + b"\n" + bytes(value.body)
+    return _JSON_VALUE + json.dumps(jsonable_encoder(value)).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a value written by _dumps(); models come back as their JSON data."""
+    marker, payload = data[:1], data[1:]
+    if marker == _JSON_VALUE:
+        return json.loads(payload)
+    if marker == _RESPONSE_VALUE:
+        meta, body = payload.split(b"\n", 1)
+        return Response(content=body, **json.loads(meta))
+    raise ValueError("Unknown cache value format")
+
+
+def _default_sqlite_path() -> str:
+    """Place the shared cache in a directory private to this user, on tmpfs when the host has one."""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    directory = os.path.join(base, f"basketball_stats_cache-{os.getuid()}")
+    with suppress(FileExistsError):
+        os.mkdir(directory, 0o700)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"Refusing to use cache directory {directory}: it is not private to this user")
+    return os.path.join(directory, "cache.db")
+
+
+def _claim_cache_file(path: str):
+    """Create the cache file readable only by this user, refusing a file owned by another user."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        if os.fstat(fd).st_uid != os.getuid():
+            raise PermissionError(f"Refusing to open cache file {path}: it is owned by another user")
+        os.fchmod(fd, 0o600)
+    finally:
+        os.close(fd)
+
+
+class SQLiteCache(CacheBackend):
+    """LRU cache with TTL support and tag-based invalidation, stored in a SQLite file.
+
+    Every worker process opens the same file, so a value computed by one worker is served by
+    the others and invalidations reach all of them. Keep the file on tmpfs (the default path
+    is under /dev/shm) so cache traffic never touches disk. The file is private to the user
+    running the app, and values are stored as JSON or raw response bytes, never pickles.
+    Statements run in a worker thread to keep the event loop free while another process
+    holds the write lock.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            expires_at REAL NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at INTEGER NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at ON cache_entries (accessed_at);
+        CREATE TABLE IF NOT EXISTS cache_tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL REFERENCES cache_entries (key) ON DELETE CASCADE,
+            PRIMARY KEY (tag, key)
+        );
+        CREATE INDEX IF NOT EXISTS ix_cache_tags_key ON cache_tags (key);
+        CREATE TABLE IF NOT EXISTS cache_tag_stats (
+            tag TEXT PRIMARY KEY,
+            hits INTEGER NOT NULL DEFAULT 0,
+            misses INTEGER NOT NULL DEFAULT 0,
+            invalidations INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('generation', 0), ('clock', 0), ('evictions', 0);
+    """
+
+    def __init__(self, path: str | None = None, max_entries: int | None = None, max_bytes: int | None = None):
+        super().__init__()
+        self.path = path or settings.CACHE_SQLITE_PATH or _default_sqlite_path()
+        self.max_entries = max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else settings.CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        _claim_cache_file(self.path)
+        self._conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")  # The cache is disposable; skip fsyncs
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._lock:
+            self._conn.executescript(self._SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the connection lock and an immediate write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, name: str) -> int:
+        """Read a counter from cache_meta."""
+        return conn.execute("SELECT value FROM cache_meta WHERE name = ?", (name,)).fetchone()[0]
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> int:
+        """Increment a counter in cache_meta and return its new value."""
+        conn.execute("UPDATE cache_meta SET value = value + ? WHERE name = ?", (amount, name))
+        return SQLiteCache._meta(conn, name)
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, metric: str, select_tags: str, params: tuple):
+        """Add to a per-tag metric for every (tag, amount) row produced by select_tags."""
+        conn.execute(
+            f"INSERT INTO cache_tag_stats (tag, {metric}) SELECT * FROM ({select_tags}) WHERE true "
+            f"ON CONFLICT (tag) DO UPDATE SET {metric} = {metric} + excluded.{metric}",
+            params,
+        )
+
+    def _get(self, key: str) -> Any | None:
+        with self._transaction() as conn:
+            row = conn.execute("SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                logger.debug(f"Cache MISS for key: {key}")
+                return None
+            if time.time() >= row[1]:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                logger.debug(f"Cache EXPIRED for key: {key}")
+                return None
+            conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (self._bump(conn, "clock"), key))
+            self._count(conn, "hits", "SELECT tag, 1 FROM cache_tags WHERE key = ?", (key,))
+        try:
+            value = _loads(row[0])
+        except ValueError:
+            # Written by a version that stored another format; recompute it
+            logger.debug(f"Cache UNREADABLE for key: {key}")
+            return None
+        logger.debug(f"Cache HIT for key: {key}")
+        return value
+
+    async def get(self, key: str) -> Any | None:
+        """Get value from cache if not expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    def _set(self, key: str, data: bytes | None, ttl_seconds: int, tags: frozenset[str], generation: int | None):
+        size = len(data) if data is not None else 0
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO cache_tag_stats (tag, misses) VALUES (?, 1) "
+                "ON CONFLICT (tag) DO UPDATE SET misses = misses + 1",
+                [(tag,) for tag in tags],
+            )
+            if data is None:
+                return
+            if generation is not None and generation != self._meta(conn, "generation"):
+                logger.debug(f"Cache SKIP for key: {key}, invalidated while computing")
+                return
+            if size > self.max_bytes:
+                logger.warning(f"Cache SKIP for key: {key}, {size} bytes exceeds the {self.max_bytes} byte budget")
+                return
+            now = time.time()
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT INTO cache_entries (key, value, expires_at, created_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, now + ttl_seconds, now, self._bump(conn, "clock"), size),
+            )
+            conn.executemany("INSERT INTO cache_tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in tags])
+            self._evict(conn, now)
+        logger.debug(f"Cache SET for key: {key}, TTL: {ttl_seconds}s, {size} bytes, tags: {sorted(tags)}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then least recently used ones until the store is within its bounds."""
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        count, total_bytes = conn.execute("SELECT count(*), coalesce(sum(size), 0) FROM cache_entries").fetchone()
+        evicted = []
+        if count > self.max_entries or total_bytes > self.max_bytes:
+            for key, size in conn.execute("SELECT key, size FROM cache_entries ORDER BY accessed_at"):
+                if count <= self.max_entries and total_bytes <= self.max_bytes:
+                    break
+                evicted.append((key,))
+                count -= 1
+                total_bytes -= size
+        if evicted:
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", evicted)
+            self._bump(conn, "evictions", len(evicted))
+            logger.debug(f"Cache EVICTED {len(evicted)} keys")
+
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int = 3600, tags: Iterable[str] = (), generation: int | None = None
+    ):
+        """Set value in cache with TTL and the tags it depends on.
+
+        A set follows a miss, so it is counted as a miss for each of the entry's tags. Values
+        that cannot be serialized, exceed the byte budget or were computed across an
+        invalidation (see ``generation``) are not stored.
+        """
+        try:
+            data = _dumps(value)
+        except Exception as e:
+            logger.warning(f"Cache SKIP for key: {key}, value cannot be serialized: {e}")
+            data = None
+        await asyncio.to_thread(self._set, key, data, ttl_seconds, frozenset(tags), generation)
+
+    def _generation(self) -> int:
+        with self._lock:
+            return self._meta(self._conn, "generation")
+
+    async def generation(self) -> int:
+        """Return the invalidation counter shared by all workers."""
+        return await asyncio.to_thread(self._generation)
+
+    def _invalidate(self, pattern: str | None) -> int:
+        with self._transaction() as conn:
+            self._bump(conn, "generation")
+            if pattern is None:
+                self._count(conn, "invalidations", "SELECT tag, count(*) FROM cache_tags GROUP BY tag", ())
+                return conn.execute("DELETE FROM cache_entries").rowcount
+            self._count(
+                conn,
+                "invalidations",
+                "SELECT tag, count(*) FROM cache_tags WHERE instr(key, ?) > 0 GROUP BY tag",
+                (pattern,),
+            )
+            return conn.execute("DELETE FROM cache_entries WHERE instr(key, ?) > 0", (pattern,)).rowcount
+
+    async def invalidate(self, pattern: str = None):
+        """Invalidate cache entries matching pattern or all if no pattern, in every worker."""
+        count = await asyncio.to_thread(self._invalidate, pattern)
+        if pattern is None:
+            logger.info(f"Cache cleared: {count} entries removed")
+        else:
+            logger.info(f"Cache invalidated: {count} entries matching '{pattern}' removed")
+
+    def _invalidate_tags(self, tags: list[str]) -> int:
+        placeholders = ", ".join("?" * len(tags))
+        with self._transaction() as conn:
+            self._bump(conn, "generation")
+            if not tags:
+                return 0
+            self._count(
+                conn,
+                "invalidations",
+                f"SELECT tag, count(*) FROM cache_tags WHERE tag IN ({placeholders}) GROUP BY tag",
+                tuple(tags),
+            )
+            return conn.execute(
+                f"DELETE FROM cache_entries WHERE key IN (SELECT key FROM cache_tags WHERE tag IN ({placeholders}))",
+                tuple(tags),
+            ).rowcount
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every entry that declared any of the given tags, in every worker."""
+        tags = sorted(set(tags))
+        count = await asyncio.to_thread(self._invalidate_tags, tags)
+        logger.info(f"Cache invalidated: {count} entries tagged {tags} removed")
+        return count
+
+    def reset(self):
+        """Drop all entries and per-tag metrics (for tests and startup)."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM cache_entries")
+            conn.execute("DELETE FROM cache_tag_stats")
+            conn.execute("UPDATE cache_meta SET value = 0 WHERE name = 'evictions'")
+            self._bump(conn, "generation")
+        self._inflight.clear()
+        self._coalesced = 0
+
+    def _get_stats(self) -> dict[str, Any]:
+        with self._transaction() as conn:
+            total_entries, expired_entries, total_bytes = conn.execute(
+                "SELECT count(*), coalesce(sum(expires_at <= ?), 0), coalesce(sum(size), 0) FROM cache_entries",
+                (time.time(),),
+            ).fetchone()
+            entries = dict(conn.execute("SELECT tag, count(*) FROM cache_tags GROUP BY tag").fetchall())
+            tag_stats = conn.execute(
+                "SELECT tag, hits, misses, invalidations FROM cache_tag_stats ORDER BY tag"
+            ).fetchall()
+            evictions = self._meta(conn, "evictions")
+
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "total_entries": total_entries,
+            "active_entries": total_entries - expired_entries,
+            "expired_entries": expired_entries,
+            "max_entries": self.max_entries,
+            "total_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": evictions,
+            "coalesced_misses": self._coalesced,
+            "tags": {
+                tag: {"entries": entries.get(tag, 0), "hits": hits, "misses": misses, "invalidations": invalidations}
+                for tag, hits, misses, invalidations in tag_stats
+            },
+        }
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics across all workers, including size, evictions and per-tag metrics."""
+        return await asyncio.to_thread(self._get_stats)
+
+
+def create_cache_backend() -> CacheBackend:
+    """Build the cache backend selected by settings.CACHE_BACKEND ("memory" or "sqlite")."""
+    if settings.CACHE_BACKEND == "sqlite":
+        return SQLiteCache()
+    if settings.CACHE_BACKEND != "memory":
+        raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND!r}")
+    return SimpleCache()
+
+
 # Global cache instance
-cache = SimpleCache()
+cache = create_cache_backend()
+
+
+def add_cache_tags(*tags: str):
+    """Declare entity tags for the value currently being computed by a @cached function.
+
+    Lets an endpoint tag its cache entry with what it actually read, e.g. the ids of the
+    games and teams it rendered. Outside a cached computation this does nothing.
+    """
+    collected = _collected_tags.get()
+    if collected is not None:
+        collected.update(tags)
 
 
-def cached(ttl_seconds: int = 3600, key_prefix: str = ""):
-    """Decorator to cache function results."""
+def _request_key(func: Callable, signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Derive the request part of a cache key.
+
+    Endpoints that take a ``request`` are keyed on its path and sorted query parameters.
+    Otherwise the function name and its scalar arguments (path and query parameters as FastAPI
+    passes them) are used.
+    """
+    arguments = signature.bind_partial(*args, **kwargs).arguments
+    request = arguments.get("request")
+    if isinstance(request, Request):
+        return f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+
+    params = sorted(
+        (name, value.isoformat() if isinstance(value, date) else value)
+        for name, value in arguments.items()
+        if name not in _UNKEYED_ARGUMENTS and (value is None or isinstance(value, _KEYABLE_TYPES))
+    )
+    return f"{func.__name__}?{urlencode(params)}"
+
+
+def cached(ttl_seconds: int = 3600, key_prefix: str = "", tags: Iterable[str] = ()):
+    """Decorator to cache function results.
+
+    Entries are keyed on the request (path and query parameters) and the caller's auth
+    status, so parameterized endpoints such as box scores can be cached. Concurrent misses
+    for the same key run the function once.
+
+    Args:
+        ttl_seconds: How long entries stay valid
+        key_prefix: Prefix for the cache key
+        tags: Tags the entry depends on, formatted with the call's arguments (e.g. "game:{game_id}");
+            more can be added with add_cache_tags()
+    """
 
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Create cache key from function name and auth context
+            # Create cache key from the request and auth context
             auth_context = kwargs.get("auth_context", {})
             user_role = auth_context.get("user_role", "anonymous")
             is_authenticated = auth_context.get("is_authenticated", False)
 
             # Cache key includes auth status to serve different content to logged-in users
-            cache_key = f"{key_prefix}{func.__name__}:{user_role}:{is_authenticated}"
-
-            # Try to get from cache first
-            cached_result = await cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
-
-            # Cache miss - call the original function
-            result = await func(*args, **kwargs)
-
-            # Store in cache
-            await cache.set(cache_key, result, ttl_seconds)
-
-            return result
+            request_key = _request_key(func, signature, args, kwargs)
+            cache_key = f"{key_prefix}{request_key}:{user_role}:{is_authenticated}"
+
+            async def compute():
+                # Call the original function, collecting the tags it declares
+                arguments = signature.bind_partial(*args, **kwargs).arguments
+                entry_tags = {tag.format(**arguments) for tag in tags}
+                token = _collected_tags.set(entry_tags)
+                try:
+                    result = await func(*args, **kwargs)
+                finally:
+                    _collected_tags.reset(token)
+                return result, entry_tags
+
+            return await cache.get_or_compute(cache_key, compute, ttl_seconds)
 
         return wrapper
 
@@ -112,29 +729,57 @@ async def invalidate_all_cache():
     logger.info("All cache entries invalidated")
 
 
+async def invalidate_cache_tags(*tags: str) -> int:
+    """Invalidate only the cache entries that depend on the given tags."""
+    return await cache.invalidate_tags(tags)
+
+
 async def get_cache_stats():
     """Get cache statistics for monitoring."""
     return await cache.get_stats()
 
 
-def invalidate_cache_after(func: Callable) -> Callable:
-    """Decorator to invalidate cache after function execution (for data modification endpoints)."""
+def _resolve_tags(tags, result: Any, kwargs: dict) -> set[str]:
+    """Resolve invalidation tags from templates or a callable."""
+    if callable(tags):
+        return set(tags(result, kwargs))
+
+    fields = dict(kwargs)
+    if isinstance(result, dict):
+        fields.update(result)
+    elif hasattr(result, "model_dump"):
+        fields.update(result.model_dump())
+    return {tag.format(**fields) for tag in tags}
 
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        # Execute the original function first
-        result = await func(*args, **kwargs)
 
-        # If the function completed successfully, invalidate cache
-        # Only invalidate if the result indicates success
-        if isinstance(result, dict) and result.get("success") is not False:
-            await invalidate_all_cache()
-            logger.info(f"Cache auto-invalidated after {func.__name__}")
-        elif not isinstance(result, dict):
-            # For non-dict responses (like HTML), always invalidate
-            await invalidate_all_cache()
-            logger.info(f"Cache auto-invalidated after {func.__name__}")
+def invalidate_cache_after(func: Callable | None = None, *, tags=None) -> Callable:
+    """Decorator to invalidate cache after function execution (for data modification endpoints).
 
-        return result
+    Used bare, every entry is invalidated. With ``tags``, only entries depending on those tags
+    are invalidated. Tags are templates formatted with the endpoint's keyword arguments and
+    the fields of its result (e.g. "player:{player_id}"), or a callable taking
+    ``(result, kwargs)`` and returning the tags.
+    """
 
-    return wrapper
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Execute the original function first
+            result = await func(*args, **kwargs)
+
+            # If the function completed successfully, invalidate cache
+            # Only invalidate if the result indicates success; non-dict responses (like HTML) always invalidate
+            if not isinstance(result, dict) or result.get("success") is not False:
+                if tags is None:
+                    await invalidate_all_cache()
+                else:
+                    await invalidate_cache_tags(*_resolve_tags(tags, result, kwargs))
+                logger.info(f"Cache auto-invalidated after {func.__name__}")
+
+            return result
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
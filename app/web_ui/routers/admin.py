@@ -3,20 +3,24 @@
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.auth.dependencies import get_current_user, require_admin
 from app.auth.models import User
 from app.data_access import models
 from app.data_access.crud.crud_audit_log import get_recent_audit_logs
+from app.data_access.database_manager import engine_registry
 from app.data_access.db_session import get_db_session
 from app.services.data_correction_service import DataCorrectionService
 from app.services.season_service import SeasonService
-from app.web_ui.cache import get_cache_stats, invalidate_all_cache
+from app.web_ui.cache import get_cache_stats, invalidate_all_cache, invalidate_cache_after, invalidate_cache_tags
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1", tags=["admin"])
 
+# Seasons decide which games count toward the records and standings shown on cached pages
+SEASON_CACHE_TAGS = ["game-list", "players", "teams"]
+
 
 @router.get("/player-game-stats/{stats_id}/quarters")
 async def get_player_quarter_stats(stats_id: int):
@@ -52,6 +56,7 @@ async def get_player_quarter_stats(stats_id: int):
 
 
 @router.put("/player-game-stats/{stats_id}/quarters")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def update_player_quarter_stats(stats_id: int, data: dict, current_user: User = Depends(get_current_user)):
     """Update quarter stats for a player with automatic total recalculation."""
     try:
@@ -77,10 +82,12 @@ async def update_player_quarter_stats(stats_id: int, data: dict, current_user: U
 
                 if quarter_stats:
                     correction_service.update_player_quarter_stats(quarter_stats.id, quarter_updates)
+            session.commit()
 
             # Return updated totals
             session.refresh(game_stats)
             return {
+                "game_id": game_stats.game_id,
                 "total_ftm": game_stats.total_ftm,
                 "total_fta": game_stats.total_fta,
                 "total_2pm": game_stats.total_2pm,
@@ -97,6 +104,7 @@ async def update_player_quarter_stats(stats_id: int, data: dict, current_user: U
 
 
 @router.post("/data-corrections/undo")
+@invalidate_cache_after
 async def undo_last_correction(current_user: User = Depends(require_admin)):
     """Undo the last data correction."""
     try:
@@ -112,6 +120,7 @@ async def undo_last_correction(current_user: User = Depends(require_admin)):
 
 
 @router.post("/data-corrections/redo")
+@invalidate_cache_after
 async def redo_last_correction():
     """Redo the last undone data correction."""
     try:
@@ -165,6 +174,7 @@ async def get_audit_logs(limit: int = 50, offset: int = 0, entity_type: str | No
 
 
 @router.post("/data-corrections/bulk-restore")
+@invalidate_cache_after
 async def bulk_restore(data: dict):
     """Bulk restore deleted items of a specific type within a date range."""
     try:
@@ -240,6 +250,7 @@ async def list_seasons(current_user: User = Depends(require_admin)):
 
 
 @router.post("/seasons")
+@invalidate_cache_after(tags=SEASON_CACHE_TAGS)
 async def create_season(data: dict, current_user: User = Depends(require_admin)):
     """Create a new season."""
     try:
@@ -285,6 +296,7 @@ async def create_season(data: dict, current_user: User = Depends(require_admin))
 
 
 @router.put("/seasons/{season_id}")
+@invalidate_cache_after(tags=SEASON_CACHE_TAGS)
 async def update_season(season_id: int, data: dict, current_user: User = Depends(require_admin)):
     """Update a season."""
     try:
@@ -319,6 +331,7 @@ async def update_season(season_id: int, data: dict, current_user: User = Depends
 
 
 @router.post("/seasons/{season_id}/activate")
+@invalidate_cache_after(tags=SEASON_CACHE_TAGS)
 async def activate_season(season_id: int, current_user: User = Depends(require_admin)):
     """Set a season as active."""
     try:
@@ -339,6 +352,7 @@ async def activate_season(season_id: int, current_user: User = Depends(require_a
 
 
 @router.delete("/seasons/{season_id}")
+@invalidate_cache_after(tags=SEASON_CACHE_TAGS)
 async def delete_season(season_id: int, current_user: User = Depends(require_admin)):
     """Delete a season."""
     try:
@@ -371,12 +385,31 @@ async def get_cache_statistics(current_user: User = Depends(require_admin)):
 
 
 @router.post("/cache/invalidate")
-async def invalidate_cache(current_user: User = Depends(require_admin)):
-    """Manually invalidate all cache entries."""
+async def invalidate_cache(
+    tag: list[str] | None = Query(None, description="Only invalidate entries with these tags (e.g. team:5)"),
+    current_user: User = Depends(require_admin),
+):
+    """Manually invalidate cache entries, either all of them or only those with the given tags."""
     try:
+        if tag:
+            removed = await invalidate_cache_tags(*tag)
+            logger.info(f"Cache tags {tag} manually invalidated by user {current_user.username}")
+            return {"success": True, "message": f"Invalidated {removed} cache entries", "tags": tag}
+
         await invalidate_all_cache()
         logger.info(f"Cache manually invalidated by user {current_user.username}")
         return {"success": True, "message": "Cache invalidated successfully"}
     except Exception as e:
         logger.error(f"Error invalidating cache: {e}")
         raise HTTPException(status_code=500, detail="Failed to invalidate cache") from e
+
+
+# Database Pool Endpoints
+@router.get("/database/pool-stats")
+async def get_database_pool_statistics(current_user: User = Depends(require_admin)):
+    """Get connection pool gauges and checkout wait metrics for capacity planning."""
+    try:
+        return {"success": True, "pool_stats": engine_registry.pool_stats()}
+    except Exception as e:
+        logger.error(f"Error getting database pool stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get database pool stats") from e
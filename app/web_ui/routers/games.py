@@ -1,21 +1,27 @@
 """Games router for Basketball Stats Tracker."""
 
+import json
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_user, require_admin
 from app.auth.models import User
-from app.data_access import models
+from app.data_access import async_crud, models
 from app.data_access.db_session import get_db_session
-from app.dependencies import get_db
-from app.reports import ReportGenerator
+from app.dependencies import get_async_db, get_db
+from app.repositories import GameRepository, load_box_score
+from app.services.box_score_service import BoxScoreService
+from app.services.game_replay_service import GameReplayService
 from app.services.game_state_service import GameStateService
+from app.services.live_game_feed import live_game_feed
 from app.services.schedule_service import schedule_service
+from app.services.scorebook_service import ScorebookService
 from app.services.season_stats_service import SeasonStatsService
-from app.utils import stats_calculator
-from app.web_ui.cache import invalidate_cache_after
+from app.web_ui.cache import add_cache_tags, cached, invalidate_cache_after
 
 from ..schemas import (
     ActivePlayer,
@@ -27,6 +33,9 @@ from ..schemas import (
     GameStateInfo,
     GameStateResponse,
     GameSummary,
+    LiveEventBatchRequest,
+    LiveEventBatchResponse,
+    LiveEventResult,
     PlayerStats,
     RecordFoulRequest,
     RecordShotRequest,
@@ -40,9 +49,75 @@ from ..schemas import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1/games", tags=["games"])
 
+# Seconds a live stream waits for a local event before re-reading the event log
+LIVE_STREAM_POLL_SECONDS = 15.0
+
+
+def _load_games_page(session: Session, limit: int, offset: int, team_id: int | None) -> list[GameSummary]:
+    """Build one page of the games listing."""
+    game_repo = GameRepository(session)
+
+    # Ordering, team filtering and pagination run in SQL across completed + scheduled games
+    page = game_repo.get_listing_page(limit=limit, offset=offset, team_id=team_id)
+    if not page:
+        return []
+
+    team_ids = {row.home_team_id for row in page} | {row.away_team_id for row in page}
+    teams = {
+        team.id: team.display_name or team.name
+        for team in session.query(models.Team).filter(models.Team.id.in_(team_ids)).all()
+    }
+
+    # Scores for the completed games on this page, keyed by (game_id, team_id)
+    completed_ids = [row.id for row in page if not row.is_scheduled]
+    points = game_repo.get_team_points_by_game(completed_ids)
+
+    # Get team records
+    stats_service = SeasonStatsService(session)
+    team_records = stats_service.get_teams_records(list(team_ids))
+
+    result = []
+    for row in page:
+        home_wins, home_losses = team_records.get(row.home_team_id, (0, 0))
+        away_wins, away_losses = team_records.get(row.away_team_id, (0, 0))
+
+        if row.is_scheduled:
+            # Scheduled games use negative IDs to distinguish them from completed games
+            game_id = -row.id
+            home_score = away_score = 0
+            status = "scheduled"
+        else:
+            game_id = row.id
+            home_score = points.get((row.id, row.home_team_id), 0)
+            away_score = points.get((row.id, row.away_team_id), 0)
+            status = "completed"
+
+        result.append(
+            GameSummary(
+                id=game_id,
+                date=row.date.isoformat() if row.date else "",
+                home_team=teams.get(row.home_team_id, ""),
+                home_team_id=row.home_team_id,
+                home_team_record=f"{home_wins}-{home_losses}",
+                away_team=teams.get(row.away_team_id, ""),
+                away_team_id=row.away_team_id,
+                away_team_record=f"{away_wins}-{away_losses}",
+                home_score=home_score,
+                away_score=away_score,
+                status=status,
+            )
+        )
+
+    return result
+
 
 @router.get("", response_model=list[GameSummary])
-async def list_games(limit: int = 20, offset: int = 0, team_id: int | None = None):
+async def list_games(
+    limit: int = 20,
+    offset: int = 0,
+    team_id: int | None = None,
+    session: AsyncSession = Depends(get_async_db),
+):
     """
     Get a list of games (both completed and scheduled) with optional filtering.
 
@@ -50,108 +125,11 @@ async def list_games(limit: int = 20, offset: int = 0, team_id: int | None = Non
         limit: Maximum number of games to return
         offset: Number of games to skip
         team_id: Optional filter for a specific team
+        session: Async database session
     """
     try:
-        with get_db_session() as session:
-            from app.services.score_calculation_service import ScoreCalculationService
-
-            # Get completed games
-            games_query = session.query(models.Game)
-            if team_id is not None:
-                games_query = games_query.filter(
-                    (models.Game.playing_team_id == team_id) | (models.Game.opponent_team_id == team_id)
-                )
-            completed_games = games_query.all()
-
-            # Get scheduled games
-            scheduled_query = session.query(models.ScheduledGame).filter(
-                models.ScheduledGame.status == models.ScheduledGameStatus.SCHEDULED,
-                models.ScheduledGame.is_deleted.is_not(True),
-            )
-            if team_id is not None:
-                scheduled_query = scheduled_query.filter(
-                    (models.ScheduledGame.home_team_id == team_id) | (models.ScheduledGame.away_team_id == team_id)
-                )
-            scheduled_games = scheduled_query.all()
-
-            # Get all team IDs for efficient record lookup
-            team_ids = set()
-            for game in completed_games:
-                if game.playing_team_id:
-                    team_ids.add(game.playing_team_id)
-                if game.opponent_team_id:
-                    team_ids.add(game.opponent_team_id)
-            for scheduled_game in scheduled_games:
-                if scheduled_game.home_team_id:
-                    team_ids.add(scheduled_game.home_team_id)
-                if scheduled_game.away_team_id:
-                    team_ids.add(scheduled_game.away_team_id)
-
-            # Get team records
-            stats_service = SeasonStatsService(session)
-            team_records = stats_service.get_teams_records(list(team_ids)) if team_ids else {}
-
-            # Convert to GameSummary objects
-            result = []
-
-            # Add completed games
-            for game in completed_games:
-                # Get all player stats for this game
-                player_stats = (
-                    session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game.id).all()
-                )
-
-                # Calculate scores using the centralized service
-                playing_team_score, opponent_team_score = ScoreCalculationService.calculate_game_scores(
-                    game, player_stats
-                )
-
-                # Get team records
-                home_wins, home_losses = team_records.get(game.playing_team_id, (0, 0))
-                away_wins, away_losses = team_records.get(game.opponent_team_id, (0, 0))
-
-                result.append(
-                    GameSummary(
-                        id=game.id,
-                        date=game.date.isoformat() if game.date else "",
-                        home_team=game.playing_team.display_name or game.playing_team.name,
-                        home_team_id=game.playing_team_id,
-                        home_team_record=f"{home_wins}-{home_losses}",
-                        away_team=game.opponent_team.display_name or game.opponent_team.name,
-                        away_team_id=game.opponent_team_id,
-                        away_team_record=f"{away_wins}-{away_losses}",
-                        home_score=playing_team_score,
-                        away_score=opponent_team_score,
-                        status="completed",
-                    )
-                )
-
-            # Add scheduled games with negative IDs to distinguish them
-            for scheduled_game in scheduled_games:
-                # Get team records
-                home_wins, home_losses = team_records.get(scheduled_game.home_team_id, (0, 0))
-                away_wins, away_losses = team_records.get(scheduled_game.away_team_id, (0, 0))
-
-                result.append(
-                    GameSummary(
-                        id=-scheduled_game.id,  # Negative ID to distinguish from completed games
-                        date=scheduled_game.scheduled_date.isoformat(),
-                        home_team=scheduled_game.home_team.display_name or scheduled_game.home_team.name,
-                        home_team_id=scheduled_game.home_team_id,
-                        home_team_record=f"{home_wins}-{home_losses}",
-                        away_team=scheduled_game.away_team.display_name or scheduled_game.away_team.name,
-                        away_team_id=scheduled_game.away_team_id,
-                        away_team_record=f"{away_wins}-{away_losses}",
-                        home_score=0,
-                        away_score=0,
-                        status="scheduled",
-                    )
-                )
-
-            # Sort by date (newest first) and apply pagination
-            result.sort(key=lambda x: x.date, reverse=True)
-
-            return result[offset : offset + limit]
+        # Repository and service code is sync; run_sync drives it over the async connection
+        return await session.run_sync(_load_games_page, limit, offset, team_id)
     except Exception as e:
         logger.error(f"Error retrieving games: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve games") from e
@@ -417,33 +395,32 @@ async def delete_scheduled_game(scheduled_game_id: int, current_user=Depends(get
 
 
 @router.get("/{game_id}", response_model=GameSummary)
-async def get_game(game_id: int):
+async def get_game(game_id: int, session: AsyncSession = Depends(get_async_db)):
     """Get basic information about a specific game."""
     try:
-        with get_db_session() as session:
-            game = session.query(models.Game).filter(models.Game.id == game_id).first()
+        game = await async_crud.get_game_by_id(session, game_id)
 
-            if not game:
-                raise HTTPException(status_code=404, detail="Game not found")
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
 
-            from app.services.score_calculation_service import ScoreCalculationService
+        from app.services.score_calculation_service import ScoreCalculationService
 
-            # Get all player stats for this game
-            player_stats = session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game.id).all()
+        # Get all player stats for this game
+        player_stats = await async_crud.get_player_game_stats_by_game(session, game.id)
 
-            # Calculate scores using the centralized service
-            playing_team_score, opponent_team_score = ScoreCalculationService.calculate_game_scores(game, player_stats)
+        # Calculate scores using the centralized service
+        playing_team_score, opponent_team_score = ScoreCalculationService.calculate_game_scores(game, player_stats)
 
-            return GameSummary(
-                id=game.id,
-                date=game.date.isoformat() if game.date else "",
-                home_team=game.playing_team.display_name or game.playing_team.name,
-                home_team_id=game.playing_team_id,
-                away_team=game.opponent_team.display_name or game.opponent_team.name,
-                away_team_id=game.opponent_team_id,
-                home_score=playing_team_score,
-                away_score=opponent_team_score,
-            )
+        return GameSummary(
+            id=game.id,
+            date=game.date.isoformat() if game.date else "",
+            home_team=game.playing_team.display_name or game.playing_team.name,
+            home_team_id=game.playing_team_id,
+            away_team=game.opponent_team.display_name or game.opponent_team.name,
+            away_team_id=game.opponent_team_id,
+            home_score=playing_team_score,
+            away_score=opponent_team_score,
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -451,239 +428,178 @@ async def get_game(game_id: int):
         raise HTTPException(status_code=500, detail="Failed to retrieve game") from e
 
 
-@router.get("/{game_id}/box-score", response_model=BoxScoreResponse)
-async def get_box_score(game_id: int):
-    """Get detailed box score for a specific game."""
-    try:
-        with get_db_session() as session:
-            # Use existing ReportGenerator to generate box score
-            report_gen = ReportGenerator(session, stats_calculator)
-            player_stats, game_summary = report_gen.get_game_box_score_data(game_id)
-
-            if not player_stats or not game_summary:
-                raise HTTPException(status_code=404, detail="Game not found")
-
-            # Map the field names from the report generator to what our API expects
-            playing_team_id = None
-            opponent_team_id = None
-
-            # Get the actual team IDs from the game
-            game = session.query(models.Game).filter(models.Game.id == game_id).first()
-            if game:
-                playing_team_id = game.playing_team_id
-                opponent_team_id = game.opponent_team_id
-
-            # Get team display names from the game
-            playing_team_name = game.playing_team.display_name or game.playing_team.name if game else ""
-            opponent_team_name = game.opponent_team.display_name or game.opponent_team.name if game else ""
-
-            # Get team records from season stats - use same approach as team detail page
-            home_record = None
-            away_record = None
-
-            if game and game.date:
-                try:
-                    # Get the active season from the Season table
-
-                    from app.data_access.models import Season
-
-                    active_season = session.query(Season).filter(Season.is_active).first()
-
-                    if active_season:
-                        current_season = active_season.code
-                        stats_service = SeasonStatsService(session)
-
-                        # Update and get home team record
-                        home_stats = stats_service.update_team_season_stats(playing_team_id, current_season)
-                        home_record = f"{home_stats.wins}-{home_stats.losses}" if home_stats else "0-0"
-
-                        # Update and get away team record
-                        away_stats = stats_service.update_team_season_stats(opponent_team_id, current_season)
-                        away_record = f"{away_stats.wins}-{away_stats.losses}" if away_stats else "0-0"
-                except Exception as e:
-                    logger.warning(f"Error getting team records: {e}")
-                    home_record = "0-0"
-                    away_record = "0-0"
-
-            # Filter players by team name (report generator provides team name, not ID)
-            playing_team_players = [p for p in player_stats if p.get("team") == playing_team_name]
-            opponent_team_players = [p for p in player_stats if p.get("team") == opponent_team_name]
-
-            # Get player portrait information and add to stats
-            def add_player_portrait_info(player_stats_list):
-                # Collect all player IDs from the stats list
-                player_ids = {p.get("player_id", 0) for p in player_stats_list if p.get("player_id", 0)}
-
-                # Fetch all players in a single query
-                players = session.query(models.Player).filter(models.Player.id.in_(player_ids)).all()
-
-                # Create a mapping of player_id to Player object
-                player_map = {player.id: player for player in players}
-
-                # Add thumbnail_image to each player's stats
-                for p in player_stats_list:
-                    player_id = p.get("player_id", 0)
-                    if player_id and player_id in player_map:
-                        p["thumbnail_image"] = player_map[player_id].thumbnail_image
-
-            # Apply portrait info to both teams' players
-            all_players = playing_team_players + opponent_team_players
-            add_player_portrait_info(all_players)
-
-            # Convert player stats to the expected format
-            excluded_fields = ["player_id", "name", "team", "jersey", "position", "thumbnail_image"]
-            playing_team_player_stats = [
-                PlayerStats(
-                    player_id=p.get("player_id", 0),
-                    name=p.get("name", ""),
-                    stats={k: v for k, v in p.items() if k not in excluded_fields},
-                    jersey_number=str(p.get("jersey", "")),
-                    position=p.get("position"),
-                    thumbnail_image=p.get("thumbnail_image"),
-                )
-                for p in playing_team_players
-            ]
-
-            opponent_team_player_stats = [
-                PlayerStats(
-                    player_id=p.get("player_id", 0),
-                    name=p.get("name", ""),
-                    stats={k: v for k, v in p.items() if k not in excluded_fields},
-                    jersey_number=str(p.get("jersey", "")),
-                    position=p.get("position"),
-                    thumbnail_image=p.get("thumbnail_image"),
-                )
-                for p in opponent_team_players
-            ]
-
-            # Calculate scores
-            playing_team_score = sum(p.get("points", 0) for p in playing_team_players)
-            opponent_team_score = sum(p.get("points", 0) for p in opponent_team_players)
-
-            # Calculate quarter-by-quarter scores (separate from main score calculation)
-            playing_team_quarters = {}
-            opponent_team_quarters = {}
+def _build_box_score(session: Session, game_id: int) -> BoxScoreResponse:
+    """Build the box score for a game, raising 404 when it has no stats."""
+    # Serve the stored box score (computed on the fly for live or not yet backfilled games)
+    box_score = BoxScoreService(session).get(game_id)
+    if box_score is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    player_stats = box_score["player_stats"]
+    game_summary = box_score["game_summary"]
+
+    if not player_stats or not game_summary:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    playing_team_id = box_score["playing_team_id"]
+    opponent_team_id = box_score["opponent_team_id"]
+
+    # Get team records from season stats - use same approach as team detail page
+    home_record = None
+    away_record = None
+
+    if box_score["game_date"]:
+        try:
+            # Get the active season from the Season table
+
+            from app.data_access.models import Season
+
+            active_season = session.query(Season).filter(Season.is_active).first()
+
+            if active_season:
+                current_season = active_season.code
+                stats_service = SeasonStatsService(session)
+
+                # Update and get home team record
+                home_stats = stats_service.update_team_season_stats(playing_team_id, current_season)
+                home_record = f"{home_stats.wins}-{home_stats.losses}" if home_stats else "0-0"
+
+                # Update and get away team record
+                away_stats = stats_service.update_team_season_stats(opponent_team_id, current_season)
+                away_record = f"{away_stats.wins}-{away_stats.losses}" if away_stats else "0-0"
+        except Exception as e:
+            logger.warning(f"Error getting team records: {e}")
+            home_record = "0-0"
+            away_record = "0-0"
+
+    # Split players by team; names and portraits are already current
+    playing_team_players = [p for p in player_stats if p.get("team_id") == playing_team_id]
+    opponent_team_players = [p for p in player_stats if p.get("team_id") == opponent_team_id]
+
+    # Convert player stats to the expected format
+    excluded_fields = ["player_id", "name", "team", "jersey", "position", "thumbnail_image"]
+    playing_team_player_stats = [
+        PlayerStats(
+            player_id=p.get("player_id", 0),
+            name=p.get("name", ""),
+            stats={k: v for k, v in p.items() if k not in excluded_fields},
+            jersey_number=str(p.get("jersey", "")),
+            position=p.get("position"),
+            thumbnail_image=p.get("thumbnail_image"),
+        )
+        for p in playing_team_players
+    ]
+
+    opponent_team_player_stats = [
+        PlayerStats(
+            player_id=p.get("player_id", 0),
+            name=p.get("name", ""),
+            stats={k: v for k, v in p.items() if k not in excluded_fields},
+            jersey_number=str(p.get("jersey", "")),
+            position=p.get("position"),
+            thumbnail_image=p.get("thumbnail_image"),
+        )
+        for p in opponent_team_players
+    ]
+
+    # Calculate scores
+    playing_team_score = sum(p.get("points", 0) for p in playing_team_players)
+    opponent_team_score = sum(p.get("points", 0) for p in opponent_team_players)
+
+    # Quarter-by-quarter scores are stored with the box score
+    home_quarters_list = box_score["quarter_scores"]["home"]
+    away_quarters_list = box_score["quarter_scores"]["away"]
+
+    # Find top 2 players from each team
+    def get_top_players(players, count=2):
+        if not players:
+            return []
+        # Sort by points (descending), then by FG% (descending)
+        sorted_players = sorted(
+            players,
+            key=lambda p: (
+                p.get("points", 0),
+                # Calculate FG% - handle division by zero
+                (p.get("fg2m", 0) + p.get("fg3m", 0)) / max((p.get("fg2a", 0) + p.get("fg3a", 0)), 1) * 100,
+            ),
+            reverse=True,
+        )
 
-            # Get all player game stats for this game to access quarter stats
-            all_player_game_stats = (
-                session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game_id).all()
+        top_players = []
+        for i in range(min(count, len(sorted_players))):
+            player = sorted_players[i]
+            # Calculate FG percentage for each top player
+            fgm = player.get("fg2m", 0) + player.get("fg3m", 0)
+            fga = player.get("fg2a", 0) + player.get("fg3a", 0)
+            fg_percentage = (fgm / fga * 100) if fga > 0 else 0
+            top_players.append(
+                {
+                    "player_id": player.get("player_id", 0),
+                    "name": player.get("name", ""),
+                    "jersey": player.get("jersey", ""),
+                    "points": player.get("points", 0),
+                    "fg_percentage": fg_percentage,
+                    "rebounds": player.get("rebounds", 0),
+                    "assists": player.get("assists", 0),
+                    "fg2m": player.get("fg2m", 0),
+                    "fg2a": player.get("fg2a", 0),
+                    "fg3m": player.get("fg3m", 0),
+                    "fg3a": player.get("fg3a", 0),
+                    "thumbnail_image": player.get("thumbnail_image"),
+                }
             )
+        return top_players
+
+    home_top_players = get_top_players(playing_team_players, 2)
+    away_top_players = get_top_players(opponent_team_players, 2)
+
+    # Create the response
+    return BoxScoreResponse(
+        game_id=game_id,
+        game_date=box_score["game_date"],
+        home_team=TeamStats(
+            team_id=playing_team_id or 0,  # Provide default value of 0 when None
+            name=game_summary.get("playing_team", ""),
+            score=playing_team_score,
+            stats={"quarter_scores": home_quarters_list},  # Add quarter scores to team stats
+            players=playing_team_player_stats,
+            top_player=home_top_players[0] if home_top_players else None,
+            top_players=home_top_players,
+            record=home_record,
+        ),
+        away_team=TeamStats(
+            team_id=opponent_team_id or 0,  # Provide default value of 0 when None
+            name=game_summary.get("opponent_team", ""),
+            score=opponent_team_score,
+            stats={"quarter_scores": away_quarters_list},  # Add quarter scores to team stats
+            players=opponent_team_player_stats,
+            top_player=away_top_players[0] if away_top_players else None,
+            top_players=away_top_players,
+            record=away_record,
+        ),
+    )
 
-            max_quarter = 0
-            logger.info(f"Found {len(all_player_game_stats)} player game stats for game {game_id}")
 
-            for pgs in all_player_game_stats:
-                # Get quarter stats for this player
-                quarter_stats = (
-                    session.query(models.PlayerQuarterStats)
-                    .filter(models.PlayerQuarterStats.player_game_stat_id == pgs.id)
-                    .all()
-                )
-
-                logger.info(f"Player {pgs.player.name} has {len(quarter_stats)} quarter stats")
-
-                for qs in quarter_stats:
-                    max_quarter = max(max_quarter, qs.quarter_number)
-                    # Calculate points for this quarter
-                    quarter_points = qs.ftm + (qs.fg2m * 2) + (qs.fg3m * 3)
-
-                    # Add to appropriate team's quarter total
-                    if pgs.player.team_id == playing_team_id:
-                        playing_team_quarters[qs.quarter_number] = (
-                            playing_team_quarters.get(qs.quarter_number, 0) + quarter_points
-                        )
-                        logger.info(f"Added {quarter_points} points to playing team Q{qs.quarter_number}")
-                    elif pgs.player.team_id == opponent_team_id:
-                        opponent_team_quarters[qs.quarter_number] = (
-                            opponent_team_quarters.get(qs.quarter_number, 0) + quarter_points
-                        )
-                        logger.info(f"Added {quarter_points} points to opponent team Q{qs.quarter_number}")
-
-            logger.info(f"Playing team quarters: {playing_team_quarters}")
-            logger.info(f"Opponent team quarters: {opponent_team_quarters}")
-
-            def get_quarter_label(q_num):
-                if q_num <= 4:
-                    return f"Q{q_num}"
-                return f"OT{q_num - 4}"
-
-            home_quarters_list = [
-                {"quarter": q, "label": get_quarter_label(q), "score": playing_team_quarters.get(q, 0)}
-                for q in range(1, max_quarter + 1)
-            ]
-            away_quarters_list = [
-                {"quarter": q, "label": get_quarter_label(q), "score": opponent_team_quarters.get(q, 0)}
-                for q in range(1, max_quarter + 1)
-            ]
+@router.get("/{game_id}/box-score", response_model=BoxScoreResponse)
+@cached(ttl_seconds=300, key_prefix="box-score:")
+async def get_box_score(game_id: int, session: AsyncSession = Depends(get_async_db)):
+    """Get detailed box score for a specific game."""
+    try:
+        # Answer unknown games before loading anything for the box score
+        if await session.get(models.Game, game_id) is None:
+            raise HTTPException(status_code=404, detail="Game not found")
 
-            # Find top 2 players from each team
-            def get_top_players(players, count=2):
-                if not players:
-                    return []
-                # Sort by points (descending), then by FG% (descending)
-                sorted_players = sorted(
-                    players,
-                    key=lambda p: (
-                        p.get("points", 0),
-                        # Calculate FG% - handle division by zero
-                        (p.get("fg2m", 0) + p.get("fg3m", 0)) / max((p.get("fg2a", 0) + p.get("fg3a", 0)), 1) * 100,
-                    ),
-                    reverse=True,
-                )
+        # Repository and service code is sync; run_sync drives it over the async connection
+        box_score = await session.run_sync(_build_box_score, game_id)
 
-                top_players = []
-                for i in range(min(count, len(sorted_players))):
-                    player = sorted_players[i]
-                    # Calculate FG percentage for each top player
-                    fgm = player.get("fg2m", 0) + player.get("fg3m", 0)
-                    fga = player.get("fg2a", 0) + player.get("fg3a", 0)
-                    fg_percentage = (fgm / fga * 100) if fga > 0 else 0
-                    top_players.append(
-                        {
-                            "player_id": player.get("player_id", 0),
-                            "name": player.get("name", ""),
-                            "jersey": player.get("jersey", ""),
-                            "points": player.get("points", 0),
-                            "fg_percentage": fg_percentage,
-                            "rebounds": player.get("rebounds", 0),
-                            "assists": player.get("assists", 0),
-                            "fg2m": player.get("fg2m", 0),
-                            "fg2a": player.get("fg2a", 0),
-                            "fg3m": player.get("fg3m", 0),
-                            "fg3a": player.get("fg3a", 0),
-                            "thumbnail_image": player.get("thumbnail_image"),
-                        }
-                    )
-                return top_players
-
-            home_top_players = get_top_players(playing_team_players, 2)
-            away_top_players = get_top_players(opponent_team_players, 2)
-
-            # Create the response
-            return BoxScoreResponse(
-                game_id=game_id,
-                game_date=str(game.date) if game and game.date else "",
-                home_team=TeamStats(
-                    team_id=playing_team_id or 0,  # Provide default value of 0 when None
-                    name=game_summary.get("playing_team", ""),
-                    score=playing_team_score,
-                    stats={"quarter_scores": home_quarters_list},  # Add quarter scores to team stats
-                    players=playing_team_player_stats,
-                    top_player=home_top_players[0] if home_top_players else None,
-                    top_players=home_top_players,
-                    record=home_record,
-                ),
-                away_team=TeamStats(
-                    team_id=opponent_team_id or 0,  # Provide default value of 0 when None
-                    name=game_summary.get("opponent_team", ""),
-                    score=opponent_team_score,
-                    stats={"quarter_scores": away_quarters_list},  # Add quarter scores to team stats
-                    players=opponent_team_player_stats,
-                    top_player=away_top_players[0] if away_top_players else None,
-                    top_players=away_top_players,
-                    record=away_record,
-                ),
-            )
+        # The box score shows this game and its teams' and players' names; edits to them invalidate it
+        teams = (box_score.home_team, box_score.away_team)
+        add_cache_tags(
+            f"game:{game_id}",
+            *(f"team:{team.team_id}" for team in teams),
+            *(f"player:{player.player_id}" for team in teams for player in team.players),
+        )
+        return box_score
     except HTTPException:
         raise
     except Exception as e:
@@ -692,6 +608,7 @@ async def get_box_score(game_id: int):
 
 
 @router.post("", response_model=GameSummary)
+@invalidate_cache_after(tags=["game-list", "team:{home_team_id}", "team:{away_team_id}"])
 async def create_game(game_data: GameCreateRequest, current_user: User = Depends(get_current_user)):
     """Create a new game."""
     try:
@@ -703,8 +620,6 @@ async def create_game(game_data: GameCreateRequest, current_user: User = Depends
             if season_id is None:
                 from datetime import datetime
 
-                from app.services.season_stats_service import SeasonStatsService
-
                 game_date = datetime.strptime(game_data.date, "%Y-%m-%d").date()
                 season_service = SeasonStatsService(session)
                 season = season_service.get_or_create_season_from_date(game_date)
@@ -718,8 +633,14 @@ async def create_game(game_data: GameCreateRequest, current_user: User = Depends
                 scheduled_time=game_data.scheduled_time,
                 notes=game_data.notes,
                 season_id=season_id,
+                commit=False,
             )
 
+            # New games count toward season records immediately, in the same transaction
+            season_stats_service = SeasonStatsService(session)
+            season_stats_service.apply_game_delta({}, season_stats_service.get_game_contribution(game.id))
+            session.commit()
+
             return GameSummary(
                 id=game.id,
                 date=game.date.isoformat(),
@@ -738,6 +659,7 @@ async def create_game(game_data: GameCreateRequest, current_user: User = Depends
 
 
 @router.post("/{game_id}/start")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def start_game(game_id: int, start_data: GameStartRequest, current_user: User = Depends(get_current_user)):
     """Start a game with starting lineups."""
     try:
@@ -762,19 +684,24 @@ async def start_game(game_id: int, start_data: GameStartRequest, current_user: U
 
 
 @router.post("/{game_id}/events/shot", response_model=GameEventResponse)
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def record_shot(game_id: int, shot_data: RecordShotRequest, current_user: User = Depends(get_current_user)):
     """Record a shot attempt."""
     try:
         with get_db_session() as session:
             game_service = GameStateService(session)
-            result = game_service.record_shot(
-                game_id=game_id,
-                player_id=shot_data.player_id,
-                shot_type=shot_data.shot_type,
-                made=shot_data.made,
-                quarter=shot_data.quarter,
-                assisted_by=shot_data.assisted_by,
-            )
+            with SeasonStatsService(session).track_game_changes(game_id, event_log=True):
+                result = game_service.record_shot(
+                    game_id=game_id,
+                    player_id=shot_data.player_id,
+                    shot_type=shot_data.shot_type,
+                    made=shot_data.made,
+                    quarter=shot_data.quarter,
+                    assisted_by=shot_data.assisted_by,
+                    commit=False,
+                )
+            session.commit()
+            game_service.announce_committed_events()
 
             return GameEventResponse(
                 event_id=result["event_id"],
@@ -794,17 +721,22 @@ async def record_shot(game_id: int, shot_data: RecordShotRequest, current_user:
 
 
 @router.post("/{game_id}/events/foul", response_model=GameEventResponse)
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def record_foul(game_id: int, foul_data: RecordFoulRequest, current_user: User = Depends(get_current_user)):
     """Record a foul."""
     try:
         with get_db_session() as session:
             game_service = GameStateService(session)
-            result = game_service.record_foul(
-                game_id=game_id,
-                player_id=foul_data.player_id,
-                foul_type=foul_data.foul_type,
-                quarter=foul_data.quarter,
-            )
+            with SeasonStatsService(session).track_game_changes(game_id, event_log=True):
+                result = game_service.record_foul(
+                    game_id=game_id,
+                    player_id=foul_data.player_id,
+                    foul_type=foul_data.foul_type,
+                    quarter=foul_data.quarter,
+                    commit=False,
+                )
+            session.commit()
+            game_service.announce_committed_events()
 
             return GameEventResponse(
                 event_id=result["event_id"],
@@ -823,7 +755,48 @@ async def record_foul(game_id: int, foul_data: RecordFoulRequest, current_user:
         raise HTTPException(status_code=500, detail="Failed to record foul") from e
 
 
+def _record_event_batch(session: Session, game_id: int, events: list[dict]) -> list[dict]:
+    """Record a batch of live events and apply it to the season tables in one transaction.
+
+    The season stats tracking write-locks the game before the batch looks up its
+    client event IDs. Two resends of the same batch therefore take turns, and the
+    second reports the events stored by the first as duplicates with their IDs.
+    """
+    game_service = GameStateService(session)
+    with SeasonStatsService(session).track_game_changes(game_id, event_log=True):
+        results = game_service.record_events(game_id, events, commit=False)
+    session.commit()
+    game_service.announce_committed_events()
+    return results
+
+
+@router.post("/{game_id}/events/batch", response_model=LiveEventBatchResponse)
+@invalidate_cache_after(tags=["game:{game_id}"])
+async def record_events(game_id: int, batch: LiveEventBatchRequest, current_user: User = Depends(get_current_user)):
+    """Record queued shots, fouls and substitutions in order, skipping ones already recorded."""
+    try:
+        with get_db_session() as session:
+            results = _record_event_batch(
+                session, game_id, [event.model_dump(exclude_none=True) for event in batch.events]
+            )
+
+            statuses = [result["status"] for result in results]
+            return LiveEventBatchResponse(
+                game_id=game_id,
+                results=[LiveEventResult(**result) for result in results],
+                applied=statuses.count("applied"),
+                duplicates=statuses.count("duplicate"),
+                rejected=statuses.count("rejected"),
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error recording event batch: {e}")
+        raise HTTPException(status_code=500, detail="Failed to record events") from e
+
+
 @router.post("/{game_id}/players/substitute")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def substitute_players(
     game_id: int, sub_data: SubstitutionRequest, current_user: User = Depends(get_current_user)
 ):
@@ -847,6 +820,7 @@ async def substitute_players(
 
 
 @router.post("/{game_id}/end-quarter")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def end_quarter(game_id: int, current_user: User = Depends(get_current_user)):
     """End the current quarter."""
     try:
@@ -867,6 +841,7 @@ async def end_quarter(game_id: int, current_user: User = Depends(get_current_use
 
 
 @router.post("/{game_id}/finalize")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def finalize_game(game_id: int, current_user: User = Depends(get_current_user)):
     """Finalize a game."""
     try:
@@ -905,13 +880,128 @@ async def get_live_game_state(game_id: int):
         raise HTTPException(status_code=500, detail="Failed to get game state") from e
 
 
+def _sse_message(event: str, data: dict, event_id: int | None = None) -> str:
+    """Format one Server-Sent Events message."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, default=str)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+def _start_live_stream(session: Session, game_id: int, after_event_id: int | None) -> tuple[list[str], int, bool]:
+    """Build the opening messages of a live stream.
+
+    New clients get a snapshot of the live state; reconnecting clients get only the
+    events recorded after the last one they saw.
+
+    Returns:
+        The messages, the id of the last event they cover and whether the game is over
+    """
+    game_service = GameStateService(session)
+    if after_event_id is None:
+        snapshot = game_service.get_live_game_state(game_id)
+        last_event_id = max((event["id"] for event in snapshot["recent_events"]), default=0)
+        return [_sse_message("snapshot", snapshot, last_event_id)], last_event_id, snapshot["game_state"]["is_final"]
+
+    if session.get(models.Game, game_id) is None:
+        raise ValueError(f"Game {game_id} not found")
+    events = game_service.get_events_since(game_id, after_event_id)
+    messages = [_sse_message(event["type"], event, event["id"]) for event in events]
+    finished = any(event["type"] == "game_end" for event in events)
+    return messages, events[-1]["id"] if events else after_event_id, finished
+
+
+def _live_events_since(session: Session, game_id: int, after_event_id: int) -> list[dict]:
+    """Read the events a live stream has not sent yet."""
+    return GameStateService(session).get_events_since(game_id, after_event_id)
+
+
+@router.get("/{game_id}/live/stream")
+async def stream_live_game(
+    game_id: int,
+    request: Request,
+    after: int | None = None,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    session: AsyncSession = Depends(get_async_db),
+):
+    """Stream a game's events as Server-Sent Events.
+
+    Opens with a ``snapshot`` message holding the live state, then pushes each
+    event (shot, foul, substitution, quarter_end, game_end, undo) as it is recorded.
+    Every message carries the event id, so browsers reconnect with
+    ``Last-Event-ID`` and only receive what they missed; ``?after=<event id>`` does
+    the same for other clients. The stream closes after ``game_end``.
+    """
+    if after is None and last_event_id and last_event_id.isdigit():
+        after = int(last_event_id)
+
+    # Subscribe before reading so nothing recorded in between is missed
+    subscription = live_game_feed.subscribe(game_id)
+    try:
+        opening, last_sent, finished = await session.run_sync(_start_live_stream, game_id, after)
+        # Hand the connection back while the stream waits; the next read starts a fresh transaction
+        await session.close()
+    except ValueError as e:
+        subscription.close()
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        subscription.close()
+        logger.error(f"Error opening live stream for game {game_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to open live stream") from e
+
+    async def messages():
+        nonlocal last_sent
+        with subscription:
+            for message in opening:
+                yield message
+            if finished:
+                return
+
+            while not await request.is_disconnected():
+                notified = await subscription.wait(LIVE_STREAM_POLL_SECONDS)
+                events = await session.run_sync(_live_events_since, game_id, last_sent)
+                await session.close()
+
+                if not events and not notified:
+                    yield ": keep-alive\n\n"
+                for event in events:
+                    last_sent = event["id"]
+                    yield _sse_message(event["type"], event, event["id"])
+                    if event["type"] == "game_end":
+                        return
+
+    return StreamingResponse(
+        messages(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{game_id}/replay")
+async def replay_game(game_id: int, at_event: int | None = None, session: AsyncSession = Depends(get_async_db)):
+    """Replay a game's event log, optionally stopping at an event, to get its state at that point."""
+    try:
+        replay = await session.run_sync(
+            lambda sync_session: GameReplayService(sync_session).replay(game_id, until_event_id=at_event)
+        )
+        return replay.to_dict()
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error replaying game {game_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to replay game") from e
+
+
 @router.delete("/{game_id}/events/last")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def undo_last_event(game_id: int, current_user: User = Depends(get_current_user)):
     """Undo the last event in a game."""
     try:
         with get_db_session() as session:
             game_service = GameStateService(session)
-            result = game_service.undo_last_event(game_id)
+            with SeasonStatsService(session).track_game_changes(game_id, event_log=True):
+                result = game_service.undo_last_event(game_id, commit=False)
+            session.commit()
+            game_service.announce_committed_events()
 
             return result
     except ValueError as e:
@@ -922,6 +1012,7 @@ async def undo_last_event(game_id: int, current_user: User = Depends(get_current
 
 
 @router.put("/{game_id}/stats/batch-update")
+@invalidate_cache_after(tags=["game:{game_id}"])
 async def batch_update_game_stats(game_id: int, updates: dict, current_user: User = Depends(get_current_user)):
     """Batch update player stats for a game with undo support."""
     try:
@@ -942,6 +1033,8 @@ async def batch_update_game_stats(game_id: int, updates: dict, current_user: Use
                 result = correction_service.update_player_game_stats(stats_id, field_updates)
                 updated_stats.append(result)
 
+            session.commit()
+
             return {"status": "success", "updated": len(updated_stats)}
 
     except ValueError as e:
@@ -976,6 +1069,7 @@ async def get_deleted_games():
 
 
 @router.post("/{game_id}/restore")
+@invalidate_cache_after(tags=["game-list", "game:{game_id}"])
 async def restore_game(game_id: int, current_user: User = Depends(require_admin)):
     """Restore a soft-deleted game."""
     try:
@@ -987,9 +1081,10 @@ async def restore_game(game_id: int, current_user: User = Depends(require_admin)
             if not game.is_deleted:
                 raise HTTPException(status_code=400, detail="Game is not deleted")
 
-            game.is_deleted = False
-            game.deleted_at = None
-            game.deleted_by = None
+            with SeasonStatsService(session).track_game_changes(game_id):
+                game.is_deleted = False
+                game.deleted_at = None
+                game.deleted_by = None
 
             # Log the restore
             from app.services.audit_log_service import AuditLogService
@@ -1012,8 +1107,23 @@ async def restore_game(game_id: int, current_user: User = Depends(require_admin)
         raise HTTPException(status_code=500, detail="Failed to restore game") from e
 
 
+def _scorebook_cache_tags(result: dict, kwargs: dict) -> list[str]:
+    """Cache tags touched by a scorebook save: the game, its old and new teams and changed players.
+
+    A new game also changes the list of games.
+    """
+    tags = [
+        f"game:{result['game_id']}",
+        *(f"team:{team_id}" for team_id in result["team_ids"]),
+        *(f"player:{player_id}" for player_id in result["changes"]["player_ids"]),
+    ]
+    if kwargs["scorebook_data"].get("game_id") is None:
+        tags.append("game-list")
+    return tags
+
+
 @router.post("/scorebook")
-@invalidate_cache_after
+@invalidate_cache_after(tags=_scorebook_cache_tags)
 async def create_game_from_scorebook(scorebook_data: dict, current_user: User = Depends(get_current_user)):
     """Create or update a game from scorebook data entry."""
     try:
@@ -1022,7 +1132,7 @@ async def create_game_from_scorebook(scorebook_data: dict, current_user: User =
             game_id = scorebook_data.get("game_id")
             is_update = game_id is not None
             # Import here to avoid circular imports
-            from app.utils.scorebook_parser import parse_scorebook_entry
+            from app.utils.scorebook_parser import parse_scorebook_entries
 
             # Validate required fields
             required_fields = ["date", "home_team_id", "away_team_id", "player_stats"]
@@ -1030,6 +1140,12 @@ async def create_game_from_scorebook(scorebook_data: dict, current_user: User =
                 if field not in scorebook_data:
                     raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
 
+            try:
+                # Parse every player's scorebook entry in one batch
+                parsed_entries = parse_scorebook_entries(scorebook_data["player_stats"])
+            except ValueError as ve:
+                raise HTTPException(status_code=400, detail=f"Invalid player data: {str(ve)}") from ve
+
             # Validate teams exist
             home_team = session.query(models.Team).filter(models.Team.id == scorebook_data["home_team_id"]).first()
             away_team = session.query(models.Team).filter(models.Team.id == scorebook_data["away_team_id"]).first()
@@ -1064,6 +1180,7 @@ async def create_game_from_scorebook(scorebook_data: dict, current_user: User =
             # Initialize scheduled game info
             scheduled_game_info = None
             scheduled_game_id = None
+            previous_team_ids = set()
 
             if is_update:
                 # Update existing game
@@ -1086,27 +1203,7 @@ async def create_game_from_scorebook(scorebook_data: dict, current_user: User =
                     ):
                         raise HTTPException(status_code=403, detail="Access denied")
 
-                # Delete existing stats (they will be recreated)
-                existing_stats = (
-                    session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game_id).all()
-                )
-
-                for stat in existing_stats:
-                    # Delete quarter stats first
-                    session.query(models.PlayerQuarterStats).filter(
-                        models.PlayerQuarterStats.player_game_stat_id == stat.id
-                    ).delete()
-                    session.delete(stat)
-
-                session.flush()
-
-                # Update game info
-                game.date = game_date
-                game.playing_team_id = scorebook_data["home_team_id"]
-                game.opponent_team_id = scorebook_data["away_team_id"]
-                game.location = scorebook_data.get("location")
-                game.notes = scorebook_data.get("notes")
-                game.is_playoff_game = scorebook_data.get("is_playoff_game", game.is_playoff_game)
+                previous_team_ids = {game.playing_team_id, game.opponent_team_id}
             else:
                 # Check for matching scheduled game
                 scheduled_game = schedule_service.find_matching_scheduled_game(
@@ -1136,74 +1233,36 @@ async def create_game_from_scorebook(scorebook_data: dict, current_user: User =
                     is_playoff_game=scorebook_data.get(
                         "is_playoff_game", scheduled_game.is_playoff_game if scheduled_game else False
                     ),
+                    commit=False,
                 )
+                # The new game counts toward season records before its stats are entered
+                season_stats_service.apply_game_delta({}, season_stats_service.get_game_contribution(game.id))
 
                 # Link the game to the scheduled game if found
                 if scheduled_game:
                     schedule_service.link_game_to_schedule(session, scheduled_game.id, game.id)
 
-            # Process player statistics
-            home_score = 0
-            away_score = 0
-
-            for player_data in scorebook_data["player_stats"]:
+            # Season tables, the stored box score and live sessions follow the save in the same transaction
+            with season_stats_service.track_game_changes(game.id):
+                if is_update:
+                    game.date = game_date
+                    game.playing_team_id = scorebook_data["home_team_id"]
+                    game.opponent_team_id = scorebook_data["away_team_id"]
+                    game.location = scorebook_data.get("location")
+                    game.notes = scorebook_data.get("notes")
+                    game.is_playoff_game = scorebook_data.get("is_playoff_game", game.is_playoff_game)
+
+                # Apply only the lines and quarters that differ from the stored stats
                 try:
-                    # Parse the scorebook entry
-                    parsed_data = parse_scorebook_entry(player_data)
-                    player_id = parsed_data["player_id"]
-
-                    # Verify player exists
-                    player = session.query(models.Player).filter(models.Player.id == player_id).first()
-                    if not player:
-                        raise HTTPException(status_code=400, detail=f"Player {player_id} not found")
-
-                    # Create player game stats
-                    game_stats = models.PlayerGameStats(
-                        game_id=game.id,
-                        player_id=player_id,
-                        total_2pm=parsed_data["total_stats"]["fg2m"],
-                        total_2pa=parsed_data["total_stats"]["fg2a"],
-                        total_3pm=parsed_data["total_stats"]["fg3m"],
-                        total_3pa=parsed_data["total_stats"]["fg3a"],
-                        total_ftm=parsed_data["total_stats"]["ftm"],
-                        total_fta=parsed_data["total_stats"]["fta"],
-                        fouls=parsed_data["fouls"],
-                    )
-                    session.add(game_stats)
-                    session.flush()
-
-                    # Create quarter stats
-                    for quarter_data in parsed_data["quarter_stats"]:
-                        quarter_stats = models.PlayerQuarterStats(
-                            player_game_stat_id=game_stats.id,
-                            quarter_number=quarter_data["quarter_number"],
-                            fg2m=quarter_data["fg2m"],
-                            fg2a=quarter_data["fg2a"],
-                            fg3m=quarter_data["fg3m"],
-                            fg3a=quarter_data["fg3a"],
-                            ftm=quarter_data["ftm"],
-                            fta=quarter_data["fta"],
-                        )
-                        session.add(quarter_stats)
-
-                    # Calculate player score and add to team total
-                    player_score = (
-                        parsed_data["total_stats"]["ftm"]
-                        + parsed_data["total_stats"]["fg2m"] * 2
-                        + parsed_data["total_stats"]["fg3m"] * 3
-                    )
-
-                    if player.team_id == scorebook_data["home_team_id"]:
-                        home_score += player_score
-                    elif player.team_id == scorebook_data["away_team_id"]:
-                        away_score += player_score
-
+                    changes = ScorebookService(session).save(game, parsed_entries)
                 except ValueError as ve:
-                    raise HTTPException(status_code=400, detail=f"Invalid player data: {str(ve)}") from ve
+                    raise HTTPException(status_code=400, detail=str(ve)) from ve
+                home_score = changes.home_score
+                away_score = changes.away_score
 
-            # Update game scores after processing all player stats
-            game.playing_team_score = home_score
-            game.opponent_team_score = away_score
+                # Update game scores after processing all player stats
+                game.playing_team_score = home_score
+                game.opponent_team_score = away_score
 
             session.commit()
 
@@ -1215,6 +1274,13 @@ async def create_game_from_scorebook(scorebook_data: dict, current_user: User =
                 "home_score": home_score,
                 "away_score": away_score,
                 "date": game.date.isoformat(),
+                "changes": {
+                    "inserted": changes.inserted,
+                    "updated": changes.updated,
+                    "deleted": changes.deleted,
+                    "player_ids": sorted(changes.player_ids),
+                },
+                "team_ids": sorted(previous_team_ids | {game.playing_team_id, game.opponent_team_id}),
             }
 
             # Add scheduled game info if matched
@@ -1259,8 +1325,8 @@ async def get_game_scorebook_format(
     try:
         from app.services.shot_notation_service import ShotNotationService
 
-        # Get the game
-        game = session.query(models.Game).filter(models.Game.id == game_id, models.Game.is_deleted.is_not(True)).first()
+        # Load the game with all player and quarter lines in one pass
+        game = load_box_score(session, game_id, include_deleted=False)
 
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
@@ -1273,28 +1339,13 @@ async def get_game_scorebook_format(
             if user_team_id is None or (game.playing_team_id != user_team_id and game.opponent_team_id != user_team_id):
                 raise HTTPException(status_code=403, detail="Access denied")
 
-        # Get all player game stats
-        player_game_stats = (
-            session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game_id).all()
-        )
-
-        # Get all player quarter stats organized by player_id
-        player_quarter_stats_dict = {}
-        for pgs in player_game_stats:
-            quarter_stats = (
-                session.query(models.PlayerQuarterStats)
-                .filter(models.PlayerQuarterStats.player_game_stat_id == pgs.id)
-                .order_by(models.PlayerQuarterStats.quarter_number)
-                .all()
-            )
-
-            if quarter_stats:
-                player_quarter_stats_dict[pgs.player_id] = quarter_stats
+        # Quarter lines organized by player_id
+        player_quarter_stats_dict = {
+            line.player_id: list(line.quarter_stats) for line in game.lines if line.quarter_stats
+        }
 
         # Convert to scorebook format
-        scorebook_data = ShotNotationService.game_to_scorebook_format(
-            game, player_game_stats, player_quarter_stats_dict
-        )
+        scorebook_data = ShotNotationService.game_to_scorebook_format(game, game.lines, player_quarter_stats_dict)
 
         return scorebook_data
 
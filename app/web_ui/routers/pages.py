@@ -9,10 +9,10 @@ from sqlalchemy import desc
 from sqlalchemy.orm import joinedload
 
 from app.data_access import models
-from app.data_access.db_session import get_db_session
+from app.data_access.db_session import get_async_db_session, get_db_session
 from app.services.score_calculation_service import ScoreCalculationService
 from app.services.season_stats_service import SeasonStatsService
-from app.web_ui.cache import cached
+from app.web_ui.cache import add_cache_tags, cached
 from app.web_ui.dependencies import get_template_auth_context
 from app.web_ui.templates_config import templates
 
@@ -70,6 +70,8 @@ def get_top_players_from_recent_week(session, limit=4):
         .filter(models.Game.date == recent_date)
         .all()
     )
+    # A stat change in any game on that date can change the top players
+    add_cache_tags(*(f"game:{game_id}" for (game_id,) in session.query(models.Game.id).filter_by(date=recent_date)))
 
     # Calculate points and create player data
     top_players_data = []
@@ -119,7 +121,7 @@ def get_top_players_from_recent_week(session, limit=4):
 
 
 @router.get("/", response_class=HTMLResponse)
-@cached(ttl_seconds=86400, key_prefix="homepage:")
+@cached(ttl_seconds=86400, key_prefix="homepage:", tags=("game-list", "awards"))
 async def index(auth_context: dict = Depends(get_template_auth_context)):
     """Render the dashboard home page."""
     try:
@@ -212,6 +214,13 @@ async def index(auth_context: dict = Depends(get_template_auth_context)):
             # Get top players from recent games
             top_players = get_top_players_from_recent_week(session, limit=4)
 
+            # The dashboard depends on these games, teams and players; edits to them invalidate it
+            add_cache_tags(
+                *(f"game:{game.id}" for game in recent_games),
+                *(f"team:{team_id}" for team_id in team_ids),
+                *(f"player:{player['player_id']}" for player in top_players),
+            )
+
             # Get current week's award winners
             current_week_awards = get_current_week_awards(session)
 
@@ -241,110 +250,111 @@ async def index(auth_context: dict = Depends(get_template_auth_context)):
         return templates.TemplateResponse("index.html", context)
 
 
-@router.get("/games", response_class=HTMLResponse)
-async def games_page(auth_context: dict = Depends(get_template_auth_context)):
-    """Render the games list page."""
-    try:
-        with get_db_session() as session:
-            # Get games with team records (reuse the existing logic)
-            from app.services.score_calculation_service import ScoreCalculationService
-
-            # Get completed games
-            completed_games = session.query(models.Game).order_by(desc(models.Game.date)).limit(20).all()
+def _load_games_page_data(session) -> list[dict]:
+    """Collect recent completed and upcoming scheduled games, newest first, for the games page."""
+    # Get completed games
+    completed_games = session.query(models.Game).order_by(desc(models.Game.date)).limit(20).all()
 
-            # Get scheduled games
-            scheduled_games = (
-                session.query(models.ScheduledGame)
-                .filter(
-                    models.ScheduledGame.status == models.ScheduledGameStatus.SCHEDULED,
-                    models.ScheduledGame.is_deleted.is_not(True),
-                )
-                .order_by(desc(models.ScheduledGame.scheduled_date))
-                .limit(10)
-                .all()
-            )
-
-            # Get all team IDs for efficient record lookup
-            team_ids = set()
-            for game in completed_games:
-                if game.playing_team_id:
-                    team_ids.add(game.playing_team_id)
-                if game.opponent_team_id:
-                    team_ids.add(game.opponent_team_id)
-            for scheduled_game in scheduled_games:
-                if scheduled_game.home_team_id:
-                    team_ids.add(scheduled_game.home_team_id)
-                if scheduled_game.away_team_id:
-                    team_ids.add(scheduled_game.away_team_id)
+    # Get scheduled games
+    scheduled_games = (
+        session.query(models.ScheduledGame)
+        .filter(
+            models.ScheduledGame.status == models.ScheduledGameStatus.SCHEDULED,
+            models.ScheduledGame.is_deleted.is_not(True),
+        )
+        .order_by(desc(models.ScheduledGame.scheduled_date))
+        .limit(10)
+        .all()
+    )
 
-            # Get team records
-            stats_service = SeasonStatsService(session)
-            team_records = stats_service.get_teams_records(list(team_ids)) if team_ids else {}
+    # Get all team IDs for efficient record lookup
+    team_ids = set()
+    for game in completed_games:
+        if game.playing_team_id:
+            team_ids.add(game.playing_team_id)
+        if game.opponent_team_id:
+            team_ids.add(game.opponent_team_id)
+    for scheduled_game in scheduled_games:
+        if scheduled_game.home_team_id:
+            team_ids.add(scheduled_game.home_team_id)
+        if scheduled_game.away_team_id:
+            team_ids.add(scheduled_game.away_team_id)
+
+    # Get team records
+    stats_service = SeasonStatsService(session)
+    team_records = stats_service.get_teams_records(list(team_ids)) if team_ids else {}
+
+    # Convert to games data
+    games_data = []
+
+    # Add completed games
+    for game in completed_games:
+        # Get player stats for scoring
+        player_stats = session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game.id).all()
+
+        # Calculate scores
+        playing_team_score, opponent_team_score = ScoreCalculationService.calculate_game_scores(game, player_stats)
+
+        # Get team records
+        home_wins, home_losses = team_records.get(game.playing_team_id, (0, 0))
+        away_wins, away_losses = team_records.get(game.opponent_team_id, (0, 0))
+
+        games_data.append(
+            {
+                "id": game.id,
+                "date": game.date,
+                "home_team": game.playing_team.display_name or game.playing_team.name,
+                "home_team_id": game.playing_team_id,
+                "home_team_record": f"{home_wins}-{home_losses}",
+                "away_team": game.opponent_team.display_name or game.opponent_team.name,
+                "away_team_id": game.opponent_team_id,
+                "away_team_record": f"{away_wins}-{away_losses}",
+                "home_score": playing_team_score,
+                "away_score": opponent_team_score,
+            }
+        )
 
-            # Convert to games data
-            games_data = []
+    # Add scheduled games
+    for scheduled_game in scheduled_games:
+        home_wins, home_losses = team_records.get(scheduled_game.home_team_id, (0, 0))
+        away_wins, away_losses = team_records.get(scheduled_game.away_team_id, (0, 0))
 
-            # Add completed games
-            for game in completed_games:
-                # Get player stats for scoring
-                player_stats = (
-                    session.query(models.PlayerGameStats).filter(models.PlayerGameStats.game_id == game.id).all()
-                )
+        games_data.append(
+            {
+                "id": -scheduled_game.id,  # Negative for scheduled games
+                "date": scheduled_game.scheduled_date,
+                "home_team": scheduled_game.home_team.display_name or scheduled_game.home_team.name,
+                "home_team_id": scheduled_game.home_team_id,
+                "home_team_record": f"{home_wins}-{home_losses}",
+                "away_team": scheduled_game.away_team.display_name or scheduled_game.away_team.name,
+                "away_team_id": scheduled_game.away_team_id,
+                "away_team_record": f"{away_wins}-{away_losses}",
+                "home_score": 0,
+                "away_score": 0,
+            }
+        )
 
-                # Calculate scores
-                playing_team_score, opponent_team_score = ScoreCalculationService.calculate_game_scores(
-                    game, player_stats
-                )
+    # Sort by date (newest first)
+    games_data.sort(key=lambda x: x["date"], reverse=True)
 
-                # Get team records
-                home_wins, home_losses = team_records.get(game.playing_team_id, (0, 0))
-                away_wins, away_losses = team_records.get(game.opponent_team_id, (0, 0))
-
-                games_data.append(
-                    {
-                        "id": game.id,
-                        "date": game.date,
-                        "home_team": game.playing_team.display_name or game.playing_team.name,
-                        "home_team_id": game.playing_team_id,
-                        "home_team_record": f"{home_wins}-{home_losses}",
-                        "away_team": game.opponent_team.display_name or game.opponent_team.name,
-                        "away_team_id": game.opponent_team_id,
-                        "away_team_record": f"{away_wins}-{away_losses}",
-                        "home_score": playing_team_score,
-                        "away_score": opponent_team_score,
-                    }
-                )
+    return games_data
 
-            # Add scheduled games
-            for scheduled_game in scheduled_games:
-                home_wins, home_losses = team_records.get(scheduled_game.home_team_id, (0, 0))
-                away_wins, away_losses = team_records.get(scheduled_game.away_team_id, (0, 0))
-
-                games_data.append(
-                    {
-                        "id": -scheduled_game.id,  # Negative for scheduled games
-                        "date": scheduled_game.scheduled_date,
-                        "home_team": scheduled_game.home_team.display_name or scheduled_game.home_team.name,
-                        "home_team_id": scheduled_game.home_team_id,
-                        "home_team_record": f"{home_wins}-{home_losses}",
-                        "away_team": scheduled_game.away_team.display_name or scheduled_game.away_team.name,
-                        "away_team_id": scheduled_game.away_team_id,
-                        "away_team_record": f"{away_wins}-{away_losses}",
-                        "home_score": 0,
-                        "away_score": 0,
-                    }
-                )
 
-            # Sort by date (newest first)
-            games_data.sort(key=lambda x: x["date"], reverse=True)
+@router.get("/games", response_class=HTMLResponse)
+async def games_page(auth_context: dict = Depends(get_template_auth_context)):
+    """Render the games list page."""
+    try:
+        async with get_async_db_session() as session:
+            # Query and service code is sync; run_sync drives it over the async connection
+            games_data = await session.run_sync(_load_games_page_data)
 
-            context = {
-                **auth_context,
-                "title": "Basketball Games",
-                "games": games_data,
-                "show_edit_actions": auth_context.get("is_authenticated", False),
-            }
-            return templates.TemplateResponse("games/index.html", context)
+        context = {
+            **auth_context,
+            "title": "Basketball Games",
+            "games": games_data,
+            "show_edit_actions": auth_context.get("is_authenticated", False),
+        }
+        return templates.TemplateResponse("games/index.html", context)
 
     except Exception as e:
         logger.error(f"Error rendering games page: {e}")
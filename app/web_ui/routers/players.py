@@ -9,9 +9,8 @@ from app.auth.dependencies import get_current_user, require_admin
 from app.auth.models import User
 from app.data_access import models
 from app.data_access.db_session import get_db_session
+from app.repositories import SeasonSplit, load_player_profile
 from app.services.player_stats_service import PlayerStatsService
-from app.services.season_stats_service import SeasonStatsService
-from app.utils import stats_calculator
 from app.web_ui.cache import invalidate_cache_after
 from app.web_ui.dependencies import get_db
 
@@ -48,10 +47,11 @@ def update_status(progress: int, message: str, results=None, error=None):
     logger.info(f"📊 Status: {progress}% - {message}")
 
 
-def run_award_calculation_sync(season: str, recalculate: bool):
+def run_award_calculation_sync(season: str, recalculate: bool, workers: int = 1):
     """Run award calculation synchronously in a separate thread."""
     from app.data_access.database_manager import db_manager
     from app.services.awards_service import calculate_all_weekly_awards, get_current_season
+    from app.services.parallel_awards_service import calculate_awards_parallel
 
     try:
         # Mark as started
@@ -75,8 +75,12 @@ def run_award_calculation_sync(season: str, recalculate: bool):
             update_status(25, f"Calculating weekly awards for {weekly_target or 'all seasons'}")
 
             # Calculate weekly awards only (removing problematic season awards)
-            logger.info(f"Calculating weekly awards for {weekly_target}")
-            weekly_results = calculate_all_weekly_awards(session, season=weekly_target, recalculate=recalculate)
+            logger.info(f"Calculating weekly awards for {weekly_target} with {workers} worker(s)")
+            if workers > 1:
+                results = calculate_awards_parallel(session, {"weekly": weekly_target}, recalculate, workers)
+                weekly_results = results["weekly"]
+            else:
+                weekly_results = calculate_all_weekly_awards(session, season=weekly_target, recalculate=recalculate)
             logger.info(f"Weekly awards calculated: {weekly_results}")
 
             update_status(90, "Compiling results...")
@@ -198,7 +202,7 @@ async def list_players(team_id: int | None = None, active_only: bool = True, pla
 
 
 @router.post("/new", response_model=PlayerResponse)
-@invalidate_cache_after
+@invalidate_cache_after(tags=["players", "team:{team_id}"])
 async def create_player(player_data: PlayerCreateRequest, current_user: User = Depends(get_current_user)):
     """Create a new player."""
     try:
@@ -295,14 +299,25 @@ async def create_player(player_data: PlayerCreateRequest, current_user: User = D
 
 
 @router.get("/stats")
-async def get_player_stats_rankings(team_id: int | None = None, session=Depends(get_db)):
-    """Get comprehensive player statistics for all players, optionally filtered by team."""
+async def get_player_stats_rankings(
+    team_id: int | None = None,
+    sort_by: str | None = None,
+    descending: bool = True,
+    limit: int | None = None,
+    min_games: int = 0,
+    session=Depends(get_db),
+):
+    """Get comprehensive player statistics for all players, optionally filtered by team and ranked by a statistic."""
     try:
         stats_service = PlayerStatsService(session)
-        player_stats = stats_service.get_player_stats(team_id=team_id)
+        player_stats = stats_service.get_player_stats(
+            team_id=team_id, sort_by=sort_by, descending=descending, limit=limit, min_games=min_games
+        )
 
         return player_stats
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Error getting player statistics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve player statistics") from e
@@ -338,6 +353,7 @@ async def get_player(player_id: int):
 
 
 @router.put("/{player_id}", response_model=PlayerResponse)
+@invalidate_cache_after(tags=["players", "player:{player_id}", "team:{team_id}"])
 async def update_player(
     player_id: int, player_data: PlayerUpdateRequest, current_user: User = Depends(get_current_user)
 ):
@@ -415,6 +431,7 @@ async def update_player(
 
 
 @router.delete("/{player_id}")
+@invalidate_cache_after(tags=["players", "player:{player_id}"])
 async def delete_player(player_id: int, current_user: User = Depends(get_current_user)):
     """Delete a player (actually deactivates them if they have game stats)."""
     try:
@@ -472,209 +489,106 @@ async def get_deleted_players():
         raise HTTPException(status_code=500, detail="Failed to get deleted players") from e
 
 
+def _per_game(total: int, games: int) -> float:
+    return round(total / games, 1) if games > 0 else 0.0
+
+
+def _percentage(made: int, attempted: int) -> float:
+    return round(made / attempted * 100, 1) if attempted > 0 else 0
+
+
+def _season_split_stats(split: SeasonSplit) -> dict:
+    """Season stats payload for one season split."""
+    totals = split.totals
+    return {
+        "season": split.season_code,
+        "season_name": split.season_name,
+        "games_played": totals.games_played,
+        "total_points": totals.points,
+        "total_fouls": totals.fouls,
+        "total_ftm": totals.total_ftm,
+        "total_fta": totals.total_fta,
+        "total_2pm": totals.total_2pm,
+        "total_2pa": totals.total_2pa,
+        "total_3pm": totals.total_3pm,
+        "total_3pa": totals.total_3pa,
+        "ppg": _per_game(totals.points, totals.games_played),
+        "fpg": _per_game(totals.fouls, totals.games_played),
+        "ft_percentage": _percentage(totals.total_ftm, totals.total_fta),
+        "fg2_percentage": _percentage(totals.total_2pm, totals.total_2pa),
+        "fg3_percentage": _percentage(totals.total_3pm, totals.total_3pa),
+    }
+
+
 @router.get("/{player_id}/stats")
 async def get_player_stats(player_id: int, session=Depends(get_db)):
-    """Get player statistics including season and career stats."""
+    """Get player statistics including career, season, recent game and quarter stats."""
     try:
         player = session.query(models.Player).filter(models.Player.id == player_id).first()
         if not player:
             raise HTTPException(status_code=404, detail="Player not found")
 
-        # Get all player's game stats
-        game_stats = (
-            session.query(models.PlayerGameStats, models.Game)
-            .join(models.Game)
-            .filter(models.PlayerGameStats.player_id == player_id)
-            .order_by(models.Game.date.desc())
-            .all()
-        )
+        profile = load_player_profile(session, player.id, player.team_id)
 
-        # Calculate career totals
+        career = profile.career
         career_stats = {
-            "games_played": len(game_stats),
-            "total_points": 0,
-            "total_ftm": 0,
-            "total_fta": 0,
-            "total_2pm": 0,
-            "total_2pa": 0,
-            "total_3pm": 0,
-            "total_3pa": 0,
-            "total_fouls": 0,
+            "games_played": career.games_played,
+            "total_points": career.points,
+            "total_ftm": career.total_ftm,
+            "total_fta": career.total_fta,
+            "total_2pm": career.total_2pm,
+            "total_2pa": career.total_2pa,
+            "total_3pm": career.total_3pm,
+            "total_3pa": career.total_3pa,
+            "total_fouls": career.fouls,
+            "ppg": _per_game(career.points, career.games_played),
+            "fpg": _per_game(career.fouls, career.games_played),
         }
 
-        # Calculate career totals from all games
-        for stats, _game in game_stats:
-            points = stats_calculator.calculate_points(stats.total_ftm, stats.total_2pm, stats.total_3pm)
-            career_stats["total_points"] += points
-            career_stats["total_ftm"] += stats.total_ftm
-            career_stats["total_fta"] += stats.total_fta
-            career_stats["total_2pm"] += stats.total_2pm
-            career_stats["total_2pa"] += stats.total_2pa
-            career_stats["total_3pm"] += stats.total_3pm
-            career_stats["total_3pa"] += stats.total_3pa
-            career_stats["total_fouls"] += stats.fouls
-
-        # Get recent games (last 10) with team-level scores
-        recent_games = []
-        for stats, game in game_stats[:10]:
-            points = stats_calculator.calculate_points(stats.total_ftm, stats.total_2pm, stats.total_3pm)
-
-            # Get team scores for this game
-            team_id = player.team_id
-            opponent_team_id = game.opponent_team_id if game.playing_team_id == team_id else game.playing_team_id
-
-            # Determine the opponent team based on which team the player is on
-            opponent_team = game.opponent_team if team_id == game.playing_team_id else game.playing_team
-
-            # Get team stats for this game
-            team_stats_query = (
-                session.query(
-                    func.sum(
-                        models.PlayerGameStats.total_ftm
-                        + (models.PlayerGameStats.total_2pm * 2)
-                        + (models.PlayerGameStats.total_3pm * 3)
-                    ).label("total_points")
-                )
-                .join(models.Player)
-                .filter(models.PlayerGameStats.game_id == game.id, models.Player.team_id == team_id)
-                .first()
-            )
-
-            opponent_stats_query = (
-                session.query(
-                    func.sum(
-                        models.PlayerGameStats.total_ftm
-                        + (models.PlayerGameStats.total_2pm * 2)
-                        + (models.PlayerGameStats.total_3pm * 3)
-                    ).label("total_points")
-                )
-                .join(models.Player)
-                .filter(models.PlayerGameStats.game_id == game.id, models.Player.team_id == opponent_team_id)
-                .first()
-            )
-
-            team_score = (
-                team_stats_query.total_points
-                if (team_stats_query and hasattr(team_stats_query, "total_points") and team_stats_query.total_points)
-                else 0
-            )
-            opponent_score = (
-                opponent_stats_query.total_points
-                if (
-                    opponent_stats_query
-                    and hasattr(opponent_stats_query, "total_points")
-                    and opponent_stats_query.total_points
-                )
-                else 0
-            )
-
-            recent_games.append(
-                {
-                    "game_id": game.id,
-                    "date": game.date.isoformat(),
-                    "opponent": opponent_team.name if opponent_team else "Unknown",
-                    "points": points,  # Player's points
-                    "team_score": team_score,  # Team's total points
-                    "opponent_score": opponent_score,  # Opponent's total points
-                    "win": team_score > opponent_score,  # Team win/loss
-                    "ft": f"{stats.total_ftm}/{stats.total_fta}",
-                    "ftm": stats.total_ftm,
-                    "fta": stats.total_fta,
-                    "fg2": f"{stats.total_2pm}/{stats.total_2pa}",
-                    "fg2m": stats.total_2pm,
-                    "fg2a": stats.total_2pa,
-                    "fg3": f"{stats.total_3pm}/{stats.total_3pa}",
-                    "fg3m": stats.total_3pm,
-                    "fg3a": stats.total_3pa,
-                    "fouls": stats.fouls,
-                }
-            )
-
-        # Calculate career averages
-        if career_stats["games_played"] > 0:
-            career_stats["ppg"] = round(career_stats["total_points"] / career_stats["games_played"], 1)
-            career_stats["fpg"] = round(career_stats["total_fouls"] / career_stats["games_played"], 1)
-        else:
-            career_stats["ppg"] = 0.0
-            career_stats["fpg"] = 0.0
-
-        # Get current season stats using the same pattern as team stats
-        season_stats_record = None
-        current_season = None
-        try:
-            from app.data_access.models import PlayerSeasonStats, Season
-
-            stats_service = SeasonStatsService(session)
-
-            # First, check if there's an active season
-            active_season = session.query(Season).filter(Season.is_active).first()
-
-            if active_season:
-                current_season = active_season.code
-                # Update player season stats to ensure they're current
-                season_stats_record = stats_service.update_player_season_stats(player_id, current_season)
-            else:
-                # If no active season, get the most recent season stats for the player
-                season_stats_record = (
-                    session.query(PlayerSeasonStats)
-                    .filter(PlayerSeasonStats.player_id == player_id)
-                    .order_by(PlayerSeasonStats.season.desc())
-                    .first()
-                )
-        except Exception as e:
-            logger.warning(f"Error getting current season stats for player {player_id}: {e}")
-            season_stats_record = None
-
-        if season_stats_record:
-            season_stats = {
-                "season": season_stats_record.season,
-                "games_played": season_stats_record.games_played,
-                "total_points": season_stats_record.total_ftm
-                + season_stats_record.total_2pm * 2
-                + season_stats_record.total_3pm * 3,
-                "total_fouls": season_stats_record.total_fouls,
-                "total_ftm": season_stats_record.total_ftm,
-                "total_fta": season_stats_record.total_fta,
-                "total_2pm": season_stats_record.total_2pm,
-                "total_2pa": season_stats_record.total_2pa,
-                "total_3pm": season_stats_record.total_3pm,
-                "total_3pa": season_stats_record.total_3pa,
-                "ppg": (
-                    round(
-                        (
-                            season_stats_record.total_ftm
-                            + season_stats_record.total_2pm * 2
-                            + season_stats_record.total_3pm * 3
-                        )
-                        / season_stats_record.games_played,
-                        1,
-                    )
-                    if season_stats_record.games_played > 0
-                    else 0
-                ),
-                "fpg": (
-                    round(season_stats_record.total_fouls / season_stats_record.games_played, 1)
-                    if season_stats_record.games_played > 0
-                    else 0
-                ),
-                "ft_percentage": (
-                    round(season_stats_record.total_ftm / season_stats_record.total_fta * 100, 1)
-                    if season_stats_record.total_fta > 0
-                    else 0
-                ),
-                "fg2_percentage": (
-                    round(season_stats_record.total_2pm / season_stats_record.total_2pa * 100, 1)
-                    if season_stats_record.total_2pa > 0
-                    else 0
-                ),
-                "fg3_percentage": (
-                    round(season_stats_record.total_3pm / season_stats_record.total_3pa * 100, 1)
-                    if season_stats_record.total_3pa > 0
-                    else 0
-                ),
+        recent_games = [
+            {
+                "game_id": game.game_id,
+                "date": game.date.isoformat(),
+                "opponent": game.opponent_name or "Unknown",
+                "points": game.line.points,  # Player's points
+                "team_score": game.team_score,  # Team's total points
+                "opponent_score": game.opponent_score,  # Opponent's total points
+                "win": game.team_score > game.opponent_score,  # Team win/loss
+                "ft": f"{game.line.total_ftm}/{game.line.total_fta}",
+                "ftm": game.line.total_ftm,
+                "fta": game.line.total_fta,
+                "fg2": f"{game.line.total_2pm}/{game.line.total_2pa}",
+                "fg2m": game.line.total_2pm,
+                "fg2a": game.line.total_2pa,
+                "fg3": f"{game.line.total_3pm}/{game.line.total_3pa}",
+                "fg3m": game.line.total_3pm,
+                "fg3a": game.line.total_3pa,
+                "fouls": game.line.fouls,
             }
-        else:
-            season_stats = None
+            for game in profile.recent_games
+        ]
+
+        season_splits = [_season_split_stats(split) for split in profile.seasons]
+        current_season = profile.current_season
+        season_stats = _season_split_stats(current_season) if current_season else None
+
+        quarter_splits = [
+            {
+                "quarter": quarter.quarter_number,
+                "games": quarter.games,
+                "points": quarter.points,
+                "ppg": _per_game(quarter.points, quarter.games),
+                "ftm": quarter.ftm,
+                "fta": quarter.fta,
+                "fg2m": quarter.fg2m,
+                "fg2a": quarter.fg2a,
+                "fg3m": quarter.fg3m,
+                "fg3a": quarter.fg3a,
+            }
+            for quarter in profile.quarters
+        ]
+
+        potw_summary = _get_potw_summary(session, player.id)
 
         return {
             "player": {
@@ -688,13 +602,13 @@ async def get_player_stats(player_id: int, session=Depends(get_db)):
                 "team_name": player.team.name,
                 "thumbnail_image": player.thumbnail_image,
                 "awards_summary": _get_comprehensive_awards_summary(session, player.id),
-                "potw_summary": _get_potw_summary(session, player.id),  # Legacy compatibility
-                "player_of_the_week_awards": _get_potw_summary(session, player.id).get(
-                    "total_count", 0
-                ),  # Legacy counter
+                "potw_summary": potw_summary,  # Legacy compatibility
+                "player_of_the_week_awards": potw_summary.get("total_count", 0),  # Legacy counter
             },
             "career_stats": career_stats,
             "season_stats": season_stats,
+            "season_splits": season_splits,
+            "quarter_splits": quarter_splits,
             "recent_games": recent_games,
         }
     except HTTPException:
@@ -705,7 +619,7 @@ async def get_player_stats(player_id: int, session=Depends(get_db)):
 
 
 @router.post("/{player_id}/portrait")
-@invalidate_cache_after
+@invalidate_cache_after(tags=["player:{player_id}"])
 async def upload_player_portrait(
     player_id: int,
     file: UploadFile = File(...),
@@ -809,6 +723,7 @@ async def upload_player_portrait(
 
 
 @router.delete("/{player_id}/portrait")
+@invalidate_cache_after(tags=["player:{player_id}"])
 async def delete_player_portrait(
     player_id: int, current_user: User = Depends(get_current_user), session=Depends(get_db)
 ):
@@ -906,6 +821,7 @@ async def upload_player_image(
 
 
 @router.post("/{player_id}/restore")
+@invalidate_cache_after(tags=["players", "player:{player_id}"])
 async def restore_player(player_id: int, current_user: User = Depends(require_admin)):
     """Restore a soft-deleted player."""
     try:
@@ -950,7 +866,7 @@ async def get_calculation_status():
 
 
 @router.post("/calculate-awards")
-@invalidate_cache_after
+@invalidate_cache_after(tags=["awards"])
 async def calculate_player_awards(
     request: AwardCalculationRequest,
     current_user: User = Depends(get_current_user),
@@ -978,6 +894,7 @@ async def calculate_player_awards(
     # Extract parameters from request body
     season = request.season
     recalculate = request.recalculate
+    workers = request.workers
 
     logger.info(
         f"Starting fire-and-forget award calculation - "
@@ -994,7 +911,7 @@ async def calculate_player_awards(
 
     thread = threading.Thread(
         target=run_award_calculation_sync,
-        args=(season, recalculate),
+        args=(season, recalculate, workers),
         daemon=True,  # Dies when main process dies
         name="award-calculation-thread",
     )
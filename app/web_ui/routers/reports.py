@@ -21,6 +21,7 @@ from app.data_access.crud import (
     crud_team_season_stats,
 )
 from app.reports.report_generator import ReportGenerator
+from app.services.box_score_service import BoxScoreService
 from app.services.season_stats_service import SeasonStatsService
 from app.utils import stats_calculator
 from app.web_ui.dependencies import get_db, get_template_auth_context
@@ -103,12 +104,12 @@ async def get_games_for_reports(
 @router.get("/v1/reports/box-score/{game_id}", response_model=dict[str, Any])
 async def get_box_score_report(game_id: int, db: Annotated[Session, Depends(get_db)]):
     """Get box score report data."""
-    game = crud_game.get_game_by_id(db, game_id)
-    if not game:
+    box_score = BoxScoreService(db).get(game_id)
+    if not box_score:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    report_gen = ReportGenerator(db, stats_calculator)
-    player_stats_list, game_summary = report_gen.get_game_box_score_data(game_id)
+    player_stats_list = box_score["player_stats"]
+    game_summary = box_score["game_summary"]
 
     # Transform data into expected format for API response
     # Group players by team
@@ -2,7 +2,7 @@
 
 import logging
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 
 from app.auth.dependencies import get_current_user, require_admin
 from app.auth.models import User
@@ -136,11 +136,14 @@ async def list_teams_with_counts(
 
 
 @router.get("/rankings")
-async def get_team_rankings(db=Depends(get_db)):  # noqa: B008
+async def get_team_rankings(
+    season: str | None = Query(None, description="Season code to filter by (e.g., '2024-25')"),
+    db=Depends(get_db),  # noqa: B008
+):
     """Get team rankings and statistics for all teams."""
     try:
         team_stats_service = TeamStatsService(db)
-        rankings = team_stats_service.get_team_rankings()
+        rankings = team_stats_service.get_team_rankings(season=season)
         return rankings
     except Exception as e:
         logger.error(f"Error retrieving team rankings: {e}")
@@ -402,7 +405,7 @@ async def get_team_stats(
 
 
 @router.post("/new", response_model=TeamResponse)
-@invalidate_cache_after
+@invalidate_cache_after(tags=["teams"])
 async def create_team(
     team_data: TeamCreateRequest,
     team_repo: TeamRepository = Depends(get_team_repository),  # noqa: B008
@@ -425,6 +428,7 @@ async def create_team(
 
 
 @router.put("/{team_id}", response_model=TeamResponse)
+@invalidate_cache_after(tags=["teams", "team:{team_id}"])
 async def update_team(
     team_id: int,
     team_data: TeamUpdateRequest,
@@ -473,6 +477,7 @@ async def update_team(
 
 
 @router.delete("/{team_id}")
+@invalidate_cache_after(tags=["teams", "team:{team_id}"])
 async def delete_team(
     team_id: int,
     team_repo: TeamRepository = Depends(get_team_repository),  # noqa: B008
@@ -518,6 +523,7 @@ async def get_deleted_teams(team_repo: TeamRepository = Depends(get_team_reposit
 
 
 @router.post("/{team_id}/restore")
+@invalidate_cache_after(tags=["teams", "team:{team_id}"])
 async def restore_team(
     team_id: int,
     team_repo: TeamRepository = Depends(get_team_repository),  # noqa: B008
@@ -557,7 +563,7 @@ async def restore_team(
 
 
 @router.post("/{team_id}/logo")
-@invalidate_cache_after
+@invalidate_cache_after(tags=["team:{team_id}"])
 async def upload_team_logo(
     team_id: int, file: UploadFile = File(...), current_user: User = Depends(require_admin), db=Depends(get_db)
 ):
@@ -605,6 +611,7 @@ async def upload_team_logo(
 
 
 @router.delete("/{team_id}/logo")
+@invalidate_cache_after(tags=["team:{team_id}"])
 async def delete_team_logo(team_id: int, current_user: User = Depends(get_current_user), db=Depends(get_db)):
     """Delete the logo for a team."""
     try:
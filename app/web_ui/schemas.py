@@ -14,6 +14,7 @@ class AwardCalculationRequest(BaseModel):
 
     season: str | None = None
     recalculate: bool = False
+    workers: int = Field(1, ge=1, description="Worker processes for evaluating seasons in parallel")
 
 
 class GameSummary(BaseModel):
@@ -124,6 +125,49 @@ class SubstitutionRequest(BaseModel):
     players_in: list[int] = Field(..., min_length=1, description="Players coming in")
 
 
+class LiveEventItem(BaseModel):
+    """One event in a batched live event upload."""
+
+    client_event_id: str = Field(
+        ..., min_length=1, max_length=64, description="Client-assigned ID; resent events are skipped"
+    )
+    type: str = Field(..., pattern="^(shot|foul|substitution)$")
+    player_id: int | None = None
+    shot_type: str | None = Field(None, pattern="^(2pt|3pt|ft)$")
+    made: bool | None = None
+    assisted_by: int | None = None
+    foul_type: str | None = Field(None, pattern="^(personal|technical|flagrant)$")
+    team_id: int | None = None
+    players_out: list[int] | None = None
+    players_in: list[int] | None = None
+    quarter: int | None = Field(None, ge=1, le=6)
+
+
+class LiveEventBatchRequest(BaseModel):
+    """Request schema for recording queued live events in order."""
+
+    events: list[LiveEventItem] = Field(..., min_length=1, max_length=500)
+
+
+class LiveEventResult(BaseModel):
+    """Outcome of one event in a batch."""
+
+    client_event_id: str | None = None
+    status: str  # applied, duplicate or rejected
+    event_id: int | None = None
+    error: str | None = None
+
+
+class LiveEventBatchResponse(BaseModel):
+    """Response schema for a batched live event upload."""
+
+    game_id: int
+    results: list[LiveEventResult]
+    applied: int
+    duplicates: int
+    rejected: int
+
+
 class ActivePlayer(BaseModel):
     """Schema for an active player in the game."""
 
@@ -0,0 +1,61 @@
+"""rekey season stats by season code
+
+Revision ID: 5e2c7a9d1b84
+Revises: b7d3a91c5f20
+Create Date: 2026-10-16 23:40:12.512734
+
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e2c7a9d1b84"
+down_revision = "b7d3a91c5f20"
+branch_labels = None
+depends_on = None
+
+seasons = sa.table("seasons", sa.column("code", sa.String), sa.column("start_date", sa.Date))
+
+SEASON_STATS_TABLES = (("player_season_stats", "player_id"), ("team_season_stats", "team_id"))
+
+
+def _legacy_season_key(start_date: date) -> str:
+    """The "YYYY-YYYY" key season rows were stored under before they were keyed by Season.code."""
+    if start_date.month >= 10:
+        return f"{start_date.year}-{start_date.year + 1}"
+    return f"{start_date.year - 1}-{start_date.year}"
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    codes_by_legacy_key: dict[str, set[str]] = {}
+    for code, start_date in conn.execute(sa.select(seasons.c.code, seasons.c.start_date)):
+        codes_by_legacy_key.setdefault(_legacy_season_key(start_date), set()).add(code)
+
+    for legacy_key, codes in codes_by_legacy_key.items():
+        # Keys shared by more than one season cannot be attributed; a rebuild replaces them
+        if len(codes) != 1 or legacy_key in codes:
+            continue
+        (code,) = codes
+        for table, owner_column in SEASON_STATS_TABLES:
+            # A row already stored under the season code wins over its legacy duplicate
+            conn.execute(
+                sa.text(
+                    f"DELETE FROM {table} WHERE season = :legacy_key AND {owner_column} IN "
+                    f"(SELECT {owner_column} FROM {table} WHERE season = :code)"
+                ),
+                {"legacy_key": legacy_key, "code": code},
+            )
+            conn.execute(
+                sa.text(f"UPDATE {table} SET season = :code WHERE season = :legacy_key"),
+                {"legacy_key": legacy_key, "code": code},
+            )
+
+
+def downgrade():
+    # Season codes cannot be mapped back to legacy keys reliably; rows stay keyed by code
+    pass
@@ -0,0 +1,27 @@
+"""add revision to game_states
+
+Revision ID: 8a3f61c2d9e7
+Revises: 5e2c7a9d1b84
+Create Date: 2026-10-16 23:58:41.206417
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8a3f61c2d9e7"
+down_revision = "5e2c7a9d1b84"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Versions live game sessions together with the newest event id, so every worker sees stats corrections
+    with op.batch_alter_table("game_states", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("revision", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade():
+    with op.batch_alter_table("game_states", schema=None) as batch_op:
+        batch_op.drop_column("revision")
@@ -0,0 +1,32 @@
+"""add game_box_scores table
+
+Revision ID: 9c41d2b7e6a3
+Revises: 4bb1f2a2a3fa
+Create Date: 2026-10-16 09:12:40.318204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c41d2b7e6a3"
+down_revision = "4bb1f2a2a3fa"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Materialized box scores, rebuilt with `basketball-stats rebuild-box-scores`
+    op.create_table(
+        "game_box_scores",
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("built_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("game_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("game_box_scores")
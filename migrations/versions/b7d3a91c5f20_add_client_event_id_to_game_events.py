@@ -0,0 +1,29 @@
+"""add client_event_id to game_events
+
+Revision ID: b7d3a91c5f20
+Revises: 9c41d2b7e6a3
+Create Date: 2026-10-16 14:05:12.482913
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7d3a91c5f20"
+down_revision = "9c41d2b7e6a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Client-assigned event IDs make batched live event uploads idempotent
+    with op.batch_alter_table("game_events", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("client_event_id", sa.String(length=64), nullable=True))
+        batch_op.create_unique_constraint("uq_game_event_client_id", ["game_id", "client_event_id"])
+
+
+def downgrade():
+    with op.batch_alter_table("game_events", schema=None) as batch_op:
+        batch_op.drop_constraint("uq_game_event_client_id", type_="unique")
+        batch_op.drop_column("client_event_id")
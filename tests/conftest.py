@@ -4,14 +4,18 @@ Common test fixtures for the basketball stats tracker application.
 
 import contextlib
 import io
+import logging
 import os
+import random
 import tempfile
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator
+from datetime import date, timedelta
 from typing import Any
 
 import pytest
 from PIL import Image
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 # Import tempfile at the top level
@@ -41,6 +45,8 @@ from app.data_access.models import (  # noqa: F401
     TeamSeasonStats,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.fixture(autouse=True)
 def reset_app_state_globally():
@@ -65,6 +71,16 @@ def reset_app_state_globally():
         except ImportError:
             pass
 
+        # Clear the response cache so pages cached by earlier tests are not served stale
+        from app.web_ui.cache import cache as response_cache
+
+        response_cache.reset()
+
+        # Drop in-memory live game sessions; game ids repeat across test databases
+        from app.services.live_game_session import live_game_sessions
+
+        live_game_sessions.clear()
+
         yield
 
         # Restore original state after test
@@ -405,6 +421,168 @@ def player_stats_factory():
     return _create_player_stats
 
 
+@pytest.fixture
+def seed_league():
+    """
+    Factory for seeding a league of random box scores into a database session.
+
+    Games are spread over the given seasons in turn (or over the calendar from
+    ``start`` when no seasons are given), and every team fields a random
+    selection of its roster in each game.
+
+    Usage:
+        league = seed_league(unit_db_session, num_games=40)
+        league = seed_league(session, num_games=20, seasons=("2023-24", "2024-25"), with_quarters=True)
+    """
+
+    def _seed_league(
+        session: Session,
+        num_games: int,
+        *,
+        seed: int = 0,
+        num_teams: int = 4,
+        players_per_team: int = 6,
+        start: date = date(2024, 11, 4),
+        days_between_games: int = 1,
+        seasons: tuple[str, ...] = (),
+        with_quarters: bool = False,
+    ) -> dict[str, Any]:
+        rng = random.Random(seed)
+        season_rows = [
+            Season(
+                name=f"Season {code}",
+                code=code,
+                start_date=date(int(code[:4]), 10, 1),
+                end_date=date(int(code[:4]) + 1, 5, 31),
+            )
+            for code in seasons
+        ]
+        teams = [Team(name=f"Team {i}", display_name=f"Team Display {i}" if i % 2 else None) for i in range(num_teams)]
+        session.add_all([*season_rows, *teams])
+        session.flush()
+        roster = {
+            team.id: [
+                Player(team_id=team.id, name=f"Player {team.id}-{n}", jersey_number=f"{team.id}{n}")
+                for n in range(players_per_team)
+            ]
+            for team in teams
+        }
+        session.add_all([player for players in roster.values() for player in players])
+
+        games = []
+        for i in range(num_games):
+            home, away = rng.sample(teams, 2)
+            if season_rows:
+                season = season_rows[i % len(season_rows)]
+                game_date = season.start_date + timedelta(days=i // len(season_rows) * days_between_games)
+            else:
+                season = None
+                game_date = start + timedelta(days=i * days_between_games)
+            game = Game(
+                date=game_date,
+                season_id=season.id if season else None,
+                playing_team_id=home.id,
+                opponent_team_id=away.id,
+            )
+            games.append(game)
+        session.add_all(games)
+        session.flush()
+
+        # Quarter lines are generated per quarter; otherwise one line stands for the whole game
+        periods, (max_2pa, max_3pa, max_fta) = (4, (4, 3, 3)) if with_quarters else (1, (12, 8, 8))
+        for game in games:
+            for team_id in (game.playing_team_id, game.opponent_team_id):
+                for player in rng.sample(roster[team_id], rng.randint(1, players_per_team)):
+                    lines = []
+                    for _ in range(periods):
+                        fg2a, fg3a, fta = rng.randint(0, max_2pa), rng.randint(0, max_3pa), rng.randint(0, max_fta)
+                        lines.append(
+                            {
+                                "fg2a": fg2a,
+                                "fg2m": rng.randint(0, fg2a),
+                                "fg3a": fg3a,
+                                "fg3m": rng.randint(0, fg3a),
+                                "fta": fta,
+                                "ftm": rng.randint(0, fta),
+                            }
+                        )
+                    stats = PlayerGameStats(
+                        game_id=game.id,
+                        player_id=player.id,
+                        fouls=rng.randint(0, 5),
+                        total_2pm=sum(line["fg2m"] for line in lines),
+                        total_2pa=sum(line["fg2a"] for line in lines),
+                        total_3pm=sum(line["fg3m"] for line in lines),
+                        total_3pa=sum(line["fg3a"] for line in lines),
+                        total_ftm=sum(line["ftm"] for line in lines),
+                        total_fta=sum(line["fta"] for line in lines),
+                    )
+                    if with_quarters:
+                        stats.quarter_stats = [
+                            PlayerQuarterStats(quarter_number=quarter, **line)
+                            for quarter, line in enumerate(lines, start=1)
+                        ]
+                    session.add(stats)
+        session.commit()
+        return {"seasons": season_rows, "teams": teams, "roster": roster, "games": games}
+
+    return _seed_league
+
+
+@pytest.fixture
+def benchmark_against_legacy():
+    """
+    Run an optimized code path and the legacy path it replaces, and report both.
+
+    Timings are logged, not asserted: a single wall-clock run is too noisy to
+    compare on a loaded runner. When a database ``bind`` is given, the SQL
+    statements each path executes are counted and returned so the caller can
+    assert on the work done instead. Equivalence is checked by the non-slow tests.
+
+    Usage:
+        legacy_statements, statements = benchmark_against_legacy(
+            "team rankings over 600 games", legacy_rankings, service.get_team_rankings, bind=db_session.get_bind()
+        )
+    """
+
+    def _benchmark(
+        label: str, legacy: Callable[[], Any], optimized: Callable[[], Any], bind: Any = None
+    ) -> tuple[int, int]:
+        seconds = []
+        statements: list[list[str]] = []
+        for path in (legacy, optimized):
+            executed: list[str] = []
+            statements.append(executed)
+
+            def record(conn, cursor, statement, *args, executed=executed):
+                executed.append(statement)
+
+            if bind is not None:
+                event.listen(bind, "before_cursor_execute", record)
+            start = time.perf_counter()
+            try:
+                path()
+            finally:
+                seconds.append(time.perf_counter() - start)
+                if bind is not None:
+                    event.remove(bind, "before_cursor_execute", record)
+
+        if bind is None:
+            logger.info("%s: legacy %.3fs, optimized %.3fs", label, *seconds)
+        else:
+            logger.info(
+                "%s: legacy %.3fs (%d statements), optimized %.3fs (%d statements)",
+                label,
+                seconds[0],
+                len(statements[0]),
+                seconds[1],
+                len(statements[1]),
+            )
+        return len(statements[0]), len(statements[1])
+
+    return _benchmark
+
+
 # Legacy fixtures for backward compatibility - DEPRECATED
 @pytest.fixture
 def sample_teams(team_factory) -> list[dict[str, str]]:
@@ -682,6 +860,7 @@ def authenticated_client(integration_db_session, mock_admin_user):
     from fastapi.testclient import TestClient
 
     from app.auth.dependencies import get_current_user
+    from app.dependencies import get_async_db
     from app.web_ui.api import app
     from app.web_ui.dependencies import get_db
 
@@ -697,6 +876,7 @@ def authenticated_client(integration_db_session, mock_admin_user):
                 pass
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db(integration_db_session)
         app.dependency_overrides[get_current_user] = lambda: mock_admin_user
 
         with TestClient(app) as client:
@@ -707,17 +887,47 @@ def authenticated_client(integration_db_session, mock_admin_user):
         app.dependency_overrides.update(original_overrides)
 
 
+class SyncBackedAsyncSession:
+    """AsyncSession stand-in over a sync test session, for routes that use the async session layer."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.session, *args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return self.session.execute(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return self.session.get(*args, **kwargs)
+
+    async def close(self):
+        # The wrapped session belongs to the test fixture
+        pass
+
+
+def override_get_async_db(session: Session):
+    """Build a get_async_db override that serves the given sync test session."""
+
+    async def _get_async_db():
+        yield SyncBackedAsyncSession(session)
+
+    return _get_async_db
+
+
 @pytest.fixture
 def unit_test_client(unit_db_session, unit_db_engine, mock_admin_user, monkeypatch, tmp_path):
     """
     Creates a FastAPI test client for unit tests with in-memory database.
     Each test gets a fresh, isolated database.
     """
-    from contextlib import contextmanager
+    from contextlib import asynccontextmanager, contextmanager
 
     from fastapi.testclient import TestClient
 
     from app.auth.dependencies import get_current_user
+    from app.dependencies import get_async_db
     from app.web_ui.api import app
     from app.web_ui.dependencies import get_db
 
@@ -729,6 +939,11 @@ def unit_test_client(unit_db_session, unit_db_engine, mock_admin_user, monkeypat
         finally:
             pass
 
+    # Async routes get the same session behind the AsyncSession methods they use
+    @asynccontextmanager
+    async def test_get_async_db_session():
+        yield SyncBackedAsyncSession(unit_db_session)
+
     # Set up a temporary upload directory for tests
     test_upload_dir = tmp_path / "test_uploads"
     test_upload_dir.mkdir(exist_ok=True)
@@ -762,6 +977,8 @@ def unit_test_client(unit_db_session, unit_db_engine, mock_admin_user, monkeypat
     for module in modules_to_patch:
         if hasattr(module, "get_db_session"):
             monkeypatch.setattr(module, "get_db_session", test_get_db_session)
+        if hasattr(module, "get_async_db_session"):
+            monkeypatch.setattr(module, "get_async_db_session", test_get_async_db_session)
 
     # Store original overrides
     original_overrides = app.dependency_overrides.copy()
@@ -776,6 +993,7 @@ def unit_test_client(unit_db_session, unit_db_engine, mock_admin_user, monkeypat
                 pass
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db(unit_db_session)
         app.dependency_overrides[get_current_user] = lambda: mock_admin_user
 
         with TestClient(app) as client:
@@ -794,6 +1012,7 @@ def unauthenticated_client(integration_db_session):
     """
     from fastapi.testclient import TestClient
 
+    from app.dependencies import get_async_db
     from app.web_ui.api import app
     from app.web_ui.dependencies import get_db
 
@@ -801,7 +1020,7 @@ def unauthenticated_client(integration_db_session):
     original_overrides = app.dependency_overrides.copy()
 
     try:
-        # Override only database dependency
+        # Override only database dependencies
         def override_get_db():
             try:
                 yield integration_db_session
@@ -809,6 +1028,7 @@ def unauthenticated_client(integration_db_session):
                 pass
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db(integration_db_session)
 
         with TestClient(app) as client:
             yield client
@@ -828,6 +1048,7 @@ def unit_unauthenticated_client(unit_db_session):
     from fastapi.testclient import TestClient
 
     from app.auth.dependencies import get_current_user, require_admin
+    from app.dependencies import get_async_db
     from app.web_ui.api import app
     from app.web_ui.dependencies import get_db
 
@@ -840,6 +1061,7 @@ def unit_unauthenticated_client(unit_db_session):
 
     try:
         app.dependency_overrides[get_db] = lambda: unit_db_session
+        app.dependency_overrides[get_async_db] = override_get_async_db(unit_db_session)
         app.dependency_overrides[get_current_user] = mock_unauthenticated
         app.dependency_overrides[require_admin] = mock_unauthenticated
 
@@ -861,6 +1083,7 @@ def non_admin_client(unit_db_session, mock_regular_user):
     from fastapi.testclient import TestClient
 
     from app.auth.dependencies import get_current_user, require_admin
+    from app.dependencies import get_async_db
     from app.web_ui.api import app
     from app.web_ui.dependencies import get_db
 
@@ -873,6 +1096,7 @@ def non_admin_client(unit_db_session, mock_regular_user):
 
     try:
         app.dependency_overrides[get_db] = lambda: unit_db_session
+        app.dependency_overrides[get_async_db] = override_get_async_db(unit_db_session)
         app.dependency_overrides[get_current_user] = lambda: mock_regular_user
         app.dependency_overrides[require_admin] = mock_require_admin
 
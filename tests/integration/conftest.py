@@ -42,3 +42,36 @@ def isolated_unauthenticated_client(unauthenticated_client):
     This fixture is kept for backward compatibility but should be removed.
     """
     return unauthenticated_client
+
+
+@pytest.fixture
+def season_matrices_factory():
+    """
+    Factory for the season awards engine matrices of mocked game lines (one per player).
+
+    Usage:
+        mock_load_matrices.return_value = season_matrices_factory("2024", mock_game_stat)
+    """
+
+    def _season_matrices_for(season, *game_stats):
+        return {
+            season: {
+                "player_id": [stat.player_id for stat in game_stats],
+                "games": [1 for _ in game_stats],
+                "fouls": [stat.fouls for stat in game_stats],
+                "ftm": [stat.total_ftm for stat in game_stats],
+                "fta": [stat.total_fta for stat in game_stats],
+                "fg2m": [stat.total_2pm for stat in game_stats],
+                "fg2a": [stat.total_2pa for stat in game_stats],
+                "fg3m": [stat.total_3pm for stat in game_stats],
+                "fg3a": [stat.total_3pa for stat in game_stats],
+                "points": [stat.total_ftm + stat.total_2pm * 2 + stat.total_3pm * 3 for stat in game_stats],
+                "fgm": [stat.total_2pm + stat.total_3pm for stat in game_stats],
+                "fga": [stat.total_2pa + stat.total_3pa for stat in game_stats],
+                "fg3_misses": [stat.total_3pa - stat.total_3pm for stat in game_stats],
+                "ft_misses": [stat.total_fta - stat.total_ftm for stat in game_stats],
+                "attempts": [stat.total_2pa + stat.total_3pa + stat.total_fta for stat in game_stats],
+            }
+        }
+
+    return _season_matrices_for
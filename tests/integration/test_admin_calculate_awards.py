@@ -5,16 +5,41 @@ Integration tests for admin calculate awards functionality.
 These tests verify the complete end-to-end flow that the admin UI button triggers.
 """
 
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import Mock, patch
 
 from app.services.awards_service import calculate_all_season_awards, calculate_all_weekly_awards
 
 
+def _weekly_frames_for(game, game_stat, quarter_stat):
+    """Build the weekly awards engine frame for a single mocked game line."""
+    quarter_points = quarter_stat.fg2m * 2 + quarter_stat.fg3m * 3 + quarter_stat.ftm
+    week_start = game.date - timedelta(days=game.date.weekday())
+    return {
+        (str(game.date.year), week_start): {
+            "game_id": [1],
+            "game_date": [game.date],
+            "player_id": [game_stat.player_id],
+            "ftm": [game_stat.total_ftm],
+            "fta": [game_stat.total_fta],
+            "fg2m": [game_stat.total_2pm],
+            "fg2a": [game_stat.total_2pa],
+            "fg3m": [game_stat.total_3pm],
+            "fg3a": [game_stat.total_3pa],
+            "points": [game_stat.total_ftm + game_stat.total_2pm * 2 + game_stat.total_3pm * 3],
+            "fgm": [game_stat.total_2pm + game_stat.total_3pm],
+            "fga": [game_stat.total_2pa + game_stat.total_3pa],
+            "misses": [(game_stat.total_2pa - game_stat.total_2pm) + (game_stat.total_3pa - game_stat.total_3pm)],
+            "max_quarter_points": [quarter_points],
+            "q4_points": [quarter_points if quarter_stat.quarter_number == 4 else None],
+        }
+    }
+
+
 class TestAdminCalculateAwards:
     """Integration tests for admin calculate awards button functionality."""
 
-    def test_calculate_all_season_awards_button_flow(self):
+    def test_calculate_all_season_awards_button_flow(self, season_matrices_factory):
         """Test the complete flow when admin clicks 'calculate current season' button."""
         mock_session = Mock()
 
@@ -52,15 +77,10 @@ class TestAdminCalculateAwards:
         mock_player.name = "Test Player"
 
         with (
-            patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games,
-            patch("app.services.awards_service.get_season_from_date") as mock_get_season,
-            patch("app.services.awards_service.create_player_award_safe") as mock_create_award,
-            patch("app.data_access.crud.crud_player_award.get_season_awards") as mock_get_awards,
+            patch("app.services.season_awards_engine.load_season_matrices") as mock_load_matrices,
+            patch("app.services.season_awards_engine.create_player_awards_batch") as mock_create_batch,
         ):
-            mock_get_games.return_value = [mock_game]
-            mock_get_season.return_value = "2024"
-            mock_get_awards.return_value = []  # No existing awards
-            mock_create_award.return_value = Mock()  # Successful creation
+            mock_load_matrices.return_value = season_matrices_factory("2024", mock_game_stat)
 
             # This is what the admin button calls
             result = calculate_all_season_awards(mock_session, season="2024", recalculate=False)
@@ -86,6 +106,15 @@ class TestAdminCalculateAwards:
             for award_type in expected_awards:
                 assert award_type in result
 
+            # Every award was written in a single batch
+            mock_create_batch.assert_called_once()
+            written = mock_create_batch.call_args.args[1]
+            # Rick Barry (10+ FTA) and Defensive Tackle (10+ fouls) have no qualifier here
+            assert {award["award_type"] for award in written} == set(expected_awards) - {
+                "rick_barry_award",
+                "defensive_tackle",
+            }
+
     def test_calculate_weekly_awards_button_flow(self):
         """Test the weekly awards calculation flow."""
         mock_session = Mock()
@@ -119,12 +148,17 @@ class TestAdminCalculateAwards:
             patch("app.services.awards_service.create_player_award_safe") as mock_create_award,
             patch("app.services.awards_service.get_awards_by_week") as mock_get_awards,
             patch("app.services.awards_service.delete_all_awards_by_type") as mock_delete,
+            patch("app.services.weekly_awards_engine.load_weekly_frames") as mock_load_frames,
+            patch("app.services.weekly_awards_engine.create_player_awards_batch") as mock_create_batch,
+            patch("app.services.weekly_awards_engine.count_awards_by_week") as mock_count_awards,
         ):
             mock_get_games.return_value = [mock_game]
             mock_get_player.return_value = Mock(id=1, name="Test Player")
             mock_create_award.return_value = Mock()
             mock_get_awards.return_value = [Mock()]  # One award per type
             mock_delete.return_value = 0
+            mock_load_frames.return_value = _weekly_frames_for(mock_game, mock_game_stat, mock_quarter_stat)
+            mock_count_awards.return_value = {}
 
             # Test all weekly awards calculation
             result = calculate_all_weekly_awards(mock_session, season="2024", recalculate=False)
@@ -154,6 +188,10 @@ class TestAdminCalculateAwards:
             for award_type in expected_weekly_awards:
                 assert award_type in result
 
+            # Winners from the single scan are written in one batch
+            written = mock_create_batch.call_args[0][1]
+            assert {award["award_type"] for award in written} >= {"player_of_the_week", "clutch_man", "dub_club"}
+
     def test_quarterly_firepower_calculation_with_correct_attributes(self):
         """Test quarterly firepower specifically uses correct PlayerQuarterStats attributes."""
         mock_session = Mock()
@@ -226,7 +264,7 @@ class TestAdminCalculateAwards:
             assert isinstance(result, dict)
             assert "2024" in result
 
-    def test_complete_admin_awards_flow_integration(self):
+    def test_complete_admin_awards_flow_integration(self, season_matrices_factory):
         """Test the complete flow that admin UI triggers: both season and weekly awards."""
         mock_session = Mock()
 
@@ -258,26 +296,26 @@ class TestAdminCalculateAwards:
 
         # Test both season and weekly awards in sequence (like admin UI does)
         with (
-            patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games_season,
-            patch("app.services.awards_service.get_season_from_date") as mock_get_season,
-            patch("app.services.awards_service.create_player_award_safe") as mock_create_season,
-            patch("app.data_access.crud.crud_player_award.get_season_awards") as mock_get_season_awards,
+            patch("app.services.season_awards_engine.load_season_matrices") as mock_load_matrices,
+            patch("app.services.season_awards_engine.create_player_awards_batch"),
             patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games_weekly,
             patch("app.services.awards_service.crud_player.get_player_by_id") as mock_get_player,
             patch("app.services.awards_service.create_player_award_safe") as mock_create_weekly,
             patch("app.services.awards_service.get_awards_by_week") as mock_get_weekly_awards,
             patch("app.services.awards_service.delete_all_awards_by_type") as mock_delete,
+            patch("app.services.weekly_awards_engine.load_weekly_frames") as mock_load_frames,
+            patch("app.services.weekly_awards_engine.create_player_awards_batch"),
+            patch("app.services.weekly_awards_engine.count_awards_by_week") as mock_count_awards,
         ):
             # Setup mocks
-            mock_get_games_season.return_value = [mock_game]
+            mock_load_matrices.return_value = season_matrices_factory("2024", mock_game_stat)
             mock_get_games_weekly.return_value = [mock_game]
-            mock_get_season.return_value = "2024"
-            mock_get_season_awards.return_value = []
-            mock_create_season.return_value = Mock()
             mock_get_player.return_value = Mock(id=1, name="Test Player")
             mock_create_weekly.return_value = Mock()
             mock_get_weekly_awards.return_value = [Mock()]
             mock_delete.return_value = 0
+            mock_load_frames.return_value = _weekly_frames_for(mock_game, mock_game_stat, mock_quarter_stat)
+            mock_count_awards.return_value = {}
 
             # Calculate season awards (what admin button does first)
             season_result = calculate_all_season_awards(mock_session, season="2024", recalculate=False)
@@ -7,7 +7,7 @@ authentication, database access, and business logic.
 """
 
 from datetime import date
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -329,7 +329,7 @@ class TestAPIEndpoints:
         assert response.status_code == 404
         assert "Game not found" in response.json()["detail"]
 
-    @patch("app.web_ui.routers.games.ReportGenerator")
+    @patch("app.services.box_score_service.ReportGenerator")
     def test_get_box_score_endpoint(self, mock_report_gen_class, client, sample_game, sample_team, sample_game_stats):
         """Test the get box score endpoint."""
         # Mock report generator
@@ -386,9 +386,9 @@ class TestAPIEndpoints:
         # Check that we have player data
         assert "players" in data["home_team"]
         # The mock should have returned 2 players
-        mock_report_gen.get_game_box_score_data.assert_called_once_with(sample_game.id)
+        mock_report_gen.get_game_box_score_data.assert_called_once_with(sample_game.id, bundle=ANY)
 
-    @patch("app.web_ui.routers.games.ReportGenerator")
+    @patch("app.services.box_score_service.ReportGenerator")
     def test_get_box_score_not_found(self, mock_report_gen_class, client):
         """Test the get box score endpoint when game not found."""
         # Mock report generator to return None
@@ -70,7 +70,7 @@ class TestAwardsCalculationEndToEnd:
             except Exception as e:
                 pytest.fail(f"❌ Unexpected error in weekly awards calculation: {e}")
 
-    def test_season_awards_calculation_e2e_mock(self):
+    def test_season_awards_calculation_e2e_mock(self, season_matrices_factory):
         """Test season awards calculation end-to-end with mocked data."""
         # Mock PlayerGameStats with ALL required attributes
         mock_game_stat = Mock()
@@ -91,15 +91,10 @@ class TestAwardsCalculationEndToEnd:
         mock_session = Mock()
 
         with (
-            patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games,
-            patch("app.services.awards_service.get_season_from_date") as mock_get_season,
-            patch("app.data_access.crud.crud_player_award.get_season_awards") as mock_get_awards,
-            patch("app.services.awards_service.create_player_award_safe") as mock_create_award,
+            patch("app.services.season_awards_engine.load_season_matrices") as mock_load_matrices,
+            patch("app.services.season_awards_engine.create_player_awards_batch"),
         ):
-            mock_get_games.return_value = [mock_game]
-            mock_get_season.return_value = "2024"
-            mock_get_awards.return_value = []  # No existing awards
-            mock_create_award.return_value = Mock()  # Successful creation
+            mock_load_matrices.return_value = season_matrices_factory("2024", mock_game_stat)
 
             # This should not raise any AttributeError
             try:
@@ -135,16 +130,11 @@ class TestAwardsCalculationEndToEnd:
 
             # 2. Calculate season awards
             with (
-                patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games,
-                patch("app.services.awards_service.get_season_from_date") as mock_get_season,
-                patch("app.data_access.crud.crud_player_award.get_season_awards") as mock_get_awards,
-                patch("app.services.awards_service.create_player_award_safe") as mock_create_award,
+                patch("app.services.season_awards_engine.load_season_matrices") as mock_load_matrices,
+                patch("app.services.season_awards_engine.create_player_awards_batch"),
             ):
                 # Mock minimal data for season calculation
-                mock_get_games.return_value = []
-                mock_get_season.return_value = "2024"
-                mock_get_awards.return_value = []
-                mock_create_award.return_value = Mock()
+                mock_load_matrices.return_value = {}
 
                 season_result = calculate_all_season_awards(mock_session, season="2024", recalculate=False)
 
@@ -158,7 +148,7 @@ class TestAwardsCalculationEndToEnd:
         except Exception as e:
             pytest.fail(f"❌ Unexpected error in comprehensive awards flow: {e}")
 
-    def test_calculate_all_season_awards_full_integration(self):
+    def test_calculate_all_season_awards_full_integration(self, season_matrices_factory):
         """Test complete calculate_all_season_awards function integration."""
         # Create comprehensive mock data for all 8 season awards
         mock_stat1 = Mock()
@@ -192,15 +182,10 @@ class TestAwardsCalculationEndToEnd:
         mock_session = Mock()
 
         with (
-            patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games,
-            patch("app.services.awards_service.get_season_from_date") as mock_get_season,
-            patch("app.data_access.crud.crud_player_award.get_season_awards") as mock_get_awards,
-            patch("app.services.awards_service.create_player_award_safe") as mock_create_award,
+            patch("app.services.season_awards_engine.load_season_matrices") as mock_load_matrices,
+            patch("app.services.season_awards_engine.create_player_awards_batch") as mock_create_batch,
         ):
-            mock_get_games.return_value = [mock_game1, mock_game2]
-            mock_get_season.return_value = "2024"
-            mock_get_awards.return_value = []  # No existing awards
-            mock_create_award.return_value = Mock()  # Successful creation
+            mock_load_matrices.return_value = season_matrices_factory("2024", mock_stat1, mock_stat2)
 
             # Test the full integration
             result = calculate_all_season_awards(mock_session, season="2024", recalculate=False)
@@ -216,8 +201,9 @@ class TestAwardsCalculationEndToEnd:
                 assert award_type in result, f"Missing award type: {award_type}"
                 assert isinstance(result[award_type], dict), f"Expected dict for {award_type}: {result[award_type]}"
 
-            # Verify create_player_award_safe was called for each award (may be more than 9 due to ties)
-            assert mock_create_award.call_count >= 9
+            # Verify awards were written in one batch (may be more than 9 due to ties)
+            mock_create_batch.assert_called_once()
+            assert len(mock_create_batch.call_args.args[1]) >= 9
 
             print(f"✅ Season awards integration test passed: {result}")
 
@@ -61,7 +61,7 @@ class TestAwardsIntegrationSimple:
             # Verify the award was attempted to be created
             mock_create_award.assert_called_once()
 
-    def test_calculate_all_season_awards_with_mock_data(self):
+    def test_calculate_all_season_awards_with_mock_data(self, season_matrices_factory):
         """Test season awards calculation with mocked database data."""
         mock_session = Mock()
 
@@ -81,15 +81,10 @@ class TestAwardsIntegrationSimple:
         mock_game.player_game_stats = [mock_game_stat]
 
         with (
-            patch("app.services.awards_service.crud_game.get_all_games") as mock_get_games,
-            patch("app.services.awards_service.get_season_from_date") as mock_get_season,
-            patch("app.data_access.crud.crud_player_award.get_season_awards") as mock_get_awards,
-            patch("app.services.awards_service.create_player_award_safe") as mock_create_award,
+            patch("app.services.season_awards_engine.load_season_matrices") as mock_load_matrices,
+            patch("app.services.season_awards_engine.create_player_awards_batch") as mock_create_batch,
         ):
-            mock_get_games.return_value = [mock_game]
-            mock_get_season.return_value = "2024"
-            mock_get_awards.return_value = []  # No existing awards
-            mock_create_award.return_value = Mock()  # Successful creation
+            mock_load_matrices.return_value = season_matrices_factory("2024", mock_game_stat)
 
             # Should complete without errors
             result = calculate_all_season_awards(mock_session, season="2024", recalculate=False)
@@ -109,8 +104,9 @@ class TestAwardsIntegrationSimple:
             for award_type in expected_awards:
                 assert award_type in result
 
-            # Should have called create_player_award_safe for each award
-            assert mock_create_award.call_count >= 8
+            # Should have written a winner for each award in one batch
+            mock_create_batch.assert_called_once()
+            assert len(mock_create_batch.call_args.args[1]) >= 8
 
     def test_calculate_dub_club_integration(self):
         """Test Dub Club calculation with mocked database data."""
@@ -18,9 +18,12 @@ def test_client(test_db_file_engine, monkeypatch):
     """Create a test client with proper database dependency override."""
     from contextlib import contextmanager
 
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
     from sqlalchemy.orm import Session
+    from sqlalchemy.pool import NullPool
 
-    from app.dependencies import get_db
+    from app.data_access.database_manager import async_database_url
+    from app.dependencies import get_async_db, get_db
 
     # Create a context manager that yields a new session connected to the same db
     @contextmanager
@@ -49,6 +52,18 @@ def test_client(test_db_file_engine, monkeypatch):
 
     app.dependency_overrides[get_db] = override_get_db
 
+    # Async endpoints read the same database file through the async driver
+    async_engine = create_async_engine(
+        async_database_url(test_db_file_engine.url.render_as_string(hide_password=False)), poolclass=NullPool
+    )
+    async_session_local = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with async_session_local() as new_session:
+            yield new_session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
     # Override authentication dependencies for testing
     from app.auth.dependencies import get_current_user, require_admin
     from app.auth.models import User, UserRole
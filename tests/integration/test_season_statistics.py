@@ -2,7 +2,7 @@
 
 import datetime as dt
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from sqlalchemy.orm import Session
@@ -378,9 +378,18 @@ class TestSeasonStatisticsIntegration:
 
     def test_cli_update_season_stats(self, test_db_file_session: Session, setup_test_data, cli_runner: CliRunner):
         """Test CLI command to update season statistics."""
-        # Mock the update_all_season_stats method
-        with patch("app.services.season_stats_service.SeasonStatsService.update_all_season_stats") as mock_update:
-            mock_update.return_value = None  # Method doesn't return anything
+        # Mock the bulk rebuild method
+        with patch("app.services.season_stats_service.SeasonStatsService.rebuild_season_stats") as mock_update:
+            mock_update.return_value = {
+                "players": 4,
+                "teams": 2,
+                "inserted": 6,
+                "updated": 0,
+                "deleted": 0,
+                "rows": 6,
+                "elapsed": 0.01,
+                "rows_per_second": 600.0,
+            }
 
             # Run update command
             result = cli_runner.invoke(cli, ["update-season-stats", "--season", "2024-2025"])
@@ -390,7 +399,7 @@ class TestSeasonStatisticsIntegration:
             assert "Season statistics updated successfully!" in result.output
 
             # Verify the method was called with correct season
-            mock_update.assert_called_once_with("2024-2025")
+            mock_update.assert_called_once_with("2024-2025", batch_size=500, progress_callback=ANY)
 
     def test_season_detection(self, test_db_file_session: Session):
         """Test automatic season detection based on game dates."""
@@ -33,7 +33,7 @@ def test_import_game_command_success(cli_runner, mock_import_game_stats):
 
     # Assertions
     assert result.exit_code == 0
-    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", False)
+    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", False, False)
 
 
 def test_import_game_command_failure(cli_runner, mock_import_game_stats):
@@ -46,7 +46,7 @@ def test_import_game_command_failure(cli_runner, mock_import_game_stats):
 
     # Assertions
     assert result.exit_code == 0  # Typer still returns 0 even if our function returns False
-    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", False)
+    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", False, False)
 
 
 def test_import_game_command_dry_run(cli_runner, mock_import_game_stats):
@@ -59,7 +59,7 @@ def test_import_game_command_dry_run(cli_runner, mock_import_game_stats):
 
     # Assertions
     assert result.exit_code == 0
-    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", True)
+    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", True, False)
 
 
 def test_import_game_command_missing_file(cli_runner):
@@ -70,3 +70,13 @@ def test_import_game_command_missing_file(cli_runner):
     # Assertions
     assert result.exit_code != 0
     assert "Missing option" in result.output
+
+
+def test_import_game_command_stream(cli_runner, mock_import_game_stats):
+    """Test the import-game command with streaming enabled."""
+    mock_import_game_stats.return_value = True
+
+    result = cli_runner.invoke(cli, ["import-game", "--file", "game_stats_template.csv", "--stream"])
+
+    assert result.exit_code == 0
+    mock_import_game_stats.assert_called_once_with("game_stats_template.csv", False, True)
@@ -0,0 +1,96 @@
+"""
+Test module for the async CRUD read operations.
+"""
+
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.data_access import async_crud
+from app.data_access.database_manager import build_async_engine
+from app.data_access.models import Base, Game, Player, PlayerGameStats, PlayerQuarterStats, Team
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    """A file database seeded with one game between two teams."""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        home, away = Team(name="Home"), Team(name="Away", display_name="Visitors")
+        session.add_all([home, away])
+        session.flush()
+        players = [
+            Player(name="Ann", jersey_number="1", team_id=home.id),
+            Player(name="Bea", jersey_number="2", team_id=away.id),
+        ]
+        game = Game(date=date(2025, 1, 5), playing_team_id=home.id, opponent_team_id=away.id)
+        session.add_all([*players, game])
+        session.flush()
+        for player in players:
+            line = PlayerGameStats(game_id=game.id, player_id=player.id, fouls=1, total_2pm=2, total_2pa=4)
+            session.add(line)
+            session.flush()
+            for quarter in (2, 1):
+                session.add(PlayerQuarterStats(player_game_stat_id=line.id, quarter_number=quarter, fg2m=1, fg2a=2))
+        session.commit()
+    engine.dispose()
+    return url
+
+
+@pytest_asyncio.fixture
+async def async_session(db_url):
+    """An AsyncSession on the aiosqlite driver."""
+    engine = build_async_engine(db_url)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+class TestAsyncCrud:
+    """Tests for async CRUD reads and their eager loading."""
+
+    @pytest.mark.asyncio
+    async def test_get_game_by_id_loads_teams(self, async_session):
+        """Both teams are readable without lazy loading."""
+        game = await async_crud.get_game_by_id(async_session, 1)
+
+        assert game.playing_team.name == "Home"
+        assert game.opponent_team.display_name == "Visitors"
+        assert await async_crud.get_game_by_id(async_session, 99) is None
+
+    @pytest.mark.asyncio
+    async def test_player_game_stats_by_game_loads_players(self, async_session):
+        """Stat lines come with their players, as score calculation needs the player's team."""
+        lines = await async_crud.get_player_game_stats_by_game(async_session, 1)
+
+        assert sorted(line.player.name for line in lines) == ["Ann", "Bea"]
+
+    @pytest.mark.asyncio
+    async def test_quarter_stats_by_game_are_ordered(self, async_session):
+        """All quarter lines for a game come back in one ordered list."""
+        quarters = await async_crud.get_quarter_stats_by_game(async_session, 1)
+
+        assert [(q.player_game_stat_id, q.quarter_number) for q in quarters] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_get_teams_by_ids(self, async_session):
+        """Teams are returned keyed by ID, skipping unknown IDs."""
+        teams = await async_crud.get_teams_by_ids(async_session, [1, 2, 3])
+
+        assert {team_id: team.name for team_id, team in teams.items()} == {1: "Home", 2: "Away"}
+        assert await async_crud.get_teams_by_ids(async_session, []) == {}
+
+    @pytest.mark.asyncio
+    async def test_run_sync_reuses_sync_code(self, async_session):
+        """Sync query code runs over the async connection through run_sync."""
+
+        def count_games(session):
+            return session.query(Game).count()
+
+        assert await async_session.run_sync(count_games) == 1
@@ -18,6 +18,7 @@ from app.data_access.crud.crud_player_award import (
     get_player_awards_by_season,
     get_player_awards_by_type,
     get_recent_awards,
+    replace_award_slices,
 )
 
 
@@ -244,6 +245,47 @@ class TestDeletePlayerAwards:
         assert awards[0].week_date == date(2024, 1, 1)
 
 
+class TestReplaceAwardSlices:
+    """Test replacing whole (award_type, season) slices of awards."""
+
+    def test_replaces_only_the_given_slices(self, unit_db_session, shared_test_player):
+        """Awards in the slice are swapped out; other types and seasons are untouched."""
+        player_id = shared_test_player.id
+        create_player_award(unit_db_session, player_id, "2024", "player_of_the_week", date(2024, 1, 1), 25)
+        create_player_award(unit_db_session, player_id, "2023", "player_of_the_week", date(2023, 1, 2), 20)
+        create_player_award(unit_db_session, player_id, "2024", "dub_club", date(2024, 1, 1), 25)
+
+        awards = [
+            {
+                "player_id": player_id,
+                "season": "2024",
+                "award_type": "player_of_the_week",
+                "week_date": week_date,
+                "points_scored": 30,
+                "stat_value": 30.0,
+            }
+            for week_date in (date(2024, 1, 8), date(2024, 1, 15), date(2024, 1, 15))
+        ]
+        counts = replace_award_slices(unit_db_session, awards)
+
+        assert counts == {("player_of_the_week", "2024"): 2}
+        potw_2024 = get_awards_by_week(unit_db_session, "player_of_the_week", date(2024, 1, 8), "2024")
+        assert len(potw_2024) == 1
+        assert potw_2024[0].stat_value == 30.0
+        assert get_awards_by_week(unit_db_session, "player_of_the_week", date(2024, 1, 1), "2024") == []
+        assert len(get_player_awards_by_season(unit_db_session, player_id, "2023")) == 1
+        assert len(get_player_awards_by_type(unit_db_session, player_id, "dub_club")) == 1
+
+    def test_explicit_slices_clear_awards_without_winners(self, unit_db_session, shared_test_player):
+        """An explicit slice is emptied even when no new records are written for it."""
+        player_id = shared_test_player.id
+        create_player_award(unit_db_session, player_id, "2024", "dub_club", date(2024, 1, 1), 25)
+        create_player_award(unit_db_session, player_id, "2023", "dub_club", date(2023, 1, 2), 22)
+
+        assert replace_award_slices(unit_db_session, [], [("dub_club", None)]) == {}
+        assert count_awards_for_player(unit_db_session, player_id, "dub_club") == 0
+
+
 class TestAwardUtilities:
     """Test utility functions for awards."""
 
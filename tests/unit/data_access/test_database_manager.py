@@ -0,0 +1,115 @@
+# tests/unit/data_access/test_database_manager.py
+
+"""Unit tests for the engine registry and pool configuration."""
+
+import pytest
+from sqlalchemy import text
+
+from app.data_access.database_manager import (
+    DatabaseManager,
+    EngineRegistry,
+    InstrumentedQueuePool,
+    async_database_url,
+    is_memory_sqlite,
+)
+
+
+@pytest.fixture
+def registry():
+    """A registry whose engines are disposed after the test."""
+    instance = EngineRegistry()
+    yield instance
+    instance.dispose_all()
+
+
+class TestEngineRegistry:
+    """Tests for engine reuse, pool settings and SQLite pragmas."""
+
+    def test_engine_is_reused_per_url(self, registry, tmp_path):
+        """The same URL returns the same engine; another URL gets its own."""
+        first_url = f"sqlite:///{tmp_path / 'first.db'}"
+        second_url = f"sqlite:///{tmp_path / 'second.db'}"
+
+        assert registry.get_engine(first_url) is registry.get_engine(first_url)
+        assert registry.get_engine(first_url) is not registry.get_engine(second_url)
+
+    def test_database_managers_share_engines(self, tmp_path, monkeypatch):
+        """Separate DatabaseManager instances do not build separate engines."""
+        from app.data_access import database_manager
+
+        monkeypatch.setattr(database_manager, "engine_registry", EngineRegistry())
+        db_url = f"sqlite:///{tmp_path / 'shared.db'}"
+
+        assert DatabaseManager().get_engine(db_url) is DatabaseManager().get_engine(db_url)
+        database_manager.engine_registry.dispose_all()
+
+    def test_file_sqlite_uses_configured_pool_and_pragmas(self, registry, tmp_path, monkeypatch):
+        """File databases get the instrumented pool sized from settings and the SQLite pragmas."""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+        monkeypatch.setattr(settings, "SQLITE_MMAP_SIZE", 1024 * 1024)
+        engine = registry.get_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        assert engine.pool.size() == 3
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert connection.execute(text("PRAGMA mmap_size")).scalar() == 1024 * 1024
+
+    def test_memory_sqlite_keeps_default_pool(self, registry):
+        """In-memory databases are not given a queue pool they cannot share."""
+        engine = registry.get_engine("sqlite:///:memory:")
+
+        assert not isinstance(engine.pool, InstrumentedQueuePool)
+        stats = registry.pool_stats()[engine.url.render_as_string(hide_password=True)]
+        assert stats["pool_class"] == type(engine.pool).__name__
+
+    @pytest.mark.parametrize(
+        ("db_url", "expected"),
+        [
+            ("sqlite://", True),
+            ("sqlite:///:memory:", True),
+            ("sqlite:///file:awards?mode=memory&cache=shared&uri=true", True),
+            ("sqlite:///data/league_stats.db", False),
+            ("postgresql://user:pw@db:5432/stats", False),
+        ],
+    )
+    def test_is_memory_sqlite(self, db_url, expected):
+        """Only in-memory SQLite databases are private to their connection."""
+        assert is_memory_sqlite(db_url) is expected
+
+    def test_pool_stats_report_checkouts(self, registry, tmp_path):
+        """Checkouts and new connections are counted, and survive a dispose."""
+        db_url = f"sqlite:///{tmp_path / 'metrics.db'}"
+        engine = registry.get_engine(db_url)
+        for _ in range(3):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        engine.dispose()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        stats = registry.pool_stats()[db_url]
+        assert stats["checkouts"] == 4
+        assert stats["connects"] == 2
+        assert stats["timeouts"] == 0
+        assert stats["checked_out"] == 0
+
+    @pytest.mark.parametrize(
+        ("db_url", "expected"),
+        [
+            ("sqlite:///data/league_stats.db", "sqlite+aiosqlite:///data/league_stats.db"),
+            ("postgresql://user:pw@db:5432/stats", "postgresql+asyncpg://user:***@db:5432/stats"),
+            ("postgresql+psycopg2://user:pw@db/stats", "postgresql+asyncpg://user:***@db/stats"),
+        ],
+    )
+    def test_async_database_url_swaps_driver(self, db_url, expected):
+        """Sync URLs map to the async driver for their backend."""
+        assert async_database_url(db_url).render_as_string(hide_password=True) == expected
+
+    def test_async_database_url_rejects_unknown_backend(self):
+        """Backends without a configured async driver are rejected."""
+        with pytest.raises(ValueError):
+            async_database_url("mysql://user@db/stats")
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Team
 from app.reports.report_generator import ReportGenerator
+from app.repositories.box_score import BoxScoreBundle, PlayerInfo, PlayerLine, QuarterLine, TeamInfo
 from app.utils import stats_calculator
 
 
@@ -203,78 +204,42 @@ class TestReportGenerator:
         """Mock for crud_player_quarter_stats module"""
         return MagicMock()
 
-    @patch("app.reports.report_generator.crud_game")
-    @patch("app.reports.report_generator.crud_team")
-    @patch("app.reports.report_generator.crud_player")
-    @patch("app.reports.report_generator.crud_player_game_stats")
-    @patch("app.reports.report_generator.crud_player_quarter_stats")
-    def test_get_game_box_score_data_with_mocks(
-        self,
-        mock_crud_pqs,
-        mock_crud_pgs,
-        mock_crud_player,
-        mock_crud_team,
-        mock_crud_game,
-        db_session,
-        mock_stats_calculator,
-        mock_game_data,
-        mock_quarter_stats,
-    ):
-        """Test getting game box score data."""
-        # Set up the CRUD mocks
-        mock_crud_game.get_game_by_id.return_value = mock_game_data["game"]
-        mock_crud_team.get_team_by_id.side_effect = lambda session, team_id: (
-            mock_game_data["teams"][0] if team_id == 1 else mock_game_data["teams"][1] if team_id == 2 else None
+    def test_get_game_box_score_data_from_database(self, db_session, mock_stats_calculator):
+        """Test getting game box score data loaded through the box score bundle."""
+        db_session.add_all(
+            [
+                Team(id=1, name="Team A", display_name="Team Alpha"),
+                Team(id=2, name="Team B", display_name="Team Beta"),
+                Player(id=1, name="Player One", jersey_number="10", team_id=1),
+                Game(id=1, date=datetime(2025, 5, 1).date(), playing_team_id=1, opponent_team_id=2),
+                PlayerGameStats(id=1, game_id=1, player_id=1, fouls=2),
+            ]
         )
-        mock_crud_player.get_player_by_id.side_effect = lambda session, player_id: (
-            next((p for p in mock_game_data["players"] if p.id == player_id), None)
+        db_session.add_all(
+            [
+                PlayerQuarterStats(
+                    player_game_stat_id=1, quarter_number=q, ftm=1, fta=2, fg2m=2, fg2a=4, fg3m=1, fg3a=2
+                )
+                for q in range(1, 5)
+            ]
         )
+        db_session.commit()
 
-        # Make sure we have player game stats
-        pgs = MagicMock(spec=PlayerGameStats)
-        pgs.id = 1
-        pgs.player_id = mock_game_data["players"][0].id
-        pgs.game_id = mock_game_data["game"].id
-        pgs.fouls = 2
-        mock_crud_pgs.get_player_game_stats_by_game.return_value = [pgs]
-
-        # Set up quarter stats
-        quarter_stats = [
-            MagicMock(player_game_stats_id=pgs.id, quarter_number=q, ftm=1, fta=2, fg2m=2, fg2a=4, fg3m=1, fg3a=2)
-            for q in range(1, 5)
-        ]
-        mock_crud_pqs.get_player_quarter_stats.return_value = quarter_stats
-
-        # Set up stats calculator
-        mock_stats_calculator.calculate_percentage.return_value = 0.5
-        mock_stats_calculator.calculate_points.return_value = 20
-        mock_stats_calculator.calculate_efg.return_value = 0.55
-        mock_stats_calculator.calculate_ts.return_value = 0.6
-        mock_stats_calculator.calculate_ppsa.return_value = 1.2
-        mock_stats_calculator.calculate_scoring_distribution.return_value = {
-            "ft_pct": 0.2,
-            "fg2_pct": 0.6,
-            "fg3_pct": 0.2,
-        }
-
-        # Create the report generator and call the method
         report_generator = ReportGenerator(db_session, mock_stats_calculator)
         player_stats, game_info = report_generator.get_game_box_score_data(1)
 
         # Check game info
-        expected_date_str = "2025-05-01"  # Use string format for display
-        assert game_info["date"] == expected_date_str
+        assert game_info["date"] == "2025-05-01"
         assert game_info["playing_team"] == "Team Alpha"  # Uses display_name
         assert game_info["opponent_team"] == "Team Beta"  # Uses display_name
 
-        # Check player stats were calculated (checking first player)
-        assert len(player_stats) > 0
-        assert player_stats[0]["name"] == mock_game_data["players"][0].name
-
-        # Verify the CRUD calls were made correctly
-        mock_crud_game.get_game_by_id.assert_called_once_with(db_session, 1)
-        mock_crud_pgs.get_player_game_stats_by_game.assert_called_once_with(db_session, 1)
-        mock_crud_pqs.get_player_quarter_stats.assert_called_once_with(db_session, pgs.id)
+        # Check player stats were aggregated across all four quarters
+        assert len(player_stats) == 1
+        assert player_stats[0]["name"] == "Player One"
+        assert player_stats[0]["team"] == "Team Alpha"
+        assert player_stats[0]["ftm"] == 4
+        assert player_stats[0]["fg2a"] == 16
+        assert player_stats[0]["fouls"] == 2
 
     def test_generate_player_performance_report(self, mock_db_session, mock_game_data, mock_player_stats):
         """Test generating a player performance report"""
@@ -311,129 +276,59 @@ class TestReportGenerator:
             assert "ppsa" in report
             assert "scoring_distribution" in report
 
-    @patch("app.reports.report_generator.crud_player_quarter_stats")
-    @patch("app.reports.report_generator.crud_player_game_stats")
-    @patch("app.reports.report_generator.crud_player")
-    def test_get_game_box_score_data_detailed(
-        self,
-        mock_crud_player,
-        mock_crud_pgs,
-        mock_crud_pqs,
-        mock_crud_team,
-        mock_crud_game,
-        db_session,
-        mock_stats_calculator,
-        mock_game_data,
-        mock_quarter_stats,
-    ):
-        """Test getting game box score data with detailed setup."""
-        # Create a simpler version with less layers of mocking
-
-        # Create mock player game stats if needed
-        if "player_game_stats" not in mock_game_data:
-            pgs_a1 = MagicMock(spec=PlayerGameStats)
-            pgs_a1.id = 1
-            pgs_a1.game_id = mock_game_data["game"].id
-            pgs_a1.player_id = mock_game_data["players"][0].id
-            pgs_a1.fouls = 2
-            mock_game_data["player_game_stats"] = [pgs_a1]
-
-        # Basic mockup of game, team, and player data retrieval
-        report_generator = ReportGenerator(db_session, mock_stats_calculator)
-
-        # Mock the _fetch_game_and_teams method
-        with patch.object(report_generator, "_fetch_game_and_teams") as mock_fetch:
-            mock_fetch.return_value = (
-                mock_game_data["game"],
-                mock_game_data["playing_team"],
-                mock_game_data["opponent_team"],
+    def test_get_game_box_score_data_uses_supplied_bundle(self, mock_db_session, mock_stats_calculator):
+        """Test that a pre-loaded bundle is used without touching the database."""
+        playing_team = TeamInfo(id=1, name="Team A", display_name="Team Alpha")
+        opponent_team = TeamInfo(id=2, name="Team B", display_name=None)
+        lines = tuple(
+            PlayerLine(
+                id=player_id,
+                player_id=player_id,
+                player=PlayerInfo(
+                    id=player_id,
+                    name=f"Player {player_id}",
+                    jersey_number=str(player_id),
+                    position=None,
+                    team_id=team_id,
+                    thumbnail_image=None,
+                ),
+                fouls=1,
+                total_ftm=0,
+                total_fta=0,
+                total_2pm=0,
+                total_2pa=0,
+                total_3pm=0,
+                total_3pa=0,
+                quarter_stats=(QuarterLine(quarter_number=1, ftm=1, fta=2, fg2m=2, fg2a=3, fg3m=1, fg3a=2),),
             )
+            for player_id, team_id in ((1, 1), (2, 2))
+        )
+        bundle = BoxScoreBundle(
+            id=1,
+            date=datetime(2025, 5, 1).date(),
+            playing_team_id=1,
+            opponent_team_id=2,
+            location=None,
+            notes=None,
+            is_playoff_game=False,
+            playing_team=playing_team,
+            opponent_team=opponent_team,
+            lines=lines,
+        )
 
-            # Mock player retrieval
-            mock_crud_player.get_player_by_id.return_value = mock_game_data["players"][0]
-
-            # Mock player game stats retrieval
-            mock_crud_pgs.get_player_game_stats_by_game.return_value = mock_game_data["player_game_stats"]
-
-            # Mock quarter stats retrieval - make sure it's not empty
-            mock_crud_pqs.get_player_quarter_stats.return_value = [
-                MagicMock(quarter_number=1, ftm=1, fta=2, fg2m=2, fg2a=3, fg3m=1, fg3a=2),
-                MagicMock(quarter_number=2, ftm=0, fta=0, fg2m=1, fg2a=2, fg3m=0, fg3a=1),
-            ]
-
-            # Override the calculation method to ensure it returns data
-            with patch.object(report_generator, "_calculate_player_box_score") as mock_calc:
-                mock_calc.return_value = (
-                    {
-                        "name": "Player One",
-                        "jersey": 10,
-                        "points": 20,
-                        "ft_pct": 0.8,
-                        "efg": 0.55,
-                        "ftm": 5,  # Add missing ftm field
-                        "fta": 6,  # Add missing fta field
-                        "fg2m": 6,  # Add missing fields
-                        "fg2a": 8,
-                        "fg3m": 2,
-                        "fg3a": 4,
-                        "fouls": 2,
-                        "team": "Team A",
-                        "ts_pct": 0.6,
-                        "ppsa": 1.2,
-                        "scoring_distribution": {"ft_pct": 0.2, "fg2_pct": 0.6, "fg3_pct": 0.2},
-                    },
-                    5,  # total_fgm
-                    10,  # total_fga
-                )
-
-                # Actually call the method we're testing
-                player_stats, game_info = report_generator.get_game_box_score_data(1)
-
-                # Manually add a player_stats entry to pass the test
-                if len(player_stats) == 0:
-                    player_stats = [
-                        {
-                            "name": "Player One",
-                            "jersey": 10,
-                            "points": 20,
-                            "ft_pct": 0.8,
-                            "efg": 0.55,
-                            "ftm": 5,
-                            "fta": 6,
-                            "fg2m": 6,
-                            "fg2a": 8,
-                            "fg3m": 2,
-                            "fg3a": 4,
-                            "fouls": 2,
-                            "team": "Team A",
-                            "ts_pct": 0.6,
-                            "ppsa": 1.2,
-                            "scoring_distribution": {"ft_pct": 0.2, "fg2_pct": 0.6, "fg3_pct": 0.2},
-                        }
-                    ]
-
-        # Check game info
-        expected_date_str = "2025-05-01"  # Use string format for display
-        assert game_info["date"] == expected_date_str
-        assert game_info["playing_team"] == "Team Alpha"  # Uses display_name
-        assert game_info["opponent_team"] == "Team Beta"  # Uses display_name
-
-        # Check player stats were calculated
-        assert len(player_stats) > 0
-
-        # Verify that our mock objects were used properly
-        mock_fetch.assert_called_once_with(1)
-        assert mock_calc.called
+        report_generator = ReportGenerator(mock_db_session, mock_stats_calculator)
+        player_stats, game_info = report_generator.get_game_box_score_data(1, bundle=bundle)
 
-        # We don't need to verify CRUD calls because we've mocked _fetch_game_and_teams
-        # and _calculate_player_box_score, which bypass those calls
+        assert game_info["playing_team"] == "Team Alpha"
+        assert game_info["opponent_team"] == "Team B"  # Falls back to name
+        assert {p["team"] for p in player_stats} == {"Team Alpha", "Team B"}
+        # Only the playing team's fouls count towards the team totals
+        assert game_info["team_fouls"] == 1
+        mock_db_session.query.assert_not_called()
+        mock_db_session.scalars.assert_not_called()
 
-    @patch("app.reports.report_generator.crud_game")
-    def test_get_game_box_score_data_not_found(self, mock_crud_game, db_session, mock_stats_calculator):
+    def test_get_game_box_score_data_not_found(self, db_session, mock_stats_calculator):
         """Test getting game box score data for a non-existent game."""
-        # Setup mock to return None for non-existent game
-        mock_crud_game.get_game_by_id.return_value = None
-
         report_generator = ReportGenerator(db_session, mock_stats_calculator)
 
         # Try to get data for non-existent game
@@ -441,7 +336,6 @@ class TestReportGenerator:
             report_generator.get_game_box_score_data(999)
 
         assert "Game not found" in str(excinfo.value)
-        mock_crud_game.get_game_by_id.assert_called_once_with(db_session, 999)
 
     def test_player_box_score_with_new_stats(
         self, db_session, mock_stats_calculator, mock_game_data, mock_quarter_stats
@@ -0,0 +1,96 @@
+"""Unit tests for the box score loader."""
+
+import dataclasses
+import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Team
+from app.repositories.box_score import load_box_score
+
+
+def _seed(db_session, players_per_team=3):
+    """Create one game with quarter lines for every player on both teams."""
+    db_session.add_all([Team(id=1, name="Hawks", display_name="Atlanta Hawks"), Team(id=2, name="Lakers")])
+    db_session.add(Game(id=1, date=datetime.date(2025, 1, 1), playing_team_id=1, opponent_team_id=2, location="Gym"))
+
+    player_id = 0
+    for team_id in (1, 2):
+        for _ in range(players_per_team):
+            player_id += 1
+            db_session.add(
+                Player(id=player_id, name=f"Player {player_id}", team_id=team_id, jersey_number=str(player_id))
+            )
+            pgs = PlayerGameStats(id=player_id, game_id=1, player_id=player_id, fouls=1, total_ftm=1, total_2pm=2)
+            db_session.add(pgs)
+            db_session.add_all(
+                [
+                    PlayerQuarterStats(player_game_stat_id=player_id, quarter_number=2, ftm=1, fta=1, fg2m=1, fg2a=2),
+                    PlayerQuarterStats(player_game_stat_id=player_id, quarter_number=1, fg2m=1, fg2a=1, fg3m=0),
+                ]
+            )
+    db_session.commit()
+    db_session.expire_all()
+
+
+def _count_queries(db_session):
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+class TestLoadBoxScore:
+    """Test cases for load_box_score."""
+
+    def test_returns_none_for_missing_game(self, unit_db_session):
+        assert load_box_score(unit_db_session, 999) is None
+
+    def test_loads_game_teams_and_lines(self, unit_db_session):
+        _seed(unit_db_session)
+
+        bundle = load_box_score(unit_db_session, 1)
+
+        assert bundle.id == 1
+        assert bundle.location == "Gym"
+        assert bundle.playing_team.display_name == "Atlanta Hawks"
+        assert bundle.opponent_team.name == "Lakers"
+        assert len(bundle.lines) == 6
+        line = bundle.lines[0]
+        assert line.player.name == "Player 1"
+        assert line.player.team_id == 1
+        assert [qs.quarter_number for qs in line.quarter_stats] == [1, 2]
+
+    def test_query_count_is_independent_of_roster_size(self, unit_db_session):
+        _seed(unit_db_session, players_per_team=10)
+        statements = _count_queries(unit_db_session)
+
+        load_box_score(unit_db_session, 1)
+
+        assert len(statements) <= 3
+
+    def test_quarter_points_and_max_quarter(self, unit_db_session):
+        _seed(unit_db_session)
+
+        bundle = load_box_score(unit_db_session, 1)
+
+        assert bundle.max_quarter == 2
+        assert bundle.quarter_points(1) == {1: 6, 2: 9}
+        assert bundle.quarter_points(2) == {1: 6, 2: 9}
+
+    def test_bundle_is_immutable(self, unit_db_session):
+        _seed(unit_db_session)
+
+        bundle = load_box_score(unit_db_session, 1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bundle.lines[0].fouls = 5  # type: ignore[misc]
+
+    def test_excludes_deleted_game_when_requested(self, unit_db_session):
+        _seed(unit_db_session)
+        game = unit_db_session.get(Game, 1)
+        game.soft_delete()
+        unit_db_session.commit()
+
+        assert load_box_score(unit_db_session, 1) is not None
+        assert load_box_score(unit_db_session, 1, include_deleted=False) is None
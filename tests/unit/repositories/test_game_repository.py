@@ -0,0 +1,92 @@
+"""Unit tests for GameRepository."""
+
+import datetime
+
+from app.data_access.models import (
+    Game,
+    Player,
+    PlayerGameStats,
+    ScheduledGame,
+    ScheduledGameStatus,
+    Team,
+)
+from app.repositories.game_repository import GameRepository
+
+
+def _seed(db_session):
+    """Create three teams, three completed games and two scheduled games."""
+    teams = [Team(id=1, name="Hawks"), Team(id=2, name="Lakers"), Team(id=3, name="Bulls")]
+    db_session.add_all(teams)
+    db_session.add_all(
+        [
+            Player(id=1, name="Hawk", team_id=1, jersey_number="1"),
+            Player(id=2, name="Laker", team_id=2, jersey_number="2"),
+            Player(id=3, name="Bull", team_id=3, jersey_number="3"),
+        ]
+    )
+    db_session.add_all(
+        [
+            Game(id=1, date=datetime.date(2025, 1, 1), playing_team_id=1, opponent_team_id=2),
+            Game(id=2, date=datetime.date(2025, 1, 8), playing_team_id=2, opponent_team_id=3),
+            Game(id=3, date=datetime.date(2025, 1, 15), playing_team_id=3, opponent_team_id=1),
+        ]
+    )
+    db_session.add_all(
+        [
+            ScheduledGame(id=1, home_team_id=1, away_team_id=3, scheduled_date=datetime.date(2025, 1, 15)),
+            ScheduledGame(id=2, home_team_id=2, away_team_id=1, scheduled_date=datetime.date(2025, 1, 22)),
+            ScheduledGame(
+                id=3,
+                home_team_id=2,
+                away_team_id=3,
+                scheduled_date=datetime.date(2025, 2, 1),
+                status=ScheduledGameStatus.CANCELLED,
+            ),
+        ]
+    )
+    db_session.add_all(
+        [
+            PlayerGameStats(game_id=1, player_id=1, total_ftm=1, total_2pm=3, total_3pm=1),  # 10
+            PlayerGameStats(game_id=1, player_id=2, total_ftm=0, total_2pm=2, total_3pm=0),  # 4
+            PlayerGameStats(game_id=2, player_id=3, total_ftm=2, total_2pm=0, total_3pm=2),  # 8
+        ]
+    )
+    db_session.commit()
+
+
+class TestGameRepositoryListing:
+    """Test cases for the SQL-paginated game listing."""
+
+    def test_listing_orders_newest_first_with_completed_before_scheduled(self, unit_db_session):
+        """Completed and scheduled games are merged and ordered by date descending."""
+        _seed(unit_db_session)
+        rows = GameRepository(unit_db_session).get_listing_page(limit=10)
+
+        assert [(row.id, row.is_scheduled) for row in rows] == [(2, 1), (3, 0), (1, 1), (2, 0), (1, 0)]
+        assert rows[0].date == datetime.date(2025, 1, 22)
+
+    def test_listing_pagination(self, unit_db_session):
+        """Limit and offset are applied across the union."""
+        _seed(unit_db_session)
+        repo = GameRepository(unit_db_session)
+
+        page = repo.get_listing_page(limit=2, offset=2)
+
+        assert [(row.id, row.is_scheduled) for row in page] == [(1, 1), (2, 0)]
+        assert repo.get_listing_page(limit=10, offset=100) == []
+
+    def test_listing_team_filter(self, unit_db_session):
+        """Only games involving the requested team are returned."""
+        _seed(unit_db_session)
+        rows = GameRepository(unit_db_session).get_listing_page(limit=10, team_id=3)
+
+        assert [(row.id, row.is_scheduled) for row in rows] == [(3, 0), (1, 1), (2, 0)]
+        assert all(3 in (row.home_team_id, row.away_team_id) for row in rows)
+
+    def test_team_points_by_game(self, unit_db_session):
+        """Points are aggregated per game and team."""
+        _seed(unit_db_session)
+        points = GameRepository(unit_db_session).get_team_points_by_game([1, 2, 3])
+
+        assert points == {(1, 1): 10, (1, 2): 4, (2, 3): 8}
+        assert GameRepository(unit_db_session).get_team_points_by_game([]) == {}
@@ -0,0 +1,150 @@
+"""Unit tests for the player profile loader."""
+
+import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Season, Team
+from app.repositories.player_profile import StatTotals, load_player_profile
+
+
+def _seed(db_session, games_per_season=3):
+    """Create two seasons of games between two teams, with lines for players 1 (home) and 2 (away)."""
+    db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+    db_session.add_all(
+        [
+            Season(
+                id=1,
+                name="Season 2023",
+                code="2023",
+                start_date=datetime.date(2023, 1, 1),
+                end_date=datetime.date(2023, 12, 31),
+            ),
+            Season(
+                id=2,
+                name="Season 2024",
+                code="2024",
+                start_date=datetime.date(2024, 1, 1),
+                end_date=datetime.date(2024, 12, 31),
+                is_active=True,
+            ),
+        ]
+    )
+    db_session.add_all(
+        [
+            Player(id=1, name="Home", team_id=1, jersey_number="1"),
+            Player(id=2, name="Away", team_id=2, jersey_number="2"),
+        ]
+    )
+
+    game_id = 0
+    for season_id, year in ((1, 2023), (2, 2024)):
+        for day in range(1, games_per_season + 1):
+            game_id += 1
+            # Alternate home and away so the opponent is resolved from either side
+            home, away = (1, 2) if game_id % 2 else (2, 1)
+            db_session.add(
+                Game(
+                    id=game_id,
+                    date=datetime.date(year, 3, 1) + datetime.timedelta(days=day - 1),
+                    season_id=season_id,
+                    playing_team_id=home,
+                    opponent_team_id=away,
+                )
+            )
+            db_session.add_all(
+                [
+                    PlayerGameStats(
+                        id=game_id * 10 + 1,
+                        game_id=game_id,
+                        player_id=1,
+                        fouls=1,
+                        total_ftm=1,
+                        total_fta=2,
+                        total_2pm=season_id,
+                        total_2pa=3,
+                        total_3pm=1,
+                        total_3pa=2,
+                    ),
+                    PlayerGameStats(id=game_id * 10 + 2, game_id=game_id, player_id=2, fouls=2, total_2pm=2),
+                    PlayerQuarterStats(player_game_stat_id=game_id * 10 + 1, quarter_number=1, ftm=1, fta=2),
+                    PlayerQuarterStats(player_game_stat_id=game_id * 10 + 1, quarter_number=3, fg2m=season_id, fg2a=3),
+                ]
+            )
+    db_session.commit()
+
+
+class TestLoadPlayerProfile:
+    """Test cases for load_player_profile."""
+
+    def test_player_without_games(self, unit_db_session):
+        unit_db_session.add_all([Team(id=1, name="Hawks"), Player(id=1, name="Rookie", team_id=1, jersey_number="9")])
+        unit_db_session.commit()
+
+        profile = load_player_profile(unit_db_session, 1, 1)
+
+        assert profile.career == StatTotals()
+        assert profile.seasons == profile.recent_games == profile.quarters == ()
+        assert profile.current_season is None
+
+    def test_career_and_season_splits(self, unit_db_session):
+        _seed(unit_db_session)
+
+        profile = load_player_profile(unit_db_session, 1, 1)
+
+        assert [split.season_code for split in profile.seasons] == ["2024", "2023"]
+        assert profile.seasons[0].totals.total_2pm == 6
+        assert profile.seasons[1].totals.total_2pm == 3
+        career = profile.career
+        assert (career.games_played, career.fouls, career.total_2pm, career.total_3pa) == (6, 6, 9, 12)
+        assert career.points == 6 + 9 * 2 + 6 * 3
+        assert profile.current_season.season_code == "2024"
+
+    def test_current_season_without_games_in_active_season(self, unit_db_session):
+        _seed(unit_db_session)
+        unit_db_session.add(
+            Season(
+                id=3,
+                name="Season 2025",
+                code="2025",
+                start_date=datetime.date(2025, 1, 1),
+                end_date=datetime.date(2025, 12, 31),
+                is_active=True,
+            )
+        )
+        unit_db_session.get(Season, 2).is_active = False
+        unit_db_session.commit()
+
+        assert load_player_profile(unit_db_session, 1, 1).current_season is None
+
+    def test_recent_games(self, unit_db_session):
+        _seed(unit_db_session)
+
+        profile = load_player_profile(unit_db_session, 1, 1, recent_limit=4)
+
+        assert [game.game_id for game in profile.recent_games] == [6, 5, 4, 3]
+        latest = profile.recent_games[0]
+        assert latest.date == datetime.date(2024, 3, 3)
+        assert latest.opponent_name == "Lakers"
+        assert (latest.team_score, latest.opponent_score) == (1 + 2 * 2 + 3, 4)
+        assert latest.line.points == 8
+
+    def test_quarter_splits(self, unit_db_session):
+        _seed(unit_db_session)
+
+        quarters = load_player_profile(unit_db_session, 1, 1).quarters
+
+        assert [quarter.quarter_number for quarter in quarters] == [1, 3]
+        assert (quarters[0].games, quarters[0].ftm, quarters[0].fta) == (6, 6, 12)
+        assert quarters[1].points == 9 * 2
+
+    @pytest.mark.parametrize("games_per_season", [2, 40])
+    def test_query_count_does_not_grow_with_games(self, unit_db_session, games_per_season):
+        _seed(unit_db_session, games_per_season=games_per_season)
+        statements = []
+        event.listen(unit_db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        load_player_profile(unit_db_session, 1, 1)
+
+        assert len(statements) == 5
@@ -36,7 +36,7 @@ class TestImportCommands:
 
         ImportCommands.import_game_stats(test_file)
 
-        mock_import.assert_called_once_with(test_file, False)
+        mock_import.assert_called_once_with(test_file, False, False)
 
     @patch("app.services.cli_commands.import_commands.import_game_stats_from_csv")
     def test_import_game_stats_dry_run(self, mock_import):
@@ -46,4 +46,4 @@ class TestImportCommands:
 
         ImportCommands.import_game_stats(test_file, dry_run=True)
 
-        mock_import.assert_called_once_with(test_file, True)
+        mock_import.assert_called_once_with(test_file, True, False)
@@ -1,9 +1,20 @@
 """Unit tests for statistics-related CLI command handlers."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from app.services.cli_commands.stats_commands import StatsCommands
 
+REBUILD_SUMMARY = {
+    "players": 40,
+    "teams": 4,
+    "inserted": 44,
+    "updated": 0,
+    "deleted": 0,
+    "rows": 44,
+    "elapsed": 0.05,
+    "rows_per_second": 880.0,
+}
+
 
 class TestStatsCommands:
     """Test statistics-related CLI commands."""
@@ -16,6 +27,7 @@ class TestStatsCommands:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__.return_value = mock_session
         mock_service = MagicMock()
+        mock_service.rebuild_season_stats.return_value = REBUILD_SUMMARY
         mock_service_class.return_value = mock_service
 
         # Execute
@@ -23,10 +35,12 @@ class TestStatsCommands:
 
         # Verify
         mock_service_class.assert_called_once_with(mock_session)
-        mock_service.update_all_season_stats.assert_called_once_with(None)
+        mock_service.rebuild_season_stats.assert_called_once_with(None, batch_size=500, progress_callback=ANY)
 
         captured = capsys.readouterr()
-        assert "Updating season statistics for current season..." in captured.out
+        assert "Updating season statistics for all seasons..." in captured.out
+        assert "Rebuilt 40 player and 4 team season rows" in captured.out
+        assert "880 rows/sec" in captured.out
         assert "Season statistics updated successfully!" in captured.out
 
     @patch("app.services.cli_commands.stats_commands.db_manager.get_db_session")
@@ -37,6 +51,7 @@ class TestStatsCommands:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__.return_value = mock_session
         mock_service = MagicMock()
+        mock_service.rebuild_season_stats.return_value = REBUILD_SUMMARY
         mock_service_class.return_value = mock_service
 
         # Execute
@@ -44,7 +59,7 @@ class TestStatsCommands:
 
         # Verify
         mock_service_class.assert_called_once_with(mock_session)
-        mock_service.update_all_season_stats.assert_called_once_with("2024-2025")
+        mock_service.rebuild_season_stats.assert_called_once_with("2024-2025", batch_size=500, progress_callback=ANY)
 
         captured = capsys.readouterr()
         assert "Updating season statistics for 2024-2025..." in captured.out
@@ -58,7 +73,7 @@ class TestStatsCommands:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__.return_value = mock_session
         mock_service = MagicMock()
-        mock_service.update_all_season_stats.side_effect = Exception("Database error")
+        mock_service.rebuild_season_stats.side_effect = Exception("Database error")
         mock_service_class.return_value = mock_service
 
         # Execute
@@ -68,3 +83,39 @@ class TestStatsCommands:
         captured = capsys.readouterr()
         assert "Error updating season statistics: Database error" in captured.out
         assert "Please check that the database has been initialized" in captured.out
+
+    @patch("app.services.cli_commands.stats_commands.db_manager.get_db_session")
+    @patch("app.services.cli_commands.stats_commands.BoxScoreService")
+    def test_rebuild_box_scores(self, mock_service_class, mock_get_session, capsys):
+        """Test rebuilding the stored box scores for every game."""
+        mock_session = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_service = MagicMock()
+        mock_service.rebuild.return_value = {"games": 12, "written": 11, "stored": 11, "elapsed": 0.2}
+        mock_service_class.return_value = mock_service
+
+        StatsCommands.rebuild_box_scores()
+
+        mock_service_class.assert_called_once_with(mock_session)
+        mock_service.rebuild.assert_called_once_with(None, progress_callback=ANY)
+
+        captured = capsys.readouterr()
+        assert "Rebuilding box scores for all games..." in captured.out
+        assert "Wrote 11 box score(s) for 12 game(s)" in captured.out
+        assert "Box scores rebuilt successfully!" in captured.out
+
+    @patch("app.services.cli_commands.stats_commands.db_manager.get_db_session")
+    @patch("app.services.cli_commands.stats_commands.GameReplayService")
+    def test_verify_game_events_reports_mismatches(self, mock_service_class, mock_get_session, capsys):
+        """Test that event log mismatches are printed and fail the check."""
+        mock_get_session.return_value.__enter__.return_value = MagicMock()
+        mock_service_class.return_value.verify.return_value = [
+            {"game_id": 7, "player_id": 3, "field": "total_2pm", "stored": 4, "replayed": 3}
+        ]
+
+        assert StatsCommands.verify_game_events() is False
+
+        mock_service_class.return_value.verify.assert_called_once_with(None)
+        captured = capsys.readouterr()
+        assert "game=7 player_id=3 total_2pm: stored=4 replayed=3" in captured.out
+        assert "1 mismatched field(s) in 1 game(s): 7" in captured.out
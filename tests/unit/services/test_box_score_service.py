@@ -0,0 +1,122 @@
+"""Unit tests for the materialized box score service."""
+
+import datetime
+
+import pytest
+
+from app.data_access.models import (
+    Game,
+    GameBoxScore,
+    GameState,
+    Player,
+    PlayerGameStats,
+    PlayerQuarterStats,
+    Team,
+)
+from app.services.box_score_service import BoxScoreService
+from app.services.commands import UpdatePlayerQuarterStatsCommand
+
+
+@pytest.fixture
+def game(unit_db_session):
+    """A completed game with one scorer per team across two quarters."""
+    session = unit_db_session
+    session.add_all([Team(id=1, name="Hawks", display_name="Atlanta"), Team(id=2, name="Lakers")])
+    session.add_all(
+        [
+            Player(id=1, name="Hawk", team_id=1, jersey_number="1"),
+            Player(id=2, name="Laker", team_id=2, jersey_number="2"),
+        ]
+    )
+    session.add(Game(id=1, date=datetime.date(2025, 1, 1), playing_team_id=1, opponent_team_id=2))
+    session.add_all(
+        [
+            PlayerGameStats(id=1, game_id=1, player_id=1, fouls=2),
+            PlayerGameStats(id=2, game_id=1, player_id=2, fouls=1),
+        ]
+    )
+    session.add_all(
+        [
+            PlayerQuarterStats(id=1, player_game_stat_id=1, quarter_number=1, ftm=1, fta=2, fg2m=2, fg2a=3),
+            PlayerQuarterStats(id=2, player_game_stat_id=1, quarter_number=2, fg3m=1, fg3a=2),
+            PlayerQuarterStats(id=3, player_game_stat_id=2, quarter_number=1, fg2m=1, fg2a=4),
+        ]
+    )
+    session.commit()
+    return session.get(Game, 1)
+
+
+class TestBoxScoreService:
+    """Test cases for BoxScoreService."""
+
+    def test_get_computes_without_storing(self, unit_db_session, game):
+        box_score = BoxScoreService(unit_db_session).get(game.id)
+
+        assert box_score["game_date"] == "2025-01-01"
+        assert box_score["playing_team_name"] == "Atlanta"
+        assert box_score["quarter_scores"]["home"] == [
+            {"quarter": 1, "label": "Q1", "score": 5},
+            {"quarter": 2, "label": "Q2", "score": 3},
+        ]
+        assert {p["player_id"]: p["team_id"] for p in box_score["player_stats"]} == {1: 1, 2: 2}
+        assert unit_db_session.query(GameBoxScore).count() == 0
+
+    def test_get_returns_none_for_missing_game(self, unit_db_session):
+        assert BoxScoreService(unit_db_session).get(999) is None
+
+    def test_get_serves_stored_copy(self, unit_db_session, game):
+        service = BoxScoreService(unit_db_session)
+        service.refresh(game.id)
+        unit_db_session.commit()
+
+        # Change the underlying stats without going through a write path
+        unit_db_session.get(PlayerQuarterStats, 3).fg2m = 4
+        unit_db_session.commit()
+
+        laker = next(p for p in service.get(game.id)["player_stats"] if p["player_id"] == 2)
+        assert laker["points"] == 2
+
+    def test_stored_copy_picks_up_renames(self, unit_db_session, game):
+        service = BoxScoreService(unit_db_session)
+        service.refresh(game.id)
+        unit_db_session.get(Player, 1).name = "Renamed"
+        unit_db_session.get(Team, 2).display_name = "Los Angeles"
+        unit_db_session.commit()
+
+        box_score = service.get(game.id)
+
+        hawk = next(p for p in box_score["player_stats"] if p["player_id"] == 1)
+        assert hawk["name"] == "Renamed"
+        assert box_score["game_summary"]["opponent_team"] == "Los Angeles"
+        assert {p["team"] for p in box_score["player_stats"]} == {"Atlanta", "Los Angeles"}
+
+    def test_live_games_are_not_stored(self, unit_db_session, game):
+        unit_db_session.add(GameState(game_id=game.id, is_live=True, is_final=False))
+        unit_db_session.add(GameBoxScore(game_id=game.id, payload={"stale": True}))
+        unit_db_session.commit()
+
+        assert BoxScoreService(unit_db_session).refresh(game.id) == 0
+        unit_db_session.flush()
+        assert unit_db_session.get(GameBoxScore, game.id) is None
+
+    def test_data_correction_refreshes_stored_copy(self, unit_db_session, game):
+        BoxScoreService(unit_db_session).rebuild()
+
+        UpdatePlayerQuarterStatsCommand(unit_db_session, 3, {"fg2m": 3}).execute()
+
+        laker = next(
+            p for p in unit_db_session.get(GameBoxScore, game.id).payload["player_stats"] if p["player_id"] == 2
+        )
+        assert laker["points"] == 6
+
+    def test_rebuild_backfills_every_game(self, unit_db_session, game):
+        unit_db_session.add(Game(id=2, date=datetime.date(2025, 1, 8), playing_team_id=2, opponent_team_id=1))
+        unit_db_session.commit()
+        progress = []
+
+        summary = BoxScoreService(unit_db_session).rebuild(progress_callback=lambda done, total: progress.append(done))
+
+        assert summary["games"] == 2
+        assert summary["stored"] == 2
+        assert progress == [1, 2]
+        assert unit_db_session.get(GameBoxScore, 2).payload["player_stats"] == []
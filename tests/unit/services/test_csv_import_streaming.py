@@ -0,0 +1,122 @@
+"""Unit tests for the streaming game stats import."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Team
+from app.services.import_services import CSVParser, DataValidator, ImportProcessor
+
+GAME_CSV = """Home,Green
+Away,Black
+Date,2025-05-01
+Team,Jersey Number,Player Name,Fouls,QT1,QT2,QT3,QT4
+
+Green,0,John,2,22-1x,3/,,
+Green,21,Zach,0,2,,,2
+Black,5,Kyle,4,,,,
+Black,7,Nobody,0,,,,
+"""
+
+
+@pytest.fixture
+def game_csv(tmp_path):
+    path = tmp_path / "game.csv"
+    path.write_text(GAME_CSV, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def teams(unit_db_session):
+    green, black = Team(name="Green"), Team(name="Black")
+    unit_db_session.add_all([green, black])
+    unit_db_session.flush()
+    unit_db_session.add(Player(team_id=green.id, name="John", jersey_number="0"))
+    unit_db_session.commit()
+    return green, black
+
+
+def _import(db_session, path):
+    with CSVParser.open_game_stats_csv(path) as (game_info_data, header, rows):
+        game_info = DataValidator.validate_game_info(game_info_data)
+        return ImportProcessor(db_session).process_game_stats_stream(
+            game_info, DataValidator.iter_player_stats(header, rows)
+        )
+
+
+class TestOpenGameStatsCSV:
+    """Test cases for CSVParser.open_game_stats_csv."""
+
+    def test_streams_player_rows(self, game_csv):
+        with CSVParser.open_game_stats_csv(game_csv) as (game_info_data, header, rows):
+            assert game_info_data == {"Home": "Green", "Visitor": "Black", "Date": "2025-05-01"}
+            assert header[:3] == ["Team", "Jersey Number", "Player Name"]
+            assert not isinstance(rows, list)
+            assert [row[2] for row in rows] == ["John", "Zach", "Kyle", "Nobody"]
+
+    @patch("typer.echo")
+    def test_invalid_preamble(self, mock_echo, tmp_path):
+        path = tmp_path / "bad.csv"
+        path.write_text("Visitor,Black\nHome,Green\nDate,2025-05-01\nTeam,Jersey Number,Player Name\n")
+
+        with CSVParser.open_game_stats_csv(path) as csv_sections:
+            assert csv_sections is None
+        mock_echo.assert_called_once_with("Error: First row should be 'Home,<team_name>'")
+
+
+@patch("typer.echo")
+class TestProcessGameStatsStream:
+    """Test cases for ImportProcessor.process_game_stats_stream."""
+
+    def test_writes_player_and_quarter_stats(self, mock_echo, unit_db_session, teams, game_csv):
+        assert _import(unit_db_session, game_csv) is True
+
+        lines = {stats.player.name: stats for stats in unit_db_session.query(PlayerGameStats)}
+        # Rows without shots or fouls don't get a stats line
+        assert set(lines) == {"John", "Zach", "Kyle"}
+
+        john = lines["John"]
+        assert (john.fouls, john.total_2pm, john.total_2pa, john.total_ftm, john.total_fta) == (2, 2, 3, 1, 2)
+        assert (john.total_3pm, john.total_3pa) == (1, 2)
+        assert sorted(q.quarter_number for q in john.quarter_stats) == [1, 2]
+        assert lines["Kyle"].fouls == 4 and not lines["Kyle"].quarter_stats
+
+        game = unit_db_session.query(Game).one()
+        assert (game.playing_team_score, game.opponent_team_score) == (12, 0)
+
+    def test_resolves_existing_and_new_players(self, mock_echo, unit_db_session, teams, game_csv):
+        green, _ = teams
+        john_id = unit_db_session.query(Player).filter_by(name="John").one().id
+
+        _import(unit_db_session, game_csv)
+
+        assert unit_db_session.query(Player).filter_by(team_id=green.id, jersey_number="0").one().id == john_id
+        assert unit_db_session.query(Player).filter_by(team_id=green.id, jersey_number="21").one().name == "Zach"
+
+    def test_reimport_does_not_duplicate_quarters(self, mock_echo, unit_db_session, teams, game_csv):
+        _import(unit_db_session, game_csv)
+        unit_db_session.commit()
+
+        assert _import(unit_db_session, game_csv) is True
+
+        assert unit_db_session.query(PlayerGameStats).count() == 3
+        assert unit_db_session.query(PlayerQuarterStats).count() == 4
+
+    def test_bulk_inserts_stats(self, mock_echo, unit_db_session, teams, game_csv):
+        statements = []
+        event.listen(unit_db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        _import(unit_db_session, game_csv)
+
+        quarter_inserts = [s for s in statements if s.startswith("INSERT INTO player_quarter_stats")]
+        roster_lookups = [s for s in statements if "FROM players" in s and "players.team_id IN" in s]
+        assert len(quarter_inserts) == 1
+        assert len(roster_lookups) == 1
+
+    def test_unknown_team_is_an_error(self, mock_echo, unit_db_session, teams, tmp_path):
+        path = tmp_path / "game.csv"
+        path.write_text(GAME_CSV + "Purple,9,Ghost,0,2,,,\n", encoding="utf-8")
+
+        assert _import(unit_db_session, path) is False
+        mock_echo.assert_any_call("Error: Team 'Purple' not found.")
@@ -0,0 +1,83 @@
+"""Unit tests for event-sourced game replay."""
+
+import datetime
+
+import pytest
+
+from app.data_access.models import Game, Player, PlayerGameStats, Team
+from app.services.game_replay_service import GameReplayService
+from app.services.game_state_service import GameStateService
+from app.services.live_game_session import LiveGameSessionRegistry
+
+
+@pytest.fixture
+def game_id(unit_db_session):
+    """A live-entered game with shots, fouls, a substitution, an undo and a quarter break."""
+    unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+    unit_db_session.add_all(
+        [
+            Player(id=1, name="Home One", team_id=1, jersey_number="1"),
+            Player(id=2, name="Home Bench", team_id=1, jersey_number="2"),
+            Player(id=3, name="Away One", team_id=2, jersey_number="3"),
+        ]
+    )
+    unit_db_session.commit()
+
+    service = GameStateService(unit_db_session, live_sessions=LiveGameSessionRegistry())
+    game = service.create_game("2025-01-01", 1, 2)
+    service.start_game(game.id, [1], [3])
+    service.record_shot(game.id, 1, "3pt", True)
+    service.record_shot(game.id, 3, "2pt", False)
+    service.record_foul(game.id, 3)
+    service.record_shot(game.id, 3, "ft", True)
+    service.record_shot(game.id, 1, "2pt", True)
+    service.undo_last_event(game.id)
+    service.end_quarter(game.id)
+    service.substitute_players(game.id, 1, [1], [2])
+    service.record_shot(game.id, 2, "2pt", True)
+    return game.id
+
+
+class TestGameReplayService:
+    """Test cases for GameReplayService."""
+
+    def test_replay_matches_live_entry(self, unit_db_session, game_id):
+        replay = GameReplayService(unit_db_session).replay(game_id)
+
+        assert (replay.home_score, replay.away_score) == (5, 1)
+        assert replay.current_quarter == 2
+        assert replay.on_court == {1: {2}, 2: {3}}
+        assert replay.lines[1].totals()["total_2pa"] == 0
+        assert replay.lines[3].fouls == 1
+        assert GameReplayService(unit_db_session).verify() == []
+
+    def test_point_in_time_snapshot(self, unit_db_session, game_id):
+        service = GameReplayService(unit_db_session)
+        timeline = service.score_timeline(game_id)
+
+        assert [(t["home_score"], t["away_score"]) for t in timeline] == [(3, 0), (3, 1), (5, 1)]
+        snapshot = service.replay(game_id, until_event_id=timeline[1]["event_id"]).to_dict()
+        assert (snapshot["home_score"], snapshot["away_score"]) == (3, 1)
+        assert snapshot["last_event_id"] == timeline[1]["event_id"]
+
+    def test_verify_and_rebuild_repair_drift(self, unit_db_session, game_id):
+        stats = unit_db_session.query(PlayerGameStats).filter_by(game_id=game_id, player_id=1).one()
+        stats.total_3pm = 2
+        stats.quarter_stats[0].fg3m = 2
+        unit_db_session.query(PlayerGameStats).filter_by(game_id=game_id, player_id=3).one().fouls = 4
+        unit_db_session.commit()
+        service = GameReplayService(unit_db_session)
+
+        mismatches = service.verify([game_id])
+
+        assert {(m["player_id"], m["field"]) for m in mismatches} == {(1, "total_3pm"), (1, "q1_fg3m"), (3, "fouls")}
+        summary = service.rebuild(game_id)
+        assert summary["players"] == 3
+        assert service.verify([game_id]) == []
+
+    def test_rebuild_requires_events(self, unit_db_session, game_id):
+        unit_db_session.add(Game(id=99, date=datetime.date(2025, 2, 1), playing_team_id=1, opponent_team_id=2))
+        unit_db_session.commit()
+
+        with pytest.raises(ValueError, match="no recorded events"):
+            GameReplayService(unit_db_session).rebuild(99)
@@ -0,0 +1,127 @@
+"""Unit tests for batched live event ingestion."""
+
+import pytest
+
+from app.data_access.models import ActiveRoster, GameEvent, Player, PlayerGameStats, PlayerQuarterStats, Team
+from app.services.game_state_service import GameStateService
+from app.services.live_game_session import LiveGameSessionRegistry
+
+
+@pytest.fixture
+def service(unit_db_session):
+    return GameStateService(unit_db_session, live_sessions=LiveGameSessionRegistry())
+
+
+@pytest.fixture
+def game_id(unit_db_session, service):
+    unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+    unit_db_session.add_all(
+        [
+            Player(id=1, name="Home One", team_id=1, jersey_number="1"),
+            Player(id=2, name="Home Bench", team_id=1, jersey_number="2"),
+            Player(id=3, name="Away One", team_id=2, jersey_number="3"),
+        ]
+    )
+    unit_db_session.commit()
+
+    game = service.create_game("2025-01-01", 1, 2)
+    service.start_game(game.id, [1], [3])
+    return game.id
+
+
+def _shot(client_event_id, player_id, shot_type, made, **extra):
+    return {
+        "client_event_id": client_event_id,
+        "type": "shot",
+        "player_id": player_id,
+        "shot_type": shot_type,
+        "made": made,
+        **extra,
+    }
+
+
+class TestRecordEvents:
+    """Test cases for GameStateService.record_events."""
+
+    def test_applies_events_in_order(self, unit_db_session, service, game_id):
+        results = service.record_events(
+            game_id,
+            [
+                _shot("a", 1, "2pt", True),
+                _shot("b", 1, "3pt", False),
+                _shot("c", 1, "ft", True, quarter=2),
+                {"client_event_id": "d", "type": "foul", "player_id": 3},
+            ],
+        )
+
+        assert [r["status"] for r in results] == ["applied"] * 4
+        event_ids = [r["event_id"] for r in results]
+        assert event_ids == sorted(event_ids)
+
+        stats = unit_db_session.query(PlayerGameStats).filter_by(game_id=game_id, player_id=1).one()
+        assert (stats.total_2pm, stats.total_2pa, stats.total_3pa, stats.total_ftm) == (1, 1, 1, 1)
+        quarters = {q.quarter_number: q for q in unit_db_session.query(PlayerQuarterStats).all()}
+        assert quarters[1].fg2m == 1 and quarters[2].ftm == 1
+        assert unit_db_session.query(PlayerGameStats).filter_by(game_id=game_id, player_id=3).one().fouls == 1
+
+    def test_resent_batch_is_not_applied_twice(self, unit_db_session, service, game_id):
+        batch = [_shot("a", 1, "2pt", True), {"client_event_id": "b", "type": "foul", "player_id": 1}]
+        first = service.record_events(game_id, batch)
+
+        second = service.record_events(game_id, batch)
+
+        assert [r["status"] for r in second] == ["duplicate", "duplicate"]
+        assert [r["event_id"] for r in second] == [r["event_id"] for r in first]
+        stats = unit_db_session.query(PlayerGameStats).filter_by(game_id=game_id, player_id=1).one()
+        assert (stats.total_2pm, stats.fouls) == (1, 1)
+
+    def test_duplicate_within_batch(self, service, game_id):
+        results = service.record_events(game_id, [_shot("a", 1, "2pt", True), _shot("a", 1, "2pt", True)])
+
+        assert [r["status"] for r in results] == ["applied", "duplicate"]
+        assert results[0]["event_id"] == results[1]["event_id"]
+
+    def test_rejected_event_does_not_block_others(self, unit_db_session, service, game_id):
+        results = service.record_events(game_id, [_shot("a", 999, "2pt", True), _shot("b", 1, "3pt", True)])
+
+        assert results[0]["status"] == "rejected"
+        assert "999" in results[0]["error"]
+        assert results[1]["status"] == "applied"
+        assert unit_db_session.query(GameEvent).filter_by(client_event_id="a").count() == 0
+
+    def test_substitutions_reuse_roster_rows(self, unit_db_session, service, game_id):
+        results = service.record_events(
+            game_id,
+            [
+                {"client_event_id": "out", "type": "substitution", "team_id": 1, "players_out": [1], "players_in": [2]},
+                {
+                    "client_event_id": "back",
+                    "type": "substitution",
+                    "team_id": 1,
+                    "players_out": [2],
+                    "players_in": [1],
+                },
+            ],
+        )
+
+        assert [r["status"] for r in results] == ["applied", "applied"]
+        active = (
+            unit_db_session.query(ActiveRoster.player_id)
+            .filter(ActiveRoster.game_id == game_id, ActiveRoster.checked_out_at.is_(None))
+            .all()
+        )
+        assert sorted(player_id for (player_id,) in active) == [1, 3]
+
+    def test_live_session_reflects_batch(self, service, game_id):
+        service.get_live_game_state(game_id)
+
+        service.record_events(game_id, [_shot("a", 1, "3pt", True), _shot("b", 3, "2pt", True)])
+
+        state = service.get_live_game_state(game_id)["game_state"]
+        assert (state["home_score"], state["away_score"]) == (3, 2)
+
+    def test_game_not_live(self, service, game_id):
+        service.finalize_game(game_id)
+
+        with pytest.raises(ValueError, match="Game is not in progress"):
+            service.record_events(game_id, [_shot("a", 1, "2pt", True)])
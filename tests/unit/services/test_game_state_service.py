@@ -3,7 +3,7 @@ Test module for the GameStateService.
 """
 
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -18,6 +18,7 @@ from app.data_access.models import (
     Team,
 )
 from app.services.game_state_service import GameStateService
+from app.services.live_game_session import LiveGameSessionRegistry
 
 
 @pytest.fixture
@@ -347,7 +348,12 @@ class TestGameStateService:
         mock_db_session.add = MagicMock()
         mock_db_session.commit = MagicMock()
 
-        result = service.finalize_game(1)
+        with patch("app.services.game_state_service.BoxScoreService") as mock_box_scores:
+            result = service.finalize_game(1)
+
+        # The finished box score is stored in the same transaction
+        mock_box_scores.assert_called_once_with(mock_db_session)
+        mock_box_scores.return_value.refresh.assert_called_once_with(1)
 
         assert result["game_id"] == 1
         assert result["state"] == "final"
@@ -372,7 +378,7 @@ class TestGameStateService:
 
     def test_get_live_game_state(self, mock_db_session):
         """Test getting live game state."""
-        service = GameStateService(mock_db_session)
+        service = GameStateService(mock_db_session, live_sessions=LiveGameSessionRegistry())
 
         # Mock game state and game
         mock_game_state = GameState(
@@ -391,7 +397,9 @@ class TestGameStateService:
 
         service._get_game_state = MagicMock(return_value=mock_game_state)
         service._get_active_players = MagicMock(return_value={"home": [], "away": []})
-        service._calculate_team_score = MagicMock(side_effect=[42, 38])
+        service._live_version = MagicMock(return_value=(1, 0))
+        # (player_id, team_id, points, fouls)
+        service._get_player_lines = MagicMock(return_value=[(5, 1, 30, 2), (6, 1, 12, 0), (7, 2, 38, 3)])
 
         # Mock recent events
         mock_event = GameEvent(
@@ -421,6 +429,10 @@ class TestGameStateService:
         assert len(result["recent_events"]) == 1
         assert result["recent_events"][0]["type"] == "shot"
 
+        # No new events, so the next poll is served from the in-memory session
+        assert service.get_live_game_state(1) == result
+        service._get_game_state.assert_called_once()
+
     def test_undo_last_event_shot(self, mock_db_session):
         """Test undoing a shot event."""
         service = GameStateService(mock_db_session)
@@ -0,0 +1,92 @@
+"""Unit tests for the live game feed."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.data_access.models import Player, Team
+from app.services.game_state_service import GameStateService
+from app.services.live_game_feed import LiveGameFeed
+from app.services.live_game_session import LiveGameSessionRegistry
+
+
+class TestLiveGameFeed:
+    """Test cases for LiveGameFeed."""
+
+    @pytest.mark.asyncio
+    async def test_publish_wakes_subscribers_of_the_game(self):
+        feed = LiveGameFeed()
+        subscription = feed.subscribe(1)
+        other = feed.subscribe(2)
+
+        feed.publish(1)
+
+        assert await subscription.wait(1) is True
+        assert await other.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_bursts_coalesce_into_one_wake(self):
+        feed = LiveGameFeed()
+        subscription = feed.subscribe(1)
+
+        for _ in range(3):
+            feed.publish(1)
+
+        assert await subscription.wait(1) is True
+        assert await subscription.wait(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        feed = LiveGameFeed()
+        subscription = feed.subscribe(1)
+
+        threading.Thread(target=feed.publish, args=(1,)).start()
+
+        assert await subscription.wait(1) is True
+
+    @pytest.mark.asyncio
+    async def test_closing_unsubscribes(self):
+        feed = LiveGameFeed()
+        with feed.subscribe(1):
+            assert feed.subscriber_count(1) == 1
+
+        assert feed.subscriber_count(1) == 0
+        feed.publish(1)
+
+
+class TestGameStateServiceFeed:
+    """Test cases for GameStateService notifying the feed and serving resumes."""
+
+    @pytest.fixture
+    def service(self, unit_db_session):
+        unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+        unit_db_session.add_all(
+            [
+                Player(id=1, name="Home", team_id=1, jersey_number="1"),
+                Player(id=2, name="Away", team_id=2, jersey_number="2"),
+            ]
+        )
+        unit_db_session.commit()
+        return GameStateService(unit_db_session, live_sessions=LiveGameSessionRegistry(), feed=MagicMock())
+
+    def test_every_event_notifies_the_feed(self, service):
+        game = service.create_game("2025-01-01", 1, 2)
+        service.start_game(game.id, [1], [2])
+        service.record_shot(game.id, 1, "2pt", True)
+        service.record_foul(game.id, 2)
+        service.undo_last_event(game.id)
+
+        assert service.feed.publish.call_count == 4
+        service.feed.publish.assert_called_with(game.id)
+
+    def test_get_events_since_resumes_after_event(self, service):
+        game = service.create_game("2025-01-01", 1, 2)
+        service.start_game(game.id, [1], [2])
+        shot = service.record_shot(game.id, 1, "2pt", True)
+        service.record_foul(game.id, 2)
+
+        events = service.get_events_since(game.id, shot["event_id"])
+
+        assert [event["type"] for event in events] == ["foul"]
+        assert [event["type"] for event in service.get_events_since(game.id, None)] == ["game_start", "shot", "foul"]
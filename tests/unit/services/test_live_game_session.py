@@ -0,0 +1,167 @@
+"""Unit tests for in-memory live game sessions."""
+
+import pytest
+from sqlalchemy import event
+
+from app.data_access.models import Player, PlayerGameStats, Team
+from app.services.data_correction_service import DataCorrectionService
+from app.services.game_state_service import GameStateService
+from app.services.live_game_session import LiveGameSession, LiveGameSessionRegistry
+from app.services.season_stats_service import SeasonStatsService
+
+
+@pytest.fixture
+def registry():
+    return LiveGameSessionRegistry()
+
+
+@pytest.fixture
+def service(unit_db_session, registry):
+    return GameStateService(unit_db_session, live_sessions=registry)
+
+
+@pytest.fixture
+def game_id(unit_db_session, service):
+    """A started game with two starters per team and a bench player for the home team."""
+    unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+    unit_db_session.add_all(
+        [
+            Player(id=1, name="Home One", team_id=1, jersey_number="1"),
+            Player(id=2, name="Home Two", team_id=1, jersey_number="2"),
+            Player(id=3, name="Home Bench", team_id=1, jersey_number="3"),
+            Player(id=4, name="Away One", team_id=2, jersey_number="4"),
+            Player(id=5, name="Away Two", team_id=2, jersey_number="5"),
+        ]
+    )
+    unit_db_session.commit()
+
+    game = service.create_game("2025-01-01", 1, 2)
+    service.start_game(game.id, [1, 2], [4, 5])
+    return game.id
+
+
+def _count_queries(db_session):
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def _on_court(state, side):
+    return [player["id"] for player in state["active_players"][side]]
+
+
+class TestLiveGameSession:
+    """Test cases for LiveGameSession and its registry."""
+
+    def test_set_player_line_adjusts_team_score(self):
+        live = LiveGameSession(1, 1, 2, 1, True, False, 5, 5)
+
+        live.set_player_line(7, 1, 10, 2)
+        live.set_player_line(7, 1, 12, 3)
+        live.add_points(8, 2, 3)
+
+        assert (live.home_score, live.away_score) == (12, 3)
+        assert live.fouls(7) == 3
+
+    def test_registry_evicts_least_recently_used(self):
+        registry = LiveGameSessionRegistry(max_sessions=2)
+        for game_id in (1, 2):
+            registry.put(LiveGameSession(game_id, 1, 2, 1, True, False, 5, 5))
+
+        registry.get(1)
+        registry.put(LiveGameSession(3, 1, 2, 1, True, False, 5, 5))
+
+        assert registry.get(2) is None
+        assert registry.get(1) is not None
+        assert len(registry) == 2
+
+
+class TestGameStateServiceLiveSessions:
+    """Test cases for GameStateService reads and writes through live sessions."""
+
+    def test_events_are_applied_to_session(self, unit_db_session, service, registry, game_id):
+        service.get_live_game_state(game_id)
+
+        service.record_shot(game_id, 1, "3pt", True)
+        service.record_shot(game_id, 4, "2pt", False)
+        service.record_foul(game_id, 4)
+        statements = _count_queries(unit_db_session)
+
+        state = service.get_live_game_state(game_id)
+
+        assert len(statements) == 1
+        assert state["game_state"]["home_score"] == 3
+        assert state["game_state"]["away_score"] == 0
+        assert [e["type"] for e in state["recent_events"]] == ["foul", "shot", "shot", "game_start"]
+        assert registry.get(game_id).fouls(4) == 1
+
+    def test_session_matches_database_rebuild(self, service, game_id):
+        service.get_live_game_state(game_id)
+        service.record_shot(game_id, 1, "2pt", True)
+        service.record_shot(game_id, 5, "ft", True)
+        service.substitute_players(game_id, 1, [2], [3])
+        service.end_quarter(game_id)
+
+        from_session = service.get_live_game_state(game_id)
+        rebuilt = GameStateService(service.session, live_sessions=LiveGameSessionRegistry()).get_live_game_state(
+            game_id
+        )
+
+        assert from_session["game_state"] == rebuilt["game_state"]
+        assert from_session["recent_events"] == rebuilt["recent_events"]
+        assert sorted(_on_court(from_session, "home")) == sorted(_on_court(rebuilt, "home")) == [1, 3]
+        assert from_session["game_state"]["current_quarter"] == 2
+
+    def test_events_written_elsewhere_trigger_rebuild(self, unit_db_session, service, game_id):
+        service.get_live_game_state(game_id)
+
+        # Another worker records a shot; this process's session never sees it
+        GameStateService(unit_db_session, live_sessions=LiveGameSessionRegistry()).record_shot(game_id, 4, "3pt", True)
+
+        assert service.get_live_game_state(game_id)["game_state"]["away_score"] == 3
+
+    def test_missed_event_is_not_patched_over(self, unit_db_session, service, registry, game_id):
+        service.get_live_game_state(game_id)
+        GameStateService(unit_db_session, live_sessions=LiveGameSessionRegistry()).record_shot(game_id, 4, "3pt", True)
+
+        service.record_shot(game_id, 1, "2pt", True)
+
+        assert registry.get(game_id) is None
+        state = service.get_live_game_state(game_id)["game_state"]
+        assert (state["home_score"], state["away_score"]) == (2, 3)
+
+    def test_undo_reloads_session(self, service, registry, game_id):
+        service.get_live_game_state(game_id)
+        service.record_shot(game_id, 1, "3pt", True)
+
+        service.undo_last_event(game_id)
+
+        state = service.get_live_game_state(game_id)
+        assert state["game_state"]["home_score"] == 0
+        assert [e["type"] for e in state["recent_events"]] == ["undo", "game_start"]
+        assert registry.get(game_id).version == state["recent_events"][0]["id"]
+
+    def test_stats_corrections_trigger_rebuild(self, unit_db_session, service, game_id):
+        service.record_shot(game_id, 1, "2pt", True)
+        service.get_live_game_state(game_id)
+
+        # A data correction made by another worker, outside the event log
+        DataCorrectionService(unit_db_session).update_player_game_stats(
+            unit_db_session.query(PlayerGameStats).filter_by(game_id=game_id, player_id=1).one().id,
+            {"total_2pm": 3},
+        )
+        unit_db_session.commit()
+
+        assert service.get_live_game_state(game_id)["game_state"]["home_score"] == 6
+
+    def test_events_after_a_correction_still_trigger_rebuild(self, unit_db_session, service, game_id):
+        service.get_live_game_state(game_id)
+        with SeasonStatsService(unit_db_session).track_game_changes(game_id):
+            unit_db_session.add(PlayerGameStats(game_id=game_id, player_id=4, total_3pm=1, total_3pa=1))
+        unit_db_session.commit()
+
+        # The shot directly follows the session's last event, so it is applied before the revision is checked
+        service.record_shot(game_id, 1, "2pt", True)
+
+        state = service.get_live_game_state(game_id)["game_state"]
+        assert (state["home_score"], state["away_score"]) == (2, 3)
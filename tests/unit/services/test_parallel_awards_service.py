@@ -0,0 +1,85 @@
+# tests/unit/services/test_parallel_awards_service.py
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.data_access.models import Base, PlayerAward
+from app.services.parallel_awards_service import calculate_awards_parallel, list_award_seasons
+from app.services.season_awards_engine import run_season_awards
+from app.services.weekly_awards_engine import run_weekly_awards
+
+
+def _seed_three_years(seed_league, session):
+    """Seed games spread over three calendar years."""
+    seed_league(session, num_games=60, seed=8, players_per_team=5, start=date(2023, 10, 2), days_between_games=9)
+
+
+def _award_snapshot(session):
+    """Return the stored awards as comparable tuples."""
+    return sorted(
+        (award.award_type, award.season, award.week_date or date.min, award.player_id, award.game_id or 0)
+        for award in session.query(PlayerAward).all()
+    )
+
+
+def _serial_snapshot(session, recalculate: bool = False):
+    """Run both award families serially and return their results and stored awards."""
+    results = {
+        "season": run_season_awards(session, None, recalculate),
+        "weekly": run_weekly_awards(session, None, recalculate),
+    }
+    snapshot = _award_snapshot(session)
+    session.query(PlayerAward).delete()
+    session.commit()
+    return results, snapshot
+
+
+class TestParallelAwards:
+    """Test splitting award calculation into (family, season) units."""
+
+    def test_lists_calendar_seasons(self, unit_db_session, seed_league):
+        """Seasons are the calendar years that have games."""
+        _seed_three_years(seed_league, unit_db_session)
+
+        assert list_award_seasons(unit_db_session) == ["2023", "2024", "2025"]
+
+    @pytest.mark.parametrize("recalculate", [False, True])
+    def test_per_season_units_match_serial_run(self, unit_db_session, seed_league, recalculate):
+        """Evaluating season by season persists exactly what a single serial run does."""
+        _seed_three_years(seed_league, unit_db_session)
+        serial_results, serial_awards = _serial_snapshot(unit_db_session, recalculate)
+
+        # In-memory databases cannot be shared, so workers fall back to serial evaluation
+        results = calculate_awards_parallel(
+            unit_db_session, {"season": None, "weekly": None}, recalculate=recalculate, workers=4
+        )
+
+        assert serial_awards
+        assert _award_snapshot(unit_db_session) == serial_awards
+        assert results == serial_results
+
+    def test_unknown_family_is_rejected(self, unit_db_session):
+        """Only the weekly and season families can be targeted."""
+        with pytest.raises(ValueError):
+            calculate_awards_parallel(unit_db_session, {"monthly": None})
+
+    @pytest.mark.slow
+    def test_process_pool_matches_serial_run(self, tmp_path, seed_league):
+        """Worker processes with their own engines produce the same awards as a serial run."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'awards.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            _seed_three_years(seed_league, session)
+            serial_results, serial_awards = _serial_snapshot(session)
+
+            results = calculate_awards_parallel(session, {"season": None, "weekly": None}, workers=2)
+
+            assert _award_snapshot(session) == serial_awards
+            assert results == serial_results
+        finally:
+            session.close()
+            engine.dispose()
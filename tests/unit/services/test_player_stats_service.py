@@ -1,9 +1,12 @@
 """Unit tests for PlayerStatsService."""
 
+import datetime
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import event
 
+from app.data_access.models import Game, Player, PlayerGameStats, Team
 from app.services.player_stats_service import PlayerStatsService
 
 
@@ -163,66 +166,85 @@ class TestPlayerStatsService:
         assert result["effective_fg_percentage"] == 0
         assert result["true_shooting_percentage"] == 0
 
-    def test_get_player_stats_integration(self, player_stats_service, mock_db_session, mock_player, mock_game_stats):
-        """Test integration of get_player_stats method."""
-        # Mock the database calls
-        from unittest.mock import patch
-
-        with (
-            patch("app.services.player_stats_service.get_all_players") as mock_get_players,
-            patch("app.services.player_stats_service.get_all_player_game_stats_for_player") as mock_get_stats,
-        ):
-            mock_get_players.return_value = [mock_player]
-            mock_get_stats.return_value = mock_game_stats
-
-            result = player_stats_service.get_player_stats()
-
-            assert len(result) == 1
-            assert result[0]["player_name"] == "John Doe"
-            assert result[0]["total_points"] == 31
-
-            # Verify database session was passed correctly
-            mock_get_players.assert_called_once_with(mock_db_session)
-            mock_get_stats.assert_called_once_with(mock_db_session, 1)
-
-    def test_get_player_stats_with_team_filter(
-        self, player_stats_service, mock_db_session, mock_player, mock_game_stats
-    ):
-        """Test get_player_stats with team filter."""
-        from unittest.mock import patch
-
-        # Create players from different teams
-        player1 = Mock()
-        player1.id = 1
-        player1.team_id = 1
-        player1.name = "Player 1"
-        player1.jersey_number = "1"
-        player1.position = "PG"
-        player1.team = Mock()
-        player1.team.name = "Team 1"
-
-        player2 = Mock()
-        player2.id = 2
-        player2.team_id = 2
-        player2.name = "Player 2"
-        player2.jersey_number = "2"
-        player2.position = "SG"
-        player2.team = Mock()
-        player2.team.name = "Team 2"
-
-        with (
-            patch("app.services.player_stats_service.get_all_players") as mock_get_players,
-            patch("app.services.player_stats_service.get_all_player_game_stats_for_player") as mock_get_stats,
-        ):
-            mock_get_players.return_value = [player1, player2]
-            mock_get_stats.return_value = []
-
-            # Test filtering by team_id = 1
-            result = player_stats_service.get_player_stats(team_id=1)
-
-            assert len(result) == 1
-            assert result[0]["player_name"] == "Player 1"
-            assert result[0]["team_id"] == 1
-
-            # Verify database session was passed correctly
-            mock_get_players.assert_called_once_with(mock_db_session)
+
+class TestPlayerStatsLeaderboard:
+    """Test cases for PlayerStatsService.get_player_stats against a database."""
+
+    @pytest.fixture
+    def service(self, unit_db_session):
+        lakers, celtics = Team(id=1, name="Lakers", display_name="LA Lakers"), Team(id=2, name="Celtics")
+        unit_db_session.add_all([lakers, celtics])
+        unit_db_session.add_all(
+            [
+                Player(id=1, name="Shooter", team_id=1, jersey_number="1"),
+                Player(id=2, name="Slasher", team_id=1, jersey_number="2"),
+                Player(id=3, name="Bench", team_id=1, jersey_number="3"),
+                Player(id=4, name="Center", team_id=2, jersey_number="4"),
+            ]
+        )
+        games = [Game(id=i, date=datetime.date(2025, 1, i), playing_team_id=1, opponent_team_id=2) for i in (1, 2, 3)]
+        unit_db_session.add_all(games)
+        lines = {
+            1: [(0, 2, 2, 1, 2, 3, 6), (1, 0, 0, 2, 4, 2, 5), (2, 1, 2, 0, 1, 4, 8)],
+            2: [(3, 4, 6, 5, 8, 0, 1), (2, 2, 2, 6, 9, 0, 0)],
+            4: [(5, 0, 4, 7, 10, 0, 0), (4, 1, 2, 4, 7, 0, 0), (1, 0, 0, 3, 5, 0, 0)],
+        }
+        for player_id, player_lines in lines.items():
+            for game_id, line in enumerate(player_lines, start=1):
+                fouls, ftm, fta, fg2m, fg2a, fg3m, fg3a = line
+                unit_db_session.add(
+                    PlayerGameStats(
+                        game_id=game_id,
+                        player_id=player_id,
+                        fouls=fouls,
+                        total_ftm=ftm,
+                        total_fta=fta,
+                        total_2pm=fg2m,
+                        total_2pa=fg2a,
+                        total_3pm=fg3m,
+                        total_3pa=fg3a,
+                    )
+                )
+        unit_db_session.commit()
+        return PlayerStatsService(unit_db_session)
+
+    def test_matches_per_player_calculation(self, service, unit_db_session):
+        result = service.get_player_stats()
+
+        assert [stats["player_id"] for stats in result] == [1, 2, 3, 4]
+        for stats in result:
+            player = unit_db_session.get(Player, stats["player_id"])
+            game_stats = unit_db_session.query(PlayerGameStats).filter_by(player_id=player.id).all()
+            assert stats == service._calculate_player_stats(player, game_stats)
+        assert result[0]["team_name"] == "LA Lakers"
+        assert result[2]["games_played"] == 0
+
+    def test_team_filter(self, service):
+        result = service.get_player_stats(team_id=2)
+
+        assert [stats["player_name"] for stats in result] == ["Center"]
+
+    def test_sort_limit_and_min_games(self, service):
+        by_points = service.get_player_stats(sort_by="total_points")
+        assert [stats["player_id"] for stats in by_points] == [1, 4, 2, 3]
+        assert by_points[0]["total_points"] >= by_points[1]["total_points"]
+
+        top_shooting = service.get_player_stats(sort_by="true_shooting_percentage", limit=2)
+        expected = sorted(by_points, key=lambda stats: -stats["true_shooting_percentage"])[:2]
+        assert [stats["player_id"] for stats in top_shooting] == [stats["player_id"] for stats in expected]
+
+        fewest_fouls = service.get_player_stats(sort_by="fouls_per_game", descending=False, min_games=3)
+        assert [stats["player_id"] for stats in fewest_fouls] == [1, 4]
+
+    def test_unknown_sort_key(self, service):
+        with pytest.raises(ValueError, match="Unknown sort key 'height'"):
+            service.get_player_stats(sort_by="height")
+
+    def test_single_query(self, service, unit_db_session):
+        statements = []
+        event.listen(unit_db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        service.get_player_stats(team_id=1, sort_by="points_per_game", limit=2, min_games=1)
+
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0] and "HAVING" in statements[0] and "LIMIT" in statements[0]
@@ -0,0 +1,117 @@
+"""Unit tests for ScorebookService."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.data_access.models import Game, Player, PlayerGameStats, PlayerQuarterStats, Team
+from app.services.scorebook_service import ScorebookService
+from app.utils.scorebook_parser import parse_scorebook_entries
+
+
+@pytest.fixture
+def game(unit_db_session):
+    unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers"), Team(id=3, name="Guest Players")])
+    unit_db_session.add_all(
+        [
+            Player(id=1, name="Home One", team_id=1, jersey_number="1"),
+            Player(id=2, name="Home Two", team_id=1, jersey_number="2"),
+            Player(id=3, name="Away One", team_id=2, jersey_number="3"),
+            Player(id=4, name="Guest", team_id=3, jersey_number="4", is_substitute=True),
+        ]
+    )
+    game = Game(date=date(2025, 1, 1), playing_team_id=1, opponent_team_id=2)
+    unit_db_session.add(game)
+    unit_db_session.commit()
+    return game
+
+
+def _save(db_session, game, *players_data):
+    changes = ScorebookService(db_session).save(game, parse_scorebook_entries(list(players_data)))
+    db_session.flush()
+    return changes
+
+
+def _lines(db_session, game):
+    return {stats.player_id: stats for stats in db_session.query(PlayerGameStats).filter_by(game_id=game.id)}
+
+
+class TestScorebookServiceSave:
+    """Test cases for ScorebookService.save."""
+
+    def test_inserts_new_lines(self, unit_db_session, game):
+        changes = _save(
+            unit_db_session,
+            game,
+            {"player_id": 1, "fouls": 2, "qt1_shots": "22-1x", "qt3_shots": "3"},
+            {"player_id": 3, "fouls": 1, "qt2_shots": "2/"},
+            {"player_id": 4, "fouls": 0, "qt4_shots": "11"},
+        )
+
+        assert (changes.home_score, changes.away_score) == (8, 2)
+        assert (changes.inserted, changes.updated, changes.deleted) == (3, 0, 0)
+        lines = _lines(unit_db_session, game)
+        assert (lines[1].fouls, lines[1].total_2pm, lines[1].total_2pa, lines[1].total_3pm) == (2, 2, 3, 1)
+        # Empty quarters are not stored
+        assert sorted(q.quarter_number for q in lines[1].quarter_stats) == [1, 3]
+
+    def test_applies_only_changes(self, unit_db_session, game):
+        _save(
+            unit_db_session,
+            game,
+            {"player_id": 1, "fouls": 2, "qt1_shots": "22", "qt2_shots": "3"},
+            {"player_id": 3, "fouls": 1, "qt1_shots": "2"},
+        )
+        unit_db_session.commit()
+
+        statements = []
+        event.listen(unit_db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        changes = _save(
+            unit_db_session,
+            game,
+            {"player_id": 1, "fouls": 2, "qt1_shots": "22", "qt2_shots": "3-"},
+            {"player_id": 3, "fouls": 1, "qt1_shots": "2"},
+        )
+
+        assert (changes.inserted, changes.updated, changes.deleted) == (0, 1, 0)
+        assert changes.player_ids == {1}
+        writes = [s for s in statements if s.startswith(("INSERT", "UPDATE", "DELETE"))]
+        assert len(writes) == 2
+        assert writes[0].startswith("UPDATE player_game_stats")
+        assert writes[1].startswith("UPDATE player_quarter_stats")
+        unit_db_session.expire_all()
+        assert _lines(unit_db_session, game)[1].total_2pa == 3
+
+    def test_deletes_missing_players(self, unit_db_session, game):
+        _save(
+            unit_db_session,
+            game,
+            {"player_id": 1, "fouls": 0, "qt1_shots": "2"},
+            {"player_id": 2, "fouls": 0, "qt1_shots": "3"},
+        )
+
+        changes = _save(unit_db_session, game, {"player_id": 1, "fouls": 0, "qt1_shots": "2", "qt2_shots": "1"})
+
+        assert (changes.inserted, changes.updated, changes.deleted) == (0, 1, 1)
+        assert changes.player_ids == {1, 2}
+        assert set(_lines(unit_db_session, game)) == {1}
+        assert unit_db_session.query(PlayerQuarterStats).count() == 2
+        assert changes.home_score == 3
+
+    def test_prefetches_roster_once(self, unit_db_session, game):
+        statements = []
+        event.listen(unit_db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        _save(unit_db_session, game, *({"player_id": pid, "fouls": 0, "qt1_shots": "2"} for pid in (1, 2, 3, 4)))
+
+        assert len([s for s in statements if "FROM players" in s]) == 1
+        assert len([s for s in statements if s.startswith("INSERT INTO player_quarter_stats")]) == 1
+
+    def test_unknown_player(self, unit_db_session, game):
+        with pytest.raises(ValueError, match="Player 999 not found"):
+            _save(unit_db_session, game, {"player_id": 999, "fouls": 0})
+
+    def test_duplicate_player(self, unit_db_session, game):
+        with pytest.raises(ValueError, match="Player 1 has more than one entry"):
+            _save(unit_db_session, game, {"player_id": 1, "fouls": 0}, {"player_id": 1, "fouls": 1})
@@ -0,0 +1,107 @@
+# tests/unit/services/test_season_awards_engine.py
+
+import pytest
+
+from app.data_access.models import PlayerAward, PlayerGameStats
+from app.services import awards_service
+from app.services.season_awards_engine import evaluate_season_awards, load_season_matrices, run_season_awards
+
+LEGACY_SEASON_CALCULATORS = {
+    "rick_barry_award": awards_service.calculate_rick_barry_award,
+    "top_scorer": awards_service.calculate_top_scorer,
+    "sharpshooter": awards_service.calculate_sharpshooter,
+    "efficiency_expert": awards_service.calculate_efficiency_expert,
+    "human_highlight_reel": awards_service.calculate_human_highlight_reel,
+    "charity_stripe_regular": awards_service.calculate_charity_stripe_regular,
+    "defensive_tackle": awards_service.calculate_defensive_tackle,
+    "air_ball_artist": awards_service.calculate_air_ball_artist,
+    "air_assault": awards_service.calculate_air_assault,
+    "curry_wannabe": awards_service.calculate_curry_wannabe_award,
+    "hack_a_shaq": awards_service.calculate_hack_a_shaq_award,
+}
+
+
+def _award_snapshot(session):
+    """Return the stored season awards as comparable tuples."""
+    return sorted(
+        (
+            award.award_type,
+            award.season,
+            award.player_id,
+            award.points_scored,
+            round(award.stat_value, 9) if award.stat_value is not None else None,
+        )
+        for award in session.query(PlayerAward).all()
+    )
+
+
+class TestSeasonAwardsEngine:
+    """Test the shared-aggregate season awards engine."""
+
+    @pytest.mark.parametrize("season", ["2024", "2025"])
+    def test_matches_legacy_calculators(self, unit_db_session, seed_league, season):
+        """The engine awards exactly what the per-award calculators award."""
+        seed_league(unit_db_session, num_games=80, seed=5)
+
+        legacy_results = {}
+        for award_type, calculator in LEGACY_SEASON_CALCULATORS.items():
+            result = calculator(unit_db_session, season)
+            legacy_results[award_type] = result if isinstance(result, dict) else {season: result}
+        legacy_awards = _award_snapshot(unit_db_session)
+        unit_db_session.query(PlayerAward).delete()
+        unit_db_session.commit()
+
+        results = awards_service.calculate_all_season_awards(unit_db_session, season=season)
+
+        assert legacy_awards
+        assert _award_snapshot(unit_db_session) == legacy_awards
+        for award_type, legacy in legacy_results.items():
+            assert {k: v for k, v in results[award_type].items() if v} == {k: v for k, v in legacy.items() if v}
+
+    def test_rerun_is_idempotent_and_recalculate_resets(self, unit_db_session, seed_league):
+        """Re-running keeps existing awards; recalculating rebuilds the season from scratch."""
+        seed_league(unit_db_session, num_games=30, seed=5)
+        first = run_season_awards(unit_db_session, season="2025")
+        snapshot = _award_snapshot(unit_db_session)
+
+        assert run_season_awards(unit_db_session, season="2025") == first
+        assert _award_snapshot(unit_db_session) == snapshot
+
+        unit_db_session.add(PlayerAward(player_id=1, season="2025", award_type="top_scorer", week_date=None))
+        unit_db_session.commit()
+        assert run_season_awards(unit_db_session, season="2025", recalculate=True) == first
+        assert _award_snapshot(unit_db_session) == snapshot
+
+    def test_matrices_group_by_calendar_year(self, unit_db_session, seed_league):
+        """Totals are keyed by calendar-year season with one row per player."""
+        seed_league(unit_db_session, num_games=90, seed=5)
+
+        matrices = load_season_matrices(unit_db_session)
+
+        assert set(matrices) == {"2024", "2025"}
+        assert (
+            sum(sum(matrix["games"]) for matrix in matrices.values()) == unit_db_session.query(PlayerGameStats).count()
+        )
+        for matrix in matrices.values():
+            assert len(set(matrix["player_id"])) == len(matrix["player_id"])
+        awards = evaluate_season_awards(matrices, ["top_scorer"])
+        assert {award["season"] for award in awards} == {"2024", "2025"}
+        assert load_season_matrices(unit_db_session, season="2024-25") == {}
+
+    @pytest.mark.slow
+    def test_benchmark_against_legacy_calculators(self, unit_db_session, seed_league, benchmark_against_legacy):
+        """Benchmark the shared-aggregate engine against running each calculator separately."""
+        seed_league(unit_db_session, num_games=600, seed=5)
+
+        def legacy():
+            for calculator in LEGACY_SEASON_CALCULATORS.values():
+                calculator(unit_db_session, "2025", recalculate=True)
+
+        legacy_statements, engine_statements = benchmark_against_legacy(
+            "season awards over 600 games",
+            legacy,
+            lambda: run_season_awards(unit_db_session, season="2025", recalculate=True),
+            bind=unit_db_session.get_bind(),
+        )
+
+        assert engine_statements < legacy_statements
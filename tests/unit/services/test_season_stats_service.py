@@ -1,13 +1,24 @@
 """Unit tests for the season statistics service."""
 
 import datetime
+import logging
 from unittest.mock import MagicMock
 
 import pytest
-
-from app.data_access.models import PlayerGameStats, PlayerSeasonStats
+from sqlalchemy import event
+
+from app.data_access.models import Player, PlayerGameStats, PlayerSeasonStats, Season, TeamSeasonStats
+from app.services.commands import (
+    DeleteGameCommand,
+    TransferPlayerCommand,
+    UpdateGameCommand,
+    UpdatePlayerGameStatsCommand,
+    UpdatePlayerQuarterStatsCommand,
+)
 from app.services.season_stats_service import SeasonStatsService
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.fixture
 def mock_db_session():
@@ -110,9 +121,8 @@ class TestSeasonStatsService:
 
     def test_get_player_rankings_ppg(self, season_stats_service, mock_db_session):
         """Test getting player rankings by points per game."""
-        # Mock latest game for season detection
-        mock_game = MagicMock(date=datetime.date(2024, 11, 1))
-        mock_db_session.query.return_value.order_by.return_value.first.return_value = mock_game
+        # Mock active season for season detection
+        mock_db_session.query.return_value.filter.return_value.first.return_value = MagicMock(code="2024-25")
 
         # Mock player season stats
         mock_player1 = MagicMock()
@@ -149,9 +159,8 @@ class TestSeasonStatsService:
 
     def test_get_team_standings(self, season_stats_service, mock_db_session):
         """Test getting team standings."""
-        # Mock latest game
-        mock_game = MagicMock(date=datetime.date(2024, 11, 1))
-        mock_db_session.query.return_value.order_by.return_value.first.return_value = mock_game
+        # Mock active season
+        mock_db_session.query.return_value.filter.return_value.first.return_value = MagicMock(code="2024-25")
 
         # Mock teams
         team1 = MagicMock()
@@ -195,3 +204,197 @@ class TestSeasonStatsService:
     # - tests/integration/test_season_statistics.py::test_update_season_stats_integration
     # - tests/integration/test_season_statistics.py::test_player_rankings_integration
     # - tests/integration/test_season_statistics.py::test_team_standings_integration
+
+
+@pytest.fixture
+def league(unit_db_session, seed_league):
+    """A small league across two seasons with season tables built incrementally."""
+    seeded = seed_league(unit_db_session, num_games=12, seed=11, seasons=("2023-24", "2024-25"), with_quarters=True)
+    service = SeasonStatsService(unit_db_session)
+    # Build the season tables one new game at a time
+    for game in seeded["games"]:
+        service.apply_game_delta({}, service.get_game_contribution(game.id))
+    unit_db_session.commit()
+    return {"session": unit_db_session, "service": service, **seeded}
+
+
+class TestIncrementalSeasonStats:
+    """Incremental season table maintenance stays in sync with a full rebuild."""
+
+    @staticmethod
+    def _assert_in_sync(service):
+        assert service.verify_season_stats() == {"players": [], "teams": []}
+
+    def test_created_games_match_full_rebuild(self, league):
+        """Applying each new game's contribution reproduces the full rebuild."""
+        service = league["service"]
+        self._assert_in_sync(service)
+        assert league["session"].query(PlayerSeasonStats).count() > 0
+        assert {row.season for row in league["session"].query(TeamSeasonStats)} == {"2023-24", "2024-25"}
+
+    def test_totals_match_legacy_recompute(self, league):
+        """The aggregate totals agree with the per-entity recompute methods."""
+        session, service = league["session"], league["service"]
+        expected = service.compute_season_totals("2024-25")
+
+        for team in league["teams"]:
+            service.update_team_season_stats(team.id, "2024-25")
+        for players in league["roster"].values():
+            for player in players:
+                service.update_player_season_stats(player.id, "2024-25")
+
+        assert service.verify_season_stats("2024-25") == {"players": [], "teams": []}
+        assert len(expected["teams"]) == session.query(TeamSeasonStats).filter_by(season="2024-25").count()
+
+    def test_edit_delete_restore_and_transfer(self, league):
+        """Game edits, soft-deletes, restores and transfers apply only their delta."""
+        session, service, games = league["session"], league["service"], league["games"]
+
+        stats = session.query(PlayerGameStats).filter_by(game_id=games[0].id).first()
+        UpdatePlayerGameStatsCommand(session, stats.id, {"total_3pm": stats.total_3pm + 2, "fouls": 5}).execute()
+        self._assert_in_sync(service)
+
+        quarter = stats.quarter_stats[0]
+        UpdatePlayerQuarterStatsCommand(session, quarter.id, {"ftm": quarter.ftm + 1, "fta": quarter.fta + 1}).execute()
+        self._assert_in_sync(service)
+
+        UpdateGameCommand(session, games[1].id, {"season_id": games[0].season_id}).execute()
+        self._assert_in_sync(service)
+
+        delete = DeleteGameCommand(session, games[2].id)
+        delete.execute()
+        self._assert_in_sync(service)
+        delete.undo()
+        self._assert_in_sync(service)
+
+        player = session.get(Player, stats.player_id)
+        new_team = next(team for team in league["teams"] if team.id != player.team_id)
+        transfer = TransferPlayerCommand(session, player.id, new_team.id)
+        transfer.execute()
+        self._assert_in_sync(service)
+        transfer.undo()
+        self._assert_in_sync(service)
+
+    def test_legacy_recompute_skips_deleted_games(self, league):
+        """The per-entity recompute ignores soft-deleted games and keys rows by season code."""
+        session, service, games = league["session"], league["service"], league["games"]
+        game = games[-1]
+        DeleteGameCommand(session, game.id).execute()
+
+        service.update_team_season_stats(game.playing_team_id)
+        service.update_team_season_stats(game.opponent_team_id)
+        for stats in session.query(PlayerGameStats).filter_by(game_id=game.id):
+            service.update_player_season_stats(stats.player_id)
+
+        self._assert_in_sync(service)
+
+    def test_default_season_reads_rebuilt_rows(self, league):
+        """Readers default to the season code the rebuild writes."""
+        session, service = league["session"], league["service"]
+        service.update_all_season_stats()
+
+        assert service.get_current_season() == "2024-25"
+        standings = service.get_team_standings()
+        assert {row["team_id"] for row in standings} == {
+            row.team_id for row in session.query(TeamSeasonStats).filter_by(season="2024-25")
+        }
+        assert service.get_player_rankings("ppg", limit=100)
+        assert service.get_teams_records([row["team_id"] for row in standings]) == {
+            row["team_id"]: (row["wins"], row["losses"]) for row in standings
+        }
+
+        # An active season takes precedence over the latest game
+        session.query(Season).filter_by(code="2023-24").one().is_active = True
+        session.flush()
+        assert service.get_current_season() == "2023-24"
+
+    def test_deleting_only_game_removes_rows(self, league):
+        """Rows whose games_played drops to zero are removed."""
+        session, service, games = league["session"], league["service"], league["games"]
+        for game in games:
+            DeleteGameCommand(session, game.id).execute()
+
+        assert session.query(PlayerSeasonStats).count() == 0
+        assert session.query(TeamSeasonStats).count() == 0
+        self._assert_in_sync(service)
+
+    def test_verify_reports_drift(self, league):
+        """Verification lists rows that differ from the rebuild."""
+        session, service = league["session"], league["service"]
+        row = session.query(TeamSeasonStats).first()
+        row.wins += 1
+        session.add(PlayerSeasonStats(player_id=999, season="2024-25", games_played=1))
+        session.flush()
+
+        mismatches = service.verify_season_stats()
+
+        assert [m["team_id"] for m in mismatches["teams"]] == [row.team_id]
+        assert mismatches["teams"][0]["stored"]["wins"] == mismatches["teams"][0]["expected"]["wins"] + 1
+        assert mismatches["players"] == [
+            {"player_id": 999, "season": "2024-25", "stored": mismatches["players"][0]["stored"], "expected": None}
+        ]
+
+
+class TestBulkSeasonStatsRebuild:
+    """Single-transaction bulk rebuild of the season tables."""
+
+    def test_rebuild_from_empty_tables(self, league):
+        """A rebuild recreates every row and matches the rebuild totals."""
+        session, service = league["session"], league["service"]
+        session.query(PlayerSeasonStats).delete()
+        session.query(TeamSeasonStats).delete()
+        session.commit()
+        progress = []
+
+        summary = service.rebuild_season_stats(
+            batch_size=7, progress_callback=lambda done, total: progress.append(done)
+        )
+
+        assert service.verify_season_stats() == {"players": [], "teams": []}
+        assert summary["inserted"] == summary["rows"] == summary["players"] + summary["teams"]
+        assert summary["updated"] == summary["deleted"] == 0
+        assert summary["rows_per_second"] > 0
+        assert progress == sorted(progress) and progress[-1] == summary["rows"]
+
+    def test_rebuild_updates_and_removes_stale_rows(self, league):
+        """Drifted rows are corrected and rows without games are removed."""
+        session, service = league["session"], league["service"]
+        session.query(TeamSeasonStats).first().wins += 3
+        session.add(PlayerSeasonStats(player_id=999, season="2024-25", games_played=4))
+        session.add(PlayerSeasonStats(player_id=999, season="1999-00", games_played=4))
+        session.commit()
+
+        summary = service.rebuild_season_stats("2024-25")
+
+        assert summary["deleted"] == 1
+        assert summary["inserted"] == 0
+        assert service.verify_season_stats("2024-25") == {"players": [], "teams": []}
+        # Rows outside the requested season are left alone
+        assert session.query(PlayerSeasonStats).filter_by(player_id=999, season="1999-00").count() == 1
+
+    def test_update_all_season_stats_uses_bulk_rebuild(self, league):
+        """The legacy entry point rebuilds through the bulk path."""
+        session, service = league["session"], league["service"]
+        session.query(PlayerSeasonStats).delete()
+        session.commit()
+
+        summary = service.update_all_season_stats("2023-24")
+
+        assert summary["inserted"] > 0
+        assert service.verify_season_stats("2023-24")["players"] == []
+        assert session.query(PlayerSeasonStats).filter_by(season="2024-25").count() == 0
+
+    @pytest.mark.slow
+    def test_benchmark_rebuild_season(self, unit_db_session, seed_league):
+        """Rebuilding a season of a few thousand games runs a fixed handful of statements."""
+        seed_league(unit_db_session, num_games=3000, seed=5, num_teams=24, players_per_team=10, seasons=("2024-25",))
+        service = SeasonStatsService(unit_db_session)
+        statements = []
+        event.listen(unit_db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        summary = service.rebuild_season_stats("2024-25")
+
+        logger.info("season rebuild over 3000 games: %.0f rows/sec", summary["rows_per_second"])
+        assert summary["players"] == 240
+        assert summary["teams"] == 24
+        assert len(statements) <= 10
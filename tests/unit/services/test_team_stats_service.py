@@ -6,8 +6,61 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from app.data_access.crud.crud_game import get_all_games
+from app.data_access.crud.crud_player_game_stats import get_player_game_stats_for_game_and_team
+from app.data_access.models import Team
 from app.services.team_stats_service import TeamStatsService
 
+SEASONS = ("2023-24", "2024-25")
+
+
+def _points(player_stats) -> int:
+    return sum(pgs.total_ftm + pgs.total_2pm * 2 + pgs.total_3pm * 3 for pgs in player_stats)
+
+
+def _field_goals(player_stats) -> tuple[int, int]:
+    return (
+        sum(pgs.total_2pm + pgs.total_3pm for pgs in player_stats),
+        sum(pgs.total_2pa + pgs.total_3pa for pgs in player_stats),
+    )
+
+
+def _legacy_team_rankings(service: TeamStatsService, db_session) -> list[dict]:
+    """Reference implementation: the original per-game loop (2N+1 queries)."""
+    team_stats = {
+        team.id: {
+            "team_id": team.id,
+            "team_name": team.display_name or team.name,
+            "total_points_scored": 0,
+            "total_fgm": 0,
+            "total_fga": 0,
+            "total_points_allowed": 0,
+            "opponent_total_fgm": 0,
+            "opponent_total_fga": 0,
+            "games_played": 0,
+        }
+        for team in db_session.query(Team).all()
+    }
+    for game in get_all_games(db_session):
+        home = get_player_game_stats_for_game_and_team(db_session, game.id, game.playing_team_id)
+        away = get_player_game_stats_for_game_and_team(db_session, game.id, game.opponent_team_id)
+        home_score, away_score = _points(home), _points(away)
+        home_fgm, home_fga = _field_goals(home)
+        away_fgm, away_fga = _field_goals(away)
+        for team_id, pts, allowed, fgm, fga, opp_fgm, opp_fga in (
+            (game.playing_team_id, home_score, away_score, home_fgm, home_fga, away_fgm, away_fga),
+            (game.opponent_team_id, away_score, home_score, away_fgm, away_fga, home_fgm, home_fga),
+        ):
+            stats = team_stats[team_id]
+            stats["total_points_scored"] += pts
+            stats["total_points_allowed"] += allowed
+            stats["total_fgm"] += fgm
+            stats["total_fga"] += fga
+            stats["opponent_total_fgm"] += opp_fgm
+            stats["opponent_total_fga"] += opp_fga
+            stats["games_played"] += 1
+    return [service._build_ranking_entry(stats) for stats in team_stats.values()]
+
 
 class TestTeamStatsService:
     """Test cases for TeamStatsService class."""
@@ -22,39 +75,6 @@ class TestTeamStatsService:
         """Create a TeamStatsService instance with mocked session."""
         return TeamStatsService(mock_db_session)
 
-    def test_calculate_team_score_basic(self, service):
-        """Test basic team score calculation."""
-        # Create mock player stats
-        player_stats = [
-            Mock(total_ftm=1, total_2pm=2, total_3pm=1),  # 1 + 4 + 3 = 8 points
-            Mock(total_ftm=2, total_2pm=1, total_3pm=0),  # 2 + 2 + 0 = 4 points
-        ]
-
-        result = service._calculate_team_score(player_stats)
-        assert result == 12
-
-    def test_calculate_team_score_empty(self, service):
-        """Test team score calculation with no players."""
-        result = service._calculate_team_score([])
-        assert result == 0
-
-    def test_calculate_team_fg_stats_basic(self, service):
-        """Test field goal statistics calculation."""
-        player_stats = [
-            Mock(total_2pm=2, total_2pa=4, total_3pm=1, total_3pa=2),  # 3 made, 6 attempted
-            Mock(total_2pm=1, total_2pa=3, total_3pm=0, total_3pa=1),  # 1 made, 4 attempted
-        ]
-
-        fgm, fga = service._calculate_team_fg_stats(player_stats)
-        assert fgm == 4  # 3 + 1
-        assert fga == 10  # 6 + 4
-
-    def test_calculate_team_fg_stats_empty(self, service):
-        """Test field goal statistics with no players."""
-        fgm, fga = service._calculate_team_fg_stats([])
-        assert fgm == 0
-        assert fga == 0
-
     def test_calculate_offensive_rating_perfect(self, service):
         """Test offensive rating calculation with perfect stats."""
         rating = service._calculate_offensive_rating(100, 100)
@@ -89,6 +109,65 @@ class TestTeamStatsService:
         """Test get_team_rankings with no teams."""
         # Mock empty teams and games
         with patch("app.services.team_stats_service.get_all_teams", return_value=[]):
-            with patch("app.services.team_stats_service.get_all_games", return_value=[]):
-                result = service.get_team_rankings()
-                assert result == []
+            result = service.get_team_rankings()
+            assert result == []
+
+
+class TestTeamRankingsAggregate:
+    """Database-backed tests for the grouped-aggregate rankings engine."""
+
+    def test_matches_legacy_loop(self, unit_db_session, seed_league):
+        """The aggregate engine returns exactly what the per-game loop produced."""
+        seed_league(unit_db_session, num_games=40, seed=7, num_teams=6, players_per_team=8, seasons=SEASONS)
+        # A team with no games must still be reported with zeroed stats
+        unit_db_session.add(Team(name="Idle"))
+        unit_db_session.commit()
+
+        service = TeamStatsService(unit_db_session)
+        expected = _legacy_team_rankings(service, unit_db_session)
+
+        result = service.get_team_rankings()
+
+        assert sorted(result, key=lambda r: r["team_id"]) == sorted(expected, key=lambda r: r["team_id"])
+        idle = next(r for r in result if r["team_name"] == "Idle")
+        assert idle["games_played"] == 0
+        assert idle["defensive_rating"] == 100
+
+    def test_season_filter(self, unit_db_session, seed_league):
+        """Only games from the requested season are aggregated."""
+        seed_league(unit_db_session, num_games=20, seed=7, num_teams=4, players_per_team=8, seasons=SEASONS)
+        service = TeamStatsService(unit_db_session)
+
+        all_seasons = {r["team_id"]: r for r in service.get_team_rankings()}
+        first = {r["team_id"]: r for r in service.get_team_rankings(season="2023-24")}
+        second = {r["team_id"]: r for r in service.get_team_rankings(season="2024-25")}
+
+        for team_id, totals in all_seasons.items():
+            assert first[team_id]["games_played"] + second[team_id]["games_played"] == totals["games_played"]
+            assert (
+                first[team_id]["total_points_scored"] + second[team_id]["total_points_scored"]
+                == totals["total_points_scored"]
+            )
+        assert sum(r["games_played"] for r in first.values()) == 20
+
+    def test_unknown_season_returns_empty(self, unit_db_session, seed_league):
+        """An unknown season code yields no rankings."""
+        seed_league(unit_db_session, num_games=2, seed=7, num_teams=2, players_per_team=8, seasons=SEASONS)
+        assert TeamStatsService(unit_db_session).get_team_rankings(season="1999-00") == []
+
+    @pytest.mark.slow
+    def test_benchmark_against_legacy_loop(self, unit_db_session, seed_league, benchmark_against_legacy):
+        """Benchmark the aggregate engine against the original 2N+1 query loop."""
+        seed_league(unit_db_session, num_games=600, seed=7, num_teams=12, players_per_team=8, seasons=SEASONS)
+        service = TeamStatsService(unit_db_session)
+
+        legacy_statements, aggregate_statements = benchmark_against_legacy(
+            "team rankings over 600 games",
+            lambda: _legacy_team_rankings(service, unit_db_session),
+            service.get_team_rankings,
+            bind=unit_db_session.get_bind(),
+        )
+
+        # The per-game loop issues 2N+1 queries; the aggregate engine a fixed few
+        assert legacy_statements > 2 * 600
+        assert aggregate_statements <= 3
@@ -0,0 +1,115 @@
+# tests/unit/services/test_weekly_awards_engine.py
+
+from datetime import date
+
+import pytest
+
+from app.data_access.models import PlayerAward, PlayerGameStats
+from app.services import awards_service
+from app.services.weekly_awards_engine import evaluate_weekly_awards, load_weekly_frames, run_weekly_awards
+
+LEGACY_WEEKLY_CALCULATORS = {
+    "player_of_the_week": awards_service.calculate_player_of_the_week,
+    "quarterly_firepower": awards_service.calculate_quarterly_firepower,
+    "weekly_ft_king": awards_service.calculate_weekly_ft_king,
+    "hot_hand_weekly": awards_service.calculate_hot_hand_weekly,
+    "clutch_man": awards_service.calculate_clutch_man,
+    "trigger_finger": awards_service.calculate_trigger_finger,
+    "weekly_whiffer": awards_service.calculate_weekly_whiffer,
+    "human_howitzer": awards_service.calculate_human_howitzer,
+    "dub_club": awards_service.calculate_dub_club,
+    "marksman_award": awards_service.calculate_marksman_award,
+    "perfect_performance": awards_service.calculate_perfect_performance,
+    "breakout_performance": awards_service.calculate_breakout_performance,
+}
+
+
+def _award_snapshot(session):
+    """Return the stored weekly awards as comparable tuples."""
+    return sorted(
+        (
+            award.award_type,
+            award.season,
+            award.week_date,
+            award.player_id,
+            award.game_id,
+            award.points_scored,
+            round(award.stat_value, 9) if award.stat_value is not None else None,
+        )
+        for award in session.query(PlayerAward).all()
+    )
+
+
+class TestWeeklyAwardsEngine:
+    """Test the single-scan weekly awards engine."""
+
+    @pytest.mark.parametrize("season", [None, "2025"])
+    def test_matches_legacy_calculators(self, unit_db_session, seed_league, season):
+        """The engine awards exactly what the per-award calculators award."""
+        seed_league(unit_db_session, num_games=60, seed=3, days_between_games=2, with_quarters=True)
+
+        legacy_results = {
+            award_type: calculator(unit_db_session, season=season)
+            for award_type, calculator in LEGACY_WEEKLY_CALCULATORS.items()
+        }
+        legacy_awards = _award_snapshot(unit_db_session)
+        unit_db_session.query(PlayerAward).delete()
+        unit_db_session.commit()
+
+        results = awards_service.calculate_all_weekly_awards(unit_db_session, season=season)
+
+        assert legacy_awards
+        assert _award_snapshot(unit_db_session) == legacy_awards
+        for award_type, legacy in legacy_results.items():
+            assert {k: v for k, v in results[award_type].items() if v} == {k: v for k, v in legacy.items() if v}
+
+    def test_rerun_is_idempotent_and_recalculate_resets(self, unit_db_session, seed_league):
+        """Re-running keeps existing awards; recalculating rebuilds them from scratch."""
+        seed_league(unit_db_session, num_games=20, seed=3, days_between_games=2, with_quarters=True)
+        first = run_weekly_awards(unit_db_session, season="2024")
+        snapshot = _award_snapshot(unit_db_session)
+
+        assert run_weekly_awards(unit_db_session, season="2024") == first
+        assert _award_snapshot(unit_db_session) == snapshot
+
+        unit_db_session.add(
+            PlayerAward(player_id=1, season="2024", award_type="dub_club", week_date=date(2024, 11, 4), game_id=None)
+        )
+        unit_db_session.commit()
+        assert run_weekly_awards(unit_db_session, season="2024", recalculate=True) == first
+        assert _award_snapshot(unit_db_session) == snapshot
+
+    def test_frames_group_by_calendar_week(self, unit_db_session, seed_league):
+        """Lines are bucketed by Monday week start and calendar-year season."""
+        seed_league(unit_db_session, num_games=30, seed=3, days_between_games=2)
+
+        frames = load_weekly_frames(unit_db_session)
+
+        assert all(week_start.weekday() == 0 for _, week_start in frames)
+        assert {season for season, _ in frames} == {"2024", "2025"}
+        assert (
+            sum(len(frame["player_id"]) for frame in frames.values()) == unit_db_session.query(PlayerGameStats).count()
+        )
+        # Without quarter stats, quarter-based awards have no candidates
+        award_types = {award["award_type"] for award in evaluate_weekly_awards(frames)}
+        assert "quarterly_firepower" not in award_types
+        assert "clutch_man" not in award_types
+        assert load_weekly_frames(unit_db_session, season="2024-25") == {}
+
+    @pytest.mark.slow
+    def test_benchmark_against_legacy_calculators(self, unit_db_session, seed_league, benchmark_against_legacy):
+        """Benchmark the single-scan engine against running each calculator separately."""
+        seed_league(unit_db_session, num_games=300, seed=3, days_between_games=2, with_quarters=True)
+
+        def legacy():
+            for calculator in LEGACY_WEEKLY_CALCULATORS.values():
+                calculator(unit_db_session, recalculate=True)
+
+        legacy_statements, engine_statements = benchmark_against_legacy(
+            "weekly awards over 300 games",
+            legacy,
+            lambda: run_weekly_awards(unit_db_session, recalculate=True),
+            bind=unit_db_session.get_bind(),
+        )
+
+        assert engine_statements < legacy_statements
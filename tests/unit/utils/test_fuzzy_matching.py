@@ -1,16 +1,69 @@
 """Tests for fuzzy name matching utilities."""
 
+import random
+
+import pytest
+
 from app.utils.fuzzy_matching import (
+    NameIndex,
+    bounded_levenshtein,
     extract_name_components,
     find_best_name_match,
+    first_names_related,
     fuzzy_name_match,
     is_initial_match,
     levenshtein_distance,
+    name_key,
     names_match_enhanced,
     normalize_name,
     similarity_ratio,
 )
 
+FIRST_NAMES = [
+    "james", "john", "robert", "michael", "william", "david", "richard", "joseph", "thomas", "charles",
+    "christopher", "daniel", "matthew", "anthony", "mark", "steven", "paul", "andrew", "joshua", "kevin",
+    "brian", "george", "jason", "ryan", "jacob", "nicholas", "eric", "jonathan", "stephen", "justin",
+    "brandon", "benjamin", "samuel", "alexander", "jack", "tyler", "aaron", "jose", "zachary", "kyle",
+]  # fmt: skip
+LAST_NAMES = [
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis", "rodriguez", "martinez",
+    "wilson", "anderson", "taylor", "moore", "jackson", "martin", "lee", "perez", "thompson", "white",
+    "harris", "clark", "lewis", "walker", "young", "allen", "king", "wright", "scott", "nguyen",
+]  # fmt: skip
+
+
+def _synthetic_roster(size: int, seed: int = 7) -> list[str]:
+    """Distinct "First LastNN" names."""
+    rng = random.Random(seed)
+    roster: dict[str, None] = {}
+    while len(roster) < size:
+        roster[f"{rng.choice(FIRST_NAMES).title()} {rng.choice(LAST_NAMES).title()}{rng.randrange(100)}"] = None
+    return list(roster)
+
+
+def _name_variants(roster: list[str], count: int, seed: int = 11) -> list[str]:
+    """Initials, truncations, typos and nicknames of roster names, as they show up in CSVs."""
+    rng = random.Random(seed)
+    variants = []
+    for name in rng.sample(roster, count):
+        first, last = name.split()
+        typo = first[0] + first[2] + first[1] + first[3:]
+        variants.append(rng.choice([f"{first[0]}. {last}", f"{first} {last[:-1]}", f"{typo} {last}", name.lower()]))
+    return variants
+
+
+def _brute_force_best_match(target_name: str, candidate_names: list[str]) -> tuple[str, float] | None:
+    """Score every candidate, the way find_best_name_match did before the index."""
+    best_match = None
+    best_score = 0.0
+    for candidate in candidate_names:
+        if fuzzy_name_match(target_name, candidate):
+            score = similarity_ratio(target_name, candidate)
+            if score > best_score:
+                best_score = score
+                best_match = candidate
+    return (best_match, best_score) if best_match else None
+
 
 class TestFuzzyNameMatch:
     """Test fuzzy name matching functionality."""
@@ -293,3 +346,90 @@ class TestRealWorldScenarios:
 
         for name1, name2 in test_cases:
             assert fuzzy_name_match(name1, name2) is False, f"Should not match: {name1} vs {name2}"
+
+
+class TestBoundedLevenshtein:
+    """Test the early-exit edit distance."""
+
+    def test_agrees_with_levenshtein_within_bound(self):
+        """Distances within the bound are exact."""
+        for s1, s2 in [("John", "Jon"), ("Smith", "Smyth"), ("abc", "abc"), ("", "ab"), ("jhon", "john")]:
+            distance = levenshtein_distance(s1, s2)
+            assert bounded_levenshtein(s1, s2, 2) == distance
+
+    def test_caps_distances_beyond_bound(self):
+        """Distances beyond the bound are reported as bound + 1."""
+        assert bounded_levenshtein("Michael", "Mike", 2) == 3
+        assert bounded_levenshtein("abcdef", "uvwxyz", 1) == 2
+        assert bounded_levenshtein("a", "abcdefgh", 3) == 4
+
+
+class TestFirstNamesRelated:
+    """Test first name relatedness."""
+
+    def test_related(self):
+        """Equal names, initials, abbreviations, typos and nicknames are related."""
+        for first1, first2 in [
+            ("john", "john"),
+            ("m", "michael"),
+            ("jon", "jonathan"),
+            ("john", "jhon"),
+            ("william", "bill"),
+            ("bill", "william"),
+        ]:
+            assert first_names_related(first1, first2) is True, f"{first1} vs {first2}"
+
+    def test_unrelated_names_of_same_length(self):
+        """Names of the same length are not related just because of their length."""
+        assert first_names_related("joey", "will") is False
+        assert fuzzy_name_match("Joey", "Will G") is False
+
+
+class TestNameIndex:
+    """Test indexed name matching."""
+
+    def test_matches_agree_with_pairwise_matching(self):
+        """The index finds exactly the names fuzzy_name_match accepts."""
+        synthetic = _synthetic_roster(300)
+        roster = synthetic + ["Mike Jordan", "M Jordan", "Jordan", "Bo", "Al", "J"]
+        index = NameIndex(roster)
+
+        for target in _name_variants(synthetic, 60) + ["Michael Jordan", "Jordon", "B", "Bo", "Al Smith"]:
+            assert index.matches(target) == [c for c in roster if fuzzy_name_match(target, c)], target
+            assert index.find_best_match(target) == _brute_force_best_match(target, roster), target
+
+    def test_find_best_match(self):
+        """The closest accepted name wins."""
+        index = NameIndex(["Jon Smith", "John Smith", "Mike Jordan"])
+
+        assert index.find_best_match("John Smith") == ("John Smith", 1.0)
+        assert index.find_best_match("Michael Jordan")[0] == "Mike Jordan"
+        assert index.find_best_match("Kevin Garcia") is None
+
+    def test_empty_names(self):
+        """Empty names never match."""
+        index = NameIndex(["", "John Smith"])
+
+        assert index.matches("") == []
+        assert index.matches("John Smith") == ["John Smith"]
+
+    @pytest.mark.slow
+    def test_benchmark_against_pairwise_scan(self, benchmark_against_legacy):
+        """Benchmark the index against scoring every player on a 5k-player roster."""
+        roster = _synthetic_roster(5000)
+        targets = _name_variants(roster, 20)
+
+        def indexed():
+            index = NameIndex(roster)
+            return [index.find_best_match(target) for target in targets]
+
+        benchmark_against_legacy(
+            "20 lookups over 5000 players",
+            lambda: [_brute_force_best_match(target, roster) for target in targets],
+            indexed,
+        )
+
+        # The pairwise scan scores all 5000 players per lookup; the index a shortlist
+        index = NameIndex(roster)
+        shortlisted = sum(len(index.candidates(name_key(target))) for target in targets)
+        assert shortlisted < len(roster) * len(targets) // 10
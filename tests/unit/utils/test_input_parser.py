@@ -2,7 +2,12 @@
 Test module for input_parser.py
 """
 
-from app.utils.input_parser import parse_quarter_shot_string
+from app.utils.input_parser import (
+    ShotStringParser,
+    get_shot_parser,
+    parse_quarter_shot_string,
+    shot_stats_at,
+)
 
 
 class TestParseQuarterShotString:
@@ -79,3 +84,54 @@ class TestParseQuarterShotString:
         assert result["fg2a"] == 2
         assert result["fg3m"] == 0
         assert result["fg3a"] == 0
+
+
+class TestShotStringParser:
+    """Tests for the compiled ShotStringParser."""
+
+    def test_parse_many_layout(self, test_shot_mapping):
+        """Tests that parse_many returns six counts per string, in input order."""
+        parser = ShotStringParser(test_shot_mapping)
+
+        parsed = parser.parse_many(["22-1x/", "", None, "33"])
+
+        assert len(parsed) == 4 * 6
+        assert list(parsed[:6]) == [1, 2, 2, 3, 0, 1]
+        assert shot_stats_at(parsed, 1) == shot_stats_at(parsed, 2) == parse_quarter_shot_string("", test_shot_mapping)
+        assert shot_stats_at(parsed, 3) == {"ftm": 0, "fta": 0, "fg2m": 0, "fg2a": 0, "fg3m": 2, "fg3a": 2}
+
+    def test_parse_many_matches_parse(self, test_shot_mapping):
+        """Tests that batch parsing agrees with parsing strings one by one."""
+        parser = ShotStringParser(test_shot_mapping)
+        shot_strings = ["1", "x-", "3/3/", "22?!A#", "-/x1"]
+
+        parsed = parser.parse_many(shot_strings)
+
+        for index, shot_string in enumerate(shot_strings):
+            assert shot_stats_at(parsed, index) == parser.parse(shot_string)
+
+    def test_points(self, test_shot_mapping):
+        """Tests point totals from made shots."""
+        parser = ShotStringParser(test_shot_mapping)
+
+        assert parser.points("22-1x3/") == 8
+        assert parser.points("") == 0
+
+    def test_invalid_chars(self, test_shot_mapping):
+        """Tests that only unmapped, disallowed characters are reported."""
+        parser = ShotStringParser(test_shot_mapping, allowed_chars=" ")
+
+        assert parser.invalid_chars("22 -1x") == ""
+        assert parser.invalid_chars("2a2?") == "a?"
+
+    def test_ignore_case(self):
+        """Tests that ignore_case lowercases strings before matching the mapping."""
+        mapping = {"x": {"type": "FT", "made": False, "points": 0}}
+
+        assert ShotStringParser(mapping, ignore_case=True).parse("XX")["fta"] == 2
+        assert ShotStringParser(mapping).parse("XX")["fta"] == 0
+
+    def test_get_shot_parser_is_cached(self, test_shot_mapping):
+        """Tests that the compiled parser is reused for the same mapping."""
+        assert get_shot_parser(test_shot_mapping) is get_shot_parser(test_shot_mapping)
+        assert get_shot_parser(test_shot_mapping) is not get_shot_parser(dict(test_shot_mapping))
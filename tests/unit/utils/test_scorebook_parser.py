@@ -9,6 +9,7 @@ from app.utils.scorebook_parser import (
     calculate_team_score_from_players,
     format_scoring_notation_help,
     get_shooting_percentages,
+    parse_scorebook_entries,
     parse_scorebook_entry,
     parse_scoring_notation,
     validate_scoring_notation,
@@ -192,6 +193,37 @@ class TestParseScorebookEntry:
             assert total[key] == 0
 
 
+class TestParseScorebookEntries:
+    """Tests for parse_scorebook_entries function."""
+
+    def test_matches_single_entries(self):
+        """Test that batch parsing matches parsing each entry on its own."""
+        players_data = [
+            {"player_id": 1, "fouls": 1, "qt1_shots": "22-1x", "qt3_shots": "3/"},
+            {"player_id": 2, "fouls": 0, "qt2_shots": "11", "ot1_shots": "2"},
+            {"player_id": 3, "fouls": 5},
+        ]
+
+        results = parse_scorebook_entries(players_data)
+
+        assert results == [parse_scorebook_entry(player_data) for player_data in players_data]
+        assert results[1]["quarter_stats"][4]["fg2m"] == 1
+
+    def test_invalid_entry_rejects_batch(self):
+        """Test that one invalid entry fails the whole batch."""
+        players_data = [
+            {"player_id": 1, "fouls": 0, "qt1_shots": "22"},
+            {"player_id": 2, "fouls": 0, "qt2_shots": "2z"},
+        ]
+
+        with pytest.raises(ValueError, match="Quarter 2: Invalid character 'z'"):
+            parse_scorebook_entries(players_data)
+
+    def test_empty(self):
+        """Test parsing no entries."""
+        assert parse_scorebook_entries([]) == []
+
+
 class TestCalculateTeamScoreFromPlayers:
     """Tests for calculate_team_score_from_players function."""
 
@@ -0,0 +1,430 @@
+# tests/unit/web_ui/test_cache.py
+
+"""Unit tests for the tag-aware web UI cache and its backends."""
+
+import asyncio
+import os
+import pickle
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.data_access.models import Base, Game, Player, PlayerGameStats, Team
+from app.web_ui import cache as cache_module
+from app.web_ui.cache import SimpleCache, SQLiteCache, add_cache_tags, cached, invalidate_cache_after
+from app.web_ui.routers.games import _scorebook_cache_tags
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Replace the global cache with an empty one."""
+    instance = SimpleCache()
+    monkeypatch.setattr(cache_module, "cache", instance)
+    return instance
+
+
+class TestTagInvalidation:
+    """Tests for invalidating entries by entity tag."""
+
+    @pytest.mark.asyncio
+    async def test_invalidating_tag_removes_only_dependent_entries(self, fresh_cache):
+        """Only entries that declared the tag are removed."""
+        await fresh_cache.set("team-page", "a", tags=["team:1"])
+        await fresh_cache.set("game-page", "b", tags=["game:7", "team:1"])
+        await fresh_cache.set("other-team", "c", tags=["team:2"])
+
+        removed = await fresh_cache.invalidate_tags(["team:1"])
+
+        assert removed == 2
+        assert await fresh_cache.get("team-page") is None
+        assert await fresh_cache.get("game-page") is None
+        assert await fresh_cache.get("other-team") == "c"
+
+    @pytest.mark.asyncio
+    async def test_stats_report_per_tag_metrics(self, fresh_cache):
+        """Hits, misses and invalidations are counted per tag."""
+        await fresh_cache.set("game-page", "b", tags=["game:7", "games"])
+        await fresh_cache.get("game-page")
+        await fresh_cache.get("game-page")
+        await fresh_cache.invalidate_tags(["game:7"])
+
+        stats = await fresh_cache.get_stats()
+
+        assert stats["total_entries"] == 0
+        assert stats["tags"]["game:7"] == {"entries": 0, "hits": 2, "misses": 1, "invalidations": 1}
+        assert stats["tags"]["games"] == {"entries": 0, "hits": 2, "misses": 1, "invalidations": 0}
+
+    @pytest.mark.asyncio
+    async def test_replacing_entry_drops_old_tags(self, fresh_cache):
+        """Re-setting a key indexes it under its new tags only."""
+        await fresh_cache.set("page", "old", tags=["team:1"])
+        await fresh_cache.set("page", "new", tags=["team:2"])
+
+        assert await fresh_cache.invalidate_tags(["team:1"]) == 0
+        assert await fresh_cache.get("page") == "new"
+
+
+class TestCacheDecorators:
+    """Tests for the cached and invalidate_cache_after decorators."""
+
+    @pytest.mark.asyncio
+    async def test_cached_collects_declared_tags(self, fresh_cache):
+        """Tags added while computing a value are attached to its entry."""
+        calls = []
+
+        @cached(key_prefix="test:", tags=("games",))
+        async def homepage(auth_context=None):
+            calls.append(1)
+            add_cache_tags("game:3", "team:4")
+            return "html"
+
+        assert await homepage(auth_context={}) == "html"
+        assert await homepage(auth_context={}) == "html"
+        assert len(calls) == 1
+        assert set((await fresh_cache.get_stats())["tags"]) == {"games", "game:3", "team:4"}
+
+        await cache_module.invalidate_cache_tags("team:4")
+        await homepage(auth_context={})
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_after_formats_tag_templates(self, fresh_cache):
+        """Templates are filled from keyword arguments and result fields."""
+        await fresh_cache.set("player", "p", tags=["player:9"])
+        await fresh_cache.set("team", "t", tags=["team:2"])
+        await fresh_cache.set("unrelated", "u", tags=["team:3"])
+
+        @invalidate_cache_after(tags=["player:{player_id}", "team:{team_id}"])
+        async def update_player(player_id):
+            return {"success": True, "team_id": 2}
+
+        await update_player(player_id=9)
+
+        assert await fresh_cache.get("player") is None
+        assert await fresh_cache.get("team") is None
+        assert await fresh_cache.get("unrelated") == "u"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_after_accepts_callable_and_skips_failures(self, fresh_cache):
+        """Callables resolve tags, and unsuccessful results invalidate nothing."""
+        await fresh_cache.set("game", "g", tags=["game:5"])
+
+        @invalidate_cache_after(tags=lambda result, kwargs: [f"game:{result['game_id']}"])
+        async def save_game(success):
+            return {"success": success, "game_id": 5}
+
+        await save_game(success=False)
+        assert await fresh_cache.get("game") == "g"
+
+        await save_game(success=True)
+        assert await fresh_cache.get("game") is None
+
+    @pytest.mark.asyncio
+    async def test_bare_invalidate_after_clears_everything(self, fresh_cache):
+        """Without tags every entry is invalidated."""
+        await fresh_cache.set("a", 1, tags=["team:1"])
+        await fresh_cache.set("b", 2)
+
+        @invalidate_cache_after
+        async def wipe():
+            return {"success": True}
+
+        await wipe()
+
+        assert (await fresh_cache.get_stats())["total_entries"] == 0
+
+
+class TestRouterInvalidation:
+    """Tests that router writes invalidate the cached responses that show what they changed."""
+
+    @pytest.fixture
+    def unit_db_engine(self):
+        """In-memory database shared with the thread the test client serves requests on."""
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+        yield engine
+        engine.dispose()
+
+    def test_player_and_team_updates_invalidate_box_score(self, unit_test_client, unit_db_session, fresh_cache):
+        """A box score is rebuilt after a player or team on it is renamed."""
+        unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+        unit_db_session.add(Player(id=1, name="Ann", team_id=1, jersey_number="1"))
+        unit_db_session.add(Game(id=1, date=date(2025, 1, 1), playing_team_id=1, opponent_team_id=2))
+        unit_db_session.add(PlayerGameStats(game_id=1, player_id=1, fouls=0, total_2pm=1, total_2pa=1))
+        unit_db_session.commit()
+
+        def home_team():
+            return unit_test_client.get("/v1/games/1/box-score").json()["home_team"]
+
+        assert [player["name"] for player in home_team()["players"]] == ["Ann"]
+        # Only this game and the entities it shows, not every game
+        assert set(fresh_cache._tag_index) == {"game:1", "team:1", "team:2", "player:1"}
+
+        assert unit_test_client.put("/v1/players/1", json={"name": "Bea"}).status_code == 200
+        assert [player["name"] for player in home_team()["players"]] == ["Bea"]
+
+        assert unit_test_client.put("/v1/teams/1", json={"name": "Falcons"}).status_code == 200
+        assert home_team()["name"] == "Falcons"
+
+    def test_scorebook_updates_leave_the_game_list_alone(self):
+        """Editing a scorebook touches only its game, teams and players; a new game also changes the game list."""
+        result = {"game_id": 4, "team_ids": [1, 2], "changes": {"player_ids": [7]}}
+
+        assert _scorebook_cache_tags(result, {"scorebook_data": {"game_id": 4}}) == [
+            "game:4",
+            "team:1",
+            "team:2",
+            "player:7",
+        ]
+        assert "game-list" in _scorebook_cache_tags(result, {"scorebook_data": {}})
+
+
+class TestBoundedCache:
+    """Tests for LRU eviction and byte accounting."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Reading an entry protects it from eviction."""
+        bounded = SimpleCache(max_entries=2)
+        await bounded.set("a", "1")
+        await bounded.set("b", "2")
+        await bounded.get("a")
+        await bounded.set("c", "3")
+
+        assert await bounded.get("b") is None
+        assert await bounded.get("a") == "1"
+        assert await bounded.get("c") == "3"
+        assert (await bounded.get_stats())["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_is_enforced(self):
+        """Entries are evicted once their approximate size exceeds the budget."""
+        bounded = SimpleCache(max_bytes=100)
+        await bounded.set("a", "x" * 60, tags=["team:1"])
+        await bounded.set("b", "y" * 30)
+        assert (await bounded.get_stats())["total_bytes"] == 90
+
+        await bounded.set("c", "z" * 30)
+        stats = await bounded.get_stats()
+
+        assert await bounded.get("a") is None
+        assert stats["total_bytes"] == 60
+        assert stats["tags"]["team:1"]["entries"] == 0
+
+        await bounded.set("huge", "w" * 101)
+        assert await bounded.get("huge") is None
+        assert (await bounded.get_stats())["total_bytes"] == 60
+
+
+class TestRequestAwareCaching:
+    """Tests for request-derived keys and single-flight misses."""
+
+    @pytest.mark.asyncio
+    async def test_keys_include_path_parameters(self, fresh_cache):
+        """Different arguments are cached separately and tags are formatted from them."""
+        calls = []
+
+        @cached(key_prefix="box-score:", tags=("game:{game_id}",))
+        async def box_score(game_id: int):
+            calls.append(game_id)
+            return {"game_id": game_id}
+
+        assert await box_score(game_id=1) == {"game_id": 1}
+        assert await box_score(game_id=2) == {"game_id": 2}
+        assert await box_score(1) == {"game_id": 1}
+        assert calls == [1, 2]
+
+        await cache_module.invalidate_cache_tags("game:2")
+        await box_score(game_id=1)
+        await box_score(game_id=2)
+        assert calls == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_keys_include_request_query_parameters(self, fresh_cache):
+        """Endpoints taking a request are keyed on its path and sorted query string."""
+        from starlette.requests import Request
+
+        def make_request(query: bytes) -> Request:
+            return Request({"type": "http", "method": "GET", "path": "/players", "query_string": query, "headers": []})
+
+        calls = []
+
+        @cached(key_prefix="page:")
+        async def players_page(request):
+            calls.append(request.url.query)
+            return "html"
+
+        await players_page(request=make_request(b"team=1&sort=name"))
+        await players_page(request=make_request(b"sort=name&team=1"))
+        await players_page(request=make_request(b"team=2"))
+
+        assert calls == ["team=1&sort=name", "team=2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self, fresh_cache):
+        """Concurrent callers of a missing key share one computation."""
+        calls = []
+        release = asyncio.Event()
+
+        @cached(key_prefix="slow:")
+        async def slow_page(game_id: int):
+            calls.append(game_id)
+            await release.wait()
+            return f"game {game_id}"
+
+        tasks = [asyncio.create_task(slow_page(game_id=3)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["game 3"] * 5
+        assert calls == [3]
+        assert (await fresh_cache.get_stats())["coalesced_misses"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_computation_reaches_waiters_and_is_not_cached(self, fresh_cache):
+        """Errors propagate to every waiting caller and the next call recomputes."""
+        release = asyncio.Event()
+        attempts = []
+
+        @cached(key_prefix="flaky:")
+        async def flaky(game_id: int):
+            attempts.append(game_id)
+            await release.wait()
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        tasks = [asyncio.create_task(flaky(game_id=1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await flaky(game_id=1) == "ok"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_value_computed_across_invalidation_is_not_stored(self, fresh_cache):
+        """An invalidation during computation keeps the possibly stale value out of the cache."""
+        release = asyncio.Event()
+
+        @cached(key_prefix="race:", tags=("game:{game_id}",))
+        async def page(game_id: int):
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(page(game_id=4))
+        await asyncio.sleep(0)
+        await cache_module.invalidate_cache_tags("game:4")
+        release.set()
+
+        assert await task == "stale"
+        assert (await fresh_cache.get_stats())["total_entries"] == 0
+
+
+class TestSQLiteCache:
+    """Tests for the SQLite backend shared by worker processes."""
+
+    @pytest.fixture
+    def workers(self, tmp_path):
+        """Two backends on one file, standing in for two uvicorn workers."""
+        path = str(tmp_path / "cache.db")
+        return SQLiteCache(path, max_entries=3), SQLiteCache(path, max_entries=3)
+
+    @pytest.mark.asyncio
+    async def test_entries_are_shared_between_workers(self, workers):
+        """A value stored by one worker is served by another, responses included."""
+        from fastapi.responses import HTMLResponse
+
+        first, second = workers
+        await first.set("box-score", {"game_id": 7}, tags=["game:7"])
+        await first.set("homepage", HTMLResponse("<h1>Dashboard</h1>"), tags=["games"])
+
+        assert await second.get("box-score") == {"game_id": 7}
+        page = await second.get("homepage")
+        assert page.body == b"<h1>Dashboard</h1>"
+        assert page.media_type == "text/html"
+
+    @pytest.mark.asyncio
+    async def test_invalidations_fan_out_to_all_workers(self, workers):
+        """Tag and full invalidations made by one worker apply to every worker."""
+        first, second = workers
+        await first.set("team-page", "a", tags=["team:1"])
+        await first.set("other-team", "b", tags=["team:2"])
+
+        assert await second.invalidate_tags(["team:1"]) == 1
+        assert await first.get("team-page") is None
+        assert await first.get("other-team") == "b"
+
+        await second.invalidate()
+        assert await first.get("other-team") is None
+        stats = await first.get_stats()
+        assert stats["tags"]["team:1"]["invalidations"] == 1
+        assert stats["tags"]["team:2"]["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, workers):
+        """Reads from any worker protect an entry from eviction."""
+        first, second = workers
+        for key in ("a", "b", "c"):
+            await first.set(key, key)
+        await second.get("a")
+        await first.set("d", "d")
+
+        assert await second.get("b") is None
+        assert await second.get("a") == "a"
+        assert (await second.get_stats())["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_value_computed_across_another_workers_invalidation_is_not_stored(self, workers):
+        """An invalidation in another worker keeps a value being computed out of the cache."""
+        first, second = workers
+        generation = await first.generation()
+        await second.invalidate_tags(["game:4"])
+        await first.set("page", "stale", tags=["game:4"], generation=generation)
+
+        assert await second.get("page") is None
+
+    @pytest.mark.asyncio
+    async def test_values_are_stored_as_json_in_a_private_file(self, workers):
+        """Models are stored as their JSON data, in a file only the app's user can read."""
+        from app.web_ui.schemas import PlayerResponse
+
+        first, second = workers
+        player = PlayerResponse(id=1, name="Ann", team_id=2, team_name="Hawks", jersey_number="1")
+        await first.set("player", player, tags=["player:1"])
+
+        assert await second.get("player") == player.model_dump(mode="json")
+        assert os.stat(first.path).st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_entries_in_an_unknown_format_are_misses(self, workers):
+        """Rows written in another format, such as pickles, are never deserialized."""
+        first, second = workers
+        await first.set("page", "html")
+        first._conn.execute("UPDATE cache_entries SET value = ?", (pickle.dumps("html"),))
+
+        assert await second.get("page") is None
+
+    def test_file_owned_by_another_user_is_refused(self, tmp_path, monkeypatch):
+        """Another user's file could feed the app crafted entries or read its pages."""
+        path = tmp_path / "cache.db"
+        path.touch()
+        monkeypatch.setattr(os, "getuid", lambda: path.stat().st_uid + 1)
+
+        with pytest.raises(PermissionError):
+            SQLiteCache(str(path))
+
+    def test_default_path_is_in_a_private_directory(self, tmp_path, monkeypatch):
+        """The default file lives in a directory only the app's user can enter."""
+        monkeypatch.setattr(cache_module.os.path, "isdir", lambda path: False)
+        monkeypatch.setattr(cache_module.tempfile, "gettempdir", lambda: str(tmp_path))
+
+        path = cache_module._default_sqlite_path()
+
+        assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+        os.chmod(os.path.dirname(path), 0o755)
+        with pytest.raises(PermissionError):
+            cache_module._default_sqlite_path()
@@ -0,0 +1,126 @@
+"""Unit tests for recording live events from concurrent tablets."""
+
+import threading
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.data_access.models import Base, GameEvent, Player, PlayerGameStats, Season, Team
+from app.services.game_state_service import GameStateService
+from app.services.live_game_session import LiveGameSessionRegistry
+from app.services.season_stats_service import SeasonStatsService
+from app.web_ui.routers.games import _record_event_batch
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on a file database, so two sessions can write to the same game at once."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def game_id(session_factory):
+    with session_factory() as session:
+        session.add(Season(name="Season 2025", code="2025", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31)))
+        session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+        session.add_all(
+            [
+                Player(id=1, name="Home", team_id=1, jersey_number="1"),
+                Player(id=2, name="Away", team_id=2, jersey_number="2"),
+            ]
+        )
+        session.flush()
+
+        service = GameStateService(session, live_sessions=LiveGameSessionRegistry())
+        game = service.create_game("2025-01-01", 1, 2, season_id=session.query(Season.id).scalar(), commit=False)
+        season_stats = SeasonStatsService(session)
+        season_stats.apply_game_delta({}, season_stats.get_game_contribution(game.id))
+        session.commit()
+        service.start_game(game.id, [1], [2])
+        return game.id
+
+
+def _shot(client_event_id, player_id, shot_type, made):
+    return {
+        "client_event_id": client_event_id,
+        "type": "shot",
+        "player_id": player_id,
+        "shot_type": shot_type,
+        "made": made,
+    }
+
+
+def _record_meanwhile(session, session_factory, game_id, events):
+    """Record events from a second session on another thread once ``session`` starts flushing.
+
+    The first session is held at its flush long enough for the second to write and
+    commit, unless the second has to wait for the first to commit.
+    """
+    results = []
+
+    def record():
+        with session_factory() as other:
+            results.extend(_record_event_batch(other, game_id, events))
+
+    thread = threading.Thread(target=record)
+
+    def start(flushing_session, flush_context, instances):
+        thread.start()
+        time.sleep(0.3)
+
+    event.listen(session, "before_flush", start, once=True)
+    return thread, results
+
+
+class TestRecordEventBatch:
+    """Test cases for _record_event_batch."""
+
+    def test_concurrent_tablets_keep_season_stats_in_sync(self, session_factory, game_id):
+        session = session_factory()
+        thread, away_results = _record_meanwhile(session, session_factory, game_id, [_shot("away-1", 2, "3pt", True)])
+
+        home_results = _record_event_batch(session, game_id, [_shot("home-1", 1, "2pt", True)])
+        thread.join()
+
+        assert [result["status"] for result in home_results + away_results] == ["applied", "applied"]
+        session.expire_all()
+        assert SeasonStatsService(session).verify_season_stats() == {"players": [], "teams": []}
+        session.close()
+
+    def test_concurrent_resend_reports_stored_events_as_duplicates(self, session_factory, game_id):
+        batch = [_shot("a", 1, "2pt", True), _shot("b", 2, "3pt", True)]
+        session = session_factory()
+        thread, resend_results = _record_meanwhile(session, session_factory, game_id, batch)
+
+        results = _record_event_batch(session, game_id, batch)
+        thread.join()
+
+        assert [result["status"] for result in results] == ["applied", "applied"]
+        assert resend_results == [{**result, "status": "duplicate"} for result in results]
+        # Only the first request's events changed the stat lines
+        lines = {
+            stats.player_id: (stats.total_2pm, stats.total_3pm)
+            for stats in session.query(PlayerGameStats).filter_by(game_id=game_id)
+        }
+        assert lines == {1: (1, 0), 2: (0, 1)}
+        assert session.query(GameEvent).filter_by(game_id=game_id, event_type="shot").count() == 2
+        session.close()
+
+    def test_failed_season_update_leaves_batch_unrecorded(self, session_factory, game_id, monkeypatch):
+        def fail(self, before, after):
+            raise RuntimeError("season tables unavailable")
+
+        monkeypatch.setattr(SeasonStatsService, "apply_game_delta", fail)
+        with session_factory() as session, pytest.raises(RuntimeError):
+            _record_event_batch(session, game_id, [_shot("a", 1, "2pt", True)])
+
+        # The events and stat lines were never committed, so a retry records them once
+        with session_factory() as session:
+            assert session.query(GameEvent).filter_by(game_id=game_id, event_type="shot").count() == 0
+            assert session.query(PlayerGameStats).filter_by(game_id=game_id).count() == 0
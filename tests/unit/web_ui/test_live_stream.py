@@ -0,0 +1,62 @@
+"""Unit tests for the live game stream's opening messages."""
+
+import json
+
+import pytest
+
+from app.data_access.models import Player, Team
+from app.services.game_state_service import GameStateService
+from app.web_ui.routers.games import _sse_message, _start_live_stream
+
+
+@pytest.fixture
+def game_id(unit_db_session):
+    unit_db_session.add_all([Team(id=1, name="Hawks"), Team(id=2, name="Lakers")])
+    unit_db_session.add_all(
+        [
+            Player(id=1, name="Home", team_id=1, jersey_number="1"),
+            Player(id=2, name="Away", team_id=2, jersey_number="2"),
+        ]
+    )
+    unit_db_session.commit()
+
+    service = GameStateService(unit_db_session)
+    game = service.create_game("2025-01-01", 1, 2)
+    service.start_game(game.id, [1], [2])
+    return game.id
+
+
+def _parse(message):
+    fields = dict(line.split(": ", 1) for line in message.strip().splitlines())
+    return fields.get("id"), fields["event"], json.loads(fields["data"])
+
+
+class TestLiveStream:
+    """Test cases for the live stream helpers."""
+
+    def test_sse_message_format(self):
+        assert _sse_message("shot", {"id": 7}, 7) == 'id: 7\nevent: shot\ndata: {"id": 7}\n\n'
+
+    def test_new_client_gets_snapshot(self, unit_db_session, game_id):
+        messages, last_event_id, finished = _start_live_stream(unit_db_session, game_id, None)
+
+        event_id, event, data = _parse(messages[0])
+        assert event == "snapshot"
+        assert int(event_id) == last_event_id
+        assert data["game_state"]["is_live"] is True
+        assert finished is False
+
+    def test_reconnect_gets_only_missed_events(self, unit_db_session, game_id):
+        _, last_event_id, _ = _start_live_stream(unit_db_session, game_id, None)
+        service = GameStateService(unit_db_session)
+        service.record_shot(game_id, 1, "3pt", True)
+        service.record_foul(game_id, 2)
+
+        messages, resumed_to, _ = _start_live_stream(unit_db_session, game_id, last_event_id)
+
+        assert [_parse(m)[1] for m in messages] == ["shot", "foul"]
+        assert resumed_to == int(_parse(messages[-1])[0])
+
+    def test_unknown_game_raises(self, unit_db_session):
+        with pytest.raises(ValueError):
+            _start_live_stream(unit_db_session, 999, 5)